@@ -0,0 +1,124 @@
+"""Partition feature_snapshots by day (PostgreSQL).
+
+Converts feature_snapshots into a table range-partitioned on timestamp with
+one partition per UTC day (feature_snapshots_pYYYYMMDD) plus a default
+partition. FeatureStore creates new day partitions on write and applies
+retention by dropping whole partitions instead of deleting rows.
+
+The primary key becomes (id, timestamp) because PostgreSQL requires the
+partition key in every unique constraint; ids still come from the existing
+sequence and stay unique. Other dialects are left unchanged.
+
+Revision ID: 099_feature_snapshot_partitions
+Revises: 098_crm_playbooks
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "099_feature_snapshot_partitions"
+down_revision = "098_crm_playbooks"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_feature_snapshots_symbol", "symbol"),
+    ("ix_feature_snapshots_timestamp", "timestamp"),
+    ("ix_features_symbol_timestamp", "symbol, timestamp"),
+    ("ix_features_symbol_quality", "symbol, quality_score"),
+    ("ix_features_timestamp_desc", "timestamp DESC"),
+)
+
+
+def _drop_indexes() -> None:
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON feature_snapshots ({columns})")
+
+
+def upgrade():
+    """Rebuild feature_snapshots as a day-partitioned table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Keep the id sequence alive when the old table is dropped
+    op.execute("ALTER SEQUENCE feature_snapshots_id_seq OWNED BY NONE")
+    _drop_indexes()
+    op.execute("ALTER TABLE feature_snapshots RENAME TO feature_snapshots_legacy")
+
+    op.execute("""
+        CREATE TABLE feature_snapshots (
+            id INTEGER NOT NULL DEFAULT nextval('feature_snapshots_id_seq'),
+            symbol VARCHAR(20) NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL,
+            features JSONB NOT NULL,
+            quality_score DOUBLE PRECISION NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """)
+    op.execute(
+        "CREATE TABLE feature_snapshots_default "
+        "PARTITION OF feature_snapshots DEFAULT"
+    )
+
+    # One partition per UTC day that already has data
+    op.execute("""
+        DO $$
+        DECLARE
+            day DATE;
+        BEGIN
+            FOR day IN
+                SELECT DISTINCT (timestamp AT TIME ZONE 'UTC')::date
+                FROM feature_snapshots_legacy
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF feature_snapshots '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'feature_snapshots_p' || to_char(day, 'YYYYMMDD'),
+                    day::text || ' 00:00:00+00',
+                    (day + 1)::text || ' 00:00:00+00'
+                );
+            END LOOP;
+        END $$;
+        """)
+
+    op.execute("INSERT INTO feature_snapshots SELECT * FROM feature_snapshots_legacy")
+    op.execute("DROP TABLE feature_snapshots_legacy")
+    op.execute("ALTER SEQUENCE feature_snapshots_id_seq OWNED BY feature_snapshots.id")
+    _create_indexes()
+
+
+def downgrade():
+    """Rebuild feature_snapshots as a single unpartitioned table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER SEQUENCE feature_snapshots_id_seq OWNED BY NONE")
+    _drop_indexes()
+    op.execute("ALTER TABLE feature_snapshots RENAME TO feature_snapshots_partitioned")
+
+    op.execute("""
+        CREATE TABLE feature_snapshots (
+            id INTEGER NOT NULL DEFAULT nextval('feature_snapshots_id_seq'),
+            symbol VARCHAR(20) NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL,
+            features JSONB NOT NULL,
+            quality_score DOUBLE PRECISION NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """)
+    op.execute(
+        "INSERT INTO feature_snapshots SELECT * FROM feature_snapshots_partitioned"
+    )
+    # Dropping the parent drops every day partition
+    op.execute("DROP TABLE feature_snapshots_partitioned")
+    op.execute("ALTER SEQUENCE feature_snapshots_id_seq OWNED BY feature_snapshots.id")
+    _create_indexes()
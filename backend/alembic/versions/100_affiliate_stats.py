@@ -0,0 +1,41 @@
+"""Add affiliate_stats rollup table.
+
+Per-referral-code counts of ReferralEvent (signups, distinct signups,
+subscriptions, first trades) so affiliate dashboards do not rescan the
+event log on every request.
+
+Revision ID: 100_affiliate_stats
+Revises: 099_feature_snapshot_partitions
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "100_affiliate_stats"
+down_revision = "099_feature_snapshot_partitions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create affiliate_stats table."""
+    op.create_table(
+        "affiliate_stats",
+        sa.Column("referral_code", sa.String(50), primary_key=True),
+        sa.Column("total_clicks", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("total_signups", sa.Integer, nullable=False, server_default="0"),
+        sa.Column(
+            "total_subscriptions", sa.Integer, nullable=False, server_default="0"
+        ),
+        sa.Column("total_first_trades", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("refreshed_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+    )
+
+
+def downgrade():
+    """Drop affiliate_stats table."""
+    op.drop_table("affiliate_stats")
@@ -0,0 +1,107 @@
+"""Partition decision_logs by month (PostgreSQL).
+
+Converts decision_logs into a table range-partitioned on timestamp with one
+partition per UTC month (decision_logs_pYYYYMM) plus a default partition.
+The decision log writer creates new month partitions on write, and the
+archival job exports cold months to Parquet and drops their partitions.
+
+The primary key becomes (id, timestamp) because PostgreSQL requires the
+partition key in every unique constraint; ids are UUIDs and stay unique.
+Other dialects are left unchanged.
+
+Revision ID: 101_decision_log_partitions
+Revises: 100_affiliate_stats
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "101_decision_log_partitions"
+down_revision = "100_affiliate_stats"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_decision_logs_timestamp", "timestamp"),
+    ("ix_decision_logs_strategy", "strategy"),
+    ("ix_decision_logs_symbol", "symbol"),
+    ("ix_decision_logs_outcome", "outcome"),
+    ("ix_decision_logs_strategy_timestamp", "strategy, timestamp"),
+    ("ix_decision_logs_symbol_timestamp", "symbol, timestamp"),
+    ("ix_decision_logs_outcome_timestamp", "outcome, timestamp"),
+    ("ix_decision_logs_strategy_symbol_timestamp", "strategy, symbol, timestamp"),
+)
+
+
+def _drop_indexes() -> None:
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON decision_logs ({columns})")
+
+
+def upgrade():
+    """Rebuild decision_logs as a month-partitioned table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _drop_indexes()
+    op.execute("ALTER TABLE decision_logs RENAME TO decision_logs_legacy")
+
+    op.execute("""
+        CREATE TABLE decision_logs (
+            LIKE decision_logs_legacy INCLUDING DEFAULTS,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """)
+    op.execute("CREATE TABLE decision_logs_default PARTITION OF decision_logs DEFAULT")
+
+    # One partition per month that already has data
+    op.execute("""
+        DO $$
+        DECLARE
+            month DATE;
+        BEGIN
+            FOR month IN
+                SELECT DISTINCT date_trunc('month', timestamp)::date
+                FROM decision_logs_legacy
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF decision_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'decision_logs_p' || to_char(month, 'YYYYMM'),
+                    month::text,
+                    (month + interval '1 month')::date::text
+                );
+            END LOOP;
+        END $$;
+        """)
+
+    op.execute("INSERT INTO decision_logs SELECT * FROM decision_logs_legacy")
+    op.execute("DROP TABLE decision_logs_legacy")
+    _create_indexes()
+
+
+def downgrade():
+    """Rebuild decision_logs as a single unpartitioned table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _drop_indexes()
+    op.execute("ALTER TABLE decision_logs RENAME TO decision_logs_partitioned")
+
+    op.execute("""
+        CREATE TABLE decision_logs (
+            LIKE decision_logs_partitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+        """)
+    op.execute("INSERT INTO decision_logs SELECT * FROM decision_logs_partitioned")
+    # Dropping the parent drops every month partition
+    op.execute("DROP TABLE decision_logs_partitioned")
+    _create_indexes()
@@ -0,0 +1,34 @@
+"""Add paper_accounts.book_seq for the in-memory paper book.
+
+The paper book keeps accounts in memory, logs every fill to an append-only
+fill log and checkpoints to the database in batches. book_seq records the
+last fill sequence number checkpointed for each account, so crash recovery
+replays only the fills that never reached the database.
+
+Revision ID: 102_paper_book_seq
+Revises: 101_decision_log_partitions
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "102_paper_book_seq"
+down_revision = "101_decision_log_partitions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add book_seq column to paper_accounts."""
+    op.add_column(
+        "paper_accounts",
+        sa.Column("book_seq", sa.BigInteger, nullable=False, server_default="0"),
+    )
+
+
+def downgrade():
+    """Remove book_seq column from paper_accounts."""
+    op.drop_column("paper_accounts", "book_seq")
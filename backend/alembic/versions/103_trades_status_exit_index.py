@@ -0,0 +1,28 @@
+"""Index trades by (status, exit_time) for incremental fraud scans.
+
+Fraud scans score closed trades and keep their watermark on exit_time, so
+the scan query filters status = 'CLOSED' and exit_time > watermark.
+
+Revision ID: 103_trades_status_exit_index
+Revises: 102_paper_book_seq
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "103_trades_status_exit_index"
+down_revision = "102_paper_book_seq"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create ix_trades_status_exit on trades."""
+    op.create_index("ix_trades_status_exit", "trades", ["status", "exit_time"])
+
+
+def downgrade():
+    """Drop ix_trades_status_exit."""
+    op.drop_index("ix_trades_status_exit", table_name="trades")
@@ -2,6 +2,7 @@
 
 from backend.app.affiliates.models import (
     Affiliate,
+    AffiliateStats,
     AffiliateStatus,
     Commission,
     CommissionStatus,
@@ -22,6 +23,7 @@ from backend.app.affiliates.service import AffiliateService
 
 __all__ = [
     "Affiliate",
+    "AffiliateStats",
     "AffiliateStatus",
     "Referral",
     "ReferralStatus",
@@ -336,6 +336,44 @@ class ReferralEvent(Base):
     __table_args__ = (Index("ix_referral_events_code", "referral_code"),)
 
 
+class AffiliateStats(Base):
+    """Per-affiliate referral event counts (rollup of ReferralEvent).
+
+    Rebuilt from ReferralEvent by a single aggregate query when missing or
+    older than the refresh interval; tracked events update it in place.
+    """
+
+    __tablename__ = "affiliate_stats"
+
+    referral_code: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        doc="Referral code the counts belong to",
+    )
+    total_clicks: Mapped[int] = mapped_column(
+        nullable=False, default=0, doc="Signup events"
+    )
+    total_signups: Mapped[int] = mapped_column(
+        nullable=False, default=0, doc="Distinct users with a signup event"
+    )
+    total_subscriptions: Mapped[int] = mapped_column(
+        nullable=False, default=0, doc="Subscription events"
+    )
+    total_first_trades: Mapped[int] = mapped_column(
+        nullable=False, default=0, doc="First trade events"
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        default=datetime.utcnow,
+        doc="When counts were last rebuilt from ReferralEvent",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    )
+
+
 class AffiliateEarnings(Base):
     """Affiliate earnings tracking."""
 
@@ -2,14 +2,16 @@
 
 import logging
 import secrets
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, distinct, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.affiliates.models import (
     Affiliate,
     AffiliateEarnings,
+    AffiliateStats,
     AffiliateStatus,
     Commission,
     CommissionTier,
@@ -24,6 +26,73 @@ from backend.app.core.errors import APIException
 
 logger = logging.getLogger(__name__)
 
+# Stats rollups older than this are rebuilt from ReferralEvent on read
+STATS_REFRESH_SECONDS = 300
+
+# ReferralEvent.event_type -> AffiliateStats counter
+EVENT_COUNTERS = {
+    "signup": "total_clicks",
+    "subscription_created": "total_subscriptions",
+    "first_trade": "total_first_trades",
+}
+
+STATS_COUNTERS = (
+    "total_clicks",
+    "total_signups",
+    "total_subscriptions",
+    "total_first_trades",
+)
+
+
+def event_counts_query(referral_codes: list[str] | None = None):
+    """Count ReferralEvents per referral code in one conditional aggregate.
+
+    Args:
+        referral_codes: Codes to count (None: all codes)
+
+    Returns:
+        Select of (referral_code, *STATS_COUNTERS) grouped by code
+    """
+    is_signup = ReferralEvent.event_type == "signup"
+    stmt = select(
+        ReferralEvent.referral_code,
+        func.count(ReferralEvent.id).filter(is_signup).label("total_clicks"),
+        func.count(distinct(ReferralEvent.user_id))
+        .filter(is_signup)
+        .label("total_signups"),
+        func.count(ReferralEvent.id)
+        .filter(ReferralEvent.event_type == "subscription_created")
+        .label("total_subscriptions"),
+        func.count(ReferralEvent.id)
+        .filter(ReferralEvent.event_type == "first_trade")
+        .label("total_first_trades"),
+    ).group_by(ReferralEvent.referral_code)
+    if referral_codes is not None:
+        stmt = stmt.where(ReferralEvent.referral_code.in_(referral_codes))
+    return stmt
+
+
+def _commission_totals(affiliate: Affiliate) -> dict[str, float]:
+    return {
+        "total_commission": affiliate.total_commission,
+        "pending_commission": affiliate.pending_commission,
+        "paid_commission": affiliate.paid_commission,
+    }
+
+
+def _stats_dict(commission: dict[str, float], counts: dict[str, int]) -> dict:
+    total_signups = counts["total_signups"]
+    total_subscriptions = counts["total_subscriptions"]
+    return {
+        "total_clicks": counts["total_clicks"],
+        "total_signups": total_signups,
+        "total_subscriptions": total_subscriptions,
+        "conversion_rate": (
+            total_subscriptions / total_signups if total_signups > 0 else 0.0
+        ),
+        **commission,
+    }
+
 
 class AffiliateService:
     """Service for affiliate program management.
@@ -310,58 +379,54 @@ class AffiliateService:
                     detail="Affiliate not found",
                 )
 
-            # Count signup events (each click/signup)
-            signups_result = await self.db.execute(
-                select(func.count(ReferralEvent.id)).where(
-                    and_(
-                        ReferralEvent.referral_code == affiliate.referral_code,
-                        ReferralEvent.event_type == "signup",
-                    )
-                )
-            )
-            total_clicks = signups_result.scalar() or 0
+            # Snapshot before the rollup commit (a rollback would expire it)
+            commission = _commission_totals(affiliate)
+            counts = await self._get_event_counts([affiliate.referral_code])
+            return _stats_dict(commission, counts[affiliate.referral_code])
 
-            # Count unique users who signed up
-            unique_signups_result = await self.db.execute(
-                select(func.count(func.distinct(ReferralEvent.user_id))).where(
-                    and_(
-                        ReferralEvent.referral_code == affiliate.referral_code,
-                        ReferralEvent.event_type == "signup",
-                    )
-                )
-            )
-            total_signups = unique_signups_result.scalar() or 0
+        except APIException:
+            raise
+        except Exception as e:
+            logger.error(f"Stats retrieval failed: {e}", exc_info=True)
+            raise APIException(
+                status_code=500,
+                error_type="server_error",
+                title="Stats Error",
+                detail="Failed to retrieve stats",
+            ) from e
 
-            # Count subscriptions
-            subscriptions_result = await self.db.execute(
-                select(func.count(ReferralEvent.id)).where(
-                    and_(
-                        ReferralEvent.referral_code == affiliate.referral_code,
-                        ReferralEvent.event_type == "subscription_created",
-                    )
-                )
-            )
-            total_subscriptions = subscriptions_result.scalar() or 0
+    async def get_stats_batch(self, affiliate_ids: list[str]) -> dict[str, dict]:
+        """Get statistics for many affiliates (admin listings).
 
-            # Calculate conversion rate
-            conversion_rate = (
-                total_subscriptions / total_signups if total_signups > 0 else 0.0
-            )
+        Uses one query for the affiliates, one for their rollups and at most
+        one aggregate over ReferralEvent for rollups that need rebuilding.
+
+        Args:
+            affiliate_ids: Affiliate IDs
 
+        Returns:
+            Dict of affiliate_id -> stats (same shape as get_stats); unknown
+            IDs are omitted
+        """
+        if not affiliate_ids:
+            return {}
+
+        try:
+            result = await self.db.execute(
+                select(Affiliate).where(Affiliate.id.in_(affiliate_ids))
+            )
+            affiliates = result.scalars().all()
+            snapshot = [
+                (a.id, a.referral_code, _commission_totals(a)) for a in affiliates
+            ]
+            counts = await self._get_event_counts([code for _, code, _ in snapshot])
             return {
-                "total_clicks": total_clicks,
-                "total_signups": total_signups,
-                "total_subscriptions": total_subscriptions,
-                "conversion_rate": conversion_rate,
-                "total_commission": affiliate.total_commission,
-                "pending_commission": affiliate.pending_commission,
-                "paid_commission": affiliate.paid_commission,
+                affiliate_id: _stats_dict(commission, counts[code])
+                for affiliate_id, code, commission in snapshot
             }
 
-        except APIException:
-            raise
         except Exception as e:
-            logger.error(f"Stats retrieval failed: {e}", exc_info=True)
+            logger.error(f"Batch stats retrieval failed: {e}", exc_info=True)
             raise APIException(
                 status_code=500,
                 error_type="server_error",
@@ -369,6 +434,113 @@ class AffiliateService:
                 detail="Failed to retrieve stats",
             ) from e
 
+    async def refresh_stats(self, referral_codes: list[str] | None = None) -> int:
+        """Rebuild stats rollups from ReferralEvent.
+
+        Args:
+            referral_codes: Codes to rebuild (None: every affiliate)
+
+        Returns:
+            Number of rollups rebuilt
+        """
+        if referral_codes is None:
+            result = await self.db.execute(select(Affiliate.referral_token))
+            referral_codes = list(result.scalars().all())
+        if not referral_codes:
+            return 0
+
+        rows = await self._load_stats_rows(referral_codes)
+        await self._rebuild_stats(referral_codes, rows)
+        return len(referral_codes)
+
+    async def _load_stats_rows(self, codes: list[str]) -> dict[str, AffiliateStats]:
+        result = await self.db.execute(
+            select(AffiliateStats).where(AffiliateStats.referral_code.in_(codes))
+        )
+        return {row.referral_code: row for row in result.scalars().all()}
+
+    async def _get_event_counts(self, codes: list[str]) -> dict[str, dict[str, int]]:
+        """Event counts per referral code, served from the rollup table.
+
+        Rollups that are missing or older than STATS_REFRESH_SECONDS are
+        rebuilt with one aggregate query for all of them.
+        """
+        rows = await self._load_stats_rows(codes)
+        cutoff = datetime.utcnow() - timedelta(seconds=STATS_REFRESH_SECONDS)
+        counts = {
+            code: {name: getattr(row, name) for name in STATS_COUNTERS}
+            for code, row in rows.items()
+            if row.refreshed_at >= cutoff
+        }
+        stale = [code for code in codes if code not in counts]
+        if stale:
+            counts.update(await self._rebuild_stats(stale, rows))
+        return counts
+
+    async def _rebuild_stats(
+        self, codes: list[str], rows: dict[str, AffiliateStats]
+    ) -> dict[str, dict[str, int]]:
+        """Recount events for codes and upsert their rollups.
+
+        Returns:
+            Dict of referral_code -> counts
+        """
+        result = await self.db.execute(event_counts_query(codes))
+        counted = {row.referral_code: row for row in result.all()}
+        now = datetime.utcnow()
+
+        counts: dict[str, dict[str, int]] = {}
+        for code in codes:
+            row = counted.get(code)
+            counts[code] = {
+                name: getattr(row, name) if row else 0 for name in STATS_COUNTERS
+            }
+            stats = rows.get(code)
+            if stats is None:
+                stats = AffiliateStats(referral_code=code)
+                self.db.add(stats)
+            for name, value in counts[code].items():
+                setattr(stats, name, value)
+            stats.refreshed_at = now
+
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # A concurrent request created the same rollup first; it holds
+            # the same counts, so only this request's write is dropped
+            await self.db.rollback()
+        return counts
+
+    async def _count_event(self, referral_code: str, event_type: str, user_id: str):
+        """Apply a new ReferralEvent to its rollup (call before adding it).
+
+        Rollups that do not exist yet are left alone; they are built from
+        the event log on first read.
+        """
+        counter = EVENT_COUNTERS.get(event_type)
+        if counter is None:
+            return
+
+        values = {counter: getattr(AffiliateStats, counter) + 1}
+        if event_type == "signup":
+            seen = await self.db.scalar(
+                select(
+                    exists().where(
+                        ReferralEvent.referral_code == referral_code,
+                        ReferralEvent.event_type == "signup",
+                        ReferralEvent.user_id == user_id,
+                    )
+                )
+            )
+            if not seen:
+                values["total_signups"] = AffiliateStats.total_signups + 1
+
+        await self.db.execute(
+            update(AffiliateStats)
+            .where(AffiliateStats.referral_code == referral_code)
+            .values(**values)
+        )
+
     async def get_earnings_summary(self, user_id: str) -> dict:
         """Get affiliate earnings summary.
 
@@ -627,6 +799,7 @@ class AffiliateService:
             await self.record_referral(referral_code, new_user_id)
 
             # Create signup event
+            await self._count_event(referral_code, "signup", new_user_id)
             event = ReferralEvent(
                 referral_code=referral_code,
                 event_type="signup",
@@ -675,6 +848,7 @@ class AffiliateService:
         """
         try:
             # Create subscription event with meta data
+            await self._count_event(referral_code, "subscription_created", user_id)
             event = ReferralEvent(
                 referral_code=referral_code,
                 event_type="subscription_created",
@@ -721,6 +895,7 @@ class AffiliateService:
         """
         try:
             # Create first trade event
+            await self._count_event(referral_code, "first_trade", user_id)
             event = ReferralEvent(
                 referral_code=referral_code,
                 event_type="first_trade",
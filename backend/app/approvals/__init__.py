@@ -1,11 +1,13 @@
 """Approvals module - user signal approval workflow."""
 
+from backend.app.approvals.fanout import ApprovalFanout
 from backend.app.approvals.models import Approval, ApprovalDecision
 from backend.app.approvals.schema import ApprovalCreate, ApprovalOut
 from backend.app.approvals.service import ApprovalService
 
 __all__ = [
     "Approval",
+    "ApprovalFanout",
     "ApprovalDecision",
     "ApprovalService",
     "ApprovalCreate",
@@ -0,0 +1,414 @@
+"""Approval fan-out: deliver one signal to every subscriber in bulk.
+
+For a new signal the engine:
+    1. Resolves every eligible subscriber (active subscription, no approval
+       for the signal yet) in one query, together with their client, tier
+       and copy-trading settings.
+    2. Consumes the signals_per_day quota for all of them in batch
+       (QuotaService.consume_batch); blocked users get nothing.
+    3. Applies the copy-trading guard rails (enabled, not paused, daily
+       trade limit) in memory. Copy traders get an approved approval and a
+       CopyTradeExecution; everyone else (including copy traders over their
+       limits) gets a pending approval for the mini app console.
+    4. Writes approvals with multi-row INSERT ... ON CONFLICT DO NOTHING
+       RETURNING, then executions for the approvals actually inserted, bumps
+       trades_today with one UPDATE per chunk, and commits once. Subscribers
+       approved concurrently by another fan-out (uq_approval_signal_user)
+       are skipped and their quota refunded; if the writes fail, all the
+       consumed quota is refunded.
+    5. Notifies EAs (approved approvals, per client channel) and Telegram
+       (messaging bus transactional lane) in one Redis pipeline.
+    6. With a paper book, fills one paper order per reached subscriber with
+       an enabled paper account, all on the signal's quote (no commit).
+
+Re-running a fan-out for the same signal only reaches subscribers that have
+no approval yet.
+
+Example:
+    >>> fanout = ApprovalFanout(db)
+    >>> counts = await fanout.fan_out(signal)
+    >>> counts["approvals"], counts["copy_executions"]
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import exists, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.approvals.models import Approval, ApprovalDecision
+from backend.app.auth.models import User
+from backend.app.clients.models import Client
+from backend.app.copytrading.service import (
+    CopyTradeExecution,
+    CopyTradeSettings,
+    CopyTradingService,
+)
+from backend.app.core.redis import get_redis
+from backend.app.messaging.bus import TRANSACTIONAL_QUEUE, build_message
+from backend.app.observability.metrics import messages_enqueued_total
+from backend.app.paper.book import PaperBook
+from backend.app.paper.models import PaperAccount, TradeSide
+from backend.app.quotas.models import QuotaType
+from backend.app.quotas.service import QuotaService
+from backend.app.signals.models import Signal
+from backend.app.subscriptions.models import Subscription, SubscriptionTier
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT / UPDATE
+FANOUT_CHUNK_SIZE = 1000
+
+# EA notification channel (one per client)
+EA_APPROVAL_CHANNEL = "ea:approvals:{client_id}"
+
+# Lot size used when the signal payload has none (matches the mini app)
+DEFAULT_LOT_SIZE = 0.04
+
+_TIER_RANK = {tier.value: rank for rank, tier in enumerate(SubscriptionTier)}
+
+
+def _chunks(rows: list[Any], size: int = FANOUT_CHUNK_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+class ApprovalFanout:
+    """Bulk approval and copy-execution fan-out for signals.
+
+    Attributes:
+        db: Database session
+        redis_client: Redis client for notifications (default: get_redis())
+        paper_book: Paper book filling subscribers' paper accounts (optional)
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        redis_client: Any | None = None,
+        paper_book: PaperBook | None = None,
+    ):
+        self.db = db
+        self.redis_client = redis_client
+        self.paper_book = paper_book
+
+    async def fan_out(
+        self, signal: Signal, now: datetime | None = None
+    ) -> dict[str, int]:
+        """Fan a signal out to every eligible subscriber.
+
+        Args:
+            signal: The signal to deliver
+            now: Timestamp for created rows (default: utcnow)
+
+        Returns:
+            Counts: subscribers, quota_blocked, approvals, pending,
+            copy_executions, copy_blocked, notified, paper_fills
+        """
+        now = now or datetime.utcnow()
+        counts = dict.fromkeys(
+            (
+                "subscribers",
+                "quota_blocked",
+                "approvals",
+                "pending",
+                "copy_executions",
+                "copy_blocked",
+                "notified",
+                "paper_fills",
+            ),
+            0,
+        )
+
+        subscribers = await self._load_subscribers(signal)
+        counts["subscribers"] = len(subscribers)
+        if not subscribers:
+            return counts
+
+        allowed = await QuotaService(self.db).consume_batch(
+            {user_id: sub["tier"] for user_id, sub in subscribers.items()},
+            QuotaType.SIGNALS_PER_DAY.value,
+        )
+        counts["quota_blocked"] = len(subscribers) - len(allowed)
+
+        volume = DEFAULT_LOT_SIZE
+        if isinstance(signal.payload, dict):
+            volume = float(signal.payload.get("lot_size", DEFAULT_LOT_SIZE))
+
+        approvals: list[dict[str, Any]] = []
+        executions: list[dict[str, Any]] = []
+        copy_users: list[str] = []
+        notifications: list[tuple[dict[str, Any], str, float]] = []
+
+        for user_id, sub in subscribers.items():
+            if user_id not in allowed:
+                continue
+            approval_id = str(uuid.uuid4())
+            copy = self._copy_eligible(sub)
+            if sub["copy_enabled"] and not copy:
+                counts["copy_blocked"] += 1
+
+            approvals.append(
+                {
+                    "id": approval_id,
+                    "signal_id": signal.id,
+                    "client_id": sub["client_id"],
+                    "user_id": user_id,
+                    "decision": ApprovalDecision.APPROVED.value if copy else None,
+                    "consent_version": 1,
+                    "created_at": now,
+                }
+            )
+            if copy:
+                executed_volume = min(
+                    volume * sub["risk_multiplier"], sub["max_position_size_lot"]
+                )
+                executions.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "user_id": user_id,
+                        "signal_id": signal.id,
+                        "original_volume": volume,
+                        "executed_volume": executed_volume,
+                        "markup_percent": CopyTradingService.MARKUP_PERCENT,
+                        "status": "executed",
+                        "executed_at": now,
+                    }
+                )
+                copy_users.append(user_id)
+                notifications.append(
+                    (approvals[-1], "copy_trade_executed", executed_volume)
+                )
+            else:
+                notifications.append((approvals[-1], "signal_approval_request", volume))
+
+        if not approvals:
+            return counts
+
+        quota = QuotaService(self.db)
+        try:
+            inserted = await self._insert_approvals(approvals)
+            executions = [e for e in executions if e["user_id"] in inserted]
+            copy_users = [u for u in copy_users if u in inserted]
+            for chunk in _chunks(executions):
+                await self.db.execute(insert(CopyTradeExecution), chunk)
+            for chunk in _chunks(copy_users):
+                await self.db.execute(
+                    update(CopyTradeSettings)
+                    .where(CopyTradeSettings.user_id.in_(chunk))
+                    .values(trades_today=CopyTradeSettings.trades_today + 1)
+                    .execution_options(synchronize_session=False)
+                )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            await quota.refund_batch(
+                {a["user_id"]: subscribers[a["user_id"]]["tier"] for a in approvals},
+                QuotaType.SIGNALS_PER_DAY.value,
+            )
+            raise
+
+        # Approved concurrently by another fan-out: their quota is given back
+        await quota.refund_batch(
+            {
+                a["user_id"]: subscribers[a["user_id"]]["tier"]
+                for a in approvals
+                if a["user_id"] not in inserted
+            },
+            QuotaType.SIGNALS_PER_DAY.value,
+        )
+        notifications = [n for n in notifications if n[0]["user_id"] in inserted]
+
+        counts["approvals"] = len(inserted)
+        counts["copy_executions"] = len(executions)
+        counts["pending"] = len(inserted) - len(executions)
+
+        counts["notified"] = await self._notify(signal, subscribers, notifications)
+        if self.paper_book is not None:
+            counts["paper_fills"] = await self._fill_paper(signal, inserted, volume)
+
+        logger.info(
+            f"Signal {signal.id} fanned out to {len(inserted)} subscribers",
+            extra={"signal_id": signal.id, **counts},
+        )
+        return counts
+
+    async def _insert_approvals(self, approvals: list[dict[str, Any]]) -> set[str]:
+        """Insert approvals, skipping (signal, user) pairs that already exist.
+
+        Returns:
+            User IDs whose approval was inserted
+        """
+        insert_ = (
+            pg_insert
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        inserted: set[str] = set()
+        for chunk in _chunks(approvals):
+            result = await self.db.execute(
+                insert_(Approval)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["signal_id", "user_id"])
+                .returning(Approval.user_id)
+            )
+            inserted.update(result.scalars())
+        return inserted
+
+    async def _fill_paper(
+        self, signal: Signal, user_ids: set[str], volume: float
+    ) -> int:
+        """Fill the signal in the paper accounts of user_ids (one book call).
+
+        Returns:
+            Number of paper fills
+        """
+        assert self.paper_book is not None
+        accounts = await self.db.scalars(
+            select(PaperAccount).where(
+                PaperAccount.user_id.in_(user_ids), PaperAccount.enabled.is_(True)
+            )
+        )
+        account_ids = [str(account.id) for account in accounts]
+        if not account_ids:
+            return 0
+
+        price = Decimal(str(signal.price))
+        payload = signal.payload if isinstance(signal.payload, dict) else {}
+        fills = await self.paper_book.fill_orders(
+            self.db,
+            signal.instrument,
+            TradeSide.BUY if signal.side == 0 else TradeSide.SELL,
+            Decimal(str(payload.get("bid", price))),
+            Decimal(str(payload.get("ask", price))),
+            dict.fromkeys(account_ids, Decimal(str(volume))),
+        )
+        return len(fills)
+
+    async def _load_subscribers(self, signal: Signal) -> dict[str, dict[str, Any]]:
+        """Eligible subscribers keyed by user ID (one query)."""
+        already_approved = exists().where(
+            Approval.signal_id == signal.id, Approval.user_id == User.id
+        )
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.telegram_user_id,
+                Subscription.tier,
+                Client.id.label("client_id"),
+                CopyTradeSettings.enabled,
+                CopyTradeSettings.is_paused,
+                CopyTradeSettings.trades_today,
+                CopyTradeSettings.max_daily_trades,
+                CopyTradeSettings.risk_multiplier,
+                CopyTradeSettings.max_position_size_lot,
+            )
+            .select_from(User)
+            .join(Subscription, Subscription.user_id == User.id)
+            .outerjoin(Client, Client.email == User.email)
+            .outerjoin(CopyTradeSettings, CopyTradeSettings.user_id == User.id)
+            .where(
+                Subscription.status == "active",
+                User.id != signal.user_id,
+                ~already_approved,
+            )
+        )
+
+        subscribers: dict[str, dict[str, Any]] = {}
+        for row in result:
+            tier = row.tier or SubscriptionTier.FREE.value
+            current = subscribers.get(row.id)
+            # Several active subscriptions: the highest tier wins
+            if current is not None and _TIER_RANK.get(
+                current["tier"], 0
+            ) >= _TIER_RANK.get(tier, 0):
+                continue
+            subscribers[row.id] = {
+                "tier": tier,
+                "telegram_user_id": row.telegram_user_id,
+                "client_id": row.client_id,
+                "copy_enabled": bool(row.enabled),
+                "is_paused": bool(row.is_paused),
+                "trades_today": row.trades_today or 0,
+                "max_daily_trades": row.max_daily_trades or 0,
+                "risk_multiplier": row.risk_multiplier or 1.0,
+                "max_position_size_lot": row.max_position_size_lot or 0.0,
+            }
+        return subscribers
+
+    @staticmethod
+    def _copy_eligible(sub: dict[str, Any]) -> bool:
+        """Copy-trading guard rails (as CopyTradingService.can_copy_execute)."""
+        return (
+            sub["copy_enabled"]
+            and not sub["is_paused"]
+            and sub["trades_today"] < sub["max_daily_trades"]
+        )
+
+    async def _notify(
+        self,
+        signal: Signal,
+        subscribers: dict[str, dict[str, Any]],
+        notifications: list[tuple[dict[str, Any], str, float]],
+    ) -> int:
+        """Publish EA and Telegram notifications in one pipeline.
+
+        Returns:
+            Number of notifications sent (0 if the pipeline failed; approvals
+            are committed already and EAs still find them by polling)
+        """
+        side = "buy" if signal.side == 0 else "sell"
+        messages: list[str] = []
+        sent = 0
+
+        redis_client = self.redis_client or await get_redis()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for approval, template_name, volume in notifications:
+                    sub = subscribers[approval["user_id"]]
+                    if approval["decision"] is not None and approval["client_id"]:
+                        pipe.publish(
+                            EA_APPROVAL_CHANNEL.format(client_id=approval["client_id"]),
+                            json.dumps(
+                                {
+                                    "approval_id": approval["id"],
+                                    "signal_id": signal.id,
+                                }
+                            ),
+                        )
+                        sent += 1
+                    if sub["telegram_user_id"]:
+                        message = build_message(
+                            approval["user_id"],
+                            "telegram",
+                            template_name,
+                            {
+                                "instrument": signal.instrument,
+                                "side": side,
+                                "entry_price": signal.price,
+                                "volume": round(volume, 2),
+                            },
+                        )
+                        messages.append(json.dumps(message))
+                if messages:
+                    pipe.rpush(TRANSACTIONAL_QUEUE, *messages)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(
+                f"Failed to notify fan-out for signal {signal.id}: {e}",
+                exc_info=True,
+                extra={"signal_id": signal.id},
+            )
+            return 0
+
+        if messages:
+            messages_enqueued_total.labels(
+                priority="transactional", channel="telegram"
+            ).inc(len(messages))
+        return sent + len(messages)
@@ -3,18 +3,22 @@
 import logging
 from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.approvals.fanout import ApprovalFanout
 from backend.app.approvals.models import Approval, ApprovalDecision
 from backend.app.approvals.schema import ApprovalCreate, ApprovalOut, PendingApprovalOut
 from backend.app.approvals.service import ApprovalService
-from backend.app.auth.dependencies import get_current_user
+from backend.app.auth.dependencies import get_current_user, require_admin
 from backend.app.auth.jwt_handler import JWTHandler
 from backend.app.auth.models import User
 from backend.app.core.db import get_db
+from backend.app.core.pagination import CountMode, InvalidCursorError, paginate
 from backend.app.observability import get_metrics
+from backend.app.paper.book import PaperBook, get_paper_book
 from backend.app.signals.models import Signal, SignalStatus
 
 logger = logging.getLogger(__name__)
@@ -274,6 +278,51 @@ async def get_pending_approvals(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
+@router.post("/approvals/fanout/{signal_id}", response_model=dict[str, int])
+async def fan_out_signal(
+    signal_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+    paper_book: PaperBook = Depends(get_paper_book),
+) -> dict[str, int]:
+    """Fan a signal out to every eligible subscriber (admin/owner only).
+
+    Creates pending approvals (or copy-trade executions) in bulk, notifies
+    EAs and Telegram, and paper-trades the signal for subscribers with a
+    paper account. Safe to repeat: subscribers that already have an
+    approval for the signal are skipped.
+
+    Args:
+        signal_id: Signal ID
+        db: Database session
+        current_user: Authenticated admin/owner
+        paper_book: Paper book for subscribers' paper accounts
+
+    Returns:
+        dict[str, int]: Fan-out counts
+
+    Raises:
+        HTTPException: 404 if the signal does not exist, 409 if the writes
+            conflict with concurrent changes (consumed quota is refunded)
+    """
+    signal = await db.get(Signal, signal_id)
+    if signal is None:
+        raise HTTPException(status_code=404, detail="Signal not found")
+    try:
+        counts: dict[str, int] = await ApprovalFanout(
+            db, paper_book=paper_book
+        ).fan_out(signal)
+        return counts
+    except IntegrityError as e:
+        logger.warning(
+            f"Fan-out conflict for signal {signal_id}: {e}",
+            extra={"signal_id": signal_id},
+        )
+        raise HTTPException(
+            status_code=409, detail="Fan-out conflicted with concurrent changes"
+        ) from e
+
+
 @router.get("/approvals/{approval_id}", response_model=ApprovalOut)
 async def get_approval(
     approval_id: str,
@@ -326,31 +375,44 @@ async def get_approval(
 
 @router.get("/approvals", response_model=list[ApprovalOut])
 async def list_approvals(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
 ) -> list[ApprovalOut]:
     """List approvals for current user.
 
+    When more approvals exist, the X-Next-Cursor response header carries a
+    keyset cursor; pass it back as `cursor` to fetch the next page without
+    OFFSET.
+
     Args:
+        response: Response (for the X-Next-Cursor header)
         db: Database session
         current_user: Authenticated user
-        skip: Pagination skip
+        skip: Pagination skip (ignored when cursor is given)
         limit: Pagination limit
+        cursor: Keyset cursor from a previous X-Next-Cursor header
 
     Returns:
         list[ApprovalOut]: List of approvals
     """
     try:
-        result = await db.execute(
-            select(Approval)
-            .where(Approval.user_id == current_user.id)
-            .order_by(Approval.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        page = await paginate(
+            db,
+            select(Approval).where(Approval.user_id == current_user.id),
+            sort_column=Approval.created_at,
+            id_column=Approval.id,
+            limit=limit,
+            cursor=cursor,
+            offset=skip,
+            count=CountMode.NONE,
         )
-        approvals = result.scalars().all()
+        approvals = page.items
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         return [
             ApprovalOut(
@@ -369,6 +431,8 @@ async def list_approvals(
             for a in approvals
         ]
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=e.detail) from e
     except Exception as e:
         logger.error(f"Failed to list approvals: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error") from e
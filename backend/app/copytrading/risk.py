@@ -8,12 +8,21 @@ This module implements risk parameter enforcement for copy-trading:
 - Daily stop loss (% accumulated losses today)
 
 All evaluations trigger Telegram alerts on breach and force pause on violation.
+
+evaluate_risk_batch() applies the same checks to every follower of a signal
+at once: settings are loaded in chunked IN queries, the limits are evaluated
+as numpy arrays, breached users are paused with bulk UPDATEs, and the
+Telegram/audit side-effects run in a background task (await drain() to wait
+for them).
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -46,6 +55,15 @@ BREACH_MAX_TRADE_RISK = "max_trade_risk_exceeded"
 BREACH_TOTAL_EXPOSURE = "total_exposure_exceeded"
 BREACH_DAILY_STOP = "daily_stop_exceeded"
 
+# Defaults when a risk parameter is unset (match evaluate_risk)
+DEFAULT_MAX_LEVERAGE = 5.0
+DEFAULT_MAX_TRADE_RISK = 2.0
+DEFAULT_MAX_EXPOSURE = 50.0
+DEFAULT_DAILY_STOP = 10.0
+
+# Users per IN query / bulk UPDATE in evaluate_risk_batch
+RISK_BATCH_CHUNK_SIZE = 1000
+
 
 class RiskEvaluator:
     """
@@ -67,6 +85,7 @@ class RiskEvaluator:
         """
         self.telegram_service = telegram_service
         self.audit_service = audit_service
+        self._side_effects: set[asyncio.Task] = set()
 
     async def evaluate_risk(
         self,
@@ -121,7 +140,7 @@ class RiskEvaluator:
         if entry_price > 0 and equity > 0:
             trade_value = trade_volume * entry_price
             trade_leverage = trade_value / equity
-            max_leverage = settings.max_leverage or 5.0
+            max_leverage = settings.max_leverage or DEFAULT_MAX_LEVERAGE
 
             if trade_leverage > max_leverage:
                 breach_reason = BREACH_MAX_LEVERAGE
@@ -138,7 +157,9 @@ class RiskEvaluator:
         if equity > 0 and entry_price > 0 and sl_price > 0:
             risk_per_trade = abs(entry_price - sl_price) * trade_volume
             risk_percent = (risk_per_trade / equity) * 100
-            max_trade_risk = settings.max_per_trade_risk_percent or 2.0
+            max_trade_risk = (
+                settings.max_per_trade_risk_percent or DEFAULT_MAX_TRADE_RISK
+            )
 
             if risk_percent > max_trade_risk:
                 breach_reason = BREACH_MAX_TRADE_RISK
@@ -156,7 +177,7 @@ class RiskEvaluator:
             new_position_value = trade_volume * entry_price
             total_exposure_value = open_positions_value + new_position_value
             total_exposure_percent = (total_exposure_value / equity) * 100
-            max_exposure = settings.total_exposure_percent or 50.0
+            max_exposure = settings.total_exposure_percent or DEFAULT_MAX_EXPOSURE
 
             if total_exposure_percent > max_exposure:
                 breach_reason = BREACH_TOTAL_EXPOSURE
@@ -172,7 +193,7 @@ class RiskEvaluator:
         # Check 4: Daily Stop Loss (accumulated losses today)
         if equity > 0:
             daily_loss_percent = (todays_loss / equity) * 100
-            daily_stop = settings.daily_stop_percent or 10.0
+            daily_stop = settings.daily_stop_percent or DEFAULT_DAILY_STOP
 
             if daily_loss_percent > daily_stop:
                 breach_reason = BREACH_DAILY_STOP
@@ -187,6 +208,237 @@ class RiskEvaluator:
 
         return True, None
 
+    async def evaluate_risk_batch(
+        self,
+        db: AsyncSession,
+        proposed_trade: dict,
+        account_states: dict[str, dict],
+        volumes: dict[str, float] | None = None,
+    ) -> dict[str, tuple[bool, str | None]]:
+        """
+        Evaluate one proposed trade for many copy traders at once.
+
+        Applies the same checks, in the same order, as evaluate_risk. Settings
+        are loaded with one IN query per chunk of users and the limits are
+        evaluated as arrays. Breached users are paused with one UPDATE per
+        breach type and chunk and a single commit; their Telegram alerts and
+        audit events are queued in the background (see drain()).
+
+        Args:
+            db: Database session
+            proposed_trade: Dict with: instrument, side, entry_price, volume, sl_price, tp_price
+            account_states: Account state per user ID (equity, open_positions_value, todays_loss)
+            volumes: Optional per-user volume overriding proposed_trade["volume"]
+                (e.g. after risk_multiplier scaling)
+
+        Returns:
+            Dict of user ID -> (can_execute, breach_reason or None)
+
+        Example:
+            >>> decisions = await evaluator.evaluate_risk_batch(
+            ...     db,
+            ...     {"instrument": "GOLD", "entry_price": 1950, "volume": 1.0, "sl_price": 1940},
+            ...     {"user-1": {"equity": 10000}, "user-2": {"equity": 500}},
+            ... )
+            >>> allowed = [uid for uid, (ok, _) in decisions.items() if ok]
+        """
+        user_ids = list(account_states)
+        decisions: dict[str, tuple[bool, str | None]] = {}
+        if not user_ids:
+            return decisions
+
+        settings: dict[str, Any] = {}
+        for start in range(0, len(user_ids), RISK_BATCH_CHUNK_SIZE):
+            chunk = user_ids[start : start + RISK_BATCH_CHUNK_SIZE]
+            result = await db.execute(
+                select(
+                    CopyTradeSettings.user_id,
+                    CopyTradeSettings.enabled,
+                    CopyTradeSettings.is_paused,
+                    CopyTradeSettings.pause_reason,
+                    CopyTradeSettings.tier,
+                    CopyTradeSettings.max_leverage,
+                    CopyTradeSettings.max_per_trade_risk_percent,
+                    CopyTradeSettings.total_exposure_percent,
+                    CopyTradeSettings.daily_stop_percent,
+                ).where(CopyTradeSettings.user_id.in_(chunk))
+            )
+            settings.update((row.user_id, row) for row in result)
+
+        candidates = []
+        for user_id in user_ids:
+            row = settings.get(user_id)
+            if row is None or not row.enabled:
+                decisions[user_id] = (False, "copy_trading_not_enabled")
+            elif row.is_paused:
+                decisions[user_id] = (False, f"copy_trading_paused: {row.pause_reason}")
+            else:
+                decisions[user_id] = (True, None)
+                candidates.append(row)
+        if not candidates:
+            return decisions
+
+        volumes = volumes or {}
+        default_volume = proposed_trade.get("volume", 0)
+        entry_price = float(proposed_trade.get("entry_price", 0) or 0)
+        sl_price = float(proposed_trade.get("sl_price", 0) or 0)
+
+        states = [account_states[row.user_id] for row in candidates]
+        equity = np.array([s.get("equity", 0) for s in states], dtype=float)
+        open_value = np.array(
+            [s.get("open_positions_value", 0) for s in states], dtype=float
+        )
+        todays_loss = np.array([s.get("todays_loss", 0) for s in states], dtype=float)
+        volume = np.array(
+            [volumes.get(row.user_id, default_volume) for row in candidates],
+            dtype=float,
+        )
+        max_leverage = np.array(
+            [row.max_leverage or DEFAULT_MAX_LEVERAGE for row in candidates]
+        )
+        max_trade_risk = np.array(
+            [
+                row.max_per_trade_risk_percent or DEFAULT_MAX_TRADE_RISK
+                for row in candidates
+            ]
+        )
+        max_exposure = np.array(
+            [row.total_exposure_percent or DEFAULT_MAX_EXPOSURE for row in candidates]
+        )
+        daily_stop = np.array(
+            [row.daily_stop_percent or DEFAULT_DAILY_STOP for row in candidates]
+        )
+
+        funded = equity > 0
+        safe_equity = np.where(funded, equity, 1.0)
+        trade_value = volume * entry_price
+
+        leverage = trade_value / safe_equity
+        risk_percent = abs(entry_price - sl_price) * volume / safe_equity * 100
+        exposure_percent = (open_value + trade_value) / safe_equity * 100
+        daily_loss_percent = todays_loss / safe_equity * 100
+
+        breaches = np.select(
+            [
+                funded & (entry_price > 0) & (leverage > max_leverage),
+                funded
+                & (entry_price > 0)
+                & (sl_price > 0)
+                & (risk_percent > max_trade_risk),
+                funded & (exposure_percent > max_exposure),
+                funded & (daily_loss_percent > daily_stop),
+            ],
+            [
+                BREACH_MAX_LEVERAGE,
+                BREACH_MAX_TRADE_RISK,
+                BREACH_TOTAL_EXPOSURE,
+                BREACH_DAILY_STOP,
+            ],
+            default="",
+        )
+
+        breached: list[tuple[Any, str, str]] = []
+        for i in np.flatnonzero(breaches != ""):
+            row, reason = candidates[i], str(breaches[i])
+            if reason == BREACH_MAX_LEVERAGE:
+                detail = f"Max leverage {max_leverage[i]}x exceeded: {leverage[i]:.2f}x"
+            elif reason == BREACH_MAX_TRADE_RISK:
+                detail = (
+                    f"Max trade risk {max_trade_risk[i]}% exceeded: "
+                    f"{risk_percent[i]:.2f}%"
+                )
+            elif reason == BREACH_TOTAL_EXPOSURE:
+                detail = (
+                    f"Max exposure {max_exposure[i]}% exceeded: "
+                    f"{exposure_percent[i]:.2f}%"
+                )
+            else:
+                detail = (
+                    f"Daily stop {daily_stop[i]}% exceeded: "
+                    f"{daily_loss_percent[i]:.2f}% loss"
+                )
+            decisions[row.user_id] = (False, reason)
+            breached.append((row, reason, detail))
+
+        if breached:
+            await self._pause_batch(db, breached)
+
+        return decisions
+
+    async def _pause_batch(
+        self, db: AsyncSession, breached: list[tuple[Any, str, str]]
+    ) -> None:
+        """
+        Pause every breached user in bulk and queue their alerts.
+
+        Args:
+            db: Database session
+            breached: (settings row, breach_reason, detailed_message) per user
+        """
+        now = datetime.utcnow()
+        by_reason: dict[str, list[str]] = {}
+        for row, reason, _ in breached:
+            by_reason.setdefault(reason, []).append(row.user_id)
+
+        for reason, user_ids in by_reason.items():
+            for start in range(0, len(user_ids), RISK_BATCH_CHUNK_SIZE):
+                await db.execute(
+                    update(CopyTradeSettings)
+                    .where(
+                        CopyTradeSettings.user_id.in_(
+                            user_ids[start : start + RISK_BATCH_CHUNK_SIZE]
+                        )
+                    )
+                    .values(
+                        is_paused=True,
+                        pause_reason=reason,
+                        paused_at=now,
+                        last_breach_at=now,
+                        last_breach_reason=reason,
+                    )
+                )
+        await db.commit()
+
+        if copy_risk_block_counter:
+            try:
+                for row, reason, _ in breached:
+                    copy_risk_block_counter.labels(
+                        reason=reason, user_tier=row.tier or "unknown"
+                    ).inc()
+            except Exception as e:
+                logger.error(f"Failed to increment Prometheus metric: {e}")
+
+        logger.warning(
+            f"Copy-trading breach detected for {len(breached)} users",
+            extra={
+                "breaches": {
+                    reason: len(user_ids) for reason, user_ids in by_reason.items()
+                }
+            },
+        )
+
+        if self.telegram_service or self.audit_service:
+            task = asyncio.create_task(self._alert_breaches(breached))
+            self._side_effects.add(task)
+            task.add_done_callback(self._side_effects.discard)
+
+    async def _alert_breaches(self, breached: list[tuple[Any, str, str]]) -> None:
+        """Send breach alerts and audit events, a chunk at a time."""
+        for start in range(0, len(breached), RISK_BATCH_CHUNK_SIZE):
+            await asyncio.gather(
+                *(
+                    self._alert_breach(row.user_id, reason, detail)
+                    for row, reason, detail in breached[
+                        start : start + RISK_BATCH_CHUNK_SIZE
+                    ]
+                )
+            )
+
+    async def drain(self) -> None:
+        """Wait for queued breach alerts and audit events to finish."""
+        while self._side_effects:
+            await asyncio.gather(*self._side_effects)
+
     async def _handle_breach(
         self,
         db: AsyncSession,
@@ -236,6 +488,21 @@ class RiskEvaluator:
             },
         )
 
+        await self._alert_breach(user_id, breach_reason, detailed_message)
+
+    async def _alert_breach(
+        self, user_id: str, breach_reason: str, detailed_message: str
+    ) -> None:
+        """
+        Send the Telegram alert and audit event for a breach.
+
+        Failures are logged and never raised: the user is already paused.
+
+        Args:
+            user_id: User identifier
+            breach_reason: Type of breach (BREACH_MAX_LEVERAGE, etc.)
+            detailed_message: Human-readable breach details
+        """
         # Send Telegram alert
         if self.telegram_service:
             try:
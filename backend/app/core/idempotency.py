@@ -11,16 +11,20 @@ Implements:
 - Error recovery with safe retries
 """
 
+import asyncio
 import hashlib
 import hmac
 import json
 import logging
+import time
+import zlib
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, cast
 
 import redis
 from pydantic import BaseModel, Field
+from redis.client import NEVER_DECODE
 
 logger = logging.getLogger(__name__)
 
@@ -542,12 +546,186 @@ class IdempotencyStorage:
         raise NotImplementedError
 
 
+# Outcomes of RedisIdempotencyStorage.check_or_lock()
+CHECK_BUSY = 0  # another request holds the lock
+CHECK_HIT = 1  # cached response returned
+CHECK_LOCKED = 2  # lock acquired by caller
+
+# Stored in place of a payload when the request completed but its response
+# was too large to cache; retries must not re-execute it
+RESPONSE_NOT_CACHED = b"not-cached"
+
+
+def encode_response_payload(
+    status_code: int, headers: list[tuple[str, str]], body: bytes
+) -> bytes:
+    """Pack a captured response into compressed raw bytes.
+
+    Layout (before zlib): 4-byte big-endian header length, JSON header
+    ({"status_code", "headers"}), then the raw body bytes untouched.
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers as (name, value) pairs
+        body: Raw response body
+
+    Returns:
+        bytes: zlib-compressed payload
+    """
+    header = json.dumps({"status_code": status_code, "headers": headers}).encode()
+    return zlib.compress(len(header).to_bytes(4, "big") + header + body, 1)
+
+
+def decode_response_payload(
+    payload: bytes,
+) -> tuple[int, list[tuple[str, str]], bytes]:
+    """Unpack a payload produced by encode_response_payload().
+
+    Args:
+        payload: Compressed payload bytes
+
+    Returns:
+        tuple: (status_code, headers, body)
+    """
+    raw = zlib.decompress(payload)
+    size = int.from_bytes(raw[:4], "big")
+    header = json.loads(raw[4 : 4 + size])
+    headers = [(name, value) for name, value in header["headers"]]
+    return header["status_code"], headers, raw[4 + size :]
+
+
+# Single round trip: return cached payload, else try to take the lock.
+# KEYS: response key, lock key. ARGV: lock ttl.
+_CHECK_OR_LOCK_SCRIPT = """
+local cached = redis.call('GET', KEYS[1])
+if cached then
+    return {1, cached}
+end
+if redis.call('SET', KEYS[2], 'locked', 'NX', 'EX', ARGV[1]) then
+    return {2, ''}
+end
+return {0, ''}
+"""
+
+
 class RedisIdempotencyStorage(IdempotencyStorage):
-    """Redis implementation of idempotency storage."""
+    """Redis implementation of idempotency storage.
+
+    Besides the dict-based get/set/lock API, supports the middleware fast
+    path: check_or_lock() in one Lua call, compressed raw-byte payloads
+    (complete()), and pub/sub completion notifications for waiters.
+    """
 
     def __init__(self, redis_client: Any):
         self.redis = redis_client
 
+    @staticmethod
+    def _response_key(key: str) -> str:
+        # Versioned: get()/set() still write JSON under idempotency:response:
+        return f"idempotency:v2:response:{key}"
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"idempotency:lock:{key}"
+
+    @staticmethod
+    def _done_channel(key: str) -> str:
+        return f"idempotency:done:{key}"
+
+    async def check_or_lock(self, key: str, ttl: int) -> tuple[int, bytes | None]:
+        """Return the cached payload or take the processing lock, atomically.
+
+        Args:
+            key: Idempotency key
+            ttl: Lock TTL in seconds
+
+        Returns:
+            tuple: (CHECK_HIT, payload) | (CHECK_LOCKED, None) | (CHECK_BUSY, None)
+        """
+        response_key, lock_key = self._response_key(key), self._lock_key(key)
+        try:
+            outcome, payload = await self.redis.execute_command(
+                "EVAL",
+                _CHECK_OR_LOCK_SCRIPT,
+                2,
+                response_key,
+                lock_key,
+                ttl,
+                **{NEVER_DECODE: True},
+            )
+            outcome = int(outcome)
+            return outcome, payload if outcome == CHECK_HIT else None
+        except Exception as e:
+            # Scripting unavailable (e.g. fakeredis without Lua): two round trips
+            logger.debug(f"check_or_lock script unavailable, falling back: {e}")
+
+        payload = await self.redis.execute_command(
+            "GET", response_key, **{NEVER_DECODE: True}
+        )
+        if payload:
+            return CHECK_HIT, payload
+        if await self.redis.set(lock_key, "locked", ex=ttl, nx=True):
+            return CHECK_LOCKED, None
+        return CHECK_BUSY, None
+
+    async def get_payload(self, key: str) -> bytes | None:
+        """Fetch the raw cached payload for a key (no lock)."""
+        payload = await self.redis.execute_command(
+            "GET", self._response_key(key), **{NEVER_DECODE: True}
+        )
+        return cast(bytes | None, payload)
+
+    async def complete(self, key: str, payload: bytes | None, ttl: int) -> None:
+        """Store the payload (if any), release the lock and notify waiters.
+
+        Runs as a single MULTI/EXEC round trip.
+
+        Args:
+            key: Idempotency key
+            payload: Encoded response, RESPONSE_NOT_CACHED, or None when the
+                request did not complete (waiters then retry and may process
+                the request themselves)
+            ttl: Response TTL in seconds
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if payload is not None:
+                pipe.set(self._response_key(key), payload, ex=ttl)
+            pipe.delete(self._lock_key(key))
+            pipe.publish(self._done_channel(key), "1")
+            await pipe.execute()
+
+    async def wait_for_completion(self, key: str, timeout: float) -> bool:
+        """Block until the lock holder for key completes, or timeout.
+
+        Subscribes first and then re-checks the lock, so a completion that
+        lands between the caller's check and the subscribe is not missed.
+
+        Args:
+            key: Idempotency key
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if completion was observed (or the lock is gone)
+        """
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.subscribe(self._done_channel(key))
+            if not await self.redis.exists(self._lock_key(key)):
+                return True
+
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is not None:
+                    return True
+                await asyncio.sleep(0)
+            return False
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
     async def get(self, key: str) -> dict[str, Any] | None:
         try:
             cached = await self.redis.get(f"idempotency:response:{key}")
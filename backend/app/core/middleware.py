@@ -1,18 +1,25 @@
 """Request ID middleware for correlation tracking."""
 
-import json
 import logging
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from contextvars import ContextVar
 from typing import cast
 
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from backend.app.core.idempotency import RedisIdempotencyStorage
+from backend.app.core.idempotency import (
+    CHECK_BUSY,
+    CHECK_HIT,
+    RESPONSE_NOT_CACHED,
+    RedisIdempotencyStorage,
+    decode_response_payload,
+    encode_response_payload,
+)
 from backend.app.core.redis import get_redis
 
 # Context variable for request ID
@@ -49,10 +56,28 @@ def get_request_id() -> str:
     return request_id_var.get()
 
 
+# Responses larger than this stream straight through and are not cached
+MAX_CACHED_BODY_BYTES = 256 * 1024
+
+# Processing lock TTL and cached response TTL (seconds)
+IDEMPOTENCY_LOCK_TTL = 60
+IDEMPOTENCY_RESPONSE_TTL = 86400
+
+# How long a duplicate request waits for the in-flight original (seconds)
+IDEMPOTENCY_WAIT_TIMEOUT = 10.0
+
+
 class IdempotencyMiddleware(BaseHTTPMiddleware):
     """
     Middleware to ensure idempotency for POST/PATCH requests.
     Uses Redis to store response for a given Idempotency-Key.
+
+    - One Lua round trip returns the cached response or takes the lock
+    - Duplicates of an in-flight request wait for its completion
+      notification (pub/sub) instead of failing fast with 409
+    - Response bodies are captured as a chunk list and cached as compressed
+      raw bytes; bodies over MAX_CACHED_BODY_BYTES stream through and are
+      recorded as completed but not cached, so retries get 409
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -68,80 +93,143 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         try:
             redis_client = await get_redis()
             storage = RedisIdempotencyStorage(redis_client)
+            outcome, payload = await self._check_or_wait(storage, key)
+        except Exception as e:
+            # Can't check idempotency: proceed (risks duplication) but log
+            logger.error(f"Idempotency middleware error: {e}", exc_info=True)
+            return cast(Response, await call_next(request))
 
-            # 1. Check cache
-            cached = await storage.get(key)
-            if cached:
-                logger.info(f"Idempotency hit for key: {key}")
-                headers = MutableHeaders(headers=cached.get("headers", {}))
-                headers["X-Idempotency-Hit"] = "true"
-                return JSONResponse(
-                    content=cached.get("body"),
-                    status_code=cached.get("status_code", 200),
-                    headers=headers,
-                )
-
-            # 2. Acquire lock
-            # TTL: 60s for processing lock
-            if not await storage.lock(key, ttl=60):
-                logger.warning(f"Idempotency conflict for key: {key}")
-                return JSONResponse(
-                    content={"detail": "Request already in progress"}, status_code=409
-                )
-
-            # 3. Process request
+        # 1. Cached response: replay raw bytes
+        if outcome == CHECK_HIT and payload == RESPONSE_NOT_CACHED:
+            logger.warning(f"Idempotency replay unavailable for key: {key}")
+            return self._not_replayable()
+        if outcome == CHECK_HIT and payload is not None:
             try:
-                response = cast(Response, await call_next(request))
-
-                # We can only cache successful responses or specific errors?
-                # Usually we cache everything to ensure idempotency.
-                # But we need to read the body.
-
-                response_body = b""
-                async for chunk in response.body_iterator:  # type: ignore
-                    response_body += chunk
-
-                # Reconstruct response for return
-                new_response = Response(
-                    content=response_body,
+                replay = self._replay(payload)
+            except Exception as e:
+                # Unreadable entry: the request already ran, so never re-run it
+                logger.warning(f"Idempotency payload for key {key} unreadable: {e}")
+                return self._not_replayable()
+            logger.info(f"Idempotency hit for key: {key}")
+            return replay
+
+        # 2. Original still in flight after waiting
+        if outcome == CHECK_BUSY:
+            logger.warning(f"Idempotency conflict for key: {key}")
+            return JSONResponse(
+                content={"detail": "Request already in progress"}, status_code=409
+            )
+
+        # 3. Lock held: process request and capture the response
+        try:
+            response = cast(Response, await call_next(request))
+        except Exception:
+            await self._complete(storage, key, None)
+            raise
+
+        return await self._capture(storage, key, response)
+
+    @staticmethod
+    async def _check_or_wait(
+        storage: RedisIdempotencyStorage, key: str
+    ) -> tuple[int, bytes | None]:
+        """Check/lock, blocking on completion notifications while busy."""
+        deadline = time.monotonic() + IDEMPOTENCY_WAIT_TIMEOUT
+        while True:
+            outcome, payload = await storage.check_or_lock(
+                key, ttl=IDEMPOTENCY_LOCK_TTL
+            )
+            remaining = deadline - time.monotonic()
+            if outcome != CHECK_BUSY or remaining <= 0:
+                return outcome, payload
+            if not await storage.wait_for_completion(key, remaining):
+                return CHECK_BUSY, None
+
+    @staticmethod
+    def _not_replayable() -> Response:
+        """409 for a request that already ran but cannot be replayed."""
+        return JSONResponse(
+            content={"detail": "Request already processed; response is not replayable"},
+            status_code=409,
+        )
+
+    @staticmethod
+    def _replay(payload: bytes) -> Response:
+        """Build a response from a cached payload without re-serializing."""
+        status_code, headers, body = decode_response_payload(payload)
+        response = Response(content=body, status_code=status_code)
+        response.raw_headers = [
+            (name.encode("latin-1"), value.encode("latin-1")) for name, value in headers
+        ]
+        response.headers["X-Idempotency-Hit"] = "true"
+        return response
+
+    @staticmethod
+    async def _complete(
+        storage: RedisIdempotencyStorage, key: str, payload: bytes | None
+    ) -> None:
+        """Store payload, release lock and notify waiters (errors logged)."""
+        try:
+            await storage.complete(key, payload, ttl=IDEMPOTENCY_RESPONSE_TTL)
+        except Exception as e:
+            logger.error(f"Idempotency completion failed for key {key}: {e}")
+
+    async def _capture(
+        self, storage: RedisIdempotencyStorage, key: str, response: Response
+    ) -> Response:
+        """Capture the body as chunks; cache it or stream it through."""
+        chunks: list[bytes] = []
+        size = 0
+        body_iterator = response.body_iterator  # type: ignore[attr-defined]
+
+        async for chunk in body_iterator:
+            if isinstance(chunk, str):
+                chunk = chunk.encode(response.charset)
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_CACHED_BODY_BYTES:
+                logger.info(
+                    f"Idempotency passthrough for key {key}: body over "
+                    f"{MAX_CACHED_BODY_BYTES} bytes is not cached"
+                )
+                return StreamingResponse(
+                    self._stream_through(storage, key, chunks, body_iterator),
                     status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
+                    headers=MutableHeaders(raw=list(response.raw_headers)),
+                    background=response.background,
                 )
 
-                # 4. Cache response (if 2xx/3xx/4xx?)
-                # We cache the result so retries get the same result.
-                # TTL: 24h (86400s)
-
-                # Parse body if JSON, otherwise store as string/bytes?
-                # RedisIdempotencyStorage expects dict for response.
-                # We need to serialize the body.
-
-                try:
-                    body_json = json.loads(response_body)
-                except Exception:
-                    body_json = response_body.decode("utf-8")
-
-                cache_data = {
-                    "body": body_json,
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                }
-
-                await storage.set(key, cache_data, ttl=86400)
-
-                return new_response
-
-            finally:
-                # 5. Release lock
-                await storage.unlock(key)
-
-        except Exception as e:
-            logger.error(f"Idempotency middleware error: {e}", exc_info=True)
-            # Fallback to normal processing if redis fails?
-            # Or fail safe?
-            # If we can't check idempotency, we might duplicate.
-            # Safer to fail or proceed?
-            # Proceeding risks duplication. Failing risks availability.
-            # Let's proceed but log error.
-            return cast(Response, await call_next(request))
+        body = b"".join(chunks)
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in response.raw_headers
+        ]
+        await self._complete(
+            storage,
+            key,
+            encode_response_payload(response.status_code, headers, body),
+        )
+
+        new_response = Response(
+            content=body,
+            status_code=response.status_code,
+            background=response.background,
+        )
+        new_response.raw_headers = list(response.raw_headers)
+        return new_response
+
+    async def _stream_through(
+        self,
+        storage: RedisIdempotencyStorage,
+        key: str,
+        head: list[bytes],
+        body_iterator: AsyncIterator[bytes],
+    ) -> AsyncIterator[bytes]:
+        """Yield captured chunks then the rest; mark completed at the end."""
+        try:
+            for chunk in head:
+                yield chunk
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            await self._complete(storage, key, RESPONSE_NOT_CACHED)
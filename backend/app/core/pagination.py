@@ -0,0 +1,275 @@
+"""
+Shared pagination for list endpoints: keyset cursors and cheap counts.
+
+OFFSET pagination makes the database read and discard every skipped row, so
+deep pages on large tables (100k+ signals for a power user) degrade into
+full scans. Keyset pagination instead seeks directly to the last row seen:
+
+    WHERE (created_at, id) < (:last_created_at, :last_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :page_size + 1
+
+The (timestamp, id) pair of the last row is handed to the client as an
+opaque cursor. The extra row tells us whether another page exists without
+counting anything.
+
+Totals are optional. CountMode.EXACT runs a single COUNT(*) with the list's
+filters (never a fetch-all). CountMode.ESTIMATE asks the PostgreSQL planner
+for its row estimate and only falls back to an exact count when the estimate
+is small enough for COUNT(*) to be cheap. CountMode.NONE skips the total.
+
+Example:
+    >>> page = await paginate(
+    ...     db,
+    ...     select(Signal).where(Signal.user_id == user_id),
+    ...     sort_column=Signal.created_at,
+    ...     id_column=Signal.id,
+    ...     limit=50,
+    ...     cursor=request_cursor,
+    ...     count=CountMode.ESTIMATE,
+    ... )
+    >>> page.items, page.next_cursor, page.total
+"""
+
+import base64
+import binascii
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Generic, TypeVar
+
+from fastapi import status
+from sqlalchemy import Select, and_, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from backend.app.core.errors import APIException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Planner estimates below this are replaced with an exact COUNT(*)
+ESTIMATE_EXACT_BELOW = 10_000
+
+
+class CountMode(StrEnum):
+    """How a paginated list computes its total."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+class InvalidCursorError(APIException):
+    """Pagination cursor could not be decoded (400)."""
+
+    def __init__(self, detail: str = "Invalid pagination cursor"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error_type="validation",
+            title="Invalid Cursor",
+            detail=detail,
+        )
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a keyset-paginated list.
+
+    Attributes:
+        items: Rows on this page, in list order
+        next_cursor: Cursor for the following page (None on the last page)
+        total: Total matching rows (None when CountMode.NONE)
+        total_is_estimate: True if total came from planner statistics
+    """
+
+    items: list[T]
+    next_cursor: str | None
+    total: int | None = None
+    total_is_estimate: bool = False
+
+
+def encode_cursor(sort_value: datetime, row_id: Any) -> str:
+    """Encode a (timestamp, id) position as an opaque URL-safe cursor.
+
+    Args:
+        sort_value: Sort column value of the last row returned
+        row_id: Primary key of the last row returned
+
+    Returns:
+        str: Opaque cursor string
+    """
+    raw = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (sort value, row id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_raw, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_raw), str(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError() from e
+
+
+async def count_rows(db: AsyncSession, query: Select) -> int:
+    """Exact COUNT(*) for a list query, keeping its FROM and WHERE clauses.
+
+    Args:
+        db: Database session
+        query: The (unpaginated) list query
+
+    Returns:
+        int: Number of matching rows
+    """
+    count_query = query.with_only_columns(
+        func.count(), maintain_column_froms=True
+    ).order_by(None)
+    result = await db.execute(count_query)
+    return result.scalar() or 0
+
+
+async def estimate_rows(db: AsyncSession, query: Select) -> int | None:
+    """Planner row estimate for a list query (PostgreSQL only).
+
+    Args:
+        db: Database session
+        query: The (unpaginated) list query
+
+    Returns:
+        Estimated row count, or None if no estimate is available
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    try:
+        compiled = query.order_by(None).compile(
+            dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        conn = await db.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        if not plan:
+            return None
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.debug(f"Row estimate unavailable, falling back to COUNT(*): {e}")
+        return None
+
+
+async def resolve_total(
+    db: AsyncSession, query: Select, count: CountMode
+) -> tuple[int | None, bool]:
+    """Compute a list total according to the requested count mode.
+
+    Args:
+        db: Database session
+        query: The (unpaginated) list query
+        count: Count mode
+
+    Returns:
+        Tuple of (total or None, whether the total is an estimate)
+    """
+    if count == CountMode.NONE:
+        return None, False
+
+    if count == CountMode.ESTIMATE:
+        estimate = await estimate_rows(db, query)
+        if estimate is not None and estimate >= ESTIMATE_EXACT_BELOW:
+            return estimate, True
+
+    return await count_rows(db, query), False
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    *,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    cursor: str | None = None,
+    offset: int = 0,
+    count: CountMode = CountMode.EXACT,
+    scalars: bool = True,
+) -> Page[Any]:
+    """Fetch one newest-first page of a list query.
+
+    With a cursor the page starts right after the cursor position (keyset);
+    without one it starts at `offset`, so existing page/offset callers keep
+    working and can switch to the returned next_cursor for deeper pages.
+
+    Args:
+        db: Database session
+        query: Filtered list query without ORDER BY / LIMIT / OFFSET
+        sort_column: Timestamp column to order by (descending)
+        id_column: Unique tiebreaker column (descending)
+        limit: Page size
+        cursor: Cursor from a previous page's next_cursor
+        offset: Rows to skip when no cursor is given
+        count: How to compute the total
+        scalars: Return ORM entities (True) or result rows (False); for rows
+            the cursor is taken from the first entity in each row
+
+    Returns:
+        Page with items, next_cursor and optional total
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    total, total_is_estimate = await resolve_total(db, query, count)
+
+    page_query = query
+    if cursor:
+        after_sort, after_id = decode_cursor(cursor)
+        id_type = id_column.type.python_type
+        try:
+            after_id_value: Any = after_id if id_type is str else id_type(after_id)
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError() from e
+        page_query = page_query.where(
+            or_(
+                sort_column < after_sort,
+                and_(sort_column == after_sort, id_column < after_id_value),
+            )
+        )
+    elif offset:
+        page_query = page_query.offset(offset)
+
+    page_query = page_query.order_by(sort_column.desc(), id_column.desc()).limit(
+        limit + 1
+    )
+    result = await db.execute(page_query)
+    rows: list[Any] = list(result.scalars().all() if scalars else result.all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1] if scalars else rows[-1][0]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key), getattr(last, id_column.key)
+        )
+
+    return Page(
+        items=rows,
+        next_cursor=next_cursor,
+        total=total,
+        total_is_estimate=total_is_estimate,
+    )
@@ -3,6 +3,7 @@
 This module provides:
 - Feature persistence (RSI, ROC, ATR, pivots, etc.)
 - Quality checks (staleness, NaNs, regime shifts)
+- Streaming drift sketches (mergeable, persisted across restarts)
 - Alert generation for quality violations
 
 PR-079 deliverables.
@@ -10,6 +11,7 @@ PR-079 deliverables.
 
 from backend.app.features.models import FeatureSnapshot
 from backend.app.features.quality import QualityMonitor, QualityReport, QualityViolation
+from backend.app.features.sketches import SketchRegistry, get_sketch_registry
 from backend.app.features.store import FeatureStore
 
 __all__ = [
@@ -18,4 +20,6 @@ __all__ = [
     "QualityMonitor",
     "QualityReport",
     "QualityViolation",
+    "SketchRegistry",
+    "get_sketch_registry",
 ]
@@ -35,6 +35,11 @@ class FeatureSnapshot(Base):
     Features are stored as JSONB for flexibility (different strategies
     may compute different features).
 
+    On PostgreSQL the table is range-partitioned by day on timestamp
+    (migration 099), with primary key (id, timestamp); id alone is still
+    unique. The ORM identity is (id, timestamp) to match. See
+    FeatureStore.apply_retention.
+
     Attributes:
         id: Primary key
         symbol: Trading instrument (GOLD, XAUUSD, etc.)
@@ -62,6 +67,10 @@ class FeatureSnapshot(Base):
         Index("ix_features_timestamp_desc", "timestamp", postgresql_using="btree"),
     )
 
+    # Identity matches the partitioned table's primary key (id, timestamp);
+    # the DDL key stays id so create_all (SQLite) can still autoincrement it
+    __mapper_args__ = {"primary_key": [id, timestamp]}
+
     def __repr__(self) -> str:
         return f"<FeatureSnapshot {self.symbol} @ {self.timestamp}: {len(self.features)} features, quality={self.quality_score:.2f}>"
 
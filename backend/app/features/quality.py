@@ -6,6 +6,10 @@ Checks for:
 - Stale data
 - Drift/regime shifts
 
+Drift is checked against streaming sketches (see features.sketches) when the
+monitor has a SketchRegistry, and against the last 7 days of snapshots
+otherwise.
+
 Examples:
     Run quality checks:
         monitor = QualityMonitor(session)
@@ -29,10 +33,14 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.features.sketches import SketchRegistry
 from backend.app.features.store import FeatureStore
 
 logger = logging.getLogger(__name__)
 
+# PSI above this means the recent distribution has shifted (industry rule of thumb)
+PSI_DRIFT_THRESHOLD = 0.25
+
 
 class ViolationType(str, Enum):
     """Quality violation types."""
@@ -102,6 +110,7 @@ class QualityMonitor:
         session: AsyncSession,
         min_quality_score: float = 0.7,
         max_age_seconds: int = 300,
+        sketches: SketchRegistry | None = None,
     ):
         """Initialize quality monitor.
 
@@ -109,9 +118,11 @@ class QualityMonitor:
             session: Database session
             min_quality_score: Minimum acceptable quality score (0.0-1.0)
             max_age_seconds: Maximum age for fresh data (seconds)
+            sketches: Drift sketches (None: compute drift from stored history)
         """
         self.session = session
-        self.store = FeatureStore(session)
+        self.sketches = sketches
+        self.store = FeatureStore(session, sketches=sketches)
         self.min_quality_score = min_quality_score
         self.max_age_seconds = max_age_seconds
 
@@ -360,65 +371,131 @@ class QualityMonitor:
         """
         violations: list[QualityViolation] = []
 
-        # Get last 7 days of snapshots for baseline
+        numeric_features = {
+            name: value
+            for name, value in current_snapshot.features.items()
+            if isinstance(value, (int, float)) and not math.isnan(value)
+        }
+        if not numeric_features:
+            return violations
+
+        if self.sketches is not None:
+            return self._check_drift_sketches(self.sketches, symbol, numeric_features)
+
+        # Get last 7 days of snapshots for baseline (projected, newest 1000)
         lookback = datetime.now() - timedelta(days=7)
-        historical = await self.store.get_features(
-            symbol=symbol,
-            start_time=lookback,
-            limit=1000,
+        historical = await self.store.get_features_frame(
+            symbol,
+            start=lookback,
+            feature_names=list(numeric_features),
         )
+        historical = historical.tail(1000)
 
         if len(historical) < 10:
             # Not enough history for drift detection
             return violations
 
         # Calculate mean and std for each feature
-        import statistics
-
-        for feature_name, current_value in current_snapshot.features.items():
-            if not isinstance(current_value, (int, float)) or math.isnan(current_value):
-                continue
-
-            # Get historical values
-            historical_values = [
-                s.features.get(feature_name)
-                for s in historical
-                if s.features.get(feature_name) is not None
-                and isinstance(s.features.get(feature_name), (int, float))
-                and not math.isnan(s.features.get(feature_name))
-            ]
+        for feature_name, current_value in numeric_features.items():
+            historical_values = historical[feature_name].dropna()
 
             if len(historical_values) < 10:
                 continue
 
-            try:
-                mean = statistics.mean(historical_values)
-                stdev = statistics.stdev(historical_values)
-
-                # Check if current value is > 3 std deviations from mean
-                if stdev > 0:
-                    z_score = abs((current_value - mean) / stdev)
-
-                    if z_score > 3.0:
-                        violations.append(
-                            QualityViolation(
-                                type=ViolationType.DRIFT_DETECTED,
-                                symbol=symbol,
-                                message=f"Feature {feature_name} drifted {z_score:.2f}σ from baseline",
-                                severity="medium" if z_score < 5.0 else "high",
-                                metadata={
-                                    "feature": feature_name,
-                                    "current_value": current_value,
-                                    "historical_mean": mean,
-                                    "historical_stdev": stdev,
-                                    "z_score": z_score,
-                                    "baseline_samples": len(historical_values),
-                                },
-                            )
+            mean = float(historical_values.mean())
+            stdev = float(historical_values.std())
+
+            # Check if current value is > 3 std deviations from mean
+            if stdev > 0:
+                z_score = abs((current_value - mean) / stdev)
+
+                if z_score > 3.0:
+                    violations.append(
+                        QualityViolation(
+                            type=ViolationType.DRIFT_DETECTED,
+                            symbol=symbol,
+                            message=f"Feature {feature_name} drifted {z_score:.2f}σ from baseline",
+                            severity="medium" if z_score < 5.0 else "high",
+                            metadata={
+                                "feature": feature_name,
+                                "current_value": current_value,
+                                "historical_mean": mean,
+                                "historical_stdev": stdev,
+                                "z_score": z_score,
+                                "baseline_samples": len(historical_values),
+                            },
                         )
+                    )
+
+        return violations
 
-            except statistics.StatisticsError:
-                # Skip if not enough variance
+    def _check_drift_sketches(
+        self,
+        sketches: SketchRegistry,
+        symbol: str,
+        numeric_features: dict[str, float],
+    ) -> list[QualityViolation]:
+        """Drift check against streaming sketches (no database reads).
+
+        Flags a feature when the current value is > 3σ from the running mean,
+        or when the recent window's distribution has shifted from the
+        baseline (PSI >= PSI_DRIFT_THRESHOLD).
+
+        Args:
+            sketches: Registry holding the (symbol, feature) sketches
+            symbol: Trading instrument
+            numeric_features: Current numeric, non-NaN feature values
+
+        Returns:
+            List of violations (empty if no drift)
+        """
+        violations: list[QualityViolation] = []
+
+        for feature_name, current_value in numeric_features.items():
+            sketch = sketches.get(symbol, feature_name)
+            if sketch is None or sketch.count < 10:
                 continue
 
+            count, mean, stdev = sketch.moments()
+            z_score = sketch.z_score(current_value)
+            psi = sketch.psi()
+            ks = sketch.ks()
+
+            if z_score is not None and z_score > 3.0:
+                violations.append(
+                    QualityViolation(
+                        type=ViolationType.DRIFT_DETECTED,
+                        symbol=symbol,
+                        message=f"Feature {feature_name} drifted {z_score:.2f}σ from baseline",
+                        severity="medium" if z_score < 5.0 else "high",
+                        metadata={
+                            "feature": feature_name,
+                            "current_value": current_value,
+                            "historical_mean": mean,
+                            "historical_stdev": stdev,
+                            "z_score": z_score,
+                            "baseline_samples": count,
+                            "psi": psi,
+                            "ks": ks,
+                        },
+                    )
+                )
+            elif psi is not None and psi >= PSI_DRIFT_THRESHOLD:
+                violations.append(
+                    QualityViolation(
+                        type=ViolationType.DRIFT_DETECTED,
+                        symbol=symbol,
+                        message=f"Feature {feature_name} distribution shifted (PSI {psi:.2f})",
+                        severity="medium" if psi < 2 * PSI_DRIFT_THRESHOLD else "high",
+                        metadata={
+                            "feature": feature_name,
+                            "current_value": current_value,
+                            "psi": psi,
+                            "ks": ks,
+                            "baseline_samples": sketch.baseline.count,
+                            "recent_samples": sketch.recent.count,
+                        },
+                    )
+                )
+
         return violations
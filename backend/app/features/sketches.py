@@ -0,0 +1,438 @@
+"""Streaming feature sketches for drift detection.
+
+Keeps small, mergeable summaries of every (symbol, feature) stream so drift
+checks cost O(features) instead of re-reading history from the database.
+
+Per (symbol, feature) a DriftSketch holds:
+    - baseline: everything seen before the current window
+    - recent: the current window (rolls into baseline every `window` values)
+
+Each side is a FeatureSketch: Welford running mean/variance plus a KLL
+quantile sketch. Drift scores:
+    - z-score of a value against the running mean/stdev
+    - PSI (population stability index) of recent vs baseline, over the
+      baseline's decile bins
+    - KS statistic (max CDF distance) of recent vs baseline
+
+The registry serializes to JSON so a restarted process resumes with warm
+sketches instead of needing a warm-up period.
+
+Example:
+    >>> registry = SketchRegistry(path="/var/lib/app/feature_sketches.json")
+    >>> registry.update("GOLD", {"rsi_14": 65.3, "atr_14": 12.5})
+    >>> sketch = registry.get("GOLD", "rsi_14")
+    >>> sketch.z_score(95.0), sketch.psi(), sketch.ks()
+"""
+
+import json
+import logging
+import math
+import os
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Probability floor for empty PSI bins (avoids log(0))
+PSI_EPSILON = 1e-4
+
+# Sketches are only compared once both sides have this many values
+MIN_DRIFT_SAMPLES = 30
+
+
+class QuantileSketch:
+    """KLL quantile sketch (mergeable, bounded memory).
+
+    Items live in levels; an item at level h stands for 2**h inputs. When a
+    level outgrows its capacity it is sorted and every other item is promoted
+    to the next level. Compaction offsets alternate, so results are
+    deterministic. Rank error is roughly 1.7/k.
+    """
+
+    def __init__(self, k: int = 200):
+        """Initialize sketch.
+
+        Args:
+            k: Accuracy parameter (capacity of the top level)
+        """
+        self.k = k
+        self.count = 0
+        self.levels: list[list[float]] = [[]]
+        self._flip = False
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a level (geometrically smaller towards the bottom)."""
+        depth = len(self.levels) - 1 - level
+        return max(2, int(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        """Compact levels that exceed their capacity."""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                keep = [items.pop()] if len(items) % 2 else []
+                offset = 1 if self._flip else 0
+                self._flip = not self._flip
+                self.levels[level + 1].extend(items[offset::2])
+                self.levels[level] = keep
+            level += 1
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.levels[0].append(value)
+        self.count += 1
+        if len(self.levels[0]) > self._capacity(0):
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def weighted_items(self) -> list[tuple[float, int]]:
+        """(value, weight) pairs sorted by value."""
+        return sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.levels)
+            for value in items
+        )
+
+    def cdf(self, value: float) -> float:
+        """Estimated fraction of inputs <= value."""
+        total = sum(len(items) << level for level, items in enumerate(self.levels))
+        if total == 0:
+            return 0.0
+        below = sum(
+            1 << level
+            for level, items in enumerate(self.levels)
+            for item in items
+            if item <= value
+        )
+        return below / total
+
+    def quantile(self, q: float) -> float:
+        """Estimated value at quantile q (0..1); NaN if empty."""
+        items = self.weighted_items()
+        if not items:
+            return math.nan
+        total = sum(weight for _, weight in items)
+        target = q * total
+        running = 0
+        for value, weight in items:
+            running += weight
+            if running >= target:
+                return value
+        return items[-1][0]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"k": self.k, "count": self.count, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(k=data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [list(items) for items in data["levels"]] or [[]]
+        return sketch
+
+
+def _cdf_table(sketch: QuantileSketch) -> tuple[list[float], list[float]]:
+    """Sorted values and their cumulative probabilities."""
+    items = sketch.weighted_items()
+    cum = list(accumulate(weight for _, weight in items))
+    total = cum[-1] if cum else 1
+    return [value for value, _ in items], [c / total for c in cum]
+
+
+class FeatureSketch:
+    """Running moments (Welford) and quantiles of one value stream."""
+
+    def __init__(self, k: int = 200):
+        """Initialize sketch.
+
+        Args:
+            k: Quantile sketch accuracy parameter
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.quantiles = QuantileSketch(k)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 with fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.quantiles.add(value)
+
+    def merge(self, other: "FeatureSketch") -> None:
+        """Merge another sketch into this one (Chan et al. parallel update)."""
+        self.merge_moments(other)
+        self.quantiles.merge(other.quantiles)
+
+    def merge_moments(self, other: "FeatureSketch") -> None:
+        """Merge only count/mean/variance of another sketch."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "quantiles": self.quantiles.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FeatureSketch":
+        sketch = cls()
+        sketch.count = data["count"]
+        sketch.mean = data["mean"]
+        sketch.m2 = data["m2"]
+        sketch.quantiles = QuantileSketch.from_dict(data["quantiles"])
+        return sketch
+
+
+class DriftSketch:
+    """Baseline vs recent-window sketches of one (symbol, feature) stream."""
+
+    def __init__(self, window: int = 500):
+        """Initialize drift sketch.
+
+        Args:
+            window: Values per recent window before it rolls into baseline
+        """
+        self.window = window
+        self.baseline = FeatureSketch()
+        self.recent = FeatureSketch()
+
+    @property
+    def count(self) -> int:
+        return self.baseline.count + self.recent.count
+
+    def add(self, value: float) -> None:
+        """Add one value, rolling the recent window into baseline when full."""
+        self.recent.add(value)
+        if self.recent.count >= self.window:
+            self.baseline.merge(self.recent)
+            self.recent = FeatureSketch()
+
+    def moments(self) -> tuple[int, float, float]:
+        """(count, mean, sample stdev) over baseline and recent combined."""
+        combined = FeatureSketch()
+        combined.merge_moments(self.baseline)
+        combined.merge_moments(self.recent)
+        return combined.count, combined.mean, combined.stdev
+
+    def z_score(self, value: float) -> float | None:
+        """Distance of value from the running mean, in stdevs (None if flat)."""
+        count, mean, stdev = self.moments()
+        if count < 2 or stdev <= 0:
+            return None
+        return abs(value - mean) / stdev
+
+    def _comparable(self) -> bool:
+        return (
+            self.baseline.count >= MIN_DRIFT_SAMPLES
+            and self.recent.count >= MIN_DRIFT_SAMPLES
+        )
+
+    def psi(self, bins: int = 10) -> float | None:
+        """Population stability index of recent vs baseline (None if too few)."""
+        if not self._comparable():
+            return None
+
+        base_q = self.baseline.quantiles
+        recent_q = self.recent.quantiles
+        edges = sorted({base_q.quantile(i / bins) for i in range(1, bins)})
+
+        psi = 0.0
+        prev_base = prev_recent = 0.0
+        for edge in [*edges, math.inf]:
+            cdf_base = base_q.cdf(edge) if edge != math.inf else 1.0
+            cdf_recent = recent_q.cdf(edge) if edge != math.inf else 1.0
+            b = max(cdf_base - prev_base, PSI_EPSILON)
+            r = max(cdf_recent - prev_recent, PSI_EPSILON)
+            psi += (r - b) * math.log(r / b)
+            prev_base, prev_recent = cdf_base, cdf_recent
+        return psi
+
+    def ks(self) -> float | None:
+        """Kolmogorov-Smirnov statistic of recent vs baseline (None if too few)."""
+        if not self._comparable():
+            return None
+
+        base_values, base_cum = _cdf_table(self.baseline.quantiles)
+        recent_values, recent_cum = _cdf_table(self.recent.quantiles)
+
+        def cdf(values: list[float], cum: list[float], x: float) -> float:
+            i = bisect_right(values, x)
+            return cum[i - 1] if i else 0.0
+
+        return max(
+            abs(cdf(base_values, base_cum, p) - cdf(recent_values, recent_cum, p))
+            for p in (*base_values, *recent_values)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "window": self.window,
+            "baseline": self.baseline.to_dict(),
+            "recent": self.recent.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DriftSketch":
+        sketch = cls(window=data["window"])
+        sketch.baseline = FeatureSketch.from_dict(data["baseline"])
+        sketch.recent = FeatureSketch.from_dict(data["recent"])
+        return sketch
+
+
+class SketchRegistry:
+    """DriftSketches for every (symbol, feature), persisted to disk.
+
+    Updated by FeatureStore on every write; read by QualityMonitor. With a
+    path, the registry is saved every `save_every` updates (and on save()),
+    and load() restores it after a restart.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        window: int = 500,
+        save_every: int = 500,
+    ):
+        """Initialize registry.
+
+        Args:
+            path: JSON file for persistence (None: memory only)
+            window: Recent-window size for new sketches
+            save_every: Updates between automatic saves
+        """
+        self.path = path
+        self.window = window
+        self.save_every = save_every
+        self._sketches: dict[tuple[str, str], DriftSketch] = {}
+        self._unsaved = 0
+
+    def get(self, symbol: str, feature: str) -> DriftSketch | None:
+        """Sketch for (symbol, feature), or None if never seen."""
+        return self._sketches.get((symbol, feature))
+
+    def update(self, symbol: str, features: dict[str, Any]) -> None:
+        """Add one snapshot's numeric, non-NaN features to the sketches.
+
+        Args:
+            symbol: Trading instrument
+            features: Dict of feature name -> value
+        """
+        for name, value in features.items():
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, int | float)
+                or math.isnan(value)
+            ):
+                continue
+            sketch = self._sketches.get((symbol, name))
+            if sketch is None:
+                sketch = self._sketches[(symbol, name)] = DriftSketch(self.window)
+            sketch.add(float(value))
+
+        self._unsaved += 1
+        if self.path and self._unsaved >= self.save_every:
+            self.save()
+
+    def save(self) -> None:
+        """Write all sketches to `path` atomically (no-op without a path)."""
+        if not self.path:
+            return
+        data = {
+            "version": 1,
+            "sketches": [
+                {"symbol": symbol, "feature": feature, **sketch.to_dict()}
+                for (symbol, feature), sketch in self._sketches.items()
+            ],
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            logger.error(f"Failed to save feature sketches to {self.path}: {e}")
+
+    @classmethod
+    def load(cls, path: str, **kwargs: Any) -> "SketchRegistry":
+        """Load a registry saved at path (empty registry if missing/corrupt).
+
+        Args:
+            path: JSON file written by save()
+            **kwargs: Extra SketchRegistry constructor arguments
+
+        Returns:
+            SketchRegistry bound to path
+        """
+        registry = cls(path=path, **kwargs)
+        if not os.path.exists(path):
+            return registry
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for entry in data["sketches"]:
+                registry._sketches[(entry["symbol"], entry["feature"])] = (
+                    DriftSketch.from_dict(entry)
+                )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable feature sketches at {path}: {e}")
+            registry._sketches.clear()
+
+        logger.info(
+            f"Loaded {len(registry._sketches)} feature sketches",
+            extra={"path": path, "sketch_count": len(registry._sketches)},
+        )
+        return registry
+
+
+# Process-wide registry shared by FeatureStore and QualityMonitor
+_registry: SketchRegistry | None = None
+
+
+def get_sketch_registry() -> SketchRegistry:
+    """Get the process-wide sketch registry.
+
+    Persisted at FEATURE_SKETCH_PATH when set (loaded on first use).
+
+    Returns:
+        SketchRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        path = os.getenv("FEATURE_SKETCH_PATH")
+        _registry = SketchRegistry.load(path) if path else SketchRegistry()
+    return _registry
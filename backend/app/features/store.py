@@ -2,6 +2,19 @@
 
 Provides put/get operations for feature snapshots with efficient querying.
 
+Performance:
+    - put_features_batch() ingests a columnar frame (one row per timestamp,
+      one column per feature) with a single executemany INSERT and commit.
+    - get_features_frame() returns a wide pandas DataFrame for many symbols
+      in one query, projecting only the requested features out of the JSON
+      blob in SQL.
+    - get_latest() is served from a write-through LatestSnapshotCache.
+    - On PostgreSQL feature_snapshots is range-partitioned by day
+      (migration 099); apply_retention() drops whole day partitions instead
+      of deleting rows. Other backends fall back to a single DELETE.
+    - With a SketchRegistry, every write also updates the streaming drift
+      sketches used by QualityMonitor.check_drift().
+
 Examples:
     Store features:
         store = FeatureStore(session)
@@ -22,19 +35,102 @@ Examples:
             start_time=yesterday,
             end_time=now
         )
+
+    Wide feature window:
+        frame = await store.get_features_frame(
+            ["GOLD", "XAUUSD"], start=last_week, end=now,
+            feature_names=["rsi_14", "atr_14"],
+        )
 """
 
 import logging
-from datetime import datetime
+import time
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import desc, select
+import pandas as pd
+from sqlalchemy import case, desc, func, insert, literal, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.features.models import FeatureSnapshot
+from backend.app.features.sketches import SketchRegistry
 
 logger = logging.getLogger(__name__)
 
+# Day partitions of feature_snapshots are named feature_snapshots_pYYYYMMDD
+PARTITION_PREFIX = "feature_snapshots_p"
+
+
+def _utc_naive(ts: datetime) -> datetime:
+    """Normalize a timestamp to naive UTC (SQLite returns naive datetimes)."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(UTC).replace(tzinfo=None)
+    return ts
+
+
+def _partition_name(day: date) -> str:
+    """Name of the day partition holding `day`."""
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def _detached_copy(snapshot: FeatureSnapshot) -> FeatureSnapshot:
+    """Session-independent copy of a snapshot, safe to cache across sessions."""
+    return FeatureSnapshot(
+        id=snapshot.id,
+        symbol=snapshot.symbol,
+        timestamp=snapshot.timestamp,
+        features=dict(snapshot.features),
+        quality_score=snapshot.quality_score,
+        created_at=snapshot.created_at,
+    )
+
+
+class LatestSnapshotCache:
+    """In-memory cache of the newest snapshot per symbol.
+
+    FeatureStore writes through to it, so readers in the writing process see
+    new snapshots immediately. Entries expire after ttl_seconds to bound
+    staleness when other processes write to the same table. Share one
+    instance across FeatureStore objects (they are per-session) to get hits.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Max age of a cached entry
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[FeatureSnapshot, float]] = {}
+
+    def get(self, symbol: str) -> FeatureSnapshot | None:
+        """Cached latest snapshot for symbol, or None if absent/expired."""
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        snapshot, cached_at = entry
+        if time.monotonic() - cached_at > self.ttl_seconds:
+            del self._entries[symbol]
+            return None
+        return snapshot
+
+    def offer(self, snapshot: FeatureSnapshot) -> None:
+        """Cache snapshot if it is at least as new as the cached one."""
+        current = self._entries.get(snapshot.symbol)
+        if current is not None and _utc_naive(current[0].timestamp) > _utc_naive(
+            snapshot.timestamp
+        ):
+            return
+        self._entries[snapshot.symbol] = (_detached_copy(snapshot), time.monotonic())
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """Drop one symbol (or every symbol if None)."""
+        if symbol is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(symbol, None)
+
 
 class FeatureStore:
     """Feature Store service.
@@ -42,13 +138,26 @@ class FeatureStore:
     Manages feature snapshot persistence and retrieval.
     """
 
-    def __init__(self, session: AsyncSession):
+    # Day partitions known to exist (PostgreSQL), shared across instances
+    _known_partitions: set[date] = set()
+    _partitioned: bool | None = None
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        latest_cache: LatestSnapshotCache | None = None,
+        sketches: SketchRegistry | None = None,
+    ):
         """Initialize feature store.
 
         Args:
             session: Database session
+            latest_cache: Shared latest-snapshot cache (default: private cache)
+            sketches: Drift sketches to update on every write (optional)
         """
         self.session = session
+        self.latest_cache = latest_cache or LatestSnapshotCache()
+        self.sketches = sketches
 
     async def put_features(
         self,
@@ -93,9 +202,14 @@ class FeatureStore:
             quality_score=quality_score,
         )
 
+        created = await self._ensure_partitions([timestamp])
         self.session.add(snapshot)
         await self.session.commit()
+        self._remember_partitions(created)
         await self.session.refresh(snapshot)
+        self.latest_cache.offer(snapshot)
+        if self.sketches is not None:
+            self.sketches.update(symbol, features)
 
         logger.info(
             f"Stored feature snapshot for {symbol}",
@@ -109,6 +223,95 @@ class FeatureStore:
 
         return snapshot
 
+    async def put_features_batch(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        quality_score: float | Sequence[float] = 1.0,
+    ) -> int:
+        """Store many feature snapshots from a columnar frame.
+
+        One executemany INSERT and one commit for the whole frame, instead of
+        a commit + refresh per snapshot.
+
+        Args:
+            symbol: Trading instrument
+            frame: DataFrame indexed by timestamp (UTC), one column per feature
+            quality_score: Quality for every row, or one value per row
+
+        Returns:
+            Number of snapshots stored
+
+        Raises:
+            ValueError: If a quality score is not in [0, 1] or the number of
+                quality scores does not match the frame length
+
+        Examples:
+            >>> frame = pd.DataFrame(
+            ...     {"rsi_14": [65.3, 66.1], "atr_14": [12.5, 12.7]},
+            ...     index=[t0, t1],
+            ... )
+            >>> await store.put_features_batch("GOLD", frame)
+            2
+        """
+        if frame.empty:
+            return 0
+
+        if isinstance(quality_score, int | float):
+            scores = [float(quality_score)] * len(frame)
+        else:
+            scores = [float(q) for q in quality_score]
+            if len(scores) != len(frame):
+                raise ValueError(
+                    f"Expected {len(frame)} quality scores, got {len(scores)}"
+                )
+        bad = [q for q in scores if not (0.0 <= q <= 1.0)]
+        if bad:
+            raise ValueError(f"quality_score must be in [0.0, 1.0], got {bad[0]}")
+
+        timestamps = [ts.to_pydatetime() for ts in pd.to_datetime(frame.index)]
+        created_at = datetime.now()
+        rows = [
+            {
+                "symbol": symbol,
+                "timestamp": ts,
+                "features": {
+                    name: value for name, value in features.items() if pd.notna(value)
+                },
+                "quality_score": score,
+                "created_at": created_at,
+            }
+            for ts, features, score in zip(
+                timestamps, frame.to_dict("records"), scores, strict=True
+            )
+        ]
+
+        created = await self._ensure_partitions(timestamps)
+        await self.session.execute(insert(FeatureSnapshot), rows)
+        await self.session.commit()
+        self._remember_partitions(created)
+        if self.sketches is not None:
+            for row in sorted(rows, key=lambda r: _utc_naive(r["timestamp"])):
+                self.sketches.update(symbol, row["features"])
+
+        # Batch rows are not loaded back; next get_latest re-reads if newer
+        cached = self.latest_cache.get(symbol)
+        if cached is not None and _utc_naive(max(timestamps)) >= _utc_naive(
+            cached.timestamp
+        ):
+            self.latest_cache.invalidate(symbol)
+
+        logger.info(
+            f"Stored {len(rows)} feature snapshots for {symbol}",
+            extra={
+                "symbol": symbol,
+                "snapshot_count": len(rows),
+                "feature_count": len(frame.columns),
+            },
+        )
+
+        return len(rows)
+
     async def get_latest(self, symbol: str) -> FeatureSnapshot | None:
         """Get the latest feature snapshot for a symbol.
 
@@ -123,6 +326,10 @@ class FeatureStore:
             >>> snapshot.features["rsi_14"]
             65.3
         """
+        cached = self.latest_cache.get(symbol)
+        if cached is not None:
+            return cached
+
         stmt = (
             select(FeatureSnapshot)
             .where(FeatureSnapshot.symbol == symbol)
@@ -131,7 +338,10 @@ class FeatureStore:
         )
 
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        snapshot = result.scalar_one_or_none()
+        if snapshot is not None:
+            self.latest_cache.offer(snapshot)
+        return snapshot
 
     async def get_features(
         self,
@@ -177,6 +387,90 @@ class FeatureStore:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_features_frame(
+        self,
+        symbols: str | Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        feature_names: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Get a wide feature window for one or more symbols in one query.
+
+        With feature_names, only those keys are extracted from the JSON blob
+        in SQL (->> on PostgreSQL, json_extract elsewhere), so the blobs are
+        never shipped to Python.
+
+        Args:
+            symbols: Trading instrument(s)
+            start: Start of time range (inclusive, optional)
+            end: End of time range (inclusive, optional)
+            feature_names: Features to project (default: all features)
+
+        Returns:
+            DataFrame with columns [symbol, timestamp, quality_score, *features]
+            ordered by symbol then timestamp ascending. Missing or non-numeric
+            feature values are NaN.
+
+        Examples:
+            >>> frame = await store.get_features_frame(
+            ...     ["GOLD"], start=last_week, feature_names=["rsi_14"]
+            ... )
+            >>> frame["rsi_14"].mean()
+            52.7
+        """
+        symbol_list = [symbols] if isinstance(symbols, str) else list(symbols)
+
+        columns: list[Any] = [
+            FeatureSnapshot.symbol,
+            FeatureSnapshot.timestamp,
+            FeatureSnapshot.quality_score,
+        ]
+        if feature_names is None:
+            columns.append(FeatureSnapshot.features)
+        else:
+            columns.extend(
+                self._feature_expr(name).label(f"f{i}")
+                for i, name in enumerate(feature_names)
+            )
+
+        stmt = select(*columns).where(FeatureSnapshot.symbol.in_(symbol_list))
+        if start:
+            stmt = stmt.where(FeatureSnapshot.timestamp >= start)
+        if end:
+            stmt = stmt.where(FeatureSnapshot.timestamp <= end)
+        stmt = stmt.order_by(FeatureSnapshot.symbol, FeatureSnapshot.timestamp)
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        base = pd.DataFrame(
+            [row[:3] for row in rows], columns=["symbol", "timestamp", "quality_score"]
+        )
+        if feature_names is None:
+            values = pd.DataFrame([row[3] for row in rows], index=base.index)
+        else:
+            values = pd.DataFrame(
+                [row[3:] for row in rows],
+                columns=list(feature_names),
+                index=base.index,
+            )
+
+        values = values.apply(pd.to_numeric, errors="coerce")
+        return pd.concat([base, values], axis=1)
+
+    def _feature_expr(self, name: str) -> Any:
+        """SQL expression extracting one feature from the JSON blob."""
+        if self.session.get_bind().dialect.name == "postgresql":
+            return FeatureSnapshot.features.op("->>")(literal(name))
+        # Blobs holding NaN are stored as non-standard JSON on SQLite
+        return case(
+            (
+                func.json_valid(FeatureSnapshot.features),
+                func.json_extract(FeatureSnapshot.features, literal(f'$."{name}"')),
+            ),
+            else_=None,
+        )
+
     async def get_by_id(self, snapshot_id: int) -> FeatureSnapshot | None:
         """Get a feature snapshot by ID.
 
@@ -216,8 +510,6 @@ class FeatureStore:
             >>> count
             2400  # 10 days of 15-min bars
         """
-        from sqlalchemy import func
-
         stmt = select(func.count(FeatureSnapshot.id))
 
         if symbol:
@@ -264,6 +556,10 @@ class FeatureStore:
 
         deleted_count = result.rowcount  # type: ignore[attr-defined]
 
+        cached = self.latest_cache.get(symbol)
+        if cached is not None and _utc_naive(cached.timestamp) < _utc_naive(older_than):
+            self.latest_cache.invalidate(symbol)
+
         logger.info(
             f"Deleted {deleted_count} old snapshots for {symbol}",
             extra={
@@ -274,3 +570,119 @@ class FeatureStore:
         )
 
         return int(deleted_count)
+
+    async def apply_retention(self, older_than: datetime) -> int:
+        """Remove snapshots of every symbol older than a cutoff.
+
+        On partitioned PostgreSQL tables whole day partitions that end at or
+        before the cutoff are dropped (no row-by-row DELETE, no bloat, no
+        vacuum); rows in the cutoff's own day are kept until that day ages
+        out. Other backends run one DELETE for all symbols.
+
+        Args:
+            older_than: Remove snapshots older than this datetime
+
+        Returns:
+            Number of snapshots removed
+
+        Examples:
+            >>> removed = await store.apply_retention(
+            ...     datetime.now(UTC) - timedelta(days=30)
+            ... )
+        """
+        cutoff = _utc_naive(older_than)
+
+        if not await self._is_partitioned():
+            from sqlalchemy import delete as sql_delete
+
+            result = await self.session.execute(
+                sql_delete(FeatureSnapshot).where(FeatureSnapshot.timestamp < cutoff)
+            )
+            await self.session.commit()
+            removed = int(result.rowcount)  # type: ignore[attr-defined]
+            dropped: list[str] = []
+        else:
+            partitions = await self.session.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'feature_snapshots'::regclass"
+                )
+            )
+            dropped = []
+            removed = 0
+            for (name,) in partitions.all():
+                if not name.startswith(PARTITION_PREFIX):
+                    continue  # default partition
+                try:
+                    day = datetime.strptime(name[len(PARTITION_PREFIX) :], "%Y%m%d")
+                except ValueError:
+                    continue
+                if day + timedelta(days=1) > cutoff:
+                    continue
+                count = await self.session.execute(
+                    text(f'SELECT count(*) FROM "{name}"')
+                )
+                removed += int(count.scalar_one())
+                await self.session.execute(text(f'DROP TABLE "{name}"'))
+                dropped.append(name)
+                FeatureStore._known_partitions.discard(day.date())
+            await self.session.commit()
+
+        self.latest_cache.invalidate()
+
+        logger.info(
+            f"Feature retention removed {removed} snapshots",
+            extra={
+                "older_than": older_than.isoformat(),
+                "deleted_count": removed,
+                "dropped_partitions": dropped,
+            },
+        )
+
+        return removed
+
+    async def _is_partitioned(self) -> bool:
+        """Whether feature_snapshots is a partitioned PostgreSQL table."""
+        if FeatureStore._partitioned is None:
+            if self.session.get_bind().dialect.name != "postgresql":
+                return False
+            result = await self.session.execute(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                    "WHERE partrelid = 'feature_snapshots'::regclass)"
+                )
+            )
+            FeatureStore._partitioned = bool(result.scalar_one())
+        return FeatureStore._partitioned
+
+    async def _ensure_partitions(self, timestamps: Sequence[datetime]) -> set[date]:
+        """Create the day partitions needed for timestamps (PostgreSQL only).
+
+        The CREATE TABLEs run in the caller's transaction, so the returned
+        days must only be added to the known-partition cache (see
+        _remember_partitions) after that transaction commits.
+
+        Returns:
+            Days whose partitions were created in this transaction
+        """
+        days = {_utc_naive(ts).date() for ts in timestamps}
+        missing = days - FeatureStore._known_partitions
+        if not missing or not await self._is_partitioned():
+            return set()
+
+        for day in sorted(missing):
+            await self.session.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{_partition_name(day)}" '
+                    f"PARTITION OF feature_snapshots FOR VALUES "
+                    f"FROM ('{day.isoformat()} 00:00:00+00') "
+                    f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+                )
+            )
+        return missing
+
+    @staticmethod
+    def _remember_partitions(days: set[date]) -> None:
+        """Cache partitions created by a transaction that has committed."""
+        FeatureStore._known_partitions.update(days)
@@ -5,6 +5,7 @@ from backend.app.fraud.detectors import (
     detect_out_of_band_fill,
     detect_slippage_zscore,
     scan_recent_trades,
+    scan_trades_since,
 )
 from backend.app.fraud.models import AnomalyEvent, AnomalySeverity, AnomalyType
 from backend.app.fraud.routes import router
@@ -17,5 +18,6 @@ __all__ = [
     "detect_latency_spike",
     "detect_out_of_band_fill",
     "scan_recent_trades",
+    "scan_trades_since",
     "router",
 ]
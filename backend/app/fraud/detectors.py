@@ -4,13 +4,21 @@ Detects suspicious MT5 execution patterns:
 - Slippage: Entry/exit price deviation from expected (z-score analysis)
 - Latency: Execution delays beyond normal thresholds
 - Out-of-band fills: Prices outside reasonable market range
+
+Bulk scans (scan_recent_trades, scan_trades_since) read each symbol's
+lookback prices once and score every trade with numpy instead of running
+the per-trade detectors, so an hourly scan costs two queries and one
+batched INSERT regardless of trade volume.
 """
 
 import logging
 import statistics
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+import numpy as np
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -128,6 +136,36 @@ async def detect_slippage_zscore(
         stddev_slippage = float(row.stddev_slippage or 1)
         trade_count = row.trade_count
 
+    return _slippage_anomaly(
+        trade,
+        expected_price,
+        slippage_pips,
+        mean_slippage,
+        stddev_slippage,
+        trade_count,
+    )
+
+
+def _severity_for_score(score: float) -> AnomalySeverity:
+    """Map a 0-1 anomaly score to a severity."""
+    if score >= 0.85:
+        return AnomalySeverity.CRITICAL
+    elif score >= 0.6:
+        return AnomalySeverity.HIGH
+    elif score >= 0.3:
+        return AnomalySeverity.MEDIUM
+    return AnomalySeverity.LOW
+
+
+def _slippage_anomaly(
+    trade: Trade,
+    expected_price: Decimal,
+    slippage_pips: float,
+    mean_slippage: float,
+    stddev_slippage: float,
+    trade_count: int,
+) -> AnomalyEvent | None:
+    """Score slippage against a baseline; AnomalyEvent if extreme."""
     # Avoid division by zero
     if stddev_slippage < 0.0001:
         stddev_slippage = 0.01  # Minimum stddev
@@ -142,16 +180,7 @@ async def detect_slippage_zscore(
     # Calculate anomaly score (0-1 scale)
     # z-score of 3 = 0.3, 5 = 0.5, 10 = 1.0
     score = min(abs(z_score) / 10.0, 1.0)
-
-    # Determine severity
-    if score >= 0.85:
-        severity = AnomalySeverity.CRITICAL
-    elif score >= 0.6:
-        severity = AnomalySeverity.HIGH
-    elif score >= 0.3:
-        severity = AnomalySeverity.MEDIUM
-    else:
-        severity = AnomalySeverity.LOW
+    severity = _severity_for_score(score)
 
     # Create anomaly event
     anomaly = AnomalyEvent(
@@ -163,7 +192,7 @@ async def detect_slippage_zscore(
         details={
             "symbol": trade.symbol,
             "expected_price": float(expected_price),
-            "actual_price": float(actual_price),
+            "actual_price": float(trade.entry_price),
             "slippage_pips": slippage_pips,
             "z_score": z_score,
             "mean_slippage": mean_slippage,
@@ -203,6 +232,13 @@ async def detect_latency_spike(
         3. Score = min(latency_ms / 10000, 1.0)
         4. Severity: <1s LOW, 1-2s MEDIUM, 2-5s HIGH, >5s CRITICAL
     """
+    return _latency_anomaly(trade, signal_time)
+
+
+def _latency_anomaly(
+    trade: Trade, signal_time: datetime | None = None
+) -> AnomalyEvent | None:
+    """Score execution latency (pure; no database access)."""
     if signal_time is None:
         # Estimate signal time as 1 minute before entry
         signal_time = trade.entry_time - timedelta(minutes=1)
@@ -342,60 +378,187 @@ async def detect_out_of_band_fill(
     return anomaly
 
 
-async def scan_recent_trades(db: AsyncSession, hours: int = 24) -> list[AnomalyEvent]:
-    """Scan recent trades for all anomaly types.
+@dataclass
+class SymbolBaseline:
+    """Lookback entry prices for one symbol, prepared for bulk scoring.
+
+    The slippage baseline of a trade is the mean/stddev of |p - expected|
+    over the symbol's other lookback trades, which depends on `expected`.
+    Sorted prices with prefix sums give sum|p - x| for any x via a binary
+    search, and sum (p - x)^2 follows from sum p and sum p^2, so every
+    trade is scored in O(log n) without re-querying. Prices are centered
+    on their mean to keep the squared sums numerically stable.
+    """
+
+    shift: float
+    prices: np.ndarray
+    prefix: np.ndarray
+    sum_sq: float
+
+    @classmethod
+    def from_prices(cls, prices: Sequence[float]) -> "SymbolBaseline":
+        """Build a baseline from raw entry prices."""
+        values = np.sort(np.asarray(prices, dtype=float))
+        shift = float(values.mean()) if len(values) else 0.0
+        centered = values - shift
+        prefix = np.concatenate(([0.0], np.cumsum(centered)))
+        return cls(shift, centered, prefix, float(np.dot(centered, centered)))
+
+    def deviation_stats(
+        self, expected: np.ndarray, in_window: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Count, mean and sample stddev of |p - expected| per trade.
+
+        Args:
+            expected: Expected price per trade
+            in_window: True where the trade itself is in the baseline (and
+                is excluded, as in detect_slippage_zscore)
+
+        Returns:
+            (count, mean, stddev) arrays; mean/stddev are NaN below 2 values
+        """
+        n = len(self.prices)
+        x = np.asarray(expected, dtype=float) - self.shift
+        k = np.searchsorted(self.prices, x, side="right")
+        below = self.prefix[k]
+        total = self.prefix[n]
+        abs_sum = (x * k - below) + (total - below - x * (n - k))
+        sq_sum = self.sum_sq - 2 * x * total + n * x * x
+
+        count = n - in_window.astype(int)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = abs_sum / count
+            var = (sq_sum - abs_sum * abs_sum / count) / (count - 1)
+        mean = np.where(count >= 2, mean, np.nan)
+        stddev = np.where(count >= 2, np.sqrt(np.clip(var, 0.0, None)), np.nan)
+        return count, mean, stddev
+
+
+async def load_symbol_baselines(
+    db: AsyncSession, symbols: Sequence[str], since: datetime
+) -> dict[str, SymbolBaseline]:
+    """Load lookback entry prices for many symbols in one query.
 
     Args:
         db: Database session
-        hours: How many hours back to scan
+        symbols: Symbols to load
+        since: Start of the lookback window (entry_time)
 
     Returns:
-        List of detected anomalies
+        Dict of symbol -> SymbolBaseline (symbols without trades omitted)
+    """
+    if not symbols:
+        return {}
 
-    Business Logic:
-        1. Fetch all trades from last N hours
-        2. Run all detectors (slippage, latency, out-of-band)
-        3. Persist detected anomalies to DB
-        4. Return list for reporting/alerting
+    result = await db.execute(
+        select(Trade.symbol, Trade.entry_price).where(
+            and_(Trade.symbol.in_(set(symbols)), Trade.entry_time >= since)
+        )
+    )
+    prices: dict[str, list[float]] = {}
+    for symbol, price in result.all():
+        prices.setdefault(symbol, []).append(float(price))
+
+    return {
+        symbol: SymbolBaseline.from_prices(values) for symbol, values in prices.items()
+    }
+
+
+async def score_trades(db: AsyncSession, trades: Sequence[Trade]) -> list[AnomalyEvent]:
+    """Run slippage and latency detection over many trades at once.
+
+    Same results as calling detect_slippage_zscore (trades with a signal)
+    and detect_latency_spike per trade, but with one baseline query for all
+    symbols.
+
+    Args:
+        db: Database session
+        trades: Closed trades to score
+
+    Returns:
+        Detected anomalies in trade order (not yet added to the session)
     """
-    lookback = datetime.utcnow() - timedelta(hours=hours)
+    lookback = datetime.utcnow() - timedelta(days=LOOKBACK_WINDOW_DAYS)
+    with_signal = [t for t in trades if t.signal_id]
+    baselines = await load_symbol_baselines(
+        db, [t.symbol for t in with_signal], lookback
+    )
+
+    # Score slippage per symbol in one vectorized pass
+    slippage: dict[str, AnomalyEvent] = {}
+    by_symbol: dict[str, list[Trade]] = {}
+    for trade in with_signal:
+        by_symbol.setdefault(trade.symbol, []).append(trade)
+
+    for symbol, symbol_trades in by_symbol.items():
+        baseline = baselines.get(symbol)
+        if baseline is None:
+            continue
+        # For closed trades, entry price is the expected price (as in
+        # detect_slippage_zscore without an expected_price)
+        expected = np.array([float(t.entry_price) for t in symbol_trades])
+        in_window = np.array([t.entry_time >= lookback for t in symbol_trades])
+        counts, means, stddevs = baseline.deviation_stats(expected, in_window)
+
+        for trade, count, mean, stddev in zip(
+            symbol_trades, counts, means, stddevs, strict=True
+        ):
+            if count < MIN_TRADES_FOR_ZSCORE:
+                continue
+            anomaly = _slippage_anomaly(
+                trade,
+                trade.entry_price,
+                0.0,
+                float(mean),
+                float(stddev),
+                int(count),
+            )
+            if anomaly:
+                slippage[trade.trade_id] = anomaly
+
+    anomalies = []
+    for trade in trades:
+        if trade.trade_id in slippage:
+            anomalies.append(slippage[trade.trade_id])
+        latency_anomaly = _latency_anomaly(trade)
+        if latency_anomaly:
+            anomalies.append(latency_anomaly)
+
+    return anomalies
+
+
+async def _scan(
+    db: AsyncSession, since: datetime, inclusive: bool
+) -> tuple[list[AnomalyEvent], datetime | None]:
+    """Score trades closed since `since` and persist anomalies.
 
-    # Fetch recent trades
+    Keyed on exit_time rather than created_at: only closed trades are
+    scored, and a trade opened before the watermark but closed after it
+    must still be picked up.
+
+    Returns:
+        (anomalies, newest exit_time among scanned trades)
+    """
+    closed_filter = Trade.exit_time >= since if inclusive else Trade.exit_time > since
     stmt = (
         select(Trade)
         .where(
             and_(
-                Trade.created_at >= lookback,
+                closed_filter,
                 Trade.status == "CLOSED",  # Only analyze closed trades
             )
         )
-        .order_by(Trade.created_at.desc())
+        .order_by(Trade.exit_time.desc())
     )
 
     result = await db.execute(stmt)
     trades = result.scalars().all()
 
-    anomalies = []
-
-    for trade in trades:
-        # Run all detectors
-        # Note: In production, expected_price would come from signal
-        # For now, we'll skip slippage if no signal reference
-        if trade.signal_id:
-            slippage_anomaly = await detect_slippage_zscore(db, trade)
-            if slippage_anomaly:
-                db.add(slippage_anomaly)
-                anomalies.append(slippage_anomaly)
-
-        # Latency detection (estimate signal time)
-        latency_anomaly = await detect_latency_spike(db, trade)
-        if latency_anomaly:
-            db.add(latency_anomaly)
-            anomalies.append(latency_anomaly)
-
-        # Out-of-band detection (would need market data feed)
-        # Skip for now unless we have market data
+    # Out-of-band detection needs a market data feed; skipped in scans
+    anomalies = await score_trades(db, trades)
 
+    # Client-side primary keys: the flush batches these into one INSERT
+    db.add_all(anomalies)
     await db.commit()
 
     logger.info(
@@ -403,4 +566,45 @@ async def scan_recent_trades(db: AsyncSession, hours: int = 24) -> list[AnomalyE
         f"detected {len(anomalies)} anomalies"
     )
 
+    newest = max((t.exit_time for t in trades if t.exit_time), default=None)
+    return anomalies, newest
+
+
+async def scan_recent_trades(db: AsyncSession, hours: int = 24) -> list[AnomalyEvent]:
+    """Scan recent trades for all anomaly types.
+
+    Args:
+        db: Database session
+        hours: How many hours back to scan
+
+    Returns:
+        List of detected anomalies
+
+    Business Logic:
+        1. Fetch all trades closed in the last N hours
+        2. Load per-symbol baselines once and score all trades (slippage, latency)
+        3. Persist detected anomalies to DB in one batch
+        4. Return list for reporting/alerting
+    """
+    lookback = datetime.utcnow() - timedelta(hours=hours)
+    anomalies, _ = await _scan(db, lookback, inclusive=True)
     return anomalies
+
+
+async def scan_trades_since(
+    db: AsyncSession, watermark: datetime
+) -> tuple[list[AnomalyEvent], datetime]:
+    """Incremental scan: only trades closed after the watermark.
+
+    Args:
+        db: Database session
+        watermark: exit_time of the newest trade already scanned
+
+    Returns:
+        (anomalies, new watermark)
+
+    Example:
+        >>> anomalies, watermark = await scan_trades_since(db, watermark)
+    """
+    anomalies, newest = await _scan(db, watermark, inclusive=False)
+    return anomalies, newest or watermark
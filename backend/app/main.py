@@ -1,5 +1,8 @@
 """Main FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -25,6 +28,7 @@ from backend.app.billing.routes import router as billing_router
 from backend.app.clients.devices.routes import router as devices_router
 from backend.app.clients.exec.routes import router as exec_router
 from backend.app.copy.routes import router as copy_router
+from backend.app.core.db import get_async_session
 from backend.app.core.errors import (
     APIException,
     problem_detail_exception_handler,
@@ -46,12 +50,14 @@ from backend.app.journeys.routes import router as journeys_router
 from backend.app.kb.routes import router as kb_router  # PR-091: Knowledge Base
 from backend.app.messaging.routes import router as messaging_router
 from backend.app.observability.metrics import metrics
+from backend.app.paper.book import get_paper_book
 from backend.app.paper.routes import router as paper_router
 from backend.app.payments.routes import router as payments_router
 from backend.app.polling.routes import router as polling_v2_router
 from backend.app.prefs.routes import router as prefs_router
 from backend.app.privacy.routes import router as privacy_router
 from backend.app.profile.routes import router as profile_router
+from backend.app.public.performance_cache import get_public_performance_cache
 from backend.app.public.performance_routes import router as performance_router
 from backend.app.public.trust_index_routes import router as trust_index_router
 from backend.app.reports.routes import (
@@ -63,6 +69,8 @@ from backend.app.risk.routes import router as risk_router
 from backend.app.risk.routes import trading_router
 from backend.app.signals.routes import router as signals_router
 from backend.app.strategy.decision_search import router as decision_search_router
+from backend.app.strategy.logs.writer import get_decision_log_writer
+from backend.app.strategy.versioning import get_version_routing
 from backend.app.trust.ledger.routes import router as ledger_router
 from backend.app.trust.routes import router as trust_router
 from backend.app.web3.routes import router as web3_router  # PR-102: NFT Access
@@ -78,6 +86,30 @@ except ImportError:
 
 settings = get_settings()
 
+# Longest shutdown waits for queued decision logs to be written (seconds)
+SHUTDOWN_FLUSH_TIMEOUT = 30.0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start and stop the process-wide background workers."""
+    paper_book = get_paper_book()
+    async with get_async_session() as db:
+        await paper_book.recover(db)
+    paper_book.start()
+    performance_cache = get_public_performance_cache()
+    performance_cache.start()
+    version_routing = get_version_routing()
+    version_routing.start()
+    yield
+    try:
+        await version_routing.stop()
+        await performance_cache.stop()
+        await paper_book.stop()
+    finally:
+        await get_decision_log_writer().stop(timeout=SHUTDOWN_FLUSH_TIMEOUT)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Trading Signal Platform API",
@@ -85,6 +117,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.app.debug else None,
     redoc_url="/redoc" if settings.app.debug else None,
+    lifespan=lifespan,
 )
 
 # Register exception handlers
@@ -67,6 +67,34 @@ PriorityType = Literal["transactional", "campaign"]
 ChannelType = Literal["email", "telegram", "push"]
 
 
+def build_message(
+    user_id: str,
+    channel: ChannelType,
+    template_name: str,
+    template_vars: dict[str, Any],
+    priority: PriorityType = "transactional",
+    retry_count: int = 0,
+) -> dict[str, Any]:
+    """Build a queue message payload (as consumed by the Celery worker).
+
+    Used by enqueue_message() and by callers that push many messages to a
+    lane themselves (e.g. in one Redis pipeline).
+
+    Returns:
+        dict: Message payload with a new message_id
+    """
+    return {
+        "message_id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "channel": channel,
+        "template_name": template_name,
+        "template_vars": template_vars,
+        "priority": priority,
+        "retry_count": retry_count,
+        "enqueued_at": datetime.now(UTC).isoformat(),
+    }
+
+
 class MessagingBus:
     """Redis-backed message queue with priority lanes and retry logic.
 
@@ -157,20 +185,11 @@ class MessagingBus:
         if priority not in ("transactional", "campaign"):
             raise ValueError(f"Invalid priority: {priority}")
 
-        # Generate message ID
-        message_id = str(uuid.uuid4())
-
         # Create message payload
-        message = {
-            "message_id": message_id,
-            "user_id": user_id,
-            "channel": channel,
-            "template_name": template_name,
-            "template_vars": template_vars,
-            "priority": priority,
-            "retry_count": retry_count,
-            "enqueued_at": datetime.now(UTC).isoformat(),
-        }
+        message = build_message(
+            user_id, channel, template_name, template_vars, priority, retry_count
+        )
+        message_id: str = message["message_id"]
 
         # Serialize to JSON
         message_json = json.dumps(message)
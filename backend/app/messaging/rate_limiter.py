@@ -0,0 +1,461 @@
+"""Shared hierarchical token-bucket limiter for outbound message senders.
+
+Telegram, SMTP relays and push services all enforce limits that span every
+worker process, so a per-process sliding window is not enough: N workers each
+sending "20/s" together send 20N/s and trigger 429 storms. This module keeps
+the buckets in Redis and updates them with a single Lua script so all workers
+share one view of the budget.
+
+Features:
+- Hierarchical buckets: one acquire checks global, per-chat and per-group
+  buckets atomically (all-or-nothing)
+- Reservation semantics: if the wait is short, the token is reserved and the
+  caller sleeps for the returned delay instead of polling
+- Penalties: a 429 with retry_after drains the bucket for every worker
+- Local fallback: in-process buckets when Redis is disabled or unreachable
+- SendScheduler: reorders queued sends so a hot chat never blocks others
+
+Example:
+    limiter = await get_message_rate_limiter()
+    buckets = telegram_buckets(chat_id="-100123")
+    wait = await limiter.acquire(buckets, max_wait=5.0)
+    if wait is None:
+        return {"status": "rate_limited", ...}
+    await asyncio.sleep(wait)
+    # ... send
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import redis.asyncio as aioredis
+
+from backend.app.core.settings import get_settings
+from backend.app.observability.metrics import message_rate_limit_wait_seconds
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+# Redis key prefix for all sender buckets
+BUCKET_KEY_PREFIX = "messaging:ratelimit:"
+
+# Telegram Bot API limits (https://core.telegram.org/bots/faq)
+TELEGRAM_GLOBAL_PER_SECOND = 20  # API allows 30/s, keep headroom
+TELEGRAM_CHAT_PER_SECOND = 1
+TELEGRAM_GROUP_PER_MINUTE = 20
+
+# SMTP relay limits (avoid IP blacklisting / per-provider throttling)
+EMAIL_GLOBAL_PER_MINUTE = 100
+EMAIL_DOMAIN_PER_MINUTE = 60
+
+# Web push limits (per push service and per device)
+PUSH_GLOBAL_PER_SECOND = 50
+PUSH_USER_PER_SECOND = 1
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """A single token bucket in a hierarchy.
+
+    Attributes:
+        key: Bucket identifier (prefixed with BUCKET_KEY_PREFIX in Redis)
+        capacity: Maximum burst size (tokens)
+        refill_per_second: Sustained rate (tokens added per second)
+    """
+
+    key: str
+    capacity: float
+    refill_per_second: float
+
+
+def telegram_buckets(chat_id: str) -> list[BucketSpec]:
+    """Build the bucket hierarchy for a Telegram chat.
+
+    Group and channel chat IDs are negative; they get an additional
+    20 messages/minute bucket on top of the per-chat bucket.
+
+    Args:
+        chat_id: Telegram chat ID
+
+    Returns:
+        list[BucketSpec]: Global, per-chat and (for groups) per-group buckets
+    """
+    buckets = [
+        BucketSpec(
+            "telegram:global",
+            TELEGRAM_GLOBAL_PER_SECOND,
+            TELEGRAM_GLOBAL_PER_SECOND,
+        ),
+        BucketSpec(f"telegram:chat:{chat_id}", 1, TELEGRAM_CHAT_PER_SECOND),
+    ]
+    if str(chat_id).startswith("-"):
+        buckets.append(
+            BucketSpec(
+                f"telegram:group:{chat_id}",
+                TELEGRAM_GROUP_PER_MINUTE,
+                TELEGRAM_GROUP_PER_MINUTE / 60,
+            )
+        )
+    return buckets
+
+
+def email_buckets(to: str) -> list[BucketSpec]:
+    """Build the bucket hierarchy for an email recipient.
+
+    Args:
+        to: Recipient email address
+
+    Returns:
+        list[BucketSpec]: Global and per-recipient-domain buckets
+    """
+    domain = to.rsplit("@", 1)[-1].lower()
+    return [
+        BucketSpec(
+            "email:global", EMAIL_GLOBAL_PER_MINUTE, EMAIL_GLOBAL_PER_MINUTE / 60
+        ),
+        BucketSpec(
+            f"email:domain:{domain}",
+            EMAIL_DOMAIN_PER_MINUTE,
+            EMAIL_DOMAIN_PER_MINUTE / 60,
+        ),
+    ]
+
+
+def push_buckets(user_id: str) -> list[BucketSpec]:
+    """Build the bucket hierarchy for a push notification recipient.
+
+    Args:
+        user_id: User ID owning the push subscription
+
+    Returns:
+        list[BucketSpec]: Global and per-user buckets
+    """
+    return [
+        BucketSpec("push:global", PUSH_GLOBAL_PER_SECOND, PUSH_GLOBAL_PER_SECOND),
+        BucketSpec(f"push:user:{user_id}", 3, PUSH_USER_PER_SECOND),
+    ]
+
+
+# Atomic multi-bucket reservation.
+# KEYS: bucket keys. ARGV: now, max_wait, then (capacity, rate) per key.
+# Returns {granted (0/1), wait_seconds as string}.
+_ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local max_wait = tonumber(ARGV[2])
+local n = #KEYS
+local tokens = {}
+local wait = 0
+
+for i = 1, n do
+    local capacity = tonumber(ARGV[1 + i * 2])
+    local rate = tonumber(ARGV[2 + i * 2])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local t = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    t = math.min(capacity, t + math.max(0, now - ts) * rate)
+    tokens[i] = t
+    if t < 1 then
+        local w = (1 - t) / rate
+        if w > wait then wait = w end
+    end
+end
+
+if wait > max_wait then
+    return {0, tostring(wait)}
+end
+
+for i = 1, n do
+    local capacity = tonumber(ARGV[1 + i * 2])
+    local rate = tonumber(ARGV[2 + i * 2])
+    redis.call('HSET', KEYS[i], 'tokens', tokens[i] - 1, 'ts', now)
+    redis.call('EXPIRE', KEYS[i], math.ceil(capacity / rate) + 60)
+end
+return {1, tostring(wait)}
+"""
+
+# Drain a bucket so the next acquire waits `seconds` (server-side 429).
+_PENALIZE_SCRIPT = """
+local rate = tonumber(ARGV[2])
+local seconds = tonumber(ARGV[3])
+redis.call('HSET', KEYS[1], 'tokens', 1 - seconds * rate, 'ts', ARGV[1])
+redis.call('EXPIRE', KEYS[1], math.ceil(seconds) + 60)
+return 1
+"""
+
+
+class _LocalBuckets:
+    """In-process implementation of the same bucket algorithm (fallback)."""
+
+    def __init__(self) -> None:
+        self._state: dict[str, tuple[float, float]] = {}
+
+    def _refilled(self, spec: BucketSpec, now: float) -> float:
+        tokens, ts = self._state.get(spec.key, (spec.capacity, now))
+        return min(spec.capacity, tokens + max(0.0, now - ts) * spec.refill_per_second)
+
+    def peek(self, buckets: Sequence[BucketSpec], now: float) -> float:
+        wait = 0.0
+        for spec in buckets:
+            tokens = self._refilled(spec, now)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / spec.refill_per_second)
+        return wait
+
+    def acquire(
+        self, buckets: Sequence[BucketSpec], now: float, max_wait: float
+    ) -> tuple[bool, float]:
+        wait = self.peek(buckets, now)
+        if wait > max_wait:
+            return False, wait
+        for spec in buckets:
+            self._state[spec.key] = (self._refilled(spec, now) - 1, now)
+        return True, wait
+
+    def penalize(self, spec: BucketSpec, now: float, seconds: float) -> None:
+        self._state[spec.key] = (1 - seconds * spec.refill_per_second, now)
+
+    def clear(self) -> None:
+        self._state.clear()
+
+
+class MessageRateLimiter:
+    """Redis-backed hierarchical token-bucket limiter shared by all workers.
+
+    Falls back to process-local buckets when Redis is disabled or a script
+    call fails, so delivery degrades to per-process limiting instead of
+    stopping.
+    """
+
+    def __init__(self) -> None:
+        """Initialize limiter (call initialize() to connect to Redis)."""
+        self.redis_client: aioredis.Redis | None = None
+        self._initialized = False
+        self._local = _LocalBuckets()
+
+    async def initialize(self) -> None:
+        """Connect to Redis; stay on local buckets if unavailable."""
+        if not settings.redis.enabled:
+            logger.warning("Redis disabled - message rate limiting is per-process")
+            return
+
+        try:
+            self.redis_client = aioredis.from_url(
+                settings.redis.url, decode_responses=True
+            )
+            await self.redis_client.ping()
+            self._initialized = True
+            logger.info("Shared message rate limiter initialized")
+        except Exception as e:
+            logger.warning(
+                f"Redis unavailable for message rate limiting, using local buckets: {e}"
+            )
+            self.redis_client = None
+            self._initialized = False
+
+    async def _reserve(
+        self, buckets: Sequence[BucketSpec], max_wait: float
+    ) -> tuple[bool, float]:
+        now = time.time()
+        if self._initialized and self.redis_client is not None:
+            keys = [BUCKET_KEY_PREFIX + b.key for b in buckets]
+            args: list[Any] = []
+            for b in buckets:
+                args.extend([b.capacity, b.refill_per_second])
+            try:
+                result = await self.redis_client.eval(
+                    _ACQUIRE_SCRIPT, len(keys), *keys, now, max_wait, *args
+                )
+                return bool(int(result[0])), float(result[1])
+            except Exception as e:
+                logger.error(f"Rate limiter script failed, using local buckets: {e}")
+        return self._local.acquire(buckets, now, max_wait)
+
+    async def acquire(
+        self, buckets: Sequence[BucketSpec], max_wait: float = 0.0
+    ) -> float | None:
+        """Reserve one token from every bucket in the hierarchy.
+
+        Args:
+            buckets: Bucket hierarchy (e.g. from telegram_buckets())
+            max_wait: Longest acceptable delay in seconds
+
+        Returns:
+            float | None: Seconds the caller must wait before sending
+                (0.0 = send now), or None if the wait exceeds max_wait
+                (nothing is consumed in that case)
+        """
+        granted, wait = await self._reserve(buckets, max_wait)
+        if not granted:
+            return None
+
+        if buckets:
+            message_rate_limit_wait_seconds.labels(
+                channel=buckets[0].key.split(":", 1)[0]
+            ).observe(wait)
+        return wait
+
+    async def try_acquire(self, buckets: Sequence[BucketSpec]) -> float:
+        """Take a token only if every bucket has one right now.
+
+        Args:
+            buckets: Bucket hierarchy
+
+        Returns:
+            float: 0.0 if the token was taken, otherwise the seconds until
+                the hierarchy is expected to have a token (nothing consumed)
+        """
+        granted, wait = await self._reserve(buckets, 0.0)
+        return 0.0 if granted else max(wait, 1e-3)
+
+    async def penalize(self, bucket: BucketSpec, seconds: float) -> None:
+        """Drain a bucket for every worker after a server-side 429.
+
+        Args:
+            bucket: Bucket the upstream service throttled
+            seconds: retry_after reported by the upstream service
+        """
+        now = time.time()
+        self._local.penalize(bucket, now, seconds)
+        if self._initialized and self.redis_client is not None:
+            try:
+                await self.redis_client.eval(
+                    _PENALIZE_SCRIPT,
+                    1,
+                    BUCKET_KEY_PREFIX + bucket.key,
+                    now,
+                    bucket.refill_per_second,
+                    seconds,
+                )
+            except Exception as e:
+                logger.error(f"Rate limiter penalize failed for {bucket.key}: {e}")
+
+    def reset_local(self) -> None:
+        """Clear process-local bucket state (tests/admin)."""
+        self._local.clear()
+
+
+class SendScheduler:
+    """Reorders queued sends to maximize throughput within bucket limits.
+
+    Items are grouped into per-recipient FIFO lanes (ordering within a lane is
+    preserved). The scheduler takes the token for a lane's head item before
+    dispatching it; lanes whose buckets are empty are parked until their
+    predicted refill time, so messages to other recipients keep flowing
+    instead of queuing behind a throttled chat.
+
+    Example:
+        scheduler = SendScheduler(limiter, concurrency=20)
+        results = await scheduler.run(
+            messages,
+            lane_key=lambda m: m["chat_id"],
+            buckets=lambda m: telegram_buckets(m["chat_id"]),
+            send=lambda m: send_telegram(**m, acquire_token=False),
+        )
+    """
+
+    def __init__(self, limiter: MessageRateLimiter, concurrency: int = 20) -> None:
+        """Initialize scheduler.
+
+        Args:
+            limiter: Shared limiter tokens are taken from
+            concurrency: Maximum in-flight sends
+        """
+        self.limiter = limiter
+        self.concurrency = max(1, concurrency)
+
+    async def run(
+        self,
+        items: Sequence[T],
+        lane_key: Callable[[T], Hashable],
+        buckets: Callable[[T], Sequence[BucketSpec]],
+        send: Callable[[T], Awaitable[Any]],
+    ) -> list[Any]:
+        """Send all items, returning results in input order.
+
+        Args:
+            items: Queued messages
+            lane_key: Recipient key; items sharing a key are sent in order
+            buckets: Bucket hierarchy for an item
+            send: Coroutine performing the send (token already taken)
+
+        Returns:
+            list: send() results (or the raised exception) per input item
+        """
+        results: list[Any] = [None] * len(items)
+        lanes: dict[Hashable, deque[int]] = {}
+        for index, item in enumerate(items):
+            lanes.setdefault(lane_key(item), deque()).append(index)
+
+        # (ready_at, sequence, lane) min-heap; sequence keeps FIFO among ties
+        ready: list[tuple[float, int, Hashable]] = [
+            (0.0, seq, key) for seq, key in enumerate(lanes)
+        ]
+        heapq.heapify(ready)
+        seq = len(ready)
+
+        slots = asyncio.Semaphore(self.concurrency)
+        finished: asyncio.Queue[Hashable] = asyncio.Queue()
+        tasks: set[asyncio.Task] = set()
+
+        async def dispatch(key: Hashable, index: int) -> None:
+            try:
+                results[index] = await send(items[index])
+            except Exception as e:
+                results[index] = e
+            finally:
+                slots.release()
+                finished.put_nowait(key)
+
+        pending = len(items)
+        while pending:
+            while ready and ready[0][0] <= time.monotonic():
+                await slots.acquire()
+                _, _, key = heapq.heappop(ready)
+                index = lanes[key][0]
+                wait = await self.limiter.try_acquire(buckets(items[index]))
+                if wait > 0:
+                    slots.release()
+                    seq += 1
+                    heapq.heappush(ready, (time.monotonic() + wait, seq, key))
+                    continue
+                lanes[key].popleft()
+                task = asyncio.create_task(dispatch(key, index))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            timeout = max(0.0, ready[0][0] - time.monotonic()) if ready else None
+            try:
+                key = await asyncio.wait_for(finished.get(), timeout=timeout)
+            except TimeoutError:
+                continue
+            pending -= 1
+            if lanes[key]:
+                seq += 1
+                heapq.heappush(ready, (0.0, seq, key))
+
+        return results
+
+
+# Global limiter instance
+_limiter: MessageRateLimiter | None = None
+
+
+async def get_message_rate_limiter() -> MessageRateLimiter:
+    """Get or initialize the global message rate limiter.
+
+    Returns:
+        MessageRateLimiter: Initialized limiter instance
+    """
+    global _limiter
+    if _limiter is None:
+        _limiter = MessageRateLimiter()
+        await _limiter.initialize()
+    return _limiter
@@ -5,6 +5,7 @@ This module provides email sending functionality with:
 - Retry logic with exponential backoff
 - Bounce handling (SMTPRecipientsRefused)
 - Rate limiting (100 emails/minute)
+- Shared global/per-domain token buckets across workers (Redis)
 - Comprehensive error logging
 - Prometheus metrics integration
 
@@ -29,6 +30,7 @@ Example:
 """
 
 import asyncio
+import bisect
 import logging
 import smtplib
 import time
@@ -37,6 +39,11 @@ from email.mime.text import MIMEText
 from typing import Any
 
 from backend.app.core.settings import get_settings
+from backend.app.messaging.rate_limiter import (
+    SendScheduler,
+    email_buckets,
+    get_message_rate_limiter,
+)
 from backend.app.observability.metrics import (
     message_fail_total,
     message_send_duration_seconds,
@@ -50,6 +57,9 @@ settings = get_settings()
 MAX_EMAILS_PER_MINUTE = 100
 _email_timestamps: list[float] = []
 
+# Longest delay accepted from the shared limiter before deferring (seconds)
+MAX_RATE_LIMIT_WAIT = 10.0
+
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_DELAYS = [1, 2, 4]  # seconds
@@ -61,15 +71,21 @@ async def send_email(
     html: str,
     text: str,
     retry_count: int = 0,
+    acquire_token: bool = True,
 ) -> dict[str, Any]:
     """Send email via SMTP with retry logic.
 
+    Every attempt (including retries) takes a token from the shared global
+    and per-recipient-domain buckets.
+
     Args:
         to: Recipient email address
         subject: Email subject line
         html: HTML email body
         text: Plain text email body (fallback)
         retry_count: Current retry attempt (internal use)
+        acquire_token: False when a SendScheduler already took the token
+            for the first attempt
 
     Returns:
         dict: {
@@ -118,7 +134,7 @@ async def send_email(
         logger.error(f"Invalid recipient email: {to}")
         return {"status": "failed", "message_id": None, "error": "Invalid recipient"}
 
-    # Check rate limit
+    # Check process-local rate limit
     if not _check_rate_limit():
         logger.warning(f"Rate limit exceeded - deferring email to {to}")
         message_fail_total.labels(reason="rate_limit", channel="email").inc()
@@ -140,106 +156,118 @@ async def send_email(
     msg.attach(part1)
     msg.attach(part2)
 
-    try:
-        # Send email via SMTP
-        await asyncio.to_thread(_send_smtp, msg, to)
-
-        # Track success metrics
-        duration = time.time() - start_time
-        message_send_duration_seconds.labels(channel="email").observe(duration)
-        messages_sent_total.labels(channel="email", type="alert").inc()
-
-        # Record timestamp for rate limiting
-        _email_timestamps.append(time.time())
-
-        logger.info(
-            f"Email sent successfully to {to}",
-            extra={
-                "recipient": to,
-                "subject": subject,
-                "duration_ms": int(duration * 1000),
-            },
-        )
-
-        return {
-            "status": "sent",
-            "message_id": msg["Message-ID"] if "Message-ID" in msg else None,
-            "error": None,
-        }
-
-    except smtplib.SMTPRecipientsRefused as e:
-        # Recipient invalid or rejected (permanent failure)
-        logger.error(
-            f"Email recipient refused: {to}",
-            exc_info=True,
-            extra={"recipient": to, "error": str(e)},
-        )
-        message_fail_total.labels(reason="recipient_refused", channel="email").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"Recipient refused: {str(e)}",
-        }
-
-    except smtplib.SMTPAuthenticationError as e:
-        # SMTP authentication failed (configuration error)
-        logger.error(
-            f"SMTP authentication failed: {e}",
-            exc_info=True,
-            extra={"smtp_user": settings.smtp.user},
-        )
-        message_fail_total.labels(reason="auth_error", channel="email").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"SMTP authentication failed: {str(e)}",
-        }
-
-    except (smtplib.SMTPException, OSError, TimeoutError) as e:
-        # Temporary SMTP error - retry if attempts remain
-        if retry_count < MAX_RETRIES:
-            delay = RETRY_DELAYS[min(retry_count, len(RETRY_DELAYS) - 1)]
-            logger.warning(
-                f"SMTP error - retrying in {delay}s (attempt {retry_count + 1}/{MAX_RETRIES})",
-                extra={"recipient": to, "error": str(e), "retry_delay": delay},
+    limiter = await get_message_rate_limiter()
+    buckets = email_buckets(to)
+
+    attempt = retry_count
+    while True:
+        # Take a token from the shared buckets (reserve + short wait)
+        if acquire_token or attempt > retry_count:
+            wait = await limiter.acquire(buckets, max_wait=MAX_RATE_LIMIT_WAIT)
+            if wait is None:
+                logger.warning(f"Shared rate limit exceeded - deferring email to {to}")
+                message_fail_total.labels(reason="rate_limit", channel="email").inc()
+                return {
+                    "status": "rate_limited",
+                    "message_id": None,
+                    "error": "Rate limit exceeded (shared global/domain bucket)",
+                }
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        try:
+            # Send email via SMTP
+            await asyncio.to_thread(_send_smtp, msg, to)
+
+            # Track success metrics
+            duration = time.time() - start_time
+            message_send_duration_seconds.labels(channel="email").observe(duration)
+            messages_sent_total.labels(channel="email", type="alert").inc()
+
+            # Record timestamp for rate limiting
+            _email_timestamps.append(time.time())
+
+            logger.info(
+                f"Email sent successfully to {to}",
+                extra={
+                    "recipient": to,
+                    "subject": subject,
+                    "duration_ms": int(duration * 1000),
+                },
             )
 
-            await asyncio.sleep(delay)
-
-            return await send_email(
-                to=to,
-                subject=subject,
-                html=html,
-                text=text,
-                retry_count=retry_count + 1,
+            return {
+                "status": "sent",
+                "message_id": msg["Message-ID"] if "Message-ID" in msg else None,
+                "error": None,
+            }
+
+        except smtplib.SMTPRecipientsRefused as e:
+            # Recipient invalid or rejected (permanent failure)
+            logger.error(
+                f"Email recipient refused: {to}",
+                exc_info=True,
+                extra={"recipient": to, "error": str(e)},
             )
-
-        # Max retries exceeded
-        logger.error(
-            f"Email failed after {MAX_RETRIES} retries: {e}",
-            exc_info=True,
-            extra={"recipient": to, "error": str(e)},
-        )
-        message_fail_total.labels(reason="max_retries", channel="email").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"Max retries exceeded: {str(e)}",
-        }
-
-    except Exception as e:
-        # Unexpected error
-        logger.error(
-            f"Unexpected email error: {e}",
-            exc_info=True,
-            extra={"recipient": to},
-        )
-        message_fail_total.labels(reason="unexpected_error", channel="email").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"Unexpected error: {str(e)}",
-        }
+            message_fail_total.labels(reason="recipient_refused", channel="email").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Recipient refused: {str(e)}",
+            }
+
+        except smtplib.SMTPAuthenticationError as e:
+            # SMTP authentication failed (configuration error)
+            logger.error(
+                f"SMTP authentication failed: {e}",
+                exc_info=True,
+                extra={"smtp_user": settings.smtp.user},
+            )
+            message_fail_total.labels(reason="auth_error", channel="email").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"SMTP authentication failed: {str(e)}",
+            }
+
+        except (smtplib.SMTPException, OSError, TimeoutError) as e:
+            # Temporary SMTP error - retry if attempts remain
+            if attempt < MAX_RETRIES:
+                delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+                logger.warning(
+                    f"SMTP error - retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})",
+                    extra={"recipient": to, "error": str(e), "retry_delay": delay},
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # Max retries exceeded
+            logger.error(
+                f"Email failed after {MAX_RETRIES} retries: {e}",
+                exc_info=True,
+                extra={"recipient": to, "error": str(e)},
+            )
+            message_fail_total.labels(reason="max_retries", channel="email").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Max retries exceeded: {str(e)}",
+            }
+
+        except Exception as e:
+            # Unexpected error
+            logger.error(
+                f"Unexpected email error: {e}",
+                exc_info=True,
+                extra={"recipient": to},
+            )
+            message_fail_total.labels(reason="unexpected_error", channel="email").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Unexpected error: {str(e)}",
+            }
 
 
 def _send_smtp(msg: MIMEMultipart, to: str) -> None:
@@ -274,15 +302,11 @@ def _check_rate_limit() -> bool:
         bool: True if allowed, False if rate limited
 
     Implementation:
-        - Cleans up timestamps older than 60 seconds
+        - Drops timestamps older than 60 seconds in place (list is time-ordered)
         - Checks if less than MAX_EMAILS_PER_MINUTE in last 60 seconds
     """
-    now = time.time()
-
-    # Remove timestamps older than 60 seconds
-    cutoff = now - 60
-    global _email_timestamps
-    _email_timestamps = [ts for ts in _email_timestamps if ts > cutoff]
+    cutoff = time.time() - 60
+    del _email_timestamps[: bisect.bisect_right(_email_timestamps, cutoff)]
 
     # Check if under limit
     return len(_email_timestamps) < MAX_EMAILS_PER_MINUTE
@@ -293,12 +317,16 @@ async def send_batch_emails(
     batch_size: int = 10,
     delay_between_batches: float = 1.0,
 ) -> dict[str, int]:
-    """Send multiple emails in batches (utility function).
+    """Send multiple emails through the rate-aware scheduler.
+
+    Emails are dispatched as soon as their recipient domain has a token, so a
+    throttled domain does not hold up mail to other providers.
 
     Args:
         emails: List of email dicts with keys: to, subject, html, text
-        batch_size: Number of emails to send concurrently
-        delay_between_batches: Delay in seconds between batches
+        batch_size: Maximum emails in flight concurrently
+        delay_between_batches: Unused; pacing comes from the shared limiter
+            (kept for backwards compatibility)
 
     Returns:
         dict: {"sent": 10, "failed": 2, "rate_limited": 1}
@@ -315,38 +343,33 @@ async def send_batch_emails(
     failed = 0
     rate_limited = 0
 
-    for i in range(0, len(emails), batch_size):
-        batch = emails[i : i + batch_size]
-
-        # Send batch concurrently
-        tasks = [
-            send_email(
-                to=email["to"],
-                subject=email["subject"],
-                html=email["html"],
-                text=email["text"],
-            )
-            for email in batch
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    scheduler = SendScheduler(await get_message_rate_limiter(), concurrency=batch_size)
+    results = await scheduler.run(
+        emails,
+        lane_key=lambda email: email["to"],
+        buckets=lambda email: email_buckets(email["to"]),
+        send=lambda email: send_email(
+            to=email["to"],
+            subject=email["subject"],
+            html=email["html"],
+            text=email["text"],
+            acquire_token=False,
+        ),
+    )
 
-        # Count results
-        for result in results:
-            if isinstance(result, Exception):
-                failed += 1
-            elif isinstance(result, dict):
-                if result["status"] == "sent":
-                    sent += 1
-                elif result["status"] == "rate_limited":
-                    rate_limited += 1
-                else:
-                    failed += 1
+    # Count results
+    for result in results:
+        if isinstance(result, Exception):
+            failed += 1
+        elif isinstance(result, dict):
+            if result["status"] == "sent":
+                sent += 1
+            elif result["status"] == "rate_limited":
+                rate_limited += 1
             else:
                 failed += 1
-
-        # Delay between batches
-        if i + batch_size < len(emails):
-            await asyncio.sleep(delay_between_batches)
+        else:
+            failed += 1
 
     logger.info(
         f"Batch email complete: {sent} sent, {failed} failed, {rate_limited} rate limited",
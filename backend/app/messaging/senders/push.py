@@ -6,6 +6,7 @@ This module provides PWA push notification functionality with:
 - Subscription management (store/delete subscriptions)
 - Automatic fallback to email/telegram on expired subscriptions
 - Error handling (410 Gone → delete subscription)
+- Shared global/per-user token buckets across workers (Redis)
 - Prometheus metrics integration
 
 Configuration via environment variables:
@@ -36,6 +37,11 @@ from pywebpush import WebPushException, webpush
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.settings import get_settings
+from backend.app.messaging.rate_limiter import (
+    SendScheduler,
+    get_message_rate_limiter,
+    push_buckets,
+)
 from backend.app.observability.metrics import (
     message_fail_total,
     message_send_duration_seconds,
@@ -49,6 +55,9 @@ settings = get_settings()
 MAX_RETRIES = 3
 RETRY_DELAYS = [1, 2, 4]  # seconds
 
+# Longest delay accepted from the shared limiter before deferring (seconds)
+MAX_RATE_LIMIT_WAIT = 5.0
+
 
 async def send_push(
     db: AsyncSession,
@@ -60,9 +69,14 @@ async def send_push(
     url: str | None = None,
     data: dict[str, Any] | None = None,
     retry_count: int = 0,
+    acquire_token: bool = True,
 ) -> dict[str, Any]:
     """Send PWA push notification to user.
 
+    Every attempt (including retries) takes a token from the shared global
+    and per-user buckets. A 429 from the push service drains the user's
+    bucket for every worker.
+
     Args:
         db: Database session (to fetch/delete subscriptions)
         user_id: User ID
@@ -73,10 +87,12 @@ async def send_push(
         url: URL to open on click (optional)
         data: Additional data payload (optional)
         retry_count: Current retry attempt (internal use)
+        acquire_token: False when a SendScheduler already took the token
+            for the first attempt
 
     Returns:
         dict: {
-            "status": "sent" | "failed" | "no_subscription",
+            "status": "sent" | "failed" | "no_subscription" | "rate_limited",
             "message_id": str | None,
             "error": str | None
         }
@@ -143,100 +159,122 @@ async def send_push(
     if data_dict:
         payload["data"] = data_dict
 
-    try:
-        # Send push notification via pywebpush
-        await asyncio.to_thread(
-            webpush,
-            subscription_info=subscription_info,
-            data=json.dumps(payload),
-            vapid_private_key=settings.push.vapid_private_key,
-            vapid_claims={
-                "sub": f"mailto:{settings.push.vapid_email}",
-                "aud": subscription_info["endpoint"],
-            },
-            timeout=10,
-        )
-
-        # Success
-        message_id = f"push-{int(time.time() * 1000)}"
-
-        # Track success metrics
-        duration = time.time() - start_time
-        message_send_duration_seconds.labels(channel="push").observe(duration)
-        messages_sent_total.labels(channel="push", type="alert").inc()
+    limiter = await get_message_rate_limiter()
+    buckets = push_buckets(user_id)
 
-        logger.info(
-            f"Push notification sent to user {user_id}",
-            extra={
-                "user_id": user_id,
-                "message_id": message_id,
-                "duration_ms": int(duration * 1000),
-            },
-        )
-
-        return {"status": "sent", "message_id": message_id, "error": None}
+    attempt = retry_count
+    while True:
+        # Take a token from the shared buckets (reserve + short wait)
+        if acquire_token or attempt > retry_count:
+            wait = await limiter.acquire(buckets, max_wait=MAX_RATE_LIMIT_WAIT)
+            if wait is None:
+                logger.warning(
+                    f"Shared rate limit exceeded - deferring push to user {user_id}",
+                    extra={"user_id": user_id},
+                )
+                message_fail_total.labels(reason="rate_limit", channel="push").inc()
+                return {
+                    "status": "rate_limited",
+                    "message_id": None,
+                    "error": "Rate limit exceeded (shared global/user bucket)",
+                }
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        try:
+            # Send push notification via pywebpush
+            await asyncio.to_thread(
+                webpush,
+                subscription_info=subscription_info,
+                data=json.dumps(payload),
+                vapid_private_key=settings.push.vapid_private_key,
+                vapid_claims={
+                    "sub": f"mailto:{settings.push.vapid_email}",
+                    "aud": subscription_info["endpoint"],
+                },
+                timeout=10,
+            )
 
-    except WebPushException as e:
-        # Handle specific push errors
-        if e.response and e.response.status_code == 410:
-            # 410 Gone: Subscription expired or invalid
-            logger.warning(
-                f"Push subscription expired for user {user_id} - deleting",
-                extra={"user_id": user_id},
+            # Success
+            message_id = f"push-{int(time.time() * 1000)}"
+
+            # Track success metrics
+            duration = time.time() - start_time
+            message_send_duration_seconds.labels(channel="push").observe(duration)
+            messages_sent_total.labels(channel="push", type="alert").inc()
+
+            logger.info(
+                f"Push notification sent to user {user_id}",
+                extra={
+                    "user_id": user_id,
+                    "message_id": message_id,
+                    "duration_ms": int(duration * 1000),
+                },
             )
 
-            # Delete expired subscription from database
-            await _delete_push_subscription(db, user_id)
+            return {"status": "sent", "message_id": message_id, "error": None}
 
-            message_fail_total.labels(
-                reason="subscription_expired", channel="push"
-            ).inc()
-            return {
-                "status": "failed",
-                "message_id": None,
-                "error": "Subscription expired (410 Gone)",
-            }
+        except WebPushException as e:
+            # Handle specific push errors
+            if e.response and e.response.status_code == 410:
+                # 410 Gone: Subscription expired or invalid
+                logger.warning(
+                    f"Push subscription expired for user {user_id} - deleting",
+                    extra={"user_id": user_id},
+                )
 
-        elif e.response and e.response.status_code in (400, 404, 413):
-            # 400 Bad Request, 404 Not Found, 413 Payload Too Large
-            # These are permanent failures - don't retry
-            logger.error(
-                f"Push notification permanent failure: {e.response.status_code}",
-                extra={"user_id": user_id, "status_code": e.response.status_code},
-            )
-            message_fail_total.labels(reason="permanent_error", channel="push").inc()
-            return {
-                "status": "failed",
-                "message_id": None,
-                "error": f"Permanent error: {e.response.status_code}",
-            }
+                # Delete expired subscription from database
+                await _delete_push_subscription(db, user_id)
+
+                message_fail_total.labels(
+                    reason="subscription_expired", channel="push"
+                ).inc()
+                return {
+                    "status": "failed",
+                    "message_id": None,
+                    "error": "Subscription expired (410 Gone)",
+                }
+
+            elif e.response and e.response.status_code in (400, 404, 413):
+                # 400 Bad Request, 404 Not Found, 413 Payload Too Large
+                # These are permanent failures - don't retry
+                logger.error(
+                    f"Push notification permanent failure: {e.response.status_code}",
+                    extra={"user_id": user_id, "status_code": e.response.status_code},
+                )
+                message_fail_total.labels(
+                    reason="permanent_error", channel="push"
+                ).inc()
+                return {
+                    "status": "failed",
+                    "message_id": None,
+                    "error": f"Permanent error: {e.response.status_code}",
+                }
 
-        else:
             # Temporary error - retry if attempts remain
-            if retry_count < MAX_RETRIES:
-                delay = RETRY_DELAYS[min(retry_count, len(RETRY_DELAYS) - 1)]
+            if attempt < MAX_RETRIES:
+                delay: float = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+                if e.response and e.response.status_code == 429:
+                    # Push service throttled this device: back off everywhere
+                    retry_after = e.response.headers.get("Retry-After", delay)
+                    try:
+                        delay = float(retry_after)
+                    except (TypeError, ValueError):
+                        pass
+                    await limiter.penalize(buckets[1], delay)
+                    delay = 0.0
                 logger.warning(
-                    f"Push notification error - retrying in {delay}s (attempt {retry_count + 1}/{MAX_RETRIES})",
+                    f"Push notification error - retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})",
                     extra={
                         "user_id": user_id,
                         "error": str(e),
                         "retry_delay": delay,
                     },
                 )
-
-                await asyncio.sleep(delay)
-
-                return await send_push(
-                    db=db,
-                    user_id=user_id,
-                    title=title,
-                    body=body,
-                    icon=icon,
-                    badge=badge,
-                    url=url,
-                    data=data,
-                    retry_count=retry_count + 1,
-                )
+                if delay:
+                    await asyncio.sleep(delay)
+                attempt += 1
+                continue
 
             # Max retries exceeded
             logger.error(
@@ -251,19 +289,19 @@ async def send_push(
                 "error": f"Max retries exceeded: {str(e)}",
             }
 
-    except Exception as e:
-        # Unexpected error
-        logger.error(
-            f"Unexpected push notification error: {e}",
-            exc_info=True,
-            extra={"user_id": user_id},
-        )
-        message_fail_total.labels(reason="unexpected_error", channel="push").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"Unexpected error: {str(e)}",
-        }
+        except Exception as e:
+            # Unexpected error
+            logger.error(
+                f"Unexpected push notification error: {e}",
+                exc_info=True,
+                extra={"user_id": user_id},
+            )
+            message_fail_total.labels(reason="unexpected_error", channel="push").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Unexpected error: {str(e)}",
+            }
 
 
 async def _get_push_subscription(
@@ -343,16 +381,20 @@ async def send_batch_push(
     batch_size: int = 10,
     delay_between_batches: float = 0.5,
 ) -> dict[str, int]:
-    """Send multiple push notifications in batches (utility function).
+    """Send multiple push notifications through the rate-aware scheduler.
+
+    Notifications are grouped per user (order within a user is preserved) and
+    dispatched as soon as the user's bucket has a token.
 
     Args:
         db: Database session
         notifications: List of notification dicts with keys: user_id, title, body, icon, url, data
-        batch_size: Number of notifications to send concurrently (max 10)
-        delay_between_batches: Delay in seconds between batches
+        batch_size: Maximum notifications in flight concurrently (max 10)
+        delay_between_batches: Unused; pacing comes from the shared limiter
+            (kept for backwards compatibility)
 
     Returns:
-        dict: {"sent": 10, "failed": 2, "no_subscription": 5}
+        dict: {"sent": 10, "failed": 2, "no_subscription": 5, "rate_limited": 0}
 
     Example:
         notifications = [
@@ -375,43 +417,41 @@ async def send_batch_push(
     sent = 0
     failed = 0
     no_subscription = 0
+    rate_limited = 0
+
+    scheduler = SendScheduler(await get_message_rate_limiter(), concurrency=batch_size)
+    results = await scheduler.run(
+        notifications,
+        lane_key=lambda notif: notif["user_id"],
+        buckets=lambda notif: push_buckets(notif["user_id"]),
+        send=lambda notif: send_push(
+            db=db,
+            user_id=notif["user_id"],
+            title=notif["title"],
+            body=notif["body"],
+            icon=notif.get("icon", "/icons/logo.png"),
+            badge=notif.get("badge", "/icons/badge.png"),
+            url=notif.get("url"),
+            data=notif.get("data"),
+            acquire_token=False,
+        ),
+    )
 
-    for i in range(0, len(notifications), batch_size):
-        batch = notifications[i : i + batch_size]
-
-        # Send batch concurrently
-        tasks = [
-            send_push(
-                db=db,
-                user_id=notif["user_id"],
-                title=notif["title"],
-                body=notif["body"],
-                icon=notif.get("icon", "/icons/logo.png"),
-                badge=notif.get("badge", "/icons/badge.png"),
-                url=notif.get("url"),
-                data=notif.get("data"),
-            )
-            for notif in batch
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Count results
-        for result in results:
-            if isinstance(result, Exception):
-                failed += 1
-            elif isinstance(result, dict):
-                if result["status"] == "sent":
-                    sent += 1
-                elif result["status"] == "no_subscription":
-                    no_subscription += 1
-                else:
-                    failed += 1
+    # Count results
+    for result in results:
+        if isinstance(result, Exception):
+            failed += 1
+        elif isinstance(result, dict):
+            if result["status"] == "sent":
+                sent += 1
+            elif result["status"] == "no_subscription":
+                no_subscription += 1
+            elif result["status"] == "rate_limited":
+                rate_limited += 1
             else:
                 failed += 1
-
-        # Delay between batches
-        if i + batch_size < len(notifications):
-            await asyncio.sleep(delay_between_batches)
+        else:
+            failed += 1
 
     logger.info(
         f"Batch push complete: {sent} sent, {failed} failed, {no_subscription} no subscription",
@@ -423,4 +463,9 @@ async def send_batch_push(
         },
     )
 
-    return {"sent": sent, "failed": failed, "no_subscription": no_subscription}
+    return {
+        "sent": sent,
+        "failed": failed,
+        "no_subscription": no_subscription,
+        "rate_limited": rate_limited,
+    }
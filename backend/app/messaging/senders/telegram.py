@@ -3,6 +3,7 @@
 This module provides Telegram message sending functionality with:
 - Bot API integration with aiohttp
 - Rate limiting (20 messages/second - Telegram API allows 30/s, we use 20/s for safety)
+- Shared global/per-chat/per-group token buckets across workers (Redis)
 - Retry logic with exponential backoff
 - MarkdownV2 parse mode support
 - Error handling (user blocked bot, chat not found, etc.)
@@ -30,6 +31,12 @@ from typing import Any
 import aiohttp
 
 from backend.app.core.settings import get_settings
+from backend.app.messaging.rate_limiter import (
+    TELEGRAM_GLOBAL_PER_SECOND,
+    SendScheduler,
+    get_message_rate_limiter,
+    telegram_buckets,
+)
 from backend.app.observability.metrics import (
     message_fail_total,
     message_send_duration_seconds,
@@ -39,9 +46,12 @@ from backend.app.observability.metrics import (
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Rate limiting: 20 messages per second (Telegram API allows 30/s)
-MAX_MESSAGES_PER_SECOND = 20
-_telegram_timestamps: list[float] = []
+# Rate limiting: 20 messages per second (Telegram API allows 30/s), enforced
+# by the shared global bucket
+MAX_MESSAGES_PER_SECOND = TELEGRAM_GLOBAL_PER_SECOND
+
+# Longest delay accepted from the shared limiter before deferring (seconds)
+MAX_RATE_LIMIT_WAIT = 5.0
 
 # Retry configuration
 MAX_RETRIES = 3
@@ -56,14 +66,22 @@ async def send_telegram(
     text: str,
     parse_mode: str = "MarkdownV2",
     retry_count: int = 0,
+    acquire_token: bool = True,
 ) -> dict[str, Any]:
     """Send Telegram message via Bot API.
 
+    Every attempt (including retries) takes a token from the shared
+    global/per-chat/per-group buckets, so all workers together stay within
+    Telegram's limits. A 429 drains the chat's buckets for every worker, and
+    the retry waits out Telegram's retry_after however long it is.
+
     Args:
         chat_id: Telegram chat ID (user ID or group ID)
         text: Message text (with MarkdownV2 formatting if parse_mode="MarkdownV2")
         parse_mode: Parse mode ("MarkdownV2", "HTML", or None)
         retry_count: Current retry attempt (internal use)
+        acquire_token: False when a SendScheduler already took the token
+            for the first attempt
 
     Returns:
         dict: {
@@ -103,15 +121,8 @@ async def send_telegram(
         logger.error("Invalid chat_id: empty")
         return {"status": "failed", "message_id": None, "error": "Invalid chat_id"}
 
-    # Check rate limit
-    if not _check_rate_limit():
-        logger.warning(f"Rate limit exceeded - deferring message to {chat_id}")
-        message_fail_total.labels(reason="rate_limit", channel="telegram").inc()
-        return {
-            "status": "rate_limited",
-            "message_id": None,
-            "error": "Rate limit exceeded (20/second)",
-        }
+    limiter = await get_message_rate_limiter()
+    buckets = telegram_buckets(chat_id)
 
     # Prepare API request
     url = TELEGRAM_API_URL.format(
@@ -123,212 +134,188 @@ async def send_telegram(
         "parse_mode": parse_mode,
     }
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=payload, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response_data = await response.json()
-
-                if response.status == 200 and response_data.get("ok"):
-                    # Success
-                    message_id = response_data["result"]["message_id"]
-
-                    # Track success metrics
-                    duration = time.time() - start_time
-                    message_send_duration_seconds.labels(channel="telegram").observe(
-                        duration
-                    )
-                    messages_sent_total.labels(channel="telegram", type="alert").inc()
-
-                    # Record timestamp for rate limiting
-                    _telegram_timestamps.append(time.time())
-
-                    logger.info(
-                        f"Telegram message sent to {chat_id}",
-                        extra={
-                            "chat_id": chat_id,
-                            "message_id": message_id,
-                            "duration_ms": int(duration * 1000),
-                        },
-                    )
-
-                    return {"status": "sent", "message_id": message_id, "error": None}
-
-                else:
-                    # API error
-                    error_code = response_data.get("error_code")
-                    error_description = response_data.get(
-                        "description", "Unknown error"
-                    )
-
-                    # Handle specific errors
-                    if error_code == 403:
-                        # User blocked bot or chat not found
-                        logger.warning(
-                            f"Telegram user blocked bot or chat not found: {chat_id}",
-                            extra={"chat_id": chat_id, "error": error_description},
-                        )
-                        message_fail_total.labels(
-                            reason="user_blocked", channel="telegram"
-                        ).inc()
-                        return {
-                            "status": "failed",
-                            "message_id": None,
-                            "error": f"User blocked bot or chat not found: {error_description}",
-                        }
-
-                    elif error_code == 400:
-                        # Bad request (invalid chat_id, parse error, etc.)
-                        logger.error(
-                            f"Telegram bad request: {error_description}",
-                            extra={"chat_id": chat_id, "error": error_description},
-                        )
-                        message_fail_total.labels(
-                            reason="bad_request", channel="telegram"
-                        ).inc()
-                        return {
-                            "status": "failed",
-                            "message_id": None,
-                            "error": f"Bad request: {error_description}",
-                        }
-
-                    elif error_code == 429:
-                        # Too many requests (rate limit from Telegram)
-                        retry_after = response_data.get("parameters", {}).get(
-                            "retry_after", 1
-                        )
-                        logger.warning(
-                            f"Telegram rate limit hit - retry after {retry_after}s",
-                            extra={"chat_id": chat_id, "retry_after": retry_after},
-                        )
-                        message_fail_total.labels(
-                            reason="telegram_rate_limit", channel="telegram"
-                        ).inc()
-
-                        # Wait and retry if attempts remain
-                        if retry_count < MAX_RETRIES:
-                            await asyncio.sleep(retry_after)
-                            return await send_telegram(
-                                chat_id=chat_id,
-                                text=text,
-                                parse_mode=parse_mode,
-                                retry_count=retry_count + 1,
-                            )
-
-                        return {
-                            "status": "failed",
-                            "message_id": None,
-                            "error": f"Rate limit exceeded, retry after {retry_after}s",
-                        }
-
-                    else:
-                        # Other API error - retry if temporary
-                        if retry_count < MAX_RETRIES:
-                            delay = RETRY_DELAYS[
-                                min(retry_count, len(RETRY_DELAYS) - 1)
-                            ]
-                            logger.warning(
-                                f"Telegram API error - retrying in {delay}s (attempt {retry_count + 1}/{MAX_RETRIES})",
-                                extra={
-                                    "chat_id": chat_id,
-                                    "error": error_description,
-                                    "retry_delay": delay,
-                                },
-                            )
-
-                            await asyncio.sleep(delay)
-
-                            return await send_telegram(
-                                chat_id=chat_id,
-                                text=text,
-                                parse_mode=parse_mode,
-                                retry_count=retry_count + 1,
-                            )
-
-                        # Max retries exceeded
-                        logger.error(
-                            f"Telegram message failed after {MAX_RETRIES} retries",
-                            extra={
-                                "chat_id": chat_id,
-                                "error_code": error_code,
-                                "error": error_description,
-                            },
-                        )
-                        message_fail_total.labels(
-                            reason="max_retries", channel="telegram"
-                        ).inc()
-                        return {
-                            "status": "failed",
-                            "message_id": None,
-                            "error": f"Max retries exceeded: {error_description}",
-                        }
-
-    except aiohttp.ClientError as e:
-        # Network error - retry if attempts remain
-        if retry_count < MAX_RETRIES:
-            delay = RETRY_DELAYS[min(retry_count, len(RETRY_DELAYS) - 1)]
-            logger.warning(
-                f"Telegram network error - retrying in {delay}s (attempt {retry_count + 1}/{MAX_RETRIES})",
-                extra={"chat_id": chat_id, "error": str(e), "retry_delay": delay},
+    attempt = retry_count
+    max_wait = MAX_RATE_LIMIT_WAIT
+    while True:
+        # Take a token from the shared buckets (reserve + short wait)
+        if acquire_token or attempt > retry_count:
+            wait = await limiter.acquire(buckets, max_wait=max_wait)
+            if wait is None:
+                logger.warning(
+                    f"Shared rate limit exceeded - deferring message to {chat_id}",
+                    extra={"chat_id": chat_id},
+                )
+                message_fail_total.labels(reason="rate_limit", channel="telegram").inc()
+                return {
+                    "status": "rate_limited",
+                    "message_id": None,
+                    "error": "Rate limit exceeded (shared chat/global bucket)",
+                }
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    url, json=payload, timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    response_data = await response.json()
+
+            if response.status == 200 and response_data.get("ok"):
+                # Success
+                message_id = response_data["result"]["message_id"]
+
+                # Track success metrics
+                duration = time.time() - start_time
+                message_send_duration_seconds.labels(channel="telegram").observe(
+                    duration
+                )
+                messages_sent_total.labels(channel="telegram", type="alert").inc()
+
+                logger.info(
+                    f"Telegram message sent to {chat_id}",
+                    extra={
+                        "chat_id": chat_id,
+                        "message_id": message_id,
+                        "duration_ms": int(duration * 1000),
+                    },
+                )
+
+                return {"status": "sent", "message_id": message_id, "error": None}
+
+            # API error
+            error_code = response_data.get("error_code")
+            error_description = response_data.get("description", "Unknown error")
+
+            # Handle specific errors
+            if error_code == 403:
+                # User blocked bot or chat not found
+                logger.warning(
+                    f"Telegram user blocked bot or chat not found: {chat_id}",
+                    extra={"chat_id": chat_id, "error": error_description},
+                )
+                message_fail_total.labels(
+                    reason="user_blocked", channel="telegram"
+                ).inc()
+                return {
+                    "status": "failed",
+                    "message_id": None,
+                    "error": f"User blocked bot or chat not found: {error_description}",
+                }
+
+            elif error_code == 400:
+                # Bad request (invalid chat_id, parse error, etc.)
+                logger.error(
+                    f"Telegram bad request: {error_description}",
+                    extra={"chat_id": chat_id, "error": error_description},
+                )
+                message_fail_total.labels(
+                    reason="bad_request", channel="telegram"
+                ).inc()
+                return {
+                    "status": "failed",
+                    "message_id": None,
+                    "error": f"Bad request: {error_description}",
+                }
+
+            elif error_code == 429:
+                # Too many requests (rate limit from Telegram)
+                retry_after = response_data.get("parameters", {}).get("retry_after", 1)
+                logger.warning(
+                    f"Telegram rate limit hit - retry after {retry_after}s",
+                    extra={"chat_id": chat_id, "retry_after": retry_after},
+                )
+                message_fail_total.labels(
+                    reason="telegram_rate_limit", channel="telegram"
+                ).inc()
+
+                # Drain chat/group buckets so every worker backs off, then
+                # let the next acquire() schedule the retry after the penalty
+                for bucket in buckets[1:]:
+                    await limiter.penalize(bucket, retry_after)
+
+                if attempt < MAX_RETRIES:
+                    max_wait = max(max_wait, float(retry_after) + 1.0)
+                    attempt += 1
+                    continue
+
+                return {
+                    "status": "failed",
+                    "message_id": None,
+                    "error": f"Rate limit exceeded, retry after {retry_after}s",
+                }
+
+            # Other API error - retry if temporary
+            if attempt < MAX_RETRIES:
+                delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+                logger.warning(
+                    f"Telegram API error - retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})",
+                    extra={
+                        "chat_id": chat_id,
+                        "error": error_description,
+                        "retry_delay": delay,
+                    },
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # Max retries exceeded
+            logger.error(
+                f"Telegram message failed after {MAX_RETRIES} retries",
+                extra={
+                    "chat_id": chat_id,
+                    "error_code": error_code,
+                    "error": error_description,
+                },
             )
-
-            await asyncio.sleep(delay)
-
-            return await send_telegram(
-                chat_id=chat_id,
-                text=text,
-                parse_mode=parse_mode,
-                retry_count=retry_count + 1,
+            message_fail_total.labels(reason="max_retries", channel="telegram").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Max retries exceeded: {error_description}",
+            }
+
+        except aiohttp.ClientError as e:
+            # Network error - retry if attempts remain
+            if attempt < MAX_RETRIES:
+                delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+                logger.warning(
+                    f"Telegram network error - retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})",
+                    extra={"chat_id": chat_id, "error": str(e), "retry_delay": delay},
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # Max retries exceeded
+            logger.error(
+                f"Telegram network error after {MAX_RETRIES} retries: {e}",
+                exc_info=True,
+                extra={"chat_id": chat_id},
             )
-
-        # Max retries exceeded
-        logger.error(
-            f"Telegram network error after {MAX_RETRIES} retries: {e}",
-            exc_info=True,
-            extra={"chat_id": chat_id},
-        )
-        message_fail_total.labels(reason="network_error", channel="telegram").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"Network error: {str(e)}",
-        }
-
-    except Exception as e:
-        # Unexpected error
-        logger.error(
-            f"Unexpected Telegram error: {e}",
-            exc_info=True,
-            extra={"chat_id": chat_id},
-        )
-        message_fail_total.labels(reason="unexpected_error", channel="telegram").inc()
-        return {
-            "status": "failed",
-            "message_id": None,
-            "error": f"Unexpected error: {str(e)}",
-        }
-
-
-def _check_rate_limit() -> bool:
-    """Check if rate limit allows sending another message.
-
-    Returns:
-        bool: True if allowed, False if rate limited
-
-    Implementation:
-        - Cleans up timestamps older than 1 second
-        - Checks if less than MAX_MESSAGES_PER_SECOND in last 1 second
-    """
-    now = time.time()
-
-    # Remove timestamps older than 1 second
-    cutoff = now - 1.0
-    global _telegram_timestamps
-    _telegram_timestamps = [ts for ts in _telegram_timestamps if ts > cutoff]
-
-    # Check if under limit
-    return len(_telegram_timestamps) < MAX_MESSAGES_PER_SECOND
+            message_fail_total.labels(reason="network_error", channel="telegram").inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Network error: {str(e)}",
+            }
+
+        except Exception as e:
+            # Unexpected error
+            logger.error(
+                f"Unexpected Telegram error: {e}",
+                exc_info=True,
+                extra={"chat_id": chat_id},
+            )
+            message_fail_total.labels(
+                reason="unexpected_error", channel="telegram"
+            ).inc()
+            return {
+                "status": "failed",
+                "message_id": None,
+                "error": f"Unexpected error: {str(e)}",
+            }
 
 
 async def send_batch_telegram(
@@ -336,12 +323,17 @@ async def send_batch_telegram(
     batch_size: int = 20,
     delay_between_batches: float = 1.0,
 ) -> dict[str, int]:
-    """Send multiple Telegram messages in batches (utility function).
+    """Send multiple Telegram messages through the rate-aware scheduler.
+
+    Messages are grouped per chat (order within a chat is preserved) and
+    dispatched as soon as the chat's buckets have a token, so a throttled
+    group does not hold up messages to other chats.
 
     Args:
         messages: List of message dicts with keys: chat_id, text, parse_mode
-        batch_size: Number of messages to send concurrently (max 20)
-        delay_between_batches: Delay in seconds between batches
+        batch_size: Maximum messages in flight concurrently (max 20)
+        delay_between_batches: Unused; pacing comes from the shared limiter
+            (kept for backwards compatibility)
 
     Returns:
         dict: {"sent": 10, "failed": 2, "rate_limited": 1}
@@ -358,37 +350,32 @@ async def send_batch_telegram(
     failed = 0
     rate_limited = 0
 
-    for i in range(0, len(messages), batch_size):
-        batch = messages[i : i + batch_size]
-
-        # Send batch concurrently
-        tasks = [
-            send_telegram(
-                chat_id=msg["chat_id"],
-                text=msg["text"],
-                parse_mode=msg.get("parse_mode", "MarkdownV2"),
-            )
-            for msg in batch
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    scheduler = SendScheduler(await get_message_rate_limiter(), concurrency=batch_size)
+    results = await scheduler.run(
+        messages,
+        lane_key=lambda msg: msg["chat_id"],
+        buckets=lambda msg: telegram_buckets(msg["chat_id"]),
+        send=lambda msg: send_telegram(
+            chat_id=msg["chat_id"],
+            text=msg["text"],
+            parse_mode=msg.get("parse_mode", "MarkdownV2"),
+            acquire_token=False,
+        ),
+    )
 
-        # Count results
-        for result in results:
-            if isinstance(result, Exception):
-                failed += 1
-            elif isinstance(result, dict):
-                if result["status"] == "sent":
-                    sent += 1
-                elif result["status"] == "rate_limited":
-                    rate_limited += 1
-                else:
-                    failed += 1
+    # Count results
+    for result in results:
+        if isinstance(result, Exception):
+            failed += 1
+        elif isinstance(result, dict):
+            if result["status"] == "sent":
+                sent += 1
+            elif result["status"] == "rate_limited":
+                rate_limited += 1
             else:
                 failed += 1
-
-        # Delay between batches
-        if i + batch_size < len(messages):
-            await asyncio.sleep(delay_between_batches)
+        else:
+            failed += 1
 
     logger.info(
         f"Batch Telegram complete: {sent} sent, {failed} failed, {rate_limited} rate limited",
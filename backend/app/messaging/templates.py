@@ -218,12 +218,20 @@ def render_telegram(template_name: str, template_vars: dict[str, Any]) -> str:
         SL_FAILURE_TELEGRAM,
         TP_FAILURE_TELEGRAM,
     )
+    from backend.app.messaging.templates.reports import REPORT_READY_TELEGRAM
+    from backend.app.messaging.templates.signals import (
+        COPY_TRADE_EXECUTED_TELEGRAM,
+        SIGNAL_APPROVAL_TELEGRAM,
+    )
 
     # Template registry
     telegram_templates = {
         "position_failure_entry": ENTRY_FAILURE_TELEGRAM,
         "position_failure_sl": SL_FAILURE_TELEGRAM,
         "position_failure_tp": TP_FAILURE_TELEGRAM,
+        "report_ready": REPORT_READY_TELEGRAM,
+        "signal_approval_request": SIGNAL_APPROVAL_TELEGRAM,
+        "copy_trade_executed": COPY_TRADE_EXECUTED_TELEGRAM,
     }
 
     # Get template
@@ -253,6 +261,10 @@ def render_telegram(template_name: str, template_vars: dict[str, Any]) -> str:
             required.append("loss_amount")
         else:
             required.append("profit_amount")
+    elif template_name == "report_ready":
+        required = ["period", "summary", "html_url", "pdf_url"]
+    elif template_name in ("signal_approval_request", "copy_trade_executed"):
+        required = ["instrument", "side", "entry_price", "volume"]
     else:
         required = []
 
@@ -455,6 +467,11 @@ def validate_template_vars(
         # PR-091: Daily Outlook templates
         "daily_outlook_email": ["outlook"],
         "daily_outlook_telegram": ["outlook"],
+        # PR-101: Report ready notification
+        "report_ready": ["name", "period", "summary", "html_url", "pdf_url"],
+        # Approval fan-out notifications
+        "signal_approval_request": ["instrument", "side", "entry_price", "volume"],
+        "copy_trade_executed": ["instrument", "side", "entry_price", "volume"],
     }
 
     required = required_vars.get(template_name, [])
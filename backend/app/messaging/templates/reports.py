@@ -0,0 +1,26 @@
+"""Report Templates: periodic trading report ready messages.
+
+Used by the reports pipeline (PR-101) to tell clients their daily/weekly/
+monthly report is available.
+
+Template variables:
+- name: Greeting name (Telegram username or "there")
+- period: daily, weekly or monthly
+- summary: Narrative report summary
+- html_url: Link to the full HTML report
+- pdf_url: Link to the PDF download
+"""
+
+REPORT_READY_EMAIL = {
+    "subject": "Your {period} Trading Report",
+    "template_file": "report_ready.html",
+    "required_vars": ["name", "period", "summary", "html_url", "pdf_url"],
+}
+
+REPORT_READY_TELEGRAM = """📊 *Your {period} Trading Report*
+
+{summary}
+
+View report: {html_url}
+Download PDF: {pdf_url}
+"""
@@ -0,0 +1,29 @@
+"""Signal Templates: fan-out notifications for a new signal.
+
+Used by the approval fan-out engine to tell subscribers about a signal that
+is waiting for their approval, or that was copy-traded on their account.
+
+Template variables:
+- instrument: Trading instrument (e.g., "GOLD")
+- side: "buy" or "sell"
+- entry_price: Signal entry price
+- volume: Lot size (executed volume for copy trades)
+"""
+
+SIGNAL_APPROVAL_TELEGRAM = """{side_emoji} *New Signal: {instrument}*
+
+Side: {side}
+Entry: {entry_price}
+Size: {volume} lots
+
+Open the approval console to approve or reject\\.
+"""
+
+COPY_TRADE_EXECUTED_TELEGRAM = """{side_emoji} *Copy Trade Placed: {instrument}*
+
+Side: {side}
+Entry: {entry_price}
+Size: {volume} lots
+
+This signal was approved automatically by copy\\-trading\\.
+"""
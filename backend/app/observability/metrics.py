@@ -124,6 +124,14 @@ class MetricsCollector:
             registry=self.registry,
         )
 
+        self.message_rate_limit_wait_seconds = Histogram(
+            "message_rate_limit_wait_seconds",
+            "Delay imposed by the shared sender rate limiter before a send",
+            ["channel"],
+            buckets=(0.0, 0.05, 0.25, 1.0, 5.0, 30.0),
+            registry=self.registry,
+        )
+
         self.position_failure_alerts_sent_total = Counter(
             "position_failure_alerts_sent_total",
             "Total position failure alerts sent (PR-104 integration)",
@@ -131,6 +139,49 @@ class MetricsCollector:
             registry=self.registry,
         )
 
+        # Trading runtime event pipeline
+        self.analytics_events_total = Counter(
+            "analytics_events_total",
+            "Trading loop events emitted",
+            ["event_type"],
+            registry=self.registry,
+        )
+
+        self.heartbeat_total = Counter(
+            "heartbeat_total",
+            "Trading loop heartbeats emitted",
+            registry=self.registry,
+        )
+
+        self.runtime_events_dropped_total = Counter(
+            "runtime_events_dropped_total",
+            "Runtime events dropped because the event buffer was full",
+            registry=self.registry,
+        )
+
+        self.runtime_events_flushed_total = Counter(
+            "runtime_events_flushed_total",
+            "Runtime events written by the background flusher",
+            ["backend"],
+            registry=self.registry,
+        )
+
+        # Position reconciliation scheduler
+        self.reconciliation_cycle_seconds = Histogram(
+            "reconciliation_cycle_seconds",
+            "Wall time of one reconciliation scheduler cycle",
+            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+            registry=self.registry,
+        )
+
+        self.reconciliation_user_sync_seconds = Histogram(
+            "reconciliation_user_sync_seconds",
+            "Duration of a single account reconciliation sync",
+            ["outcome"],  # ok, errors, exception
+            buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+            registry=self.registry,
+        )
+
         # CRM metrics (PR-098)
         self.crm_playbook_fired_total = Counter(
             "crm_playbook_fired_total",
@@ -729,6 +780,21 @@ class MetricsCollector:
             registry=self.registry,
         )
 
+        self.strategy_run_seconds = Histogram(
+            "strategy_run_seconds",
+            "Strategy signal generation time per candle",
+            ["name"],
+            buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            registry=self.registry,
+        )
+
+        self.strategy_timeouts_total = Counter(
+            "strategy_timeouts_total",
+            "Strategy runs abandoned after exceeding their timeout",
+            ["name"],
+            registry=self.registry,
+        )
+
         # PR-072: Signal Generation & Distribution metrics
         self.signal_publish_total = Counter(
             "signal_publish_total",
@@ -1060,8 +1126,19 @@ messages_enqueued_total = metrics.messages_enqueued_total
 messages_sent_total = metrics.messages_sent_total
 message_fail_total = metrics.message_fail_total
 message_send_duration_seconds = metrics.message_send_duration_seconds
+message_rate_limit_wait_seconds = metrics.message_rate_limit_wait_seconds
 position_failure_alerts_sent_total = metrics.position_failure_alerts_sent_total
 
+# Export trading runtime event metrics
+analytics_events_total = metrics.analytics_events_total
+heartbeat_total = metrics.heartbeat_total
+runtime_events_dropped_total = metrics.runtime_events_dropped_total
+runtime_events_flushed_total = metrics.runtime_events_flushed_total
+
+# Export reconciliation scheduler metrics
+reconciliation_cycle_seconds = metrics.reconciliation_cycle_seconds
+reconciliation_user_sync_seconds = metrics.reconciliation_user_sync_seconds
+
 # Export CRM metrics for convenient access (PR-098)
 crm_playbook_fired_total = metrics.crm_playbook_fired_total
 crm_rescue_recovered_total = metrics.crm_rescue_recovered_total
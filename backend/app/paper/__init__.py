@@ -4,6 +4,15 @@ Paper Trading Module
 Provides sandbox trading environment for users to test strategies without risking capital.
 """
 
+from backend.app.paper.book import PaperBook, PaperFill, PaperFillLog, get_paper_book
 from backend.app.paper.models import PaperAccount, PaperPosition, PaperTrade
 
-__all__ = ["PaperAccount", "PaperPosition", "PaperTrade"]
+__all__ = [
+    "PaperAccount",
+    "PaperBook",
+    "PaperFill",
+    "PaperFillLog",
+    "PaperPosition",
+    "PaperTrade",
+    "get_paper_book",
+]
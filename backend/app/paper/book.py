@@ -0,0 +1,820 @@
+"""
+In-memory Paper Trading Book
+
+Keeps paper accounts in memory so orders fill without a database round trip:
+
+- Fills apply to an in-memory AccountBook (cash, positions) and are appended
+  to an append-only fill log (JSON lines, one file per segment).
+- Quotes from the price stream mark positions to market; equity is always
+  balance + unrealized PnL at the latest mark (as in the engine, balance
+  excludes the margin of open positions). equities() values every
+  account at once with numpy over a cached position table.
+- checkpoint() writes changed accounts, their positions and the new trades
+  with bulk statements and one commit, then prunes the log. A background
+  task (start()/stop()) checkpoints every checkpoint_seconds.
+- recover() rebuilds the book after a crash: accounts are loaded from the
+  database and log fills newer than each account's book_seq are replayed.
+
+Fill prices and slippage come from PaperTradingEngine.quote_fill, so the book
+fills exactly like the engine; only persistence differs.
+
+Example:
+    >>> book = get_paper_book()
+    >>> await book.recover(db)
+    >>> book.start()
+    >>> fills = await book.fill_orders(db, "GOLD", TradeSide.BUY, bid, ask, volumes)
+    >>> book.mark("GOLD", Decimal("1960.00"), Decimal("1960.50"))
+    >>> book.equity(account_id)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import AbstractAsyncContextManager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.observability.metrics import metrics
+from backend.app.paper.engine import PaperTradingEngine
+from backend.app.paper.models import PaperAccount, PaperPosition, PaperTrade, TradeSide
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background checkpoints
+DEFAULT_CHECKPOINT_SECONDS = 5.0
+
+# Rows per bulk statement in a checkpoint
+CHECKPOINT_CHUNK_SIZE = 1000
+
+LOG_SEGMENT = re.compile(r"^fills_(\d{12})\.jsonl$")
+
+CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class PaperFill:
+    """One entry of the fill log.
+
+    Opening fills add to the (symbol, side) position at price; closing fills
+    close that whole position at price. Replaying a fill reproduces the same
+    state change, so slippage is recorded rather than recomputed.
+    """
+
+    seq: int
+    account_id: str
+    trade_id: str
+    position_id: str
+    symbol: str
+    side: TradeSide  # Position side
+    volume: Decimal
+    price: Decimal
+    slippage: Decimal
+    filled_at: datetime
+    closing: bool = False
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data.update(
+            side=self.side.value,
+            volume=str(self.volume),
+            price=str(self.price),
+            slippage=str(self.slippage),
+            filled_at=self.filled_at.isoformat(),
+        )
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, line: str) -> "PaperFill":
+        data = json.loads(line)
+        return cls(
+            seq=data["seq"],
+            account_id=data["account_id"],
+            trade_id=data["trade_id"],
+            position_id=data["position_id"],
+            symbol=data["symbol"],
+            side=TradeSide(data["side"]),
+            volume=Decimal(data["volume"]),
+            price=Decimal(data["price"]),
+            slippage=Decimal(data["slippage"]),
+            filled_at=datetime.fromisoformat(data["filled_at"]),
+            closing=data["closing"],
+        )
+
+
+@dataclass
+class BookPosition:
+    """Open position held in memory."""
+
+    id: str
+    symbol: str
+    side: TradeSide
+    volume: Decimal
+    entry_price: Decimal
+    opened_at: datetime
+
+
+@dataclass
+class AccountBook:
+    """In-memory state of one paper account.
+
+    Attributes:
+        account_id: PaperAccount ID
+        balance: Cash (margin of open positions already deducted)
+        positions: Open positions keyed by (symbol, side)
+        seq: Sequence number of the last fill applied
+    """
+
+    account_id: str
+    balance: Decimal
+    positions: dict[tuple[str, TradeSide], BookPosition] = field(default_factory=dict)
+    seq: int = 0
+
+
+class _PositionTable(NamedTuple):
+    """Open positions flattened into arrays for equities()."""
+
+    account_idx: np.ndarray
+    symbols: list[str]
+    symbol_idx: np.ndarray
+    sign: np.ndarray
+    volume: np.ndarray
+    entry: np.ndarray
+
+
+class PaperFillLog:
+    """Append-only fill log in JSON-lines segments.
+
+    A new segment (fills_<first seq>.jsonl) is started after every roll();
+    prune() deletes closed segments once their fills are checkpointed.
+
+    Attributes:
+        root: Directory holding the segments
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._file: TextIO | None = None
+        self._path: Path | None = None
+
+    def segments(self) -> list[tuple[int, Path]]:
+        """(first seq, path) of every segment, oldest first."""
+        if not self.root.is_dir():
+            return []
+        segments = []
+        for path in self.root.iterdir():
+            match = LOG_SEGMENT.match(path.name)
+            if match:
+                segments.append((int(match[1]), path))
+        return sorted(segments)
+
+    def append(self, fills: list[PaperFill]) -> None:
+        """Append fills (one write, flushed to the OS)."""
+        if not fills:
+            return
+        if self._file is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._path = self.root / f"fills_{fills[0].seq:012d}.jsonl"
+            self._file = self._path.open("a", encoding="utf-8")
+        self._file.write("".join(f"{fill.to_json()}\n" for fill in fills))
+        self._file.flush()
+
+    def roll(self) -> None:
+        """Close the current segment; the next append starts a new one."""
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._path = None
+
+    def prune(self, upto_seq: int) -> None:
+        """Delete closed segments holding only fills up to upto_seq."""
+        for first, path in self.segments():
+            if path != self._path and first <= upto_seq:
+                path.unlink(missing_ok=True)
+
+    def replay(self) -> Iterator[PaperFill]:
+        """Every logged fill, oldest first.
+
+        A torn last line (crash mid-write) is skipped.
+        """
+        for _, path in self.segments():
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield PaperFill.from_json(line)
+                    except (ValueError, KeyError) as e:
+                        logger.warning(
+                            f"Skipping unreadable paper fill in {path.name}: {e}",
+                            extra={"segment": path.name},
+                        )
+
+    def close(self) -> None:
+        self.roll()
+
+
+class PaperBook:
+    """In-memory paper book with fill log and batched checkpoints.
+
+    Attributes:
+        log: Fill log
+        engine: Fill pricing (fill mode and slippage)
+        session_factory: Callable returning an async session context manager
+            (background checkpoints)
+        checkpoint_seconds: Interval between background checkpoints
+        accounts: Loaded accounts keyed by account ID
+        marks: Latest mid price per symbol
+    """
+
+    def __init__(
+        self,
+        log: PaperFillLog,
+        engine: PaperTradingEngine | None = None,
+        session_factory: (
+            Callable[[], AbstractAsyncContextManager[AsyncSession]] | None
+        ) = None,
+        checkpoint_seconds: float = DEFAULT_CHECKPOINT_SECONDS,
+    ):
+        self.log = log
+        self.engine = engine or PaperTradingEngine()
+        self.session_factory = session_factory
+        self.checkpoint_seconds = checkpoint_seconds
+        self.accounts: dict[str, AccountBook] = {}
+        self.marks: dict[str, Decimal] = {}
+        self._seq = 0
+        self._dirty: set[str] = set()
+        self._ticked: set[str] = set()
+        self._holders: dict[str, set[str]] = {}
+        self._trades: list[dict[str, Any]] = []
+        self._table: _PositionTable | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    # ------------------------------------------------------------------
+    # Loading and recovery
+    # ------------------------------------------------------------------
+
+    async def load(self, db: AsyncSession, account_ids: list[str]) -> None:
+        """Load accounts not yet in memory (two queries per chunk)."""
+        missing = [a for a in dict.fromkeys(account_ids) if a not in self.accounts]
+        for start in range(0, len(missing), CHECKPOINT_CHUNK_SIZE):
+            chunk = missing[start : start + CHECKPOINT_CHUNK_SIZE]
+            result = await db.execute(
+                select(
+                    PaperAccount.id, PaperAccount.balance, PaperAccount.book_seq
+                ).where(PaperAccount.id.in_(chunk))
+            )
+            loaded = {
+                row.id: AccountBook(row.id, Decimal(row.balance), seq=row.book_seq)
+                for row in result
+            }
+            positions = await db.execute(
+                select(PaperPosition).where(PaperPosition.account_id.in_(chunk))
+            )
+            for pos in positions.scalars():
+                book = loaded[pos.account_id]
+                book.positions[(pos.symbol, pos.side)] = BookPosition(
+                    id=pos.id,
+                    symbol=pos.symbol,
+                    side=pos.side,
+                    volume=Decimal(pos.volume),
+                    entry_price=Decimal(pos.entry_price),
+                    opened_at=pos.opened_at,
+                )
+                self._holders.setdefault(pos.symbol, set()).add(pos.account_id)
+            self.accounts.update(loaded)
+        if missing:
+            self._table = None
+
+    async def recover(self, db: AsyncSession) -> int:
+        """Rebuild the book from the database and the fill log.
+
+        Replays, per account, the logged fills newer than its checkpointed
+        book_seq, then checkpoints so the log can be pruned.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of fills replayed
+        """
+        fills = list(self.log.replay())
+        await self.load(db, [fill.account_id for fill in fills])
+
+        db_seq = await db.scalar(select(func.max(PaperAccount.book_seq))) or 0
+        self._seq = max([db_seq, self._seq, *(fill.seq for fill in fills)])
+
+        replayed = 0
+        for fill in fills:
+            book = self.accounts.get(fill.account_id)
+            if book is None or fill.seq <= book.seq:
+                continue
+            self._apply(book, fill)
+            replayed += 1
+
+        if replayed:
+            logger.info(
+                f"Paper book replayed {replayed} fills from the log",
+                extra={"replayed": replayed, "seq": self._seq},
+            )
+        await self.checkpoint(db)
+        self.log.prune(self._seq)
+        return replayed
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    async def fill_order(
+        self,
+        db: AsyncSession,
+        account_id: str,
+        symbol: str,
+        side: TradeSide,
+        volume: Decimal,
+        bid: Decimal,
+        ask: Decimal,
+    ) -> PaperFill:
+        """
+        Fill one order (same rules as PaperTradingEngine.fill_order).
+
+        Raises:
+            ValueError: If the account is unknown or balance is insufficient
+        """
+        await self.load(db, [account_id])
+        book = self._account(account_id)
+        fill = self._open(book, symbol, side, volume, bid, ask)
+        self._record([fill])
+        return fill
+
+    async def fill_orders(
+        self,
+        db: AsyncSession,
+        symbol: str,
+        side: TradeSide,
+        bid: Decimal,
+        ask: Decimal,
+        volumes: dict[str, Decimal],
+    ) -> dict[str, PaperFill]:
+        """
+        Fill one order per account on the same quote (signal fan-out).
+
+        Accounts that are unknown or lack balance are skipped and logged.
+
+        Args:
+            db: Database session (loads accounts not yet in memory)
+            symbol: Trading symbol
+            side: BUY or SELL
+            bid: Current bid price
+            ask: Current ask price
+            volumes: Order volume per account ID
+
+        Returns:
+            Fills keyed by account ID
+        """
+        await self.load(db, list(volumes))
+        fills: dict[str, PaperFill] = {}
+        rejected = 0
+        for account_id, volume in volumes.items():
+            book = self.accounts.get(account_id)
+            if book is None:
+                rejected += 1
+                continue
+            try:
+                fills[account_id] = self._open(book, symbol, side, volume, bid, ask)
+            except ValueError:
+                rejected += 1
+        self._record(list(fills.values()))
+
+        if rejected:
+            logger.warning(
+                f"Paper book rejected {rejected} of {len(volumes)} {symbol} orders",
+                extra={"symbol": symbol, "rejected": rejected},
+            )
+        return fills
+
+    async def close_position(
+        self,
+        db: AsyncSession,
+        account_id: str,
+        symbol: str,
+        side: TradeSide,
+        bid: Decimal,
+        ask: Decimal,
+    ) -> PaperFill:
+        """
+        Close the account's (symbol, side) position.
+
+        Raises:
+            ValueError: If the account or position does not exist
+        """
+        await self.load(db, [account_id])
+        book = self._account(account_id)
+        position = book.positions.get((symbol, side))
+        if position is None:
+            raise ValueError(f"No open {side.value} {symbol} position")
+
+        exit_side = TradeSide.SELL if side == TradeSide.BUY else TradeSide.BUY
+        exit_price, slippage = self.engine.quote_fill(exit_side, bid, ask)
+        fill = self._next_fill(
+            book,
+            position.id,
+            symbol,
+            side,
+            position.volume,
+            exit_price,
+            slippage,
+            closing=True,
+        )
+        self._apply(book, fill)
+        self._record([fill])
+        return fill
+
+    def _account(self, account_id: str) -> AccountBook:
+        book = self.accounts.get(account_id)
+        if book is None:
+            raise ValueError(f"Paper account {account_id} not found")
+        return book
+
+    def _open(
+        self,
+        book: AccountBook,
+        symbol: str,
+        side: TradeSide,
+        volume: Decimal,
+        bid: Decimal,
+        ask: Decimal,
+    ) -> PaperFill:
+        fill_price, slippage = self.engine.quote_fill(side, bid, ask)
+        required_margin = fill_price * volume
+        if book.balance < required_margin:
+            raise ValueError(
+                f"Insufficient balance: {book.balance} < {required_margin}"
+            )
+        position = book.positions.get((symbol, side))
+        fill = self._next_fill(
+            book,
+            position.id if position else str(uuid4()),
+            symbol,
+            side,
+            volume,
+            fill_price,
+            slippage,
+        )
+        self._apply(book, fill)
+        return fill
+
+    def _next_fill(
+        self,
+        book: AccountBook,
+        position_id: str,
+        symbol: str,
+        side: TradeSide,
+        volume: Decimal,
+        price: Decimal,
+        slippage: float,
+        closing: bool = False,
+    ) -> PaperFill:
+        self._seq += 1
+        return PaperFill(
+            seq=self._seq,
+            account_id=book.account_id,
+            trade_id=str(uuid4()),
+            position_id=position_id,
+            symbol=symbol,
+            side=side,
+            volume=volume,
+            price=price,
+            slippage=Decimal(str(abs(slippage))),
+            filled_at=datetime.utcnow(),
+            closing=closing,
+        )
+
+    def _apply(self, book: AccountBook, fill: PaperFill) -> None:
+        """Apply a fill to the account and queue its PaperTrade row."""
+        key = (fill.symbol, fill.side)
+        if fill.closing:
+            position = book.positions.pop(key)
+            if fill.side == TradeSide.BUY:
+                pnl = (fill.price - position.entry_price) * position.volume
+            else:
+                pnl = (position.entry_price - fill.price) * position.volume
+            book.balance += position.entry_price * position.volume + pnl
+            if not any(s == fill.symbol for s, _ in book.positions):
+                self._holders.get(fill.symbol, set()).discard(book.account_id)
+            self._trades.append(
+                {
+                    "id": fill.trade_id,
+                    "account_id": book.account_id,
+                    "symbol": fill.symbol,
+                    "side": (
+                        TradeSide.SELL if fill.side == TradeSide.BUY else TradeSide.BUY
+                    ),
+                    "volume": position.volume,
+                    "entry_price": position.entry_price,
+                    "exit_price": fill.price,
+                    "realized_pnl": pnl,
+                    "slippage": fill.slippage,
+                    "filled_at": position.opened_at,
+                    "closed_at": fill.filled_at,
+                }
+            )
+        else:
+            book.balance -= fill.price * fill.volume
+            existing = book.positions.get(key)
+            if existing:
+                total_volume = existing.volume + fill.volume
+                existing.entry_price = (
+                    existing.entry_price * existing.volume + fill.price * fill.volume
+                ) / total_volume
+                existing.volume = total_volume
+            else:
+                book.positions[key] = BookPosition(
+                    id=fill.position_id,
+                    symbol=fill.symbol,
+                    side=fill.side,
+                    volume=fill.volume,
+                    entry_price=fill.price,
+                    opened_at=fill.filled_at,
+                )
+                self._holders.setdefault(fill.symbol, set()).add(book.account_id)
+            self._trades.append(
+                {
+                    "id": fill.trade_id,
+                    "account_id": book.account_id,
+                    "symbol": fill.symbol,
+                    "side": fill.side,
+                    "volume": fill.volume,
+                    "entry_price": fill.price,
+                    "slippage": fill.slippage,
+                    "filled_at": fill.filled_at,
+                }
+            )
+        book.seq = fill.seq
+        self._dirty.add(book.account_id)
+        self._table = None
+
+    def _record(self, fills: list[PaperFill]) -> None:
+        """Log applied fills and count them."""
+        self.log.append(fills)
+        for (symbol, side), count in Counter(
+            (fill.symbol, fill.side.value) for fill in fills
+        ).items():
+            metrics.paper_fills_total.labels(symbol=symbol, side=side).inc(count)
+
+    # ------------------------------------------------------------------
+    # Mark to market
+    # ------------------------------------------------------------------
+
+    def mark(self, symbol: str, bid: Decimal, ask: Decimal) -> None:
+        """Record a quote from the price stream (marks at mid)."""
+        self.marks[symbol] = (bid + ask) / Decimal("2")
+        self._ticked.add(symbol)
+
+    def equity(self, account_id: str) -> Decimal:
+        """Balance plus unrealized PnL at the latest marks.
+
+        Raises:
+            KeyError: If the account is not loaded
+        """
+        book = self.accounts[account_id]
+        equity = book.balance
+        for position in book.positions.values():
+            price = self.marks.get(position.symbol, position.entry_price)
+            equity += self._pnl(position, price)
+        return equity.quantize(CENT)
+
+    def marked_positions(
+        self, account_id: str
+    ) -> list[tuple[BookPosition, Decimal, Decimal]]:
+        """(position, mark price, unrealized PnL) of the account's positions.
+
+        Raises:
+            KeyError: If the account is not loaded
+        """
+        marked = []
+        for position in self.accounts[account_id].positions.values():
+            price = self.marks.get(position.symbol, position.entry_price)
+            marked.append((position, price, self._pnl(position, price).quantize(CENT)))
+        return marked
+
+    def pending_trades(self, account_id: str) -> list[dict[str, Any]]:
+        """PaperTrade rows of the account not yet checkpointed."""
+        return [row for row in self._trades if row["account_id"] == account_id]
+
+    def evict(self, account_id: str) -> None:
+        """Forget an account; the next access reloads it from the database.
+
+        Checkpoint first: fills not yet checkpointed are dropped from memory
+        (they remain in the fill log).
+        """
+        book = self.accounts.pop(account_id, None)
+        if book is None:
+            return
+        for symbol, _ in book.positions:
+            self._holders.get(symbol, set()).discard(account_id)
+        self._dirty.discard(account_id)
+        self._table = None
+
+    def equities(self) -> dict[str, Decimal]:
+        """Equity of every loaded account, computed in one vectorized pass."""
+        ids = list(self.accounts)
+        if self._table is None:
+            self._table = self._build_table(ids)
+        account_idx, symbols, symbol_idx, sign, volume, entry = self._table
+
+        marks = np.array(
+            [float(self.marks.get(s, np.nan)) for s in symbols], dtype=float
+        )
+        price = marks[symbol_idx]
+        price = np.where(np.isnan(price), entry, price)
+        unrealized = np.bincount(
+            account_idx, weights=sign * (price - entry) * volume, minlength=len(ids)
+        )
+
+        return {
+            account_id: (
+                self.accounts[account_id].balance + Decimal(f"{v:.2f}")
+            ).quantize(CENT)
+            for account_id, v in zip(ids, unrealized, strict=True)
+        }
+
+    def _build_table(self, ids: list[str]) -> _PositionTable:
+        """Flatten open positions into arrays (rebuilt only after fills)."""
+        index = {account_id: i for i, account_id in enumerate(ids)}
+        symbols = sorted(self._holders)
+        symbol_index = {s: i for i, s in enumerate(symbols)}
+        positions = [
+            (index[book.account_id], pos)
+            for book in self.accounts.values()
+            for pos in book.positions.values()
+        ]
+        return _PositionTable(
+            np.array([i for i, _ in positions], dtype=np.int64),
+            symbols,
+            np.array([symbol_index[p.symbol] for _, p in positions], dtype=np.int64),
+            np.array([1.0 if p.side == TradeSide.BUY else -1.0 for _, p in positions]),
+            np.array([float(p.volume) for _, p in positions], dtype=float),
+            np.array([float(p.entry_price) for _, p in positions], dtype=float),
+        )
+
+    @staticmethod
+    def _pnl(position: BookPosition, price: Decimal) -> Decimal:
+        if position.side == TradeSide.BUY:
+            return (price - position.entry_price) * position.volume
+        return (position.entry_price - price) * position.volume
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    async def checkpoint(self, db: AsyncSession) -> int:
+        """
+        Persist every changed account with bulk statements and one commit.
+
+        Writes balance, equity and book_seq of accounts with new fills or
+        newly marked positions, replaces their positions, inserts new
+        trades, and then prunes the fill log.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of accounts written
+        """
+        async with self._lock:
+            for symbol in self._ticked:
+                self._dirty.update(self._holders.get(symbol, ()))
+            dirty = [a for a in self._dirty if a in self.accounts]
+            trades = self._trades
+            seq = self._seq
+            self._dirty, self._ticked, self._trades = set(), set(), []
+            if not dirty and not trades:
+                return 0
+            self.log.roll()
+
+            now = datetime.utcnow()
+            accounts, positions = [], []
+            for account_id in dirty:
+                book = self.accounts[account_id]
+                accounts.append(
+                    {
+                        "id": account_id,
+                        "balance": book.balance,
+                        "equity": self.equity(account_id),
+                        "book_seq": book.seq,
+                        "updated_at": now,
+                    }
+                )
+                for pos, price, pnl in self.marked_positions(account_id):
+                    positions.append(
+                        {
+                            "id": pos.id,
+                            "account_id": account_id,
+                            "symbol": pos.symbol,
+                            "side": pos.side,
+                            "volume": pos.volume,
+                            "entry_price": pos.entry_price,
+                            "current_price": price,
+                            "unrealized_pnl": pnl,
+                            "opened_at": pos.opened_at,
+                            "updated_at": now,
+                        }
+                    )
+
+            try:
+                for start in range(0, len(dirty), CHECKPOINT_CHUNK_SIZE):
+                    await db.execute(
+                        update(PaperAccount),
+                        accounts[start : start + CHECKPOINT_CHUNK_SIZE],
+                    )
+                    await db.execute(
+                        delete(PaperPosition).where(
+                            PaperPosition.account_id.in_(
+                                dirty[start : start + CHECKPOINT_CHUNK_SIZE]
+                            )
+                        )
+                    )
+                for rows, model in ((positions, PaperPosition), (trades, PaperTrade)):
+                    for start in range(0, len(rows), CHECKPOINT_CHUNK_SIZE):
+                        await db.execute(
+                            insert(model), rows[start : start + CHECKPOINT_CHUNK_SIZE]
+                        )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                self._dirty.update(dirty)
+                self._trades = trades + self._trades
+                raise
+
+            self.log.prune(seq)
+            logger.debug(
+                f"Paper book checkpointed {len(dirty)} accounts",
+                extra={"accounts": len(dirty), "trades": len(trades), "seq": seq},
+            )
+            return len(dirty)
+
+    def start(self) -> None:
+        """Start background checkpoints (idempotent)."""
+        if self.session_factory is None:
+            raise RuntimeError("PaperBook needs a session_factory to run")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background checkpoints and write a final checkpoint."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.session_factory is not None:
+            async with self.session_factory() as session:
+                await self.checkpoint(session)
+        self.log.close()
+
+    async def _run(self) -> None:
+        assert self.session_factory is not None
+        while True:
+            await asyncio.sleep(self.checkpoint_seconds)
+            try:
+                async with self.session_factory() as session:
+                    await self.checkpoint(session)
+            except Exception as e:
+                # Fills stay in memory and in the log; retried next interval
+                logger.error(f"Paper book checkpoint failed: {e}", exc_info=True)
+
+
+_book: PaperBook | None = None
+
+
+def get_paper_book() -> PaperBook:
+    """Get the process-wide paper book.
+
+    The fill log lives in PAPER_BOOK_DIR; checkpoints run every
+    PAPER_CHECKPOINT_SECONDS.
+    """
+    global _book
+    if _book is None:
+        from backend.app.core.db import get_async_session
+
+        _book = PaperBook(
+            PaperFillLog(os.getenv("PAPER_BOOK_DIR", "data/paper_book")),
+            session_factory=get_async_session,
+            checkpoint_seconds=float(
+                os.getenv("PAPER_CHECKPOINT_SECONDS", str(DEFAULT_CHECKPOINT_SECONDS))
+            ),
+        )
+    return _book
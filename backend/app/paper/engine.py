@@ -92,17 +92,7 @@ class PaperTradingEngine:
             ... )
             >>> assert trade.entry_price == Decimal("1950.25")  # Mid price
         """
-        # Calculate base fill price
-        if self.fill_mode == FillPriceMode.MID:
-            base_price = (bid + ask) / Decimal("2")
-        elif self.fill_mode == FillPriceMode.BID:
-            base_price = bid
-        else:  # ASK
-            base_price = ask
-
-        # Apply slippage
-        slippage = self._calculate_slippage(side)
-        fill_price = base_price + Decimal(str(slippage))
+        fill_price, slippage = self.quote_fill(side, bid, ask)
 
         # Calculate required margin (simplified: full cost)
         required_margin = fill_price * volume
@@ -170,16 +160,7 @@ class PaperTradingEngine:
         # Calculate exit price (opposite side of entry)
         exit_side = TradeSide.SELL if position.side == TradeSide.BUY else TradeSide.BUY
 
-        if self.fill_mode == FillPriceMode.MID:
-            base_price = (bid + ask) / Decimal("2")
-        elif self.fill_mode == FillPriceMode.BID:
-            base_price = bid
-        else:  # ASK
-            base_price = ask
-
-        # Apply slippage
-        slippage = self._calculate_slippage(exit_side)
-        exit_price = base_price + Decimal(str(slippage))
+        exit_price, slippage = self.quote_fill(exit_side, bid, ask)
 
         # Calculate realized PnL
         if position.side == TradeSide.BUY:
@@ -224,6 +205,32 @@ class PaperTradingEngine:
 
         return trade
 
+    def quote_fill(
+        self, side: TradeSide, bid: Decimal, ask: Decimal
+    ) -> tuple[Decimal, float]:
+        """
+        Fill price for an order on the current quote.
+
+        Args:
+            side: Order direction
+            bid: Current bid price
+            ask: Current ask price
+
+        Returns:
+            Tuple of (fill price including slippage, slippage in price units)
+        """
+        # Calculate base fill price
+        if self.fill_mode == FillPriceMode.MID:
+            base_price = (bid + ask) / Decimal("2")
+        elif self.fill_mode == FillPriceMode.BID:
+            base_price = bid
+        else:  # ASK
+            base_price = ask
+
+        # Apply slippage
+        slippage = self._calculate_slippage(side)
+        return base_price + Decimal(str(slippage)), slippage
+
     def _calculate_slippage(self, side: TradeSide) -> float:
         """
         Calculate slippage based on mode.
@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime
+from sqlalchemy import BigInteger, Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import relationship
@@ -39,6 +39,9 @@ class PaperAccount(Base):
         Numeric(15, 2), nullable=False, default=10000.00
     )  # Balance + unrealized PnL
     enabled = Column(Boolean, nullable=False, default=False)
+    book_seq = Column(
+        BigInteger, nullable=False, default=0
+    )  # Last paper book fill checkpointed (see paper.book)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
@@ -1,7 +1,9 @@
 """
 Paper Trading API Routes
 
-Endpoints for managing paper trading accounts and orders.
+Endpoints for managing paper trading accounts and orders. Orders fill
+through the in-memory paper book (paper.book); balances, equity, positions
+and trades are read from it, so they include fills not yet checkpointed.
 """
 
 from decimal import Decimal
@@ -13,8 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.auth.models import User
 from backend.app.core.db import get_db
-from backend.app.paper.engine import FillPriceMode, PaperTradingEngine, SlippageMode
-from backend.app.paper.models import PaperAccount, PaperPosition, PaperTrade, TradeSide
+from backend.app.paper.book import PaperBook, get_paper_book
+from backend.app.paper.models import PaperAccount, PaperTrade, TradeSide
 
 router = APIRouter(prefix="/api/v1/paper", tags=["paper-trading"])
 
@@ -95,6 +97,7 @@ async def enable_paper_trading(
     request: PaperAccountCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    book: PaperBook = Depends(get_paper_book),
 ):
     """
     Enable paper trading for user.
@@ -105,6 +108,7 @@ async def enable_paper_trading(
         request: Initial balance configuration
         db: Database session
         current_user: Authenticated user
+        book: Paper book
 
     Returns:
         PaperAccountResponse: Created account
@@ -129,7 +133,9 @@ async def enable_paper_trading(
         raise HTTPException(status_code=400, detail="Paper trading already enabled")
 
     if existing:
-        # Re-enable existing account
+        # Re-enable existing account; the book reloads it with the new balance
+        await book.checkpoint(db)
+        book.evict(str(existing.id))
         existing.enabled = True
         existing.balance = request.initial_balance
         existing.equity = request.initial_balance
@@ -206,13 +212,15 @@ async def disable_paper_trading(
 async def get_paper_account(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    book: PaperBook = Depends(get_paper_book),
 ):
     """
-    Get paper account summary.
+    Get paper account summary (equity marked to the latest quotes).
 
     Args:
         db: Database session
         current_user: Authenticated user
+        book: Paper book
 
     Returns:
         PaperAccountResponse: Account details
@@ -232,11 +240,13 @@ async def get_paper_account(
     if not account:
         raise HTTPException(status_code=404, detail="Paper account not found")
 
+    account_id = str(account.id)
+    await book.load(db, [account_id])
     return PaperAccountResponse(
         id=account.id,
         user_id=account.user_id,
-        balance=account.balance,
-        equity=account.equity,
+        balance=book.accounts[account_id].balance,
+        equity=book.equity(account_id),
         enabled=account.enabled,
     )
 
@@ -245,13 +255,15 @@ async def get_paper_account(
 async def get_paper_positions(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    book: PaperBook = Depends(get_paper_book),
 ):
     """
-    Get open paper positions.
+    Get open paper positions, marked to the latest quotes.
 
     Args:
         db: Database session
         current_user: Authenticated user
+        book: Paper book
 
     Returns:
         List[PaperPositionResponse]: Open positions
@@ -268,11 +280,8 @@ async def get_paper_positions(
     if not account:
         return []
 
-    result = await db.execute(
-        select(PaperPosition).where(PaperPosition.account_id == account.id)
-    )
-    positions = result.scalars().all()
-
+    account_id = str(account.id)
+    await book.load(db, [account_id])
     return [
         PaperPositionResponse(
             id=pos.id,
@@ -280,10 +289,10 @@ async def get_paper_positions(
             side=pos.side.value,
             volume=pos.volume,
             entry_price=pos.entry_price,
-            current_price=pos.current_price,
-            unrealized_pnl=pos.unrealized_pnl,
+            current_price=price,
+            unrealized_pnl=pnl,
         )
-        for pos in positions
+        for pos, price, pnl in book.marked_positions(account_id)
     ]
 
 
@@ -291,13 +300,15 @@ async def get_paper_positions(
 async def get_paper_trades(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    book: PaperBook = Depends(get_paper_book),
 ):
     """
-    Get paper trade history.
+    Get paper trade history (including trades not yet checkpointed).
 
     Args:
         db: Database session
         current_user: Authenticated user
+        book: Paper book
 
     Returns:
         List[PaperTradeResponse]: Trade history
@@ -319,9 +330,7 @@ async def get_paper_trades(
         .where(PaperTrade.account_id == account.id)
         .order_by(PaperTrade.filled_at.desc())
     )
-    trades = result.scalars().all()
-
-    return [
+    trades = [
         PaperTradeResponse(
             id=trade.id,
             symbol=trade.symbol,
@@ -334,8 +343,24 @@ async def get_paper_trades(
             filled_at=trade.filled_at.isoformat(),
             closed_at=trade.closed_at.isoformat() if trade.closed_at else None,
         )
-        for trade in trades
+        for trade in result.scalars().all()
+    ]
+    pending = [
+        PaperTradeResponse(
+            id=row["id"],
+            symbol=row["symbol"],
+            side=row["side"].value,
+            volume=row["volume"],
+            entry_price=row["entry_price"],
+            exit_price=row.get("exit_price"),
+            realized_pnl=row.get("realized_pnl"),
+            slippage=row["slippage"],
+            filled_at=row["filled_at"].isoformat(),
+            closed_at=row["closed_at"].isoformat() if row.get("closed_at") else None,
+        )
+        for row in book.pending_trades(str(account.id))
     ]
+    return sorted(pending + trades, key=lambda t: t.filled_at, reverse=True)
 
 
 @router.post("/order", status_code=201, response_model=PaperTradeResponse)
@@ -343,14 +368,16 @@ async def place_paper_order(
     request: PaperOrderRequest,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    book: PaperBook = Depends(get_paper_book),
 ):
     """
-    Place paper trading order.
+    Place paper trading order (filled in the paper book, no commit).
 
     Args:
         request: Order details
         db: Database session
         current_user: Authenticated user
+        book: Paper book
 
     Returns:
         PaperTradeResponse: Filled trade
@@ -381,33 +408,28 @@ async def place_paper_order(
     if not account.enabled:
         raise HTTPException(status_code=403, detail="Paper trading disabled")
 
-    # Execute order
-    engine = PaperTradingEngine(
-        fill_mode=FillPriceMode.MID, slippage_mode=SlippageMode.FIXED, slippage_pips=2.0
-    )
-
     try:
-        trade = await engine.fill_order(
-            db=db,
-            account=account,
-            symbol=request.symbol,
-            side=request.side,
-            volume=request.volume,
-            bid=request.bid,
-            ask=request.ask,
+        fill = await book.fill_order(
+            db,
+            str(account.id),
+            request.symbol,
+            request.side,
+            request.volume,
+            request.bid,
+            request.ask,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
     return PaperTradeResponse(
-        id=trade.id,
-        symbol=trade.symbol,
-        side=trade.side.value,
-        volume=trade.volume,
-        entry_price=trade.entry_price,
-        exit_price=trade.exit_price,
-        realized_pnl=trade.realized_pnl,
-        slippage=trade.slippage,
-        filled_at=trade.filled_at.isoformat(),
-        closed_at=trade.closed_at.isoformat() if trade.closed_at else None,
+        id=fill.trade_id,
+        symbol=fill.symbol,
+        side=fill.side.value,
+        volume=fill.volume,
+        entry_price=fill.price,
+        exit_price=None,
+        realized_pnl=None,
+        slippage=fill.slippage,
+        filled_at=fill.filled_at.isoformat(),
+        closed_at=None,
     )
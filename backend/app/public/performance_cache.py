@@ -0,0 +1,488 @@
+"""Materialized, cached public performance payloads.
+
+The public performance endpoints are unauthenticated marketing pages, so a
+traffic spike must not turn into repeated scans of the trades table:
+
+- Closed trades are materialized once per process as a compact series
+  (trade_id, exit_time, profit, risk_reward_ratio) ordered by exit time.
+  Refreshes only fetch trades closed after the last one seen (keyset on
+  exit_time, trade_id); a full reload every full_reload_seconds picks up
+  late corrections.
+- Requested delays are rounded up to a delay bucket (DELAY_BUCKETS). A
+  bucket's trades are the prefix of the series that closed before
+  now - bucket, so every payload is built from memory.
+- Payloads (JSON body + ETag) are cached per endpoint, bucket and date
+  range, locally and in Redis (shared by workers) for ttl_seconds. Expired
+  local payloads are pruned once more than MAX_LOCAL_PAYLOADS are held.
+- On expiry a single caller rebuilds each payload: concurrent requests in a
+  process wait on a per-key lock, and across workers a Redis lock elects the
+  builder while the others keep serving the stale copy.
+
+Rounding a delay up only ever publishes older data, so the T+X guarantee
+holds; delay_applied_minutes reports the bucket actually applied.
+
+Example:
+    >>> cache = get_public_performance_cache()
+    >>> payload = await cache.get(db, "summary", delay_bucket(1440))
+    >>> payload.body, payload.etag
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.polling.protocol_v2 import generate_etag
+from backend.app.trading.store.models import Trade
+
+logger = logging.getLogger(__name__)
+
+# Published delays in minutes (1m, 5m, 15m, 1h, 4h, 1d, 1w, 30d)
+DELAY_BUCKETS = (1, 5, 15, 60, 240, 1440, 10080, 43200)
+
+# Payload lifetime (also the minimum interval between trade refreshes)
+DEFAULT_TTL_SECONDS = 60.0
+
+# Interval between full reloads of the closed-trade series
+DEFAULT_FULL_RELOAD_SECONDS = 3600.0
+
+# Cross-worker rebuild lock: lifetime, and how long losers wait for a payload
+LOCK_MILLISECONDS = 10_000
+LOCK_WAIT_SECONDS = 2.0
+
+# Local payload count above which expired payloads are pruned
+MAX_LOCAL_PAYLOADS = 1024
+
+CACHE_KEY = "public:performance:{endpoint}:{bucket}"
+
+
+def delay_bucket(delay_minutes: int) -> int:
+    """Smallest delay bucket >= delay_minutes.
+
+    Delays beyond the largest bucket are rounded up to a multiple of it.
+    """
+    for bucket in DELAY_BUCKETS:
+        if delay_minutes <= bucket:
+            return bucket
+    largest = DELAY_BUCKETS[-1]
+    return -(-delay_minutes // largest) * largest
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Trade times are naive UTC; normalize aware query parameters."""
+    if value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def cache_key(
+    endpoint: str,
+    bucket: int,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+) -> str:
+    """Cache key of an endpoint payload for a delay bucket and date range."""
+    key = CACHE_KEY.format(endpoint=endpoint, bucket=bucket)
+    if from_date is None and to_date is None:
+        return key
+    bounds = [
+        _naive_utc(value).isoformat() if value is not None else ""
+        for value in (from_date, to_date)
+    ]
+    return f"{key}:{bounds[0]}:{bounds[1]}"
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    """Serialized endpoint response.
+
+    Attributes:
+        body: JSON response body
+        etag: Content hash (excludes data_as_of, so unchanged data keeps its ETag)
+        expires_at: time.monotonic() deadline
+    """
+
+    body: bytes
+    etag: str
+    expires_at: float
+
+    def max_age(self) -> int:
+        """Seconds left before the payload expires."""
+        return max(0, int(self.expires_at - time.monotonic()))
+
+
+class PublicPerformanceCache:
+    """Closed-trade series and cached payloads for the public endpoints.
+
+    Attributes:
+        redis_client: Shared payload cache (None: process-local only)
+        ttl_seconds: Payload lifetime
+        full_reload_seconds: Interval between full series reloads
+        session_factory: Session factory for background materialization
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        full_reload_seconds: float = DEFAULT_FULL_RELOAD_SECONDS,
+        session_factory: (
+            Callable[[], AbstractAsyncContextManager[AsyncSession]] | None
+        ) = None,
+    ):
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self.session_factory = session_factory
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop the materialized series and local payloads."""
+        self._trades: list[Any] = []
+        self._exit_times: list[datetime] = []
+        self._loaded_at: float | None = None
+        self._full_at: float | None = None
+        self._payloads: dict[str, CachedPayload] = {}
+        self._refresh_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Closed-trade series
+    # ------------------------------------------------------------------
+
+    async def refresh_trades(self, db: AsyncSession) -> int:
+        """Fetch trades closed since the last refresh (at most once per TTL).
+
+        Returns:
+            Number of trades fetched
+        """
+        async with self._refresh_lock:
+            now = time.monotonic()
+            if self._loaded_at is not None and now - self._loaded_at < self.ttl_seconds:
+                return 0
+
+            full = (
+                self._full_at is None
+                or not self._trades
+                or now - self._full_at >= self.full_reload_seconds
+            )
+            query = select(
+                Trade.trade_id,
+                Trade.exit_time,
+                Trade.profit,
+                Trade.risk_reward_ratio,
+            ).where(Trade.status == "CLOSED", Trade.exit_time.is_not(None))
+            if not full:
+                last = self._trades[-1]
+                query = query.where(
+                    or_(
+                        Trade.exit_time > last.exit_time,
+                        and_(
+                            Trade.exit_time == last.exit_time,
+                            Trade.trade_id > last.trade_id,
+                        ),
+                    )
+                )
+            result = await db.execute(
+                query.order_by(Trade.exit_time.asc(), Trade.trade_id.asc())
+            )
+            rows = list(result.all())
+
+            if full:
+                self._trades = rows
+                self._exit_times = [row.exit_time for row in rows]
+                self._full_at = now
+            else:
+                self._trades.extend(rows)
+                self._exit_times.extend(row.exit_time for row in rows)
+            self._loaded_at = now
+            return len(rows)
+
+    def trades(
+        self,
+        bucket: int,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> list[Any]:
+        """Materialized trades published under a delay bucket, oldest first."""
+        cutoff = datetime.utcnow() - timedelta(minutes=bucket)
+        end = bisect_left(self._exit_times, cutoff)
+        start = 0
+        if from_date is not None:
+            start = bisect_left(self._exit_times, _naive_utc(from_date))
+        if to_date is not None:
+            end = min(end, bisect_right(self._exit_times, _naive_utc(to_date)))
+        return self._trades[start:end]
+
+    # ------------------------------------------------------------------
+    # Payloads
+    # ------------------------------------------------------------------
+
+    async def build(
+        self,
+        db: AsyncSession,
+        endpoint: str,
+        bucket: int,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> CachedPayload:
+        """Build an endpoint payload from the materialized series (not cached)."""
+        from backend.app.public.performance_routes import PAYLOAD_BUILDERS
+
+        await self.refresh_trades(db)
+        payload = await PAYLOAD_BUILDERS[endpoint](
+            self.trades(bucket, from_date, to_date), bucket
+        )
+        return CachedPayload(
+            body=json.dumps(payload).encode(),
+            etag=generate_etag(
+                {key: value for key, value in payload.items() if key != "data_as_of"}
+            ),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+    async def get(
+        self,
+        db: AsyncSession,
+        endpoint: str,
+        bucket: int,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> CachedPayload:
+        """Cached payload for an endpoint, delay bucket and date range.
+
+        Args:
+            db: Database session (used only when this caller rebuilds)
+            endpoint: "summary" or "equity"
+            bucket: Delay bucket (see delay_bucket())
+            from_date: Optional start of the exit time range
+            to_date: Optional end of the exit time range
+
+        Returns:
+            Fresh payload, or a stale one while another worker rebuilds it
+        """
+        key = cache_key(endpoint, bucket, from_date, to_date)
+        payload = self._payloads.get(key)
+        if payload is not None and payload.expires_at > time.monotonic():
+            return payload
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # Another request may have rebuilt it while we waited
+            payload = self._payloads.get(key)
+            if payload is not None and payload.expires_at > time.monotonic():
+                return payload
+
+            payload = await self._fetch(key, db, endpoint, bucket, from_date, to_date)
+            self._store(key, payload)
+            return payload
+
+    def _store(self, key: str, payload: CachedPayload) -> None:
+        """Keep a payload locally, pruning expired ones when there are many."""
+        self._payloads[key] = payload
+        if len(self._payloads) <= MAX_LOCAL_PAYLOADS:
+            return
+        now = time.monotonic()
+        for stale in [k for k, p in self._payloads.items() if p.expires_at <= now]:
+            del self._payloads[stale]
+            lock = self._locks.get(stale)
+            if lock is not None and not lock.locked():
+                del self._locks[stale]
+
+    async def _fetch(
+        self,
+        key: str,
+        db: AsyncSession,
+        endpoint: str,
+        bucket: int,
+        from_date: datetime | None,
+        to_date: datetime | None,
+    ) -> CachedPayload:
+        shared = await self._read_shared(key)
+        if shared is not None:
+            return shared
+
+        token = await self._acquire(key)
+        if token is None:
+            stale = self._payloads.get(key)
+            if stale is not None:
+                return stale
+            deadline = time.monotonic() + LOCK_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                shared = await self._read_shared(key)
+                if shared is not None:
+                    return shared
+            # Builder is slow or gone: build locally rather than fail
+
+        try:
+            payload = await self.build(db, endpoint, bucket, from_date, to_date)
+        except Exception:
+            stale = self._payloads.get(key)
+            if stale is None:
+                raise
+            logger.error(
+                f"Rebuilding {key} failed, serving stale payload",
+                exc_info=True,
+                extra={"key": key},
+            )
+            return stale
+
+        await self._write_shared(key, payload, token)
+        return payload
+
+    # ------------------------------------------------------------------
+    # Redis (fails open: every error falls back to process-local caching)
+    # ------------------------------------------------------------------
+
+    async def _read_shared(self, key: str) -> CachedPayload | None:
+        if self.redis_client is None:
+            return None
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.pttl(key)
+                raw, pttl = await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Performance cache read failed: {e}", extra={"key": key})
+            return None
+        if raw is None or pttl is None or pttl <= 0:
+            return None
+        try:
+            data = json.loads(raw)
+            return CachedPayload(
+                body=data["body"].encode(),
+                etag=data["etag"],
+                expires_at=time.monotonic() + pttl / 1000,
+            )
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            # Corrupt entry: treat as a miss so it is rebuilt and overwritten
+            logger.warning(
+                f"Performance cache entry unreadable: {e}", extra={"key": key}
+            )
+            return None
+
+    async def _acquire(self, key: str) -> str | None:
+        """Take the rebuild lock; returns its token (a fresh one without Redis)."""
+        token = uuid4().hex
+        if self.redis_client is None:
+            return token
+        try:
+            acquired = await self.redis_client.set(
+                f"{key}:lock", token, nx=True, px=LOCK_MILLISECONDS
+            )
+        except Exception as e:
+            logger.debug(f"Performance cache lock failed: {e}", extra={"key": key})
+            return token
+        return token if acquired else None
+
+    async def _write_shared(
+        self, key: str, payload: CachedPayload, token: str | None
+    ) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    key,
+                    json.dumps({"body": payload.body.decode(), "etag": payload.etag}),
+                    px=max(1, int(self.ttl_seconds * 1000)),
+                )
+                pipe.get(f"{key}:lock")
+                _, holder = await pipe.execute()
+            if token is not None and holder in (token, token.encode()):
+                await self.redis_client.delete(f"{key}:lock")
+        except Exception as e:
+            logger.debug(f"Performance cache write failed: {e}", extra={"key": key})
+
+    # ------------------------------------------------------------------
+    # Periodic materialization
+    # ------------------------------------------------------------------
+
+    async def materialize(self, db: AsyncSession) -> int:
+        """Rebuild every endpoint payload for every delay bucket.
+
+        Returns:
+            Number of payloads written
+        """
+        from backend.app.public.performance_routes import PAYLOAD_BUILDERS
+
+        written = 0
+        for endpoint in PAYLOAD_BUILDERS:
+            for bucket in DELAY_BUCKETS:
+                key = cache_key(endpoint, bucket)
+                payload = await self.build(db, endpoint, bucket)
+                self._store(key, payload)
+                await self._write_shared(key, payload, None)
+                written += 1
+        return written
+
+    def start(self) -> None:
+        """Start periodic materialization (idempotent)."""
+        if self.session_factory is None:
+            raise RuntimeError("PublicPerformanceCache needs a session_factory to run")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic materialization."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        assert self.session_factory is not None
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    await self.materialize(session)
+            except Exception as e:
+                logger.error(
+                    f"Public performance materialization failed: {e}", exc_info=True
+                )
+            # Refresh a little before payloads expire so readers never miss
+            await asyncio.sleep(self.ttl_seconds * 0.9)
+
+
+_cache: PublicPerformanceCache | None = None
+
+
+def get_public_performance_cache() -> PublicPerformanceCache:
+    """Get the process-wide public performance cache.
+
+    Payloads are shared over Redis when it is enabled; their lifetime is
+    PUBLIC_PERFORMANCE_CACHE_SECONDS.
+    """
+    global _cache
+    if _cache is None:
+        from backend.app.core.db import get_async_session
+        from backend.app.core.settings import get_settings
+
+        settings = get_settings()
+        redis_client = None
+        if settings.redis.enabled:
+            redis_client = aioredis.from_url(settings.redis.url)
+        _cache = PublicPerformanceCache(
+            redis_client,
+            ttl_seconds=float(
+                os.getenv("PUBLIC_PERFORMANCE_CACHE_SECONDS", str(DEFAULT_TTL_SECONDS))
+            ),
+            session_factory=get_async_session,
+        )
+    return _cache
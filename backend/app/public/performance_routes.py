@@ -2,13 +2,15 @@
 
 Provides read-only, aggregated trading performance data with T+X delay enforcement.
 No PII leak. Strong disclaimers. For marketing and transparency.
+
+Responses are served from materialized payloads (see performance_cache) with
+ETag and Cache-Control headers; requests never scan the trades table.
 """
 
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from prometheus_client import Counter
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +22,10 @@ from backend.app.analytics.metrics import (
 )
 from backend.app.core.db import get_db
 from backend.app.core.logging import get_logger
+from backend.app.public.performance_cache import (
+    delay_bucket,
+    get_public_performance_cache,
+)
 from backend.app.trading.store.models import Trade
 
 logger = get_logger(__name__)
@@ -72,7 +78,7 @@ class PerformanceResponse:
         self.delay_applied_minutes = delay_applied_minutes
         self.disclaimer = disclaimer
 
-    def to_dict(self):
+    def to_dict(self) -> dict:
         """Convert to dictionary for JSON response."""
         return {
             "total_trades": self.total_trades,
@@ -261,22 +267,117 @@ def _calculate_max_drawdown(trades: list[Trade]) -> float:
     return max_dd * 100
 
 
+async def _summary_payload(trades: list[Trade], delay_minutes: int) -> dict:
+    """Performance summary response body for a delay bucket."""
+    metrics = await _calculate_performance_metrics(trades)
+    metrics.delay_applied_minutes = delay_minutes
+
+    logger.info(
+        f"Performance summary calculated: {metrics.total_trades} trades",
+        extra={"total_trades": metrics.total_trades, "delay_minutes": delay_minutes},
+    )
+    return metrics.to_dict()
+
+
+async def _equity_payload(trades: list[Trade], delay_minutes: int) -> dict:
+    """Equity curve response body for a delay bucket."""
+    points = []
+    running_equity = Decimal("10000")  # Starting equity
+
+    for trade in trades:
+        if not trade.exit_time or not trade.profit:
+            continue
+
+        running_equity += Decimal(str(trade.profit))
+
+        # Calculate return percentage
+        returns_percent = float(
+            ((running_equity - Decimal("10000")) / Decimal("10000")) * 100
+        )
+
+        # Create point for this trade's exit date
+        points.append(
+            EquityPoint(
+                date=trade.exit_time,
+                equity=running_equity,
+                returns_percent=returns_percent,
+            )
+        )
+
+    logger.info(
+        f"Equity curve calculated: {len(points)} data points",
+        extra={"total_points": len(points), "delay_minutes": delay_minutes},
+    )
+
+    # Get final equity
+    final_equity = float(running_equity) if points else 10000.0
+
+    return {
+        "points": [p.to_dict() for p in points],
+        "final_equity": round(final_equity, 2),
+        "delay_applied_minutes": delay_minutes,
+        "data_as_of": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+# Response body builders, keyed by endpoint (used by performance_cache)
+PAYLOAD_BUILDERS = {
+    "summary": _summary_payload,
+    "equity": _equity_payload,
+}
+
+
+async def _cached_response(
+    db: AsyncSession,
+    endpoint: str,
+    delay_minutes: int,
+    from_date: datetime | None,
+    to_date: datetime | None,
+    if_none_match: str | None,
+) -> Response:
+    """Serve an endpoint from the performance cache with HTTP caching headers.
+
+    Payloads are cached per delay bucket and date range.
+    """
+    payload = await get_public_performance_cache().get(
+        db, endpoint, delay_bucket(delay_minutes), from_date, to_date
+    )
+
+    headers = {
+        "ETag": f'"{payload.etag}"',
+        "Cache-Control": f"public, max-age={payload.max_age()}",
+    }
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or headers["ETag"] in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(
+        content=payload.body, media_type="application/json", headers=headers
+    )
+
+
 @router.get("/performance/summary")
 async def get_performance_summary(
     delay_minutes: int = Query(1440, ge=0, le=1_000_000),  # noqa: B008
     from_date: datetime | None = Query(None),  # noqa: B008
     to_date: datetime | None = Query(None),  # noqa: B008
+    if_none_match: str | None = Header(None),  # noqa: B008
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> dict:
+) -> Response:
     """Get aggregated performance summary with T+X delay.
 
     Endpoint: GET /api/v1/public/performance/summary
 
     Query Parameters:
-        delay_minutes: Minimum delay before publishing data (default: 1440 = 24h)
+        delay_minutes: Minimum delay before publishing data (default: 1440 = 24h),
+            rounded up to the next published delay bucket
         from_date: Optional start date filter
         to_date: Optional end date filter
 
+    Caching:
+        ETag + Cache-Control: public, max-age=<seconds until refresh>.
+        If-None-Match with the current ETag returns 304 Not Modified.
+
     Returns:
         Aggregated performance metrics (no PII):
         - total_trades: Number of closed trades
@@ -326,20 +427,10 @@ async def get_performance_summary(
             extra={"delay_minutes": delay_minutes},
         )
 
-        trades = await _get_closed_trades_with_delay(
-            db, delay_minutes, from_date, to_date
+        return await _cached_response(
+            db, "summary", delay_minutes, from_date, to_date, if_none_match
         )
 
-        # Calculate metrics
-        metrics = await _calculate_performance_metrics(trades)
-
-        logger.info(
-            f"Performance summary calculated: {metrics.total_trades} trades",
-            extra={"total_trades": metrics.total_trades},
-        )
-
-        return cast(dict[Any, Any], metrics.to_dict())
-
     except ValueError as e:
         logger.warning(f"Validation error: {e}")
         public_performance_error_total.labels(
@@ -361,14 +452,16 @@ async def get_equity_curve(
     from_date: datetime | None = Query(None),  # noqa: B008
     to_date: datetime | None = Query(None),  # noqa: B008
     granularity: str = Query("daily"),  # noqa: B008
+    if_none_match: str | None = Header(None),  # noqa: B008
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> dict:
+) -> Response:
     """Get equity curve data points for charting.
 
     Endpoint: GET /api/v1/public/performance/equity
 
     Query Parameters:
-        delay_minutes: Minimum delay before publishing (default: 1440 = 24h)
+        delay_minutes: Minimum delay before publishing (default: 1440 = 24h),
+            rounded up to the next published delay bucket
         from_date: Optional start date
         to_date: Optional end date
         granularity: "daily" (only option for now)
@@ -422,55 +515,10 @@ async def get_equity_curve(
             extra={"delay_minutes": delay_minutes, "granularity": granularity},
         )
 
-        # Fetch closed trades with delay enforcement
-        trades = await _get_closed_trades_with_delay(
-            db, delay_minutes, from_date, to_date
-        )
-
-        # Build equity curve
-        points = []
-        running_equity = Decimal("10000")  # Starting equity
-        last_date = None
-
-        for trade in trades:
-            if not trade.exit_time or not trade.profit:
-                continue
-
-            # Group by date
-            trade_date = trade.exit_time.date()
-            if last_date is None or trade_date != last_date:
-                last_date = trade_date
-
-            running_equity += Decimal(str(trade.profit))
-
-            # Calculate return percentage
-            returns_percent = float(
-                ((running_equity - Decimal("10000")) / Decimal("10000")) * 100
-            )
-
-            # Create point for this trade's exit date
-            point = EquityPoint(
-                date=trade.exit_time,
-                equity=running_equity,
-                returns_percent=returns_percent,
-            )
-            points.append(point)
-
-        logger.info(
-            f"Equity curve calculated: {len(points)} data points",
-            extra={"total_points": len(points)},
+        return await _cached_response(
+            db, "equity", delay_minutes, from_date, to_date, if_none_match
         )
 
-        # Get final equity
-        final_equity = float(running_equity) if points else 10000.0
-
-        return {
-            "points": [p.to_dict() for p in points],
-            "final_equity": round(final_equity, 2),
-            "delay_applied_minutes": delay_minutes,
-            "data_as_of": datetime.utcnow().isoformat() + "Z",
-        }
-
     except ValueError as e:
         logger.warning(f"Validation error: {e}")
         public_performance_error_total.labels(
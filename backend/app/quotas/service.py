@@ -272,6 +272,143 @@ class QuotaService:
                 "reset_at": period_end,
             }
 
+    async def consume_batch(
+        self,
+        user_tiers: dict[str, str],
+        quota_type: str,
+        amount: int = 1,
+    ) -> set[str]:
+        """Check and consume one quota for many users in two Redis round trips.
+
+        Same rules as check_and_consume(): a user whose counter would exceed
+        the tier limit is blocked and nothing is consumed for them. All
+        counters are incremented in one pipeline; blocked users are rolled
+        back (and first-use TTLs set) in a second. Only the Redis counters are
+        updated; QuotaUsage audit rows are not written per user.
+
+        Args:
+            user_tiers: User ID -> subscription tier
+            quota_type: Type of quota (signals_per_day, etc.)
+            amount: Amount to consume per user (default 1)
+
+        Returns:
+            set[str]: Users whose quota was consumed (the others are blocked)
+        """
+        if not user_tiers:
+            return set()
+
+        allowed, keyed = await self._batch_keys(user_tiers, quota_type)
+
+        if not keyed:
+            return allowed
+
+        redis_client = await get_redis()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for _, redis_key, _, _ in keyed:
+                    pipe.incrby(redis_key, amount)
+                counts = await pipe.execute()
+
+            blocked = 0
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for (user_id, redis_key, definition, period_end), count in zip(
+                    keyed, counts, strict=True
+                ):
+                    if count > definition.limit:
+                        pipe.decrby(redis_key, amount)
+                        blocked += 1
+                        continue
+                    allowed.add(user_id)
+                    if count == amount:
+                        pipe.expire(
+                            redis_key,
+                            self._calculate_ttl(definition.period, period_end),
+                        )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error checking quota batch: {e}", exc_info=True)
+            # On error, allow by default (fail open)
+            return set(user_tiers)
+
+        if blocked:
+            metrics.quota_block_total.labels(key=quota_type).inc(blocked)
+            logger.warning(
+                f"Quota exceeded for {blocked}/{len(user_tiers)} users: {quota_type}",
+                extra={"quota_type": quota_type, "blocked": blocked},
+            )
+
+        return allowed
+
+    async def refund_batch(
+        self,
+        user_tiers: dict[str, str],
+        quota_type: str,
+        amount: int = 1,
+    ) -> None:
+        """Give back quota consumed by consume_batch() (one Redis round trip).
+
+        Used when the work the quota was consumed for did not happen. Errors
+        are logged, not raised: the counters expire with their period.
+
+        Args:
+            user_tiers: User ID -> subscription tier
+            quota_type: Type of quota (signals_per_day, etc.)
+            amount: Amount consumed per user (default 1)
+        """
+        if not user_tiers:
+            return
+
+        _, keyed = await self._batch_keys(user_tiers, quota_type)
+        if not keyed:
+            return
+
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for _, redis_key, _, _ in keyed:
+                    pipe.decrby(redis_key, amount)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error refunding quota batch: {e}", exc_info=True)
+            return
+
+        logger.info(
+            f"Refunded {quota_type} quota for {len(keyed)} users",
+            extra={"quota_type": quota_type, "refunded": len(keyed)},
+        )
+
+    async def _batch_keys(
+        self, user_tiers: dict[str, str], quota_type: str
+    ) -> tuple[set[str], list[tuple[str, str, QuotaDefinition, datetime]]]:
+        """Split users into unlimited ones and (user, key, definition, end)."""
+        await self._ensure_quota_definitions()
+        result = await self.db.execute(
+            select(QuotaDefinition).where(QuotaDefinition.quota_type == quota_type)
+        )
+        definitions = {d.tier: d for d in result.scalars()}
+
+        now = datetime.utcnow()
+        unlimited: set[str] = set()
+        keyed: list[tuple[str, str, QuotaDefinition, datetime]] = []
+        for user_id, tier in user_tiers.items():
+            definition = definitions.get(tier)
+            if definition is None:
+                # No definition: allowed by default, as in check_and_consume()
+                unlimited.add(user_id)
+                continue
+            period_start, period_end = self._calculate_period_boundaries(
+                definition.period, now
+            )
+            keyed.append(
+                (
+                    user_id,
+                    self._get_redis_key(user_id, quota_type, period_start),
+                    definition,
+                    period_end,
+                )
+            )
+        return unlimited, keyed
+
     async def _update_usage_record(
         self,
         user_id: str,
@@ -27,6 +27,77 @@ logger = logging.getLogger(__name__)
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
+def calculate_period_range(
+    period: ReportPeriod, now: datetime | None = None
+) -> tuple[datetime, datetime]:
+    """Calculate start and end dates for report period."""
+    now = now or datetime.utcnow()
+    today = now.date()
+
+    if period == ReportPeriod.DAILY:
+        # Yesterday
+        start = datetime.combine(today - timedelta(days=1), datetime.min.time())
+        end = datetime.combine(today, datetime.min.time())
+    elif period == ReportPeriod.WEEKLY:
+        # Last 7 days
+        start = datetime.combine(today - timedelta(days=7), datetime.min.time())
+        end = datetime.combine(today, datetime.min.time())
+    else:  # MONTHLY
+        # Last 30 days
+        start = datetime.combine(today - timedelta(days=30), datetime.min.time())
+        end = datetime.combine(today, datetime.min.time())
+
+    return start, end
+
+
+def format_period_label(start: datetime, end: datetime) -> str:
+    """Format period label for display."""
+    return f"{start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}"
+
+
+def build_summary(report_type: ReportType, data: dict[str, Any]) -> str:
+    """Template-based narrative summary for report data."""
+    # In production: call OpenAI/Claude API
+    # For now: template-based summary
+
+    if report_type == ReportType.CLIENT:
+        if data["total_trades"] == 0:
+            return "No trades were executed during this period. Consider reviewing signal approvals to ensure you're actively participating in opportunities."
+
+        pnl = data["total_pnl"]
+        win_rate = data["win_rate"] * 100
+        trades = data["total_trades"]
+
+        if pnl > 0:
+            sentiment = "strong positive"
+        elif pnl < 0:
+            sentiment = "negative"
+        else:
+            sentiment = "neutral"
+
+        return (
+            f"Your trading performance this period shows {sentiment} results with "
+            f"£{pnl:,.2f} total P&L across {trades} trades. "
+            f"Your win rate of {win_rate:.1f}% {'exceeded' if win_rate > 50 else 'was below'} "
+            f"the 50% benchmark. "
+            f"{'Risk management metrics look healthy.' if data['max_drawdown'] < 0.15 else 'Consider tightening risk controls to reduce drawdown.'}"
+        )
+    else:  # OWNER
+        mrr = data["mrr"]
+        mrr_change = data["mrr_change"]
+        churn = data["churn_rate"] * 100
+        users = data["active_users"]
+        win_rate = data["platform_win_rate"] * 100
+
+        return (
+            f"Business performance this period: MRR at £{mrr:,.0f} "
+            f"({'up' if mrr_change > 0 else 'down'} {abs(mrr_change):.1f}%), "
+            f"serving {users} active users with {churn:.1f}% churn. "
+            f"Platform win rate of {win_rate:.1f}% demonstrates strong signal quality. "
+            f"{'Growth trajectory is positive.' if mrr_change > 0 else 'Focus on retention and upsell strategies.'}"
+        )
+
+
 class ReportGenerator:
     """
     Service for generating AI-enhanced reports (PR-101).
@@ -146,23 +217,7 @@ class ReportGenerator:
         self, period: ReportPeriod
     ) -> tuple[datetime, datetime]:
         """Calculate start and end dates for report period."""
-        now = datetime.utcnow()
-        today = now.date()
-
-        if period == ReportPeriod.DAILY:
-            # Yesterday
-            start = datetime.combine(today - timedelta(days=1), datetime.min.time())
-            end = datetime.combine(today, datetime.min.time())
-        elif period == ReportPeriod.WEEKLY:
-            # Last 7 days
-            start = datetime.combine(today - timedelta(days=7), datetime.min.time())
-            end = datetime.combine(today, datetime.min.time())
-        else:  # MONTHLY
-            # Last 30 days
-            start = datetime.combine(today - timedelta(days=30), datetime.min.time())
-            end = datetime.combine(today, datetime.min.time())
-
-        return start, end
+        return calculate_period_range(period)
 
     async def _collect_client_data(
         self, user_id: str, start: datetime, end: datetime
@@ -455,45 +510,7 @@ class ReportGenerator:
         self, report_type: ReportType, data: dict[str, Any]
     ) -> str:
         """Generate AI narrative summary from data."""
-        # In production: call OpenAI/Claude API
-        # For now: template-based summary
-
-        if report_type == ReportType.CLIENT:
-            if data["total_trades"] == 0:
-                return "No trades were executed during this period. Consider reviewing signal approvals to ensure you're actively participating in opportunities."
-
-            pnl = data["total_pnl"]
-            win_rate = data["win_rate"] * 100
-            trades = data["total_trades"]
-
-            if pnl > 0:
-                sentiment = "strong positive"
-            elif pnl < 0:
-                sentiment = "negative"
-            else:
-                sentiment = "neutral"
-
-            return (
-                f"Your trading performance this period shows {sentiment} results with "
-                f"£{pnl:,.2f} total P&L across {trades} trades. "
-                f"Your win rate of {win_rate:.1f}% {'exceeded' if win_rate > 50 else 'was below'} "
-                f"the 50% benchmark. "
-                f"{'Risk management metrics look healthy.' if data['max_drawdown'] < 0.15 else 'Consider tightening risk controls to reduce drawdown.'}"
-            )
-        else:  # OWNER
-            mrr = data["mrr"]
-            mrr_change = data["mrr_change"]
-            churn = data["churn_rate"] * 100
-            users = data["active_users"]
-            win_rate = data["platform_win_rate"] * 100
-
-            return (
-                f"Business performance this period: MRR at £{mrr:,.0f} "
-                f"({'up' if mrr_change > 0 else 'down'} {abs(mrr_change):.1f}%), "
-                f"serving {users} active users with {churn:.1f}% churn. "
-                f"Platform win rate of {win_rate:.1f}% demonstrates strong signal quality. "
-                f"{'Growth trajectory is positive.' if mrr_change > 0 else 'Focus on retention and upsell strategies.'}"
-            )
+        return build_summary(report_type, data)
 
     def _render_html(
         self, report_type: ReportType, data: dict[str, Any], summary: str
@@ -516,4 +533,4 @@ class ReportGenerator:
 
     def _format_period_label(self, start: datetime, end: datetime) -> str:
         """Format period label for display."""
-        return f"{start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}"
+        return format_period_label(start, end)
@@ -0,0 +1,627 @@
+"""
+Batch client report pipeline (PR-101).
+
+Generates periodic client reports for every eligible user in shards instead
+of one user at a time:
+
+    1. One streamed query pulls every closed trade of the period.
+    2. Per-user metrics are computed in one vectorized pandas pass.
+    3. HTML is rendered in a process pool whose workers compile the Jinja
+       templates once at start-up and write each report to
+       <html_dir>/<report_id>.html (the file behind html_url). Without an
+       html_dir (REPORT_HTML_DIR) nothing would keep the HTML, so nothing
+       is rendered.
+    4. Each shard's reports are committed before any notification goes
+       out; "report_ready" is then enqueued through the messaging bus with
+       bounded concurrency and the delivery status committed.
+    5. Each shard is committed on its own. A run is keyed by
+       (period, period_start); the highest user_id with a report for that
+       key is the watermark, so a restarted run resumes after it.
+
+Eligible users are those above the free tier (see paid_user_clause).
+Metrics are derived from the period's closed trades: P&L is Trade.profit,
+the close time is Trade.exit_time, and equity/drawdown start from the same
+10,000 initial balance as EquityEngine. Sharpe uses the per-trade formula of
+analytics.metrics.calculate_sharpe_ratio.
+
+Example:
+    >>> pipeline = ReportPipeline(db, render_executor=get_render_executor())
+    >>> result = await pipeline.run(ReportPeriod.DAILY)
+    >>> result["generated"]
+    20000
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+from jinja2 import Environment, FileSystemLoader, Template
+from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.auth.models import User
+from backend.app.billing.entitlements.models import EntitlementType, UserEntitlement
+from backend.app.reports.generator import (
+    TEMPLATES_DIR,
+    build_summary,
+    calculate_period_range,
+    format_period_label,
+)
+from backend.app.reports.models import Report, ReportPeriod, ReportStatus, ReportType
+from backend.app.trading.store.models import Trade
+
+logger = logging.getLogger(__name__)
+
+# Users per shard (one commit and one watermark step per shard)
+REPORT_SHARD_SIZE = 500
+
+# Contexts per render task sent to the worker pool
+RENDER_BATCH_SIZE = 50
+
+# Concurrent messaging bus enqueues
+DELIVERY_CONCURRENCY = 50
+
+# Rows fetched per round trip when streaming trades
+TRADE_STREAM_BATCH = 5_000
+
+# Same starting balance as EquityEngine.compute_equity_series
+INITIAL_BALANCE = 10_000.0
+
+# Entitlements that put a user above the free tier
+PAID_ENTITLEMENTS = ("premium_signals", "copy_trading", "vip_support")
+
+APP_URL = "https://app.example.com/dashboard"
+
+
+# ---------------------------------------------------------------------------
+# Rendering (runs in worker processes)
+# ---------------------------------------------------------------------------
+
+# Templates compiled once per process
+_templates: dict[str, Template] | None = None
+
+
+def compile_templates() -> dict[str, Template]:
+    """Compile report templates (once per process; pool initializer)."""
+    global _templates
+    if _templates is None:
+        env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=True)
+        _templates = {
+            ReportType.CLIENT.value: env.get_template("client.html.j2"),
+            ReportType.OWNER.value: env.get_template("owner.html.j2"),
+        }
+    return _templates
+
+
+def render_reports(
+    report_type: str, contexts: list[dict[str, Any]], paths: list[str]
+) -> None:
+    """Render a batch of report contexts and write each to its path.
+
+    Writing in the worker keeps the rendered HTML out of the result pipe.
+    """
+    template = compile_templates()[report_type]
+    for context, path in zip(contexts, paths, strict=True):
+        Path(path).write_text(template.render(context), encoding="utf-8")
+
+
+# Process-wide render pool
+_render_executor: ProcessPoolExecutor | None = None
+
+
+def get_render_executor() -> ProcessPoolExecutor | None:
+    """Get the process pool used to render report HTML.
+
+    Sized by REPORT_RENDER_WORKERS (default 2; 0 renders inline).
+
+    Returns:
+        ProcessPoolExecutor, or None if rendering is inline
+    """
+    global _render_executor
+    if _render_executor is None:
+        workers = int(os.getenv("REPORT_RENDER_WORKERS", "2"))
+        if workers <= 0:
+            return None
+        _render_executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=compile_templates
+        )
+    return _render_executor
+
+
+# ---------------------------------------------------------------------------
+# Data
+# ---------------------------------------------------------------------------
+
+
+def paid_user_clause(now: datetime) -> Any:
+    """Filter for users above the free tier.
+
+    Same rule as EntitlementService.get_user_tier (tier >= 1): the user holds
+    an active, unexpired entitlement beyond basic_access.
+    """
+    return exists().where(
+        UserEntitlement.user_id == User.id,
+        UserEntitlement.entitlement_type_id == EntitlementType.id,
+        EntitlementType.name.in_(PAID_ENTITLEMENTS),
+        UserEntitlement.is_active == 1,
+        or_(UserEntitlement.expires_at.is_(None), UserEntitlement.expires_at > now),
+    )
+
+
+async def load_period_trades(
+    db: AsyncSession,
+    start: datetime,
+    end: datetime,
+    after_user_id: str | None = None,
+    retry_user_ids: Sequence[str] = (),
+) -> pd.DataFrame:
+    """Stream all trades closed in [start, end) into one frame.
+
+    Args:
+        db: Database session
+        start: Period start (inclusive)
+        end: Period end (exclusive)
+        after_user_id: Only users with id > this (resume point)
+        retry_user_ids: Users at or below the resume point to include anyway
+
+    Returns:
+        DataFrame [user_id, symbol, profit, exit_time] ordered by user, close
+    """
+    stmt = select(Trade.user_id, Trade.symbol, Trade.profit, Trade.exit_time).where(
+        and_(
+            Trade.status == "CLOSED",
+            Trade.exit_time >= start,
+            Trade.exit_time < end,
+        )
+    )
+    if after_user_id is not None:
+        resumed = Trade.user_id > after_user_id
+        if retry_user_ids:
+            resumed = or_(resumed, Trade.user_id.in_(retry_user_ids))
+        stmt = stmt.where(resumed)
+    stmt = stmt.order_by(Trade.user_id, Trade.exit_time).execution_options(
+        yield_per=TRADE_STREAM_BATCH
+    )
+
+    rows: list[Any] = []
+    result = await db.stream(stmt)
+    async for partition in result.partitions():
+        rows.extend(partition)
+
+    frame = pd.DataFrame(rows, columns=["user_id", "symbol", "profit", "exit_time"])
+    frame["profit"] = pd.to_numeric(frame["profit"], errors="coerce").fillna(0.0)
+    return frame
+
+
+def empty_client_data(start: datetime, end: datetime) -> dict[str, Any]:
+    """Client report data for a user without trades in the period."""
+    return {
+        "total_trades": 0,
+        "total_pnl": 0.0,
+        "win_rate": 0.0,
+        "sharpe_ratio": None,
+        "best_trade": 0.0,
+        "worst_trade": 0.0,
+        "best_trade_date": None,
+        "worst_trade_date": None,
+        "avg_win": 0.0,
+        "avg_loss": 0.0,
+        "risk_reward": 0.0,
+        "max_drawdown": 0.0,
+        "current_equity": 0.0,
+        "recovery_factor": 0.0,
+        "top_instruments": [],
+        "period_label": format_period_label(start, end),
+    }
+
+
+def compute_client_metrics(
+    trades: pd.DataFrame, start: datetime, end: datetime
+) -> dict[str, dict[str, Any]]:
+    """Compute client report data for every user in one vectorized pass.
+
+    Args:
+        trades: Frame from load_period_trades (ordered by user, close time)
+        start: Period start
+        end: Period end
+
+    Returns:
+        Dict of user_id -> report data (same keys as the client template)
+    """
+    if trades.empty:
+        return {}
+
+    df = trades.reset_index(drop=True)
+    pnl = df["profit"].astype(float)
+    df = df.assign(
+        pnl=pnl,
+        win=pnl > 0,
+        loss=pnl < 0,
+        win_pnl=pnl.where(pnl > 0, 0.0),
+        loss_pnl=pnl.where(pnl < 0, 0.0),
+    )
+    by_user = df.groupby("user_id", sort=False)
+
+    stats = pd.DataFrame(
+        {
+            "total_trades": by_user.size(),
+            "total_pnl": by_user["pnl"].sum(),
+            "wins": by_user["win"].sum(),
+            "losses": by_user["loss"].sum(),
+            "win_sum": by_user["win_pnl"].sum(),
+            "loss_sum": by_user["loss_pnl"].sum(),
+            "pnl_mean": by_user["pnl"].mean(),
+            "pnl_std": by_user["pnl"].std(ddof=0),
+        }
+    )
+
+    # Worst = first minimum, best = last maximum (stable sort semantics)
+    worst_idx = by_user["pnl"].idxmin()
+    best_idx = df.iloc[::-1].groupby("user_id", sort=False)["pnl"].idxmax()
+
+    # Equity curve from the initial balance; drawdown relative to peak
+    equity = INITIAL_BALANCE + by_user["pnl"].cumsum()
+    peak = np.maximum(equity.groupby(df["user_id"]).cummax(), INITIAL_BALANCE)
+    drawdown_amount = peak - equity
+    stats["max_drawdown"] = (drawdown_amount / peak).groupby(df["user_id"]).max()
+    stats["max_drawdown_amount"] = drawdown_amount.groupby(df["user_id"]).max()
+    stats["current_equity"] = equity.groupby(df["user_id"]).last()
+
+    # Top instruments per user
+    instruments = (
+        df.groupby(["user_id", "symbol"], sort=False)
+        .agg(trades=("pnl", "size"), wins=("win", "sum"), pnl=("pnl", "sum"))
+        .reset_index()
+        .sort_values(["user_id", "pnl"], ascending=[True, False], kind="stable")
+    )
+    instruments["win_rate"] = instruments["wins"] / instruments["trades"]
+    top: dict[str, list[dict[str, Any]]] = {}
+    for row in instruments.groupby("user_id", sort=False).head(5).itertuples():
+        top.setdefault(row.user_id, []).append(
+            {
+                "name": row.symbol,
+                "trades": int(row.trades),
+                "wins": int(row.wins),
+                "pnl": float(row.pnl),
+                "win_rate": float(row.win_rate),
+            }
+        )
+
+    period_label = format_period_label(start, end)
+    results: dict[str, dict[str, Any]] = {}
+    for row in stats.itertuples():
+        user_id = row.Index
+        total = int(row.total_trades)
+        wins = int(row.wins)
+        losses = int(row.losses)
+        avg_win = float(row.win_sum) / wins if wins else 0.0
+        avg_loss = abs(float(row.loss_sum) / losses) if losses else 0.0
+        sharpe = (
+            float(row.pnl_mean / row.pnl_std) if total >= 2 and row.pnl_std > 0 else 0.0
+        )
+        worst = df.loc[worst_idx[user_id]]
+        best = df.loc[best_idx[user_id]]
+        total_pnl = float(row.total_pnl)
+        max_dd_amount = float(row.max_drawdown_amount)
+
+        results[user_id] = {
+            "total_trades": total,
+            "total_pnl": total_pnl,
+            "win_rate": wins / total,
+            "sharpe_ratio": sharpe,
+            "best_trade": float(best.pnl),
+            "worst_trade": float(worst.pnl),
+            "best_trade_date": best.exit_time.strftime("%Y-%m-%d"),
+            "worst_trade_date": worst.exit_time.strftime("%Y-%m-%d"),
+            "avg_win": avg_win,
+            "avg_loss": avg_loss,
+            "risk_reward": avg_win / avg_loss if avg_loss > 0 else 0.0,
+            "max_drawdown": float(row.max_drawdown),
+            "current_equity": float(row.current_equity),
+            "recovery_factor": total_pnl / max_dd_amount if max_dd_amount > 0 else 0.0,
+            "top_instruments": top.get(user_id, []),
+            "period_label": period_label,
+        }
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+class ReportPipeline:
+    """Sharded, restartable client report generation and delivery.
+
+    Attributes:
+        db: Database session (reports, then delivery status, per shard)
+        bus: Messaging bus (default: global bus, resolved on first delivery)
+        render_executor: Pool for HTML rendering (None: render inline)
+        html_dir: Directory rendered HTML is written to (None: not rendered)
+        shard_size: Users per shard
+        delivery_concurrency: Max concurrent bus enqueues
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        bus: Any | None = None,
+        render_executor: Executor | None = None,
+        shard_size: int = REPORT_SHARD_SIZE,
+        delivery_concurrency: int = DELIVERY_CONCURRENCY,
+        html_dir: str | Path | None = None,
+    ):
+        self.db = db
+        self.bus = bus
+        self.render_executor = render_executor
+        html_dir = html_dir or os.getenv("REPORT_HTML_DIR")
+        self.html_dir = Path(html_dir) if html_dir else None
+        self.shard_size = shard_size
+        self.delivery_concurrency = delivery_concurrency
+
+    async def run(
+        self, period: ReportPeriod, now: datetime | None = None
+    ) -> dict[str, int]:
+        """Generate and deliver client reports for all eligible users.
+
+        Args:
+            period: Report period
+            now: Reference time for the period range (default: utcnow)
+
+        Returns:
+            Counts: users, generated, failed, delivered, resumed_after (0/1),
+            retried (users whose earlier report for this run FAILED)
+        """
+        start, end = calculate_period_range(period, now)
+        watermark = await self.get_watermark(period, start)
+        retry = await self.get_failed_user_ids(period, start)
+
+        users_query = select(User.id, User.email, User.telegram_user_id).where(
+            paid_user_clause(now or datetime.utcnow()),
+            # TODO: Add preferences check for report opt-in
+        )
+        if watermark is not None:
+            resumed = User.id > watermark
+            if retry:
+                resumed = or_(resumed, User.id.in_(retry))
+            users_query = users_query.where(resumed)
+        elif retry:
+            users_query = users_query.where(User.id.in_(retry))
+        users = (await self.db.execute(users_query.order_by(User.id))).all()
+
+        counts = {
+            "users": len(users),
+            "generated": 0,
+            "failed": 0,
+            "delivered": 0,
+            "resumed_after": int(watermark is not None or bool(retry)),
+            "retried": len(retry),
+        }
+        if not users:
+            return counts
+
+        trades = await load_period_trades(self.db, start, end, watermark, retry)
+        metrics = compute_client_metrics(trades, start, end)
+
+        for offset in range(0, len(users), self.shard_size):
+            shard = users[offset : offset + self.shard_size]
+            shard_counts = await self._run_shard(period, start, end, shard, metrics)
+            for key, value in shard_counts.items():
+                counts[key] += value
+
+            logger.info(
+                f"Report shard done: {offset + len(shard)}/{len(users)} users",
+                extra={
+                    "period": period.value,
+                    "period_start": start.isoformat(),
+                    "watermark": shard[-1].id,
+                },
+            )
+
+        return counts
+
+    async def get_watermark(
+        self, period: ReportPeriod, period_start: datetime
+    ) -> str | None:
+        """Highest user_id already reported for this run, or None.
+
+        FAILED reports do not advance the watermark; their users are retried
+        via get_failed_user_ids.
+        """
+        result = await self.db.execute(
+            select(func.max(Report.user_id)).where(
+                Report.type == ReportType.CLIENT,
+                Report.period == period,
+                Report.period_start == period_start,
+                Report.status != ReportStatus.FAILED,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_failed_user_ids(
+        self, period: ReportPeriod, period_start: datetime
+    ) -> list[str]:
+        """Users whose only reports for this run FAILED (to retry on resume)."""
+        run = and_(
+            Report.type == ReportType.CLIENT,
+            Report.period == period,
+            Report.period_start == period_start,
+        )
+        reported = select(Report.user_id).where(
+            run, Report.status != ReportStatus.FAILED
+        )
+        result = await self.db.execute(
+            select(Report.user_id)
+            .where(
+                run,
+                Report.status == ReportStatus.FAILED,
+                Report.user_id.not_in(reported),
+            )
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def _run_shard(
+        self,
+        period: ReportPeriod,
+        start: datetime,
+        end: datetime,
+        users: Sequence[Any],
+        metrics: dict[str, dict[str, Any]],
+    ) -> dict[str, int]:
+        """Build, render and commit reports for one shard, then deliver them."""
+        generated_at = datetime.utcnow()
+        reports: list[Report] = []
+        contexts: list[dict[str, Any]] = []
+
+        for user in users:
+            data = metrics.get(user.id) or empty_client_data(start, end)
+            report_id = str(uuid4())
+            summary = build_summary(ReportType.CLIENT, data)
+            reports.append(
+                Report(
+                    id=report_id,
+                    type=ReportType.CLIENT,
+                    period=period,
+                    user_id=user.id,
+                    period_start=start,
+                    period_end=end,
+                    status=ReportStatus.COMPLETED,
+                    data=data,
+                    summary=summary,
+                    html_url=f"/reports/{report_id}.html",
+                    pdf_url=f"/reports/{report_id}.pdf",
+                    generated_at=generated_at,
+                    delivered_channels=[],
+                    delivery_failed_channels=[],
+                )
+            )
+            contexts.append(
+                {
+                    **data,
+                    "ai_summary": summary,
+                    "generated_at": generated_at.strftime("%Y-%m-%d %H:%M UTC"),
+                    "app_url": APP_URL,
+                }
+            )
+
+        if self.html_dir is not None:
+            await self._render(reports, contexts, self.html_dir)
+        self.db.add_all(reports)
+
+        # Reports must exist before anyone is told they are ready
+        await self.db.commit()
+
+        semaphore = asyncio.Semaphore(self.delivery_concurrency)
+        deliveries = [
+            self._deliver(semaphore, report, user)
+            for report, user in zip(reports, users, strict=True)
+            if report.status == ReportStatus.COMPLETED
+        ]
+        delivered = sum(await asyncio.gather(*deliveries))
+
+        # Record delivered/failed channels
+        await self.db.commit()
+
+        failed = sum(1 for r in reports if r.status == ReportStatus.FAILED)
+        return {
+            "generated": len(reports) - failed,
+            "failed": failed,
+            "delivered": delivered,
+        }
+
+    async def _render(
+        self, reports: list[Report], contexts: list[dict[str, Any]], html_dir: Path
+    ) -> None:
+        """Render HTML files in batches; reports whose batch fails are marked FAILED."""
+        html_dir.mkdir(parents=True, exist_ok=True)
+        paths = [str(html_dir / f"{report.id}.html") for report in reports]
+        loop = asyncio.get_running_loop()
+        batches = [
+            (i, contexts[i : i + RENDER_BATCH_SIZE], paths[i : i + RENDER_BATCH_SIZE])
+            for i in range(0, len(contexts), RENDER_BATCH_SIZE)
+        ]
+
+        async def render_batch(
+            batch: list[dict[str, Any]], batch_paths: list[str]
+        ) -> None:
+            if self.render_executor is None:
+                render_reports(ReportType.CLIENT.value, batch, batch_paths)
+                return
+            await loop.run_in_executor(
+                self.render_executor,
+                render_reports,
+                ReportType.CLIENT.value,
+                batch,
+                batch_paths,
+            )
+
+        results = await asyncio.gather(
+            *(render_batch(batch, batch_paths) for _, batch, batch_paths in batches),
+            return_exceptions=True,
+        )
+
+        for (offset, batch, _), result in zip(batches, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Report render batch failed: {result}")
+                for report in reports[offset : offset + len(batch)]:
+                    report.status = ReportStatus.FAILED
+                    report.error_message = str(result)
+                    report.generated_at = None
+
+    async def _deliver(
+        self, semaphore: asyncio.Semaphore, report: Report, user: Any
+    ) -> int:
+        """Enqueue report_ready on each channel; record delivery status.
+
+        Returns:
+            1 if at least one channel was enqueued, else 0
+        """
+        template_vars = {
+            "name": user.email.split("@")[0] if user.email else "there",
+            "period": report.period.value,
+            "summary": report.summary,
+            "html_url": report.html_url,
+            "pdf_url": report.pdf_url,
+        }
+        channels = ["email"] + (["telegram"] if user.telegram_user_id else [])
+        delivered: list[str] = []
+        failed: list[str] = []
+
+        async with semaphore:
+            for channel in channels:
+                try:
+                    bus = await self._get_bus()
+                    await bus.enqueue_message(
+                        user_id=user.id,
+                        channel=channel,
+                        template_name="report_ready",
+                        template_vars=template_vars,
+                        priority="campaign",
+                    )
+                    delivered.append(channel)
+                except Exception as e:
+                    logger.error(
+                        f"{channel} delivery failed for report {report.id}: {e}"
+                    )
+                    failed.append(channel)
+
+        report.delivered_channels = delivered
+        report.delivery_failed_channels = failed
+        return int(bool(delivered))
+
+    async def _get_bus(self) -> Any:
+        if self.bus is None:
+            from backend.app.messaging.bus import get_messaging_bus
+
+            self.bus = await get_messaging_bus()
+        return self.bus
@@ -15,11 +15,17 @@ from datetime import datetime
 from decimal import Decimal
 from logging import getLogger
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.accounts.models import AccountInfo, AccountLink
 from backend.app.risk.models import ExposureSnapshot, RiskProfile
+from backend.app.risk.state import (
+    PEAK_EQUITY_LOOKBACK_TRADES,
+    drawdown_percent,
+    peak_equity_from_history,
+    risk_state,
+)
 from backend.app.signals.models import Signal
 from backend.app.trading.store.models import Trade
 
@@ -113,15 +119,15 @@ class RiskService:
     async def calculate_current_exposure(
         client_id: str, db: AsyncSession
     ) -> ExposureSnapshot:
-        """Calculate current exposure from open trades.
+        """Re-sync the client's risk state from the database and snapshot it.
 
-        Queries all OPEN trades for client and aggregates:
-        - Total exposure (volume * entry_price)
-        - Exposure by instrument (instrument → total volume)
-        - Exposure by direction (buy → volume, sell → volume)
-        - Open positions count
+        Rebuilds the in-memory risk state from OPEN trades (total exposure,
+        exposure by instrument and direction, open positions count), the
+        running peak equity and today's P&L, then persists an ExposureSnapshot
+        for historical tracking.
 
-        Creates new snapshot record for historical tracking.
+        Pre-trade checks do not call this: they read the incrementally
+        maintained state (see backend.app.risk.state).
 
         Args:
             client_id: Client UUID
@@ -137,74 +143,21 @@ class RiskService:
             >>> print(f"Total: {snapshot.total_exposure}")
             >>> print(f"By instrument: {snapshot.exposure_by_instrument}")
         """
-        # Query all open trades for this client
-        stmt = (
-            select(Trade)
-            .where(
-                and_(
-                    Trade.user_id == client_id,
-                    Trade.status == "OPEN",
-                )
-            )
-            .order_by(desc(Trade.entry_time))
-        )
-        result = await db.execute(stmt)
-        open_trades = result.scalars().all()
-
-        # Aggregate exposure
-        total_exposure = Decimal("0.00")
-        exposure_by_instrument = {}
-        exposure_by_direction = {"buy": Decimal("0.00"), "sell": Decimal("0.00")}
-
-        for trade in open_trades:
-            # Calculate position size in USD (volume * entry_price)
-            position_value = trade.volume * trade.entry_price
-
-            # Add to totals
-            total_exposure += position_value
-
-            # By instrument
-            if trade.symbol not in exposure_by_instrument:
-                exposure_by_instrument[trade.symbol] = Decimal("0.00")
-            exposure_by_instrument[trade.symbol] += position_value
-
-            # By direction
-            direction_key = "buy" if trade.direction == 0 else "sell"
-            exposure_by_direction[direction_key] += position_value
-
-        # Convert Decimals to floats for JSON serialization
-        exposure_by_instrument_float = {
-            k: float(v) for k, v in exposure_by_instrument.items()
-        }
-        exposure_by_direction_float = {
-            k: float(v) for k, v in exposure_by_direction.items()
-        }
-
-        # Create snapshot record
-        snapshot = ExposureSnapshot(
-            client_id=client_id,
-            timestamp=datetime.utcnow(),
-            total_exposure=total_exposure,
-            exposure_by_instrument=exposure_by_instrument_float,
-            exposure_by_direction=exposure_by_direction_float,
-            open_positions_count=len(open_trades),
-            current_drawdown_percent=await RiskService.calculate_current_drawdown(
-                client_id, db
-            ),
-            daily_pnl=await RiskService.calculate_daily_pnl(client_id, db),
-        )
+        state = await risk_state.refresh_client(client_id, db)
 
+        snapshot = state.to_snapshot()
         db.add(snapshot)
         await db.commit()
         await db.refresh(snapshot)
+        state.dirty = False
 
         logger.debug(
             f"Calculated exposure for client {client_id}: "
-            f"${total_exposure} across {len(open_trades)} positions",
+            f"${state.total_exposure} across {state.open_positions_count} positions",
             extra={
                 "client_id": client_id,
-                "total_exposure": str(total_exposure),
-                "open_positions": len(open_trades),
+                "total_exposure": str(state.total_exposure),
+                "open_positions": state.open_positions_count,
             },
         )
 
@@ -224,10 +177,13 @@ class RiskService:
         5. Correlation exposure limit
         6. Global platform limits
 
+        Exposure, drawdown and daily P&L come from the in-memory risk state,
+        so the check costs one profile lookup instead of a full trade scan.
+
         Returns dict with:
         - passes: True if all checks pass
         - violations: List of violated limits with details
-        - exposure: Current ExposureSnapshot
+        - exposure: Current exposure (transient ExposureSnapshot, not persisted)
         - margin_available: Remaining capacity for this signal
 
         Args:
@@ -250,8 +206,9 @@ class RiskService:
         # Get risk profile
         profile = await RiskService.get_or_create_risk_profile(client_id, db)
 
-        # Calculate current exposure
-        exposure = await RiskService.calculate_current_exposure(client_id, db)
+        # Current exposure from the incremental risk state (no snapshot write)
+        state = await risk_state.get_client_state(client_id, db)
+        exposure = state.to_snapshot()
 
         # Check 1: Max open positions
         if exposure.open_positions_count >= profile.max_open_positions:
@@ -307,9 +264,7 @@ class RiskService:
         # Check 5: Correlation exposure (related instruments)
         related_group = await RiskService._find_instrument_group(signal.instrument)
         if related_group:
-            related_exposure = await RiskService._calculate_related_exposure(
-                client_id, related_group, db
-            )
+            related_exposure = state.related_exposure(related_group)
             max_related = exposure.total_exposure * profile.max_correlation_exposure
             if related_exposure > max_related:
                 violations.append(
@@ -458,8 +413,8 @@ class RiskService:
         Drawdown % = (Peak Equity - Current Equity) / Peak Equity * 100
 
         Implementation:
-        - Get all closed trades to calculate cumulative P&L
-        - Track historical high
+        - Get the last 100 closed trades' P&L
+        - Unwind from the current balance (newest first) to find the peak
         - Return current drawdown
 
         Args:
@@ -475,22 +430,23 @@ class RiskService:
         """
         # Get account balance
         stmt = (
-            select(AccountInfo)
+            select(AccountInfo.balance)
             .join(AccountLink)
             .where(AccountLink.user_id == client_id)
             .order_by(desc(AccountInfo.last_updated))
+            .limit(1)
         )
         result = await db.execute(stmt)
-        account_info = result.scalars().first()
+        balance = result.scalar()
 
-        if not account_info or account_info.balance is None:
+        if balance is None:
             return Decimal("0.00")
 
-        current_balance = Decimal(str(account_info.balance))
+        current_balance = Decimal(str(balance))
 
-        # Get all closed trades to find historical high
+        # Profits of the most recent closed trades, newest first
         stmt = (
-            select(Trade)
+            select(Trade.profit)
             .where(
                 and_(
                     Trade.user_id == client_id,
@@ -498,30 +454,17 @@ class RiskService:
                 )
             )
             .order_by(desc(Trade.exit_time))
-            .limit(100)  # Last 100 closed trades
+            .limit(PEAK_EQUITY_LOOKBACK_TRADES)
         )
         result = await db.execute(stmt)
-        closed_trades = result.scalars().all()
+        profits = result.scalars().all()
 
-        if not closed_trades:
+        if not profits:
             return Decimal("0.00")
 
-        # Reconstruct historical equity curve
-        historical_equity = current_balance
-        max_equity = current_balance
-
-        for trade in reversed(closed_trades):
-            # Remove profit from trade to get prior equity
-            if trade.profit:
-                historical_equity = historical_equity - Decimal(str(trade.profit))
-                max_equity = max(max_equity, historical_equity)
-
-        # Calculate drawdown
-        if max_equity == 0:
-            return Decimal("0.00")
-
-        drawdown = ((max_equity - current_balance) / max_equity) * Decimal("100")
-        drawdown = max(drawdown, Decimal("0.00"))  # Never negative
+        # Unwind the equity curve backwards from the current balance
+        max_equity = peak_equity_from_history(current_balance, profits)
+        drawdown: Decimal = drawdown_percent(max_equity, current_balance)
 
         logger.debug(
             f"Calculated drawdown for {client_id}: {drawdown}%",
@@ -553,8 +496,8 @@ class RiskService:
             hour=0, minute=0, second=0, microsecond=0
         )
 
-        # Query closed trades since today
-        stmt = select(Trade).where(
+        # Sum profits of closed trades since today
+        stmt = select(func.coalesce(func.sum(Trade.profit), 0)).where(
             and_(
                 Trade.user_id == client_id,
                 Trade.status == "CLOSED",
@@ -562,12 +505,8 @@ class RiskService:
             )
         )
         result = await db.execute(stmt)
-        today_trades = result.scalars().all()
-
-        # Sum profits
-        daily_pnl = sum((trade.profit or Decimal("0.00")) for trade in today_trades)
 
-        return Decimal(str(daily_pnl))
+        return Decimal(str(result.scalar() or 0))
 
     @staticmethod
     async def check_global_limits(
@@ -596,13 +535,10 @@ class RiskService:
         """
         violations = []
 
-        # Query all open trades across platform
-        stmt = select(Trade).where(Trade.status == "OPEN")
-        result = await db.execute(stmt)
-        all_open_trades = result.scalars().all()
-
-        # Calculate total platform exposure
-        total_exposure = sum((t.volume * t.entry_price) for t in all_open_trades)
+        # Platform aggregate maintained incrementally from trade events
+        platform = await risk_state.get_platform_state(db)
+        total_exposure = platform.total_exposure
+        open_positions = platform.open_positions_count
 
         # Check 1: Total exposure
         if total_exposure >= RiskService.PLATFORM_MAX_EXPOSURE:
@@ -615,18 +551,18 @@ class RiskService:
             )
 
         # Check 2: Open positions count
-        if len(all_open_trades) >= RiskService.PLATFORM_MAX_OPEN_POSITIONS:
+        if open_positions >= RiskService.PLATFORM_MAX_OPEN_POSITIONS:
             violations.append(
                 {
                     "check": "platform_max_positions",
                     "limit": str(RiskService.PLATFORM_MAX_OPEN_POSITIONS),
-                    "current": str(len(all_open_trades)),
+                    "current": str(open_positions),
                 }
             )
 
         # Check 3: Instrument concentration
-        instrument_exposure = sum(
-            t.volume for t in all_open_trades if t.symbol == instrument
+        instrument_exposure = platform.volume_by_instrument.get(
+            instrument, Decimal("0.00")
         )
         if (
             instrument_exposure + lot_size
@@ -646,7 +582,7 @@ class RiskService:
             extra={
                 "violations": len(violations),
                 "total_exposure": str(total_exposure),
-                "open_trades": len(all_open_trades),
+                "open_trades": open_positions,
             },
         )
 
@@ -654,7 +590,7 @@ class RiskService:
             "passes": len(violations) == 0,
             "violations": violations,
             "total_platform_exposure": total_exposure,
-            "total_open_positions": len(all_open_trades),
+            "total_open_positions": open_positions,
         }
 
     @staticmethod
@@ -0,0 +1,480 @@
+"""In-memory incremental risk state for O(1) pre-trade checks.
+
+Pre-trade risk checks sit on the critical path between approval and
+execution. Instead of reloading every OPEN trade, rebuilding the equity
+curve and writing an ExposureSnapshot on each check, this module keeps a
+per-client risk state (exposure by instrument/direction, running peak
+equity, daily P&L) plus a platform-wide aggregate that are:
+
+1. Loaded once from the database on first use (warm-up)
+2. Updated incrementally from trade open/close events (TradeService),
+   applied only once the session that wrote the trade commits
+3. Re-synced from the database when older than RISK_STATE_MAX_AGE_SECONDS
+   (covers trades written outside TradeService, e.g. MT5 reconciliation)
+4. Checkpointed to exposure_snapshots periodically (one transaction)
+
+Example:
+    >>> state = await risk_state.get_client_state("client-123", db)
+    >>> state.total_exposure, state.open_positions_count
+    >>> risk_state.on_trade_opened(trade)
+    >>> await risk_state.checkpoint(db)
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from logging import getLogger
+
+from sqlalchemy import and_, desc, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.app.accounts.models import AccountInfo, AccountLink
+from backend.app.risk.models import ExposureSnapshot
+from backend.app.trading.store.models import Trade
+
+logger = getLogger(__name__)
+
+# Re-sync a state from the database when it is older than this (seconds)
+RISK_STATE_MAX_AGE_SECONDS = 60.0
+
+# Closed trades used to reconstruct the peak equity on warm-up
+PEAK_EQUITY_LOOKBACK_TRADES = 100
+
+ZERO = Decimal("0.00")
+
+# Session.info key holding state updates that wait for the commit
+PENDING_UPDATES_KEY = "risk_state_pending"
+
+
+def _defer_until_commit(db: AsyncSession, update: Callable[[], None]) -> None:
+    """Queue an in-memory update to run when db commits (dropped on rollback)."""
+    db.sync_session.info.setdefault(PENDING_UPDATES_KEY, []).append(update)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_updates(session: Session) -> None:
+    for update in session.info.pop(PENDING_UPDATES_KEY, []):
+        try:
+            update()
+        except Exception as e:
+            # State self-heals on the next re-sync; never fail the commit
+            logger.error(f"Risk state update after commit failed: {e}", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_updates(session: Session) -> None:
+    session.info.pop(PENDING_UPDATES_KEY, None)
+
+
+def drawdown_percent(peak_equity: Decimal, balance: Decimal) -> Decimal:
+    """Peak-to-trough drawdown % (never negative, 0 if no peak)."""
+    if peak_equity <= 0:
+        return ZERO
+    return max((peak_equity - balance) / peak_equity * Decimal("100"), ZERO)
+
+
+def peak_equity_from_history(balance: Decimal, profits_newest_first: list) -> Decimal:
+    """Reconstruct the historical peak equity by unwinding closed-trade P&L.
+
+    Args:
+        balance: Current account balance
+        profits_newest_first: Closed trade profits, most recent first
+
+    Returns:
+        Decimal: Highest equity reached over the unwound history
+    """
+    equity = balance
+    peak = balance
+    for profit in profits_newest_first:
+        if profit:
+            equity -= Decimal(str(profit))
+            peak = max(peak, equity)
+    return peak
+
+
+@dataclass
+class _OpenPosition:
+    symbol: str
+    direction: str  # "buy" | "sell"
+    value: Decimal  # volume * entry_price
+    volume: Decimal
+
+
+def _position_from_trade(trade: Trade) -> _OpenPosition:
+    return _OpenPosition(
+        symbol=trade.symbol,
+        direction="buy" if trade.direction == 0 else "sell",
+        value=trade.volume * trade.entry_price,
+        volume=trade.volume,
+    )
+
+
+@dataclass
+class ClientRiskState:
+    """Running risk state for one client.
+
+    Attributes:
+        client_id: Client UUID
+        positions: Open trades by trade_id
+        exposure_by_instrument: Symbol → exposure (volume * entry_price)
+        exposure_by_direction: "buy"/"sell" → exposure
+        total_exposure: Sum of open exposure
+        balance: Last known account balance (None if no linked account)
+        peak_equity: Running peak equity for drawdown
+        has_closed_history: Drawdown is only reported once trades have closed
+        daily_pnl: Sum of today's closed P&L
+        pnl_date: UTC date daily_pnl refers to
+        loaded_at: Monotonic time of last database sync
+        dirty: Changed since last checkpoint
+    """
+
+    client_id: str
+    positions: dict[str, _OpenPosition] = field(default_factory=dict)
+    exposure_by_instrument: dict[str, Decimal] = field(default_factory=dict)
+    exposure_by_direction: dict[str, Decimal] = field(
+        default_factory=lambda: {"buy": ZERO, "sell": ZERO}
+    )
+    total_exposure: Decimal = ZERO
+    balance: Decimal | None = None
+    peak_equity: Decimal = ZERO
+    has_closed_history: bool = False
+    daily_pnl: Decimal = ZERO
+    pnl_date: date = field(default_factory=lambda: datetime.utcnow().date())
+    loaded_at: float = field(default_factory=time.monotonic)
+    dirty: bool = True
+
+    @property
+    def open_positions_count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def current_drawdown_percent(self) -> Decimal:
+        if self.balance is None or not self.has_closed_history:
+            return ZERO
+        return drawdown_percent(self.peak_equity, self.balance)
+
+    def current_daily_pnl(self) -> Decimal:
+        """Today's P&L, rolling over at 00:00 UTC."""
+        if self.pnl_date != datetime.utcnow().date():
+            return ZERO
+        return self.daily_pnl
+
+    def add_position(self, trade_id: str, position: _OpenPosition) -> None:
+        if trade_id in self.positions:
+            return
+        self.positions[trade_id] = position
+        self.exposure_by_instrument[position.symbol] = (
+            self.exposure_by_instrument.get(position.symbol, ZERO) + position.value
+        )
+        self.exposure_by_direction[position.direction] += position.value
+        self.total_exposure += position.value
+        self.dirty = True
+
+    def remove_position(self, trade_id: str) -> _OpenPosition | None:
+        position = self.positions.pop(trade_id, None)
+        if position is None:
+            return None
+        remaining = self.exposure_by_instrument[position.symbol] - position.value
+        if remaining:
+            self.exposure_by_instrument[position.symbol] = remaining
+        else:
+            del self.exposure_by_instrument[position.symbol]
+        self.exposure_by_direction[position.direction] -= position.value
+        self.total_exposure -= position.value
+        self.dirty = True
+        return position
+
+    def apply_realized_pnl(self, profit: Decimal, closed_on: date) -> None:
+        """Book closed-trade P&L into balance, peak equity and daily P&L."""
+        self.has_closed_history = True
+        if self.balance is not None:
+            self.balance += profit
+            self.peak_equity = max(self.peak_equity, self.balance)
+        today = datetime.utcnow().date()
+        if self.pnl_date != today:
+            self.pnl_date, self.daily_pnl = today, ZERO
+        if closed_on == today:
+            self.daily_pnl += profit
+        self.dirty = True
+
+    def related_exposure(self, instruments: list[str]) -> Decimal:
+        """Exposure across a correlation group."""
+        return sum(
+            (self.exposure_by_instrument.get(symbol, ZERO) for symbol in instruments),
+            ZERO,
+        )
+
+    def to_snapshot(self) -> ExposureSnapshot:
+        """Build a (transient) ExposureSnapshot from the current state."""
+        return ExposureSnapshot(
+            client_id=self.client_id,
+            timestamp=datetime.utcnow(),
+            total_exposure=self.total_exposure,
+            exposure_by_instrument={
+                k: float(v) for k, v in self.exposure_by_instrument.items()
+            },
+            exposure_by_direction={
+                k: float(v) for k, v in self.exposure_by_direction.items()
+            },
+            open_positions_count=self.open_positions_count,
+            current_drawdown_percent=self.current_drawdown_percent,
+            daily_pnl=self.current_daily_pnl(),
+        )
+
+
+@dataclass
+class PlatformRiskState:
+    """Platform-wide open exposure aggregate (all clients)."""
+
+    positions: dict[str, _OpenPosition] = field(default_factory=dict)
+    volume_by_instrument: dict[str, Decimal] = field(default_factory=dict)
+    total_exposure: Decimal = ZERO
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def open_positions_count(self) -> int:
+        return len(self.positions)
+
+    def add_position(self, trade_id: str, position: _OpenPosition) -> None:
+        if trade_id in self.positions:
+            return
+        self.positions[trade_id] = position
+        self.volume_by_instrument[position.symbol] = (
+            self.volume_by_instrument.get(position.symbol, ZERO) + position.volume
+        )
+        self.total_exposure += position.value
+
+    def remove_position(self, trade_id: str) -> None:
+        position = self.positions.pop(trade_id, None)
+        if position is None:
+            return
+        self.volume_by_instrument[position.symbol] -= position.volume
+        self.total_exposure -= position.value
+
+
+class RiskStateTracker:
+    """Registry of per-client and platform risk states.
+
+    Single-process, event-loop confined (no locking needed). Events are
+    idempotent per trade_id, so a state loaded from the database that already
+    contains a trade is not double-counted when its event arrives.
+    """
+
+    def __init__(self, max_age_seconds: float = RISK_STATE_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self._clients: dict[str, ClientRiskState] = {}
+        self._platform: PlatformRiskState | None = None
+
+    def _is_fresh(self, loaded_at: float) -> bool:
+        return time.monotonic() - loaded_at < self.max_age_seconds
+
+    async def get_client_state(
+        self, client_id: str, db: AsyncSession
+    ) -> ClientRiskState:
+        """Return the client's state, loading it from the database if needed."""
+        state = self._clients.get(client_id)
+        if state is None or not self._is_fresh(state.loaded_at):
+            state = await self.refresh_client(client_id, db)
+        return state
+
+    async def refresh_client(self, client_id: str, db: AsyncSession) -> ClientRiskState:
+        """Rebuild a client's state from the database (warm-up / re-sync)."""
+        state = ClientRiskState(client_id=client_id)
+
+        # Open trades (projected columns only)
+        result = await db.execute(
+            select(
+                Trade.trade_id,
+                Trade.symbol,
+                Trade.direction,
+                Trade.volume,
+                Trade.entry_price,
+            ).where(and_(Trade.user_id == client_id, Trade.status == "OPEN"))
+        )
+        for trade_id, symbol, direction, volume, entry_price in result.all():
+            state.add_position(
+                trade_id,
+                _OpenPosition(
+                    symbol=symbol,
+                    direction="buy" if direction == 0 else "sell",
+                    value=volume * entry_price,
+                    volume=volume,
+                ),
+            )
+
+        # Latest account balance
+        result = await db.execute(
+            select(AccountInfo.balance)
+            .join(AccountLink)
+            .where(AccountLink.user_id == client_id)
+            .order_by(desc(AccountInfo.last_updated))
+            .limit(1)
+        )
+        balance = result.scalar()
+        if balance is not None:
+            state.balance = Decimal(str(balance))
+
+        # Peak equity from the most recent closed trades
+        result = await db.execute(
+            select(Trade.profit)
+            .where(and_(Trade.user_id == client_id, Trade.status == "CLOSED"))
+            .order_by(desc(Trade.exit_time))
+            .limit(PEAK_EQUITY_LOOKBACK_TRADES)
+        )
+        profits = list(result.scalars().all())
+        state.has_closed_history = bool(profits)
+        if state.balance is not None:
+            state.peak_equity = peak_equity_from_history(state.balance, profits)
+
+        # Today's realized P&L (single aggregate)
+        today_start = datetime.utcnow().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        result = await db.execute(
+            select(func.coalesce(func.sum(Trade.profit), 0)).where(
+                and_(
+                    Trade.user_id == client_id,
+                    Trade.status == "CLOSED",
+                    Trade.exit_time >= today_start,
+                )
+            )
+        )
+        state.daily_pnl = Decimal(str(result.scalar() or 0))
+        state.pnl_date = today_start.date()
+
+        self._clients[client_id] = state
+        return state
+
+    async def get_platform_state(self, db: AsyncSession) -> PlatformRiskState:
+        """Return the platform aggregate, loading it from the database if needed."""
+        if self._platform is None or not self._is_fresh(self._platform.loaded_at):
+            platform = PlatformRiskState()
+            result = await db.execute(
+                select(
+                    Trade.trade_id,
+                    Trade.symbol,
+                    Trade.direction,
+                    Trade.volume,
+                    Trade.entry_price,
+                ).where(Trade.status == "OPEN")
+            )
+            for trade_id, symbol, direction, volume, entry_price in result.all():
+                platform.add_position(
+                    trade_id,
+                    _OpenPosition(
+                        symbol=symbol,
+                        direction="buy" if direction == 0 else "sell",
+                        value=volume * entry_price,
+                        volume=volume,
+                    ),
+                )
+            self._platform = platform
+        return self._platform
+
+    def on_trade_opened(self, trade: Trade) -> None:
+        """Apply an OPEN trade to loaded states (unloaded states warm from DB)."""
+        self._apply_opened(trade.user_id, trade.trade_id, _position_from_trade(trade))
+
+    def on_trade_closed(self, trade: Trade) -> None:
+        """Apply a CLOSED trade: release exposure and book realized P&L.
+
+        P&L is only booked if the state knew the trade as open; otherwise the
+        state was loaded after the close and already includes it.
+        """
+        self._apply_closed(*self._closed_args(trade))
+
+    def on_trade_opened_after_commit(self, db: AsyncSession, trade: Trade) -> None:
+        """Apply an OPEN trade once db commits; a rollback leaves state as is.
+
+        Trade values are captured now, so the update does not touch the
+        (expired) ORM object after the commit.
+        """
+        _defer_until_commit(
+            db,
+            partial(
+                self._apply_opened,
+                trade.user_id,
+                trade.trade_id,
+                _position_from_trade(trade),
+            ),
+        )
+
+    def on_trade_closed_after_commit(self, db: AsyncSession, trade: Trade) -> None:
+        """Apply a CLOSED trade once db commits; a rollback leaves state as is."""
+        _defer_until_commit(db, partial(self._apply_closed, *self._closed_args(trade)))
+
+    @staticmethod
+    def _closed_args(trade: Trade) -> tuple[str | None, str, Decimal, date]:
+        closed_on = (trade.exit_time or datetime.utcnow()).date()
+        return trade.user_id, trade.trade_id, Decimal(str(trade.profit or 0)), closed_on
+
+    def _apply_opened(
+        self, user_id: str | None, trade_id: str, position: _OpenPosition
+    ) -> None:
+        state = self._clients.get(user_id) if user_id else None
+        if state is not None:
+            state.add_position(trade_id, position)
+        if self._platform is not None:
+            self._platform.add_position(trade_id, position)
+
+    def _apply_closed(
+        self, user_id: str | None, trade_id: str, profit: Decimal, closed_on: date
+    ) -> None:
+        state = self._clients.get(user_id) if user_id else None
+        if state is not None and state.remove_position(trade_id) is not None:
+            state.apply_realized_pnl(profit, closed_on)
+        if self._platform is not None:
+            self._platform.remove_position(trade_id)
+
+    async def checkpoint(
+        self, db: AsyncSession, client_ids: list[str] | None = None
+    ) -> int:
+        """Persist ExposureSnapshots for changed states in one transaction.
+
+        Args:
+            db: Database session
+            client_ids: Clients to checkpoint (loaded if needed); defaults to
+                every loaded state that changed since the last checkpoint
+
+        Returns:
+            int: Number of snapshots written
+        """
+        if client_ids is None:
+            states = [s for s in self._clients.values() if s.dirty]
+        else:
+            states = [await self.get_client_state(cid, db) for cid in client_ids]
+
+        if not states:
+            return 0
+
+        db.add_all([state.to_snapshot() for state in states])
+        await db.commit()
+        for state in states:
+            state.dirty = False
+
+        logger.debug(
+            f"Checkpointed {len(states)} risk states",
+            extra={"snapshots": len(states)},
+        )
+        return len(states)
+
+    def invalidate(self, client_id: str | None = None) -> None:
+        """Drop cached state (one client, or everything)."""
+        if client_id is None:
+            self._clients.clear()
+            self._platform = None
+        else:
+            self._clients.pop(client_id, None)
+
+
+# Process-wide tracker
+risk_state = RiskStateTracker()
+
+
+def get_risk_state_tracker() -> RiskStateTracker:
+    """Get the process-wide risk state tracker."""
+    return risk_state
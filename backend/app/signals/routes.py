@@ -9,9 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.auth.dependencies import get_current_user
 from backend.app.core.db import get_db
 from backend.app.core.errors import APIError
+from backend.app.core.pagination import CountMode
 from backend.app.core.settings import get_settings
 from backend.app.core.websockets import manager
 from backend.app.signals.schema import (
+    SignalBatchCreate,
+    SignalBatchOut,
     SignalCreate,
     SignalListOut,
     SignalOut,
@@ -104,6 +107,85 @@ async def create_signal(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
+@router.post("/batch", status_code=200, response_model=SignalBatchOut)
+async def create_signals_batch(
+    request: SignalBatchCreate,
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+    current_user=Depends(get_current_user),  # noqa: B008
+    x_signature: str | None = Header(None),
+) -> SignalBatchOut:
+    """Ingest up to 100 trading signals in one signed request.
+
+    One HMAC signature covers the whole envelope. Deduplication (external_id
+    and instrument/version window) is applied per item; duplicates are
+    reported in the results instead of failing the batch.
+
+    Args:
+        request: Envelope with signals (each may carry an external_id)
+        x_signature: HMAC-SHA256 signature of the request envelope
+
+    Returns:
+        Per-item results in request order
+
+    Raises:
+        401: Unauthorized / invalid signature
+        413: Payload too large
+        422: Validation error
+        500: Server error
+    """
+    try:
+        settings = get_settings()
+        service = SignalService(
+            db,
+            hmac_key=settings.signals.hmac_key,
+            dedup_window_seconds=settings.signals.dedup_window_seconds,
+        )
+
+        # Validate payload sizes
+        for item in request.signals:
+            if (
+                item.payload
+                and len(json.dumps(item.payload).encode())
+                > settings.signals.max_payload_bytes
+            ):
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Payload exceeds {settings.signals.max_payload_bytes} bytes",
+                )
+
+        # Verify HMAC over the whole envelope
+        if x_signature and settings.signals.hmac_enabled:
+            payload_json = json.dumps(request.model_dump())
+            if not service.verify_hmac_signature(payload_json, x_signature):
+                logger.warning(f"HMAC verification failed for user {current_user.id}")
+                raise HTTPException(status_code=401, detail="Invalid HMAC signature")
+
+        result = await service.create_signals_batch(
+            user_id=current_user.id,
+            items=request.signals,
+        )
+
+        # Broadcast new signals to connected clients
+        for item in result.results:
+            if item.signal is not None:
+                await manager.broadcast(
+                    {
+                        "type": "signal_created",
+                        "data": item.signal.model_dump(mode="json"),
+                    }
+                )
+
+        return result
+
+    except HTTPException:
+        raise
+    except APIError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail) from e
+    except Exception as e:
+        logger.error(f"Signal batch creation failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
 @router.get("/{signal_id}", response_model=SignalOut)
 async def get_signal(
     signal_id: str,
@@ -174,23 +256,33 @@ async def list_signals(
     instrument: str | None = None,
     page: int = 1,
     page_size: int = 50,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
 ) -> SignalListOut:
-    """List user's signals with filtering."""
+    """List user's signals with filtering.
+
+    Pass next_cursor from the previous response as `cursor` to page
+    through large histories without OFFSET; `count=none` skips the total.
+    """
     try:
         service = SignalService(db, hmac_key="your-secret-key")
-        signals, total = await service.list_signals(
+        result = await service.list_signals_page(
             user_id=current_user.id,
             status=status,
             instrument=instrument,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            count=count,
         )
 
         return SignalListOut(
-            items=signals,
-            total=total,
+            items=result.items,
+            total=result.total,
             page=page,
             page_size=page_size,
+            next_cursor=result.next_cursor,
+            total_is_estimate=result.total_is_estimate,
         )
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
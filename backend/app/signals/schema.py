@@ -108,6 +108,32 @@ class SignalCreate(BaseModel):
         }
 
 
+class SignalBatchItem(SignalCreate):
+    """Signal inside a batch envelope, carrying its own dedupe ID."""
+
+    external_id: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=100,
+        description="External system ID for deduplication",
+    )
+
+
+class SignalBatchCreate(BaseModel):
+    """Schema for ingesting several signals in one signed request.
+
+    The X-Signature header signs the whole envelope, so N signals cost one
+    HMAC verification and one request.
+    """
+
+    signals: list[SignalBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Signals to ingest (1-100)",
+    )
+
+
 class SignalOut(BaseModel):
     """Schema for signal responses."""
 
@@ -152,6 +178,28 @@ class SignalOut(BaseModel):
         return labels.get(self.status, "unknown")
 
 
+class SignalBatchItemResult(BaseModel):
+    """Outcome for one signal of a batch, in request order."""
+
+    index: int = Field(..., description="Position of the signal in the request")
+    status: str = Field(..., pattern="^(created|duplicate)$")
+    external_id: str | None = None
+    signal: SignalOut | None = Field(
+        default=None, description="Created signal (status=created only)"
+    )
+    error: str | None = Field(
+        default=None, description="Why the signal was not created"
+    )
+
+
+class SignalBatchOut(BaseModel):
+    """Schema for batch ingest responses."""
+
+    results: list[SignalBatchItemResult]
+    created: int
+    duplicates: int
+
+
 class SignalUpdate(BaseModel):
     """Schema for updating existing signal."""
 
@@ -176,11 +224,19 @@ class SignalListOut(BaseModel):
     """Schema for list of signals with pagination."""
 
     items: list[SignalOut]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (None on last page)"
+    )
+    total_is_estimate: bool = Field(
+        default=False, description="True if total is a planner estimate"
+    )
 
     @property
     def pages(self) -> int:
         """Calculate total pages."""
+        if self.total is None:
+            return 0
         return (self.total + self.page_size - 1) // self.page_size
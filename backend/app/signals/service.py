@@ -6,14 +6,21 @@ import logging
 import time
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.errors import APIException, ConflictError, NotFoundError
+from backend.app.core.pagination import CountMode, InvalidCursorError, Page, paginate
 from backend.app.observability import get_metrics
 from backend.app.signals.models import Signal, SignalStatus
-from backend.app.signals.schema import SignalCreate, SignalOut
+from backend.app.signals.schema import (
+    SignalBatchItem,
+    SignalBatchItemResult,
+    SignalBatchOut,
+    SignalCreate,
+    SignalOut,
+)
 
 logger = logging.getLogger(__name__)
 _metrics = None  # Lazy load on first use
@@ -173,6 +180,209 @@ class SignalService:
                 detail="Failed to create signal",
             ) from e
 
+    async def create_signals_batch(
+        self,
+        user_id: str,
+        items: list[SignalBatchItem],
+    ) -> SignalBatchOut:
+        """Create several signals with set-based deduplication.
+
+        Applies the same rules as create_signal (unique external_id, one
+        signal per (instrument, version) within dedup_window) to the whole
+        batch with two SELECTs, then inserts every accepted signal in one
+        flush and one commit. Earlier items win over later duplicates in
+        the same batch.
+
+        Args:
+            user_id: User receiving the signals
+            items: Validated signals, each with an optional external_id
+
+        Returns:
+            Per-item results in request order plus created/duplicate counts
+
+        Raises:
+            APIException: If the batch cannot be stored
+
+        Example:
+            >>> out = await service.create_signals_batch(user_id, batch.signals)
+            >>> [r.status for r in out.results]
+            ['created', 'duplicate']
+        """
+        start_time = time.time()
+        cutoff_time = datetime.utcnow() - timedelta(seconds=self.dedup_window_seconds)
+
+        external_ids = {item.external_id for item in items if item.external_id}
+        instruments = {item.instrument for item in items}
+        versions = {item.version for item in items}
+
+        try:
+            # Existing external IDs (one query)
+            taken_ids: set[str] = set()
+            if external_ids:
+                rows = await self.db.execute(
+                    select(Signal.external_id).where(
+                        Signal.external_id.in_(external_ids)
+                    )
+                )
+                taken_ids = set(rows.scalars().all())
+
+            # (instrument, version) keys already used within the window (one query)
+            rows = await self.db.execute(
+                select(Signal.instrument, Signal.version)
+                .where(
+                    and_(
+                        Signal.instrument.in_(instruments),
+                        Signal.version.in_(versions),
+                        Signal.created_at >= cutoff_time,
+                    )
+                )
+                .distinct()
+            )
+            taken_windows: set[tuple[str, str]] = {tuple(row) for row in rows.all()}
+
+            results: list[SignalBatchItemResult] = []
+            created: list[tuple[int, Signal]] = []
+            for index, item in enumerate(items):
+                window_key = (item.instrument, item.version)
+                if item.external_id and item.external_id in taken_ids:
+                    error = f"Signal {item.external_id} already exists"
+                elif window_key in taken_windows:
+                    error = (
+                        f"Duplicate signal in dedup window: "
+                        f"{item.instrument} v{item.version}"
+                    )
+                else:
+                    error = None
+
+                if error:
+                    results.append(
+                        SignalBatchItemResult(
+                            index=index,
+                            status="duplicate",
+                            external_id=item.external_id,
+                            error=error,
+                        )
+                    )
+                    continue
+
+                if item.external_id:
+                    taken_ids.add(item.external_id)
+                taken_windows.add(window_key)
+
+                signal = Signal(
+                    user_id=user_id,
+                    instrument=item.instrument,
+                    side=0 if item.side == "buy" else 1,
+                    price=item.price,
+                    payload=item.payload or {},
+                    external_id=item.external_id,
+                    version=item.version,
+                )
+                created.append((index, signal))
+                results.append(
+                    SignalBatchItemResult(
+                        index=index, status="created", external_id=item.external_id
+                    )
+                )
+
+            if created:
+                self.db.add_all([signal for _, signal in created])
+                await self.db.flush()
+                await self.db.commit()
+
+                for index, signal in created:
+                    results[index].signal = SignalOut.model_validate(signal)
+
+        except IntegrityError as e:
+            # Lost a race with a concurrent ingest: fall back to per-item path
+            await self.db.rollback()
+            logger.warning(f"Batch insert conflict, retrying per signal: {e}")
+            return await self._create_signals_individually(user_id, items)
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Signal batch creation failed: {e}", exc_info=True)
+            raise APIException(
+                status_code=500,
+                error_type="server_error",
+                title="Signal Creation Error",
+                detail="Failed to create signals",
+            ) from e
+
+        # Emit telemetry
+        try:
+            metrics = _get_metrics()
+            for _, signal in created:
+                metrics.signals_ingested_total.labels(
+                    instrument=signal.instrument,
+                    side="buy" if signal.side == 0 else "sell",
+                ).inc()
+            metrics.signals_create_seconds.observe(time.time() - start_time)
+        except Exception:
+            # metrics best-effort
+            pass
+
+        logger.info(
+            f"Signal batch ingested: {len(created)}/{len(items)} created",
+            extra={
+                "user_id": user_id,
+                "batch_size": len(items),
+                "created_count": len(created),
+            },
+        )
+
+        return SignalBatchOut(
+            results=results,
+            created=len(created),
+            duplicates=len(items) - len(created),
+        )
+
+    async def _create_signals_individually(
+        self,
+        user_id: str,
+        items: list[SignalBatchItem],
+    ) -> SignalBatchOut:
+        """Slow path for a batch whose bulk insert hit a unique constraint.
+
+        Args:
+            user_id: User receiving the signals
+            items: Signals from the batch
+
+        Returns:
+            Per-item results in request order
+        """
+        results: list[SignalBatchItemResult] = []
+        for index, item in enumerate(items):
+            try:
+                signal = await self.create_signal(
+                    user_id=user_id,
+                    signal_create=SignalCreate(
+                        **item.model_dump(exclude={"external_id"})
+                    ),
+                    external_id=item.external_id,
+                )
+                results.append(
+                    SignalBatchItemResult(
+                        index=index,
+                        status="created",
+                        external_id=item.external_id,
+                        signal=signal,
+                    )
+                )
+            except ConflictError as e:
+                results.append(
+                    SignalBatchItemResult(
+                        index=index,
+                        status="duplicate",
+                        external_id=item.external_id,
+                        error=str(e.detail),
+                    )
+                )
+
+        created = sum(1 for r in results if r.status == "created")
+        return SignalBatchOut(
+            results=results, created=created, duplicates=len(items) - created
+        )
+
     async def get_signal(self, signal_id: str) -> SignalOut:
         """Retrieve signal by ID.
 
@@ -212,6 +422,8 @@ class SignalService:
         instrument: str | None = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: str | None = None,
+        count: CountMode = CountMode.EXACT,
     ) -> tuple[list[SignalOut], int]:
         """List signals with filtering and pagination.
 
@@ -219,12 +431,56 @@ class SignalService:
             user_id: User ID
             status: Filter by status (optional)
             instrument: Filter by instrument (optional)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored when cursor is given)
             page_size: Signals per page
+            cursor: Keyset cursor from a previous page (optional)
+            count: How to compute the total
 
         Returns:
             Tuple of (signals, total_count)
         """
+        result = await self.list_signals_page(
+            user_id=user_id,
+            status=status,
+            instrument=instrument,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            count=count,
+        )
+        return result.items, result.total or 0
+
+    async def list_signals_page(
+        self,
+        user_id: str,
+        status: int | None = None,
+        instrument: str | None = None,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: str | None = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> Page[SignalOut]:
+        """List signals newest first, with a cursor for the next page.
+
+        Pages are keyed on (created_at, id), so following next_cursor costs
+        the same at any depth. The total honours the same filters as the
+        page and is computed with COUNT(*) (or skipped/estimated per count).
+
+        Args:
+            user_id: User ID
+            status: Filter by status (optional)
+            instrument: Filter by instrument (optional)
+            page: Page number (1-indexed, ignored when cursor is given)
+            page_size: Signals per page
+            cursor: Keyset cursor from a previous page (optional)
+            count: How to compute the total
+
+        Returns:
+            Page of signals with next_cursor and total
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
         try:
             # Build query
             query = select(Signal).where(Signal.user_id == user_id)
@@ -234,26 +490,21 @@ class SignalService:
             if instrument:
                 query = query.where(Signal.instrument == instrument)
 
-            # Get total count
-            count_result = await self.db.execute(
-                select(Signal).where(Signal.user_id == user_id)
-            )
-            total = len(count_result.fetchall())
-
-            # Apply pagination
-            offset = (page - 1) * page_size
-            query = (
-                query.order_by(desc(Signal.created_at)).offset(offset).limit(page_size)
-            )
-
-            result = await self.db.execute(query)
-            signals = result.scalars().all()
-
-            return (
-                [SignalOut.model_validate(s) for s in signals],
-                total,
+            result = await paginate(
+                self.db,
+                query,
+                sort_column=Signal.created_at,
+                id_column=Signal.id,
+                limit=page_size,
+                cursor=cursor,
+                offset=(page - 1) * page_size,
+                count=count,
             )
+            result.items = [SignalOut.model_validate(s) for s in result.items]
+            return result
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Signal listing failed: {e}")
             raise APIException(
@@ -20,6 +20,10 @@ Example:
 
 import json
 import logging
+import os
+import socket
+import time
+import uuid
 from datetime import datetime
 from typing import Any
 
@@ -316,9 +320,170 @@ class SignalPublishCache:
             return None
 
 
+# Release a claim only if this guard still owns it (compare-and-delete)
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Strategy component for claims that cover every strategy (candle processing)
+ANY_STRATEGY = "*"
+
+
+class DedupeGuard:
+    """Atomic claim-once guard shared by candle detection and signal publishing.
+
+    A claim is keyed by (instrument, timeframe, candle_start, strategy). With
+    Redis the claim is a single SET NX EX, so exactly one worker across all
+    nodes wins it. Keys this process has already seen claimed are kept in a
+    local negative cache, so repeat checks (e.g. a poller hitting the same
+    candle every few seconds) return without a Redis round trip.
+
+    Without Redis the local cache is authoritative (single-process dedupe).
+    If Redis errors, the guard logs and falls back to the local cache rather
+    than blocking signal generation.
+
+    Example:
+        >>> guard = DedupeGuard(redis_client)
+        >>> if await guard.claim("GOLD", "15m", candle_start, "ppo_gold"):
+        ...     await publish(...)
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis | None = None,
+        ttl: int = 86400,
+        local_max_entries: int = 10_000,
+    ):
+        """Initialize dedupe guard.
+
+        Args:
+            redis_client: Optional Redis client (local-only if None)
+            ttl: Claim lifetime in seconds (default: 24 hours)
+            local_max_entries: Local cache size that triggers expiry cleanup
+        """
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.local_max_entries = local_max_entries
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._claimed: dict[str, float] = {}  # key -> monotonic expiry
+        self._release_script: Any = None
+
+    @staticmethod
+    def make_key(
+        instrument: str,
+        timeframe: str,
+        candle_start: datetime,
+        strategy: str = ANY_STRATEGY,
+    ) -> str:
+        """Create claim key.
+
+        Args:
+            instrument: Trading instrument (e.g., "GOLD")
+            timeframe: Timeframe string (e.g., "15m")
+            candle_start: Candle start timestamp
+            strategy: Strategy name (ANY_STRATEGY for whole-candle claims)
+
+        Returns:
+            Cache key string
+        """
+        return f"dedupe:{instrument}:{timeframe}:{candle_start.isoformat()}:{strategy}"
+
+    def _seen(self, key: str) -> bool:
+        """Check the local negative cache."""
+        expiry = self._claimed.get(key)
+        if expiry is None:
+            return False
+        if time.monotonic() >= expiry:
+            del self._claimed[key]
+            return False
+        return True
+
+    def _remember(self, key: str) -> None:
+        """Record key as claimed in the local negative cache."""
+        now = time.monotonic()
+        self._claimed[key] = now + self.ttl
+        if len(self._claimed) > self.local_max_entries:
+            self._claimed = {k: v for k, v in self._claimed.items() if v > now}
+
+    async def claim(
+        self,
+        instrument: str,
+        timeframe: str,
+        candle_start: datetime,
+        strategy: str = ANY_STRATEGY,
+    ) -> bool:
+        """Claim (instrument, timeframe, candle_start, strategy) once.
+
+        Args:
+            instrument: Trading instrument
+            timeframe: Timeframe string
+            candle_start: Candle start timestamp
+            strategy: Strategy name (ANY_STRATEGY for whole-candle claims)
+
+        Returns:
+            True if this caller won the claim, False if already claimed
+        """
+        key = self.make_key(instrument, timeframe, candle_start, strategy)
+
+        if self._seen(key):
+            return False
+
+        if self.redis_client is not None:
+            try:
+                won = await self.redis_client.set(key, self.owner, nx=True, ex=self.ttl)
+                self._remember(key)
+                return bool(won)
+            except Exception as e:
+                logger.error(
+                    f"Dedupe claim failed in Redis, using local cache: {key}: {e}",
+                    exc_info=True,
+                )
+
+        self._remember(key)
+        return True
+
+    async def release(
+        self,
+        instrument: str,
+        timeframe: str,
+        candle_start: datetime,
+        strategy: str = ANY_STRATEGY,
+    ) -> None:
+        """Release a claim this guard won (e.g. after a failed publish).
+
+        Args:
+            instrument: Trading instrument
+            timeframe: Timeframe string
+            candle_start: Candle start timestamp
+            strategy: Strategy name
+        """
+        key = self.make_key(instrument, timeframe, candle_start, strategy)
+        self._claimed.pop(key, None)
+
+        if self.redis_client is None:
+            return
+
+        try:
+            if self._release_script is None:
+                self._release_script = self.redis_client.register_script(
+                    _RELEASE_SCRIPT
+                )
+            await self._release_script(keys=[key], args=[self.owner])
+        except Exception as e:
+            logger.error(f"Failed to release dedupe claim: {key}: {e}", exc_info=True)
+
+    def clear_local(self) -> None:
+        """Clear the local negative cache (Redis claims are kept)."""
+        self._claimed.clear()
+
+
 # Global cache instances
 _candle_cache: CandleCache | None = None
 _signal_publish_cache: SignalPublishCache | None = None
+_dedupe_guard: DedupeGuard | None = None
 _redis_client: aioredis.Redis | None = None
 
 
@@ -331,7 +496,7 @@ async def initialize_caches() -> tuple[CandleCache, SignalPublishCache]:
     Example:
         >>> candle_cache, signal_cache = await initialize_caches()
     """
-    global _candle_cache, _signal_publish_cache, _redis_client
+    global _candle_cache, _signal_publish_cache, _dedupe_guard, _redis_client
 
     try:
         # Import settings here to avoid circular imports
@@ -354,12 +519,14 @@ async def initialize_caches() -> tuple[CandleCache, SignalPublishCache]:
 
                 _candle_cache = CandleCache(redis_client=_redis_client)
                 _signal_publish_cache = SignalPublishCache(redis_client=_redis_client)
+                _dedupe_guard = DedupeGuard(redis_client=_redis_client)
             else:
                 raise RuntimeError("Failed to connect to Redis")
         else:
             logger.info("Redis disabled, using in-memory caches")
             _candle_cache = CandleCache()
             _signal_publish_cache = SignalPublishCache()
+            _dedupe_guard = DedupeGuard()
 
     except Exception as e:
         logger.warning(
@@ -368,6 +535,7 @@ async def initialize_caches() -> tuple[CandleCache, SignalPublishCache]:
         )
         _candle_cache = CandleCache()
         _signal_publish_cache = SignalPublishCache()
+        _dedupe_guard = DedupeGuard()
 
     return _candle_cache, _signal_publish_cache
 
@@ -400,6 +568,21 @@ async def get_signal_publish_cache() -> SignalPublishCache:
     return _signal_publish_cache
 
 
+async def get_dedupe_guard() -> DedupeGuard:
+    """Get global dedupe guard instance.
+
+    Returns:
+        DedupeGuard instance (initializes if needed)
+    """
+    global _dedupe_guard
+
+    if _dedupe_guard is None:
+        await initialize_caches()
+        _dedupe_guard = _dedupe_guard or DedupeGuard()
+
+    return _dedupe_guard
+
+
 async def close_caches() -> None:
     """Close cache connections."""
     global _redis_client
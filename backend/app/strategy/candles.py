@@ -5,7 +5,8 @@ drift tolerance to handle timing variations in real-world systems.
 
 Key Features:
     - New candle detection with configurable window
-    - Duplicate signal prevention (Redis-backed persistent cache)
+    - Duplicate signal prevention (atomic Redis claim via DedupeGuard, so
+      only one worker across all nodes processes each candle)
     - Multi-timeframe support (15m, 1h, 4h, 1d)
     - Timezone-aware handling
     - Distributed system support
@@ -17,7 +18,8 @@ Example:
     >>> # Check if timestamp is at new candle boundary
     >>> is_new = detector.is_new_candle(datetime.utcnow(), "15m")
     >>>
-    >>> # Prevent duplicates within same candle (async, uses Redis cache)
+    >>> # Prevent duplicates across workers (async, atomic Redis claim)
+    >>> detector = CandleDetector(dedupe=await get_dedupe_guard())
     >>> if await detector.should_process_candle_async("GOLD", "15m", datetime.utcnow()):
     ...     # Process signal
     ...     pass
@@ -28,12 +30,49 @@ import os
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from backend.app.strategy.cache import DedupeGuard
+
 if TYPE_CHECKING:
     from backend.app.strategy.cache import CandleCache
 
 logger = logging.getLogger(__name__)
 
 
+def timeframe_minutes(timeframe: str) -> int:
+    """Parse timeframe string to interval in minutes.
+
+    Args:
+        timeframe: Timeframe string (e.g., "15m", "1h", "4h", "1d")
+
+    Returns:
+        Interval in minutes
+
+    Raises:
+        ValueError: If timeframe format is invalid
+
+    Example:
+        >>> timeframe_minutes("15m")
+        15
+        >>> timeframe_minutes("1h")
+        60
+        >>> timeframe_minutes("4h")
+        240
+        >>> timeframe_minutes("1d")
+        1440
+    """
+    if timeframe.endswith("m"):
+        return int(timeframe[:-1])
+    elif timeframe.endswith("h"):
+        return int(timeframe[:-1]) * 60
+    elif timeframe.endswith("d"):
+        return int(timeframe[:-1]) * 1440
+    else:
+        raise ValueError(
+            f"Unsupported timeframe format: {timeframe}. "
+            f"Expected format: <number><unit> where unit is m, h, or d"
+        )
+
+
 class CandleDetector:
     """Detects new candle boundaries and prevents duplicate processing.
 
@@ -42,19 +81,22 @@ class CandleDetector:
     Attributes:
         window_seconds: Grace period for boundary detection (drift tolerance)
         _processed_candles: In-memory cache of (instrument, timeframe, candle_ts)
-        _redis_cache: Optional Redis cache for persistent duplicate prevention
+        _dedupe: Optional DedupeGuard for cross-process duplicate prevention
     """
 
     def __init__(
         self,
         window_seconds: int | None = None,
         redis_cache: "CandleCache | None" = None,
+        dedupe: DedupeGuard | None = None,
     ):
         """Initialize candle detector.
 
         Args:
             window_seconds: Grace period in seconds (default: from CANDLE_CHECK_WINDOW env)
-            redis_cache: Optional CandleCache instance for persistent caching
+            redis_cache: Optional CandleCache; its Redis client backs a DedupeGuard
+                when no dedupe guard is given
+            dedupe: Optional DedupeGuard shared with SignalPublisher
 
         Example:
             >>> detector = CandleDetector(window_seconds=60)
@@ -70,14 +112,16 @@ class CandleDetector:
         # In-memory cache (fallback or primary if Redis unavailable)
         self._processed_candles: dict[tuple[str, str, datetime], datetime] = {}
 
-        # Redis cache for persistent duplicate prevention
-        self._redis_cache = redis_cache
+        # Atomic claim-once guard for persistent/distributed duplicate prevention
+        if dedupe is None and redis_cache is not None:
+            dedupe = DedupeGuard(redis_client=redis_cache.redis_client)
+        self._dedupe = dedupe
 
         logger.info(
             "CandleDetector initialized",
             extra={
                 "window_seconds": self.window_seconds,
-                "redis_enabled": redis_cache is not None,
+                "redis_enabled": dedupe is not None and dedupe.redis_client is not None,
             },
         )
 
@@ -227,10 +271,11 @@ class CandleDetector:
         timeframe: str,
         timestamp: datetime,
     ) -> bool:
-        """Check if candle should be processed with Redis-backed persistent caching.
+        """Check if candle should be processed, deduplicated across processes.
 
-        Uses Redis for duplicate prevention across process restarts and distributed deployments.
-        Falls back to in-memory cache if Redis unavailable.
+        With a DedupeGuard the candle is claimed atomically (Redis SET NX), so
+        exactly one worker across restarts and nodes processes it. Falls back
+        to the in-memory cache if no guard is configured.
 
         Args:
             instrument: Trading instrument (e.g., "GOLD", "EURUSD")
@@ -241,10 +286,9 @@ class CandleDetector:
             True if this is a new candle that hasn't been processed yet
 
         Example:
-            >>> from backend.app.strategy.cache import get_candle_cache
+            >>> from backend.app.strategy.cache import get_dedupe_guard
             >>>
-            >>> cache = await get_candle_cache()
-            >>> detector = CandleDetector(redis_cache=cache)
+            >>> detector = CandleDetector(dedupe=await get_dedupe_guard())
             >>>
             >>> # First call at boundary
             >>> if await detector.should_process_candle_async("GOLD", "15m", datetime.utcnow()):
@@ -258,14 +302,11 @@ class CandleDetector:
         # Get candle start timestamp
         candle_start = self.get_candle_start(timestamp, timeframe)
 
-        # Create cache key
-        cache_key = f"{instrument}:{timeframe}:{candle_start.isoformat()}"
-
-        # Check Redis cache first (if available)
-        if self._redis_cache:
-            if await self._redis_cache.exists(cache_key):
+        # Atomic claim across processes (if configured)
+        if self._dedupe is not None:
+            if not await self._dedupe.claim(instrument, timeframe, candle_start):
                 logger.debug(
-                    "Duplicate candle detected (Redis cache), skipping",
+                    "Duplicate candle detected (dedupe guard), skipping",
                     extra={
                         "instrument": instrument,
                         "timeframe": timeframe,
@@ -274,9 +315,6 @@ class CandleDetector:
                 )
                 return False
 
-            # Mark as processed in Redis (24 hour TTL)
-            await self._redis_cache.set(cache_key, "processed", ttl=86400)
-
         # Also check in-memory cache for this process
         sync_key = (instrument, timeframe, candle_start)
         if sync_key in self._processed_candles:
@@ -304,12 +342,44 @@ class CandleDetector:
                 "timeframe": timeframe,
                 "candle_start": candle_start.isoformat(),
                 "timestamp": timestamp.isoformat(),
-                "redis_backed": self._redis_cache is not None,
+                "redis_backed": self._dedupe is not None
+                and self._dedupe.redis_client is not None,
             },
         )
 
         return True
 
+    async def release_candle(
+        self,
+        instrument: str,
+        timeframe: str,
+        timestamp: datetime,
+    ) -> None:
+        """Release a candle claimed by should_process_candle_async.
+
+        Call this when processing the candle failed, so it can be retried
+        here or picked up by another worker instead of staying claimed for
+        the dedupe TTL.
+
+        Args:
+            instrument: Trading instrument (e.g., "GOLD", "EURUSD")
+            timeframe: Timeframe string (e.g., "15m", "1h")
+            timestamp: Timestamp passed to should_process_candle_async
+        """
+        candle_start = self.get_candle_start(timestamp, timeframe)
+        self._processed_candles.pop((instrument, timeframe, candle_start), None)
+        if self._dedupe is not None:
+            await self._dedupe.release(instrument, timeframe, candle_start)
+
+        logger.info(
+            "Candle claim released",
+            extra={
+                "instrument": instrument,
+                "timeframe": timeframe,
+                "candle_start": candle_start.isoformat(),
+            },
+        )
+
     def get_candle_start(
         self,
         timestamp: datetime,
@@ -351,42 +421,13 @@ class CandleDetector:
             >>> detector.clear_cache()  # Reset
         """
         self._processed_candles.clear()
+        if self._dedupe is not None:
+            self._dedupe.clear_local()
         logger.info("Candle cache cleared")
 
     def _parse_timeframe(self, timeframe: str) -> int:
-        """Parse timeframe string to interval in minutes.
-
-        Args:
-            timeframe: Timeframe string (e.g., "15m", "1h", "4h", "1d")
-
-        Returns:
-            Interval in minutes
-
-        Raises:
-            ValueError: If timeframe format is invalid
-
-        Example:
-            >>> detector = CandleDetector()
-            >>> detector._parse_timeframe("15m")
-            15
-            >>> detector._parse_timeframe("1h")
-            60
-            >>> detector._parse_timeframe("4h")
-            240
-            >>> detector._parse_timeframe("1d")
-            1440
-        """
-        if timeframe.endswith("m"):
-            return int(timeframe[:-1])
-        elif timeframe.endswith("h"):
-            return int(timeframe[:-1]) * 60
-        elif timeframe.endswith("d"):
-            return int(timeframe[:-1]) * 1440
-        else:
-            raise ValueError(
-                f"Unsupported timeframe format: {timeframe}. "
-                f"Expected format: <number><unit> where unit is m, h, or d"
-            )
+        """Parse timeframe string to interval in minutes (see timeframe_minutes)."""
+        return timeframe_minutes(timeframe)
 
     def _cleanup_old_candles(self) -> None:
         """Remove oldest candles from cache to prevent memory bloat.
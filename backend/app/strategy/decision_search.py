@@ -1,7 +1,10 @@
 """Decision search API endpoints (PR-080).
 
 Provides searchable interface for historical trading decisions with filtering,
-pagination, and individual decision retrieval.
+pagination, and individual decision retrieval. Months archived to Parquet
+(see strategy.logs.archive) are searched transparently: they are older than
+every row left in the database, so results continue into the archive once
+the database rows for a query run out.
 
 Endpoints:
     GET /api/v1/decisions/search - Search decisions with filters
@@ -14,11 +17,21 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.db import get_db
+from backend.app.core.pagination import (
+    CountMode,
+    InvalidCursorError,
+    Page,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
 from backend.app.observability.metrics import metrics
+from backend.app.strategy.logs.archive import DecisionArchive, get_decision_archive
 from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
 
 logger = logging.getLogger(__name__)
@@ -45,10 +58,12 @@ class DecisionSearchResponse(BaseModel):
     """Paginated decision search response."""
 
     results: list[DecisionSearchResult]
-    total: int
+    total: int | None
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 @router.get("/search", response_model=DecisionSearchResponse)
@@ -70,7 +85,14 @@ async def search_decisions(
     page_size: int = Query(
         20, ge=1, le=100, description="Items per page"
     ),  # noqa: B008
+    cursor: str | None = Query(  # noqa: B008
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
+    count: CountMode = Query(  # noqa: B008
+        CountMode.EXACT, description="Total: exact, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),  # noqa: B008
+    archive: DecisionArchive = Depends(get_decision_archive),  # noqa: B008
 ) -> DecisionSearchResponse:
     """Search decisions with filters and pagination.
 
@@ -83,15 +105,19 @@ async def search_decisions(
         outcome: Filter by outcome (e.g., "entered", "rejected")
         start_date: Filter decisions after this date (inclusive)
         end_date: Filter decisions before this date (inclusive)
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored when cursor is given)
         page_size: Number of results per page (max 100)
+        cursor: Keyset cursor; pages deep into the log without OFFSET
+        count: How to compute the total (estimate uses planner statistics)
         db: Database session
+        archive: Parquet archive of cold months
 
     Returns:
         Paginated search results with total count and page info
 
     Example:
         GET /api/v1/decisions/search?strategy=fib_rsi&symbol=GOLD&page=1
+        GET /api/v1/decisions/search?strategy=fib_rsi&cursor=<next_cursor>
     """
     # Track search telemetry
     metrics.decision_search_total.inc()
@@ -105,6 +131,7 @@ async def search_decisions(
     if symbol:
         query = query.where(DecisionLog.symbol == symbol)
 
+    outcome_enum = None
     if outcome:
         try:
             outcome_enum = DecisionOutcome(outcome)
@@ -120,20 +147,46 @@ async def search_decisions(
     if end_date:
         query = query.where(DecisionLog.timestamp <= end_date)
 
-    # Count total results
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Fetch page (ordered by timestamp DESC - most recent first) and total
+    horizon = archive.horizon()
+    try:
+        if horizon is None or (start_date is not None and start_date >= horizon):
+            result_page = await paginate(
+                db,
+                query,
+                sort_column=DecisionLog.timestamp,
+                id_column=DecisionLog.id,
+                limit=page_size,
+                cursor=cursor,
+                offset=(page - 1) * page_size,
+                count=count,
+            )
+        else:
+            result_page = await _paginate_with_archive(
+                db,
+                query,
+                archive,
+                horizon,
+                archive_filters={
+                    "strategy": strategy,
+                    "symbol": symbol,
+                    "outcome": outcome_enum,
+                    "start": start_date,
+                    "end": end_date,
+                },
+                page_size=page_size,
+                cursor=cursor,
+                offset=(page - 1) * page_size,
+                count=count,
+            )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=e.detail) from e
+
+    decisions = result_page.items
+    total = result_page.total
 
     # Calculate pagination
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-    offset = (page - 1) * page_size
-
-    # Fetch paginated results (ordered by timestamp DESC - most recent first)
-    query = query.order_by(DecisionLog.timestamp.desc()).limit(page_size).offset(offset)
-
-    result = await db.execute(query)
-    decisions = result.scalars().all()
+    total_pages = (total + page_size - 1) // page_size if total else 0
 
     # Convert to response model
     results = [
@@ -168,6 +221,8 @@ async def search_decisions(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=result_page.next_cursor,
+        total_is_estimate=result_page.total_is_estimate,
     )
 
 
@@ -175,12 +230,14 @@ async def search_decisions(
 async def get_decision(
     decision_id: str,
     db: AsyncSession = Depends(get_db),  # noqa: B008
+    archive: DecisionArchive = Depends(get_decision_archive),  # noqa: B008
 ) -> DecisionSearchResult:
-    """Get a single decision by ID.
+    """Get a single decision by ID (database first, then the archive).
 
     Args:
         decision_id: Decision UUID
         db: Database session
+        archive: Parquet archive of cold months
 
     Returns:
         Decision details
@@ -193,7 +250,7 @@ async def get_decision(
     """
     query = select(DecisionLog).where(DecisionLog.id == decision_id)
     result = await db.execute(query)
-    decision = result.scalar_one_or_none()
+    decision = result.scalar_one_or_none() or archive.get(decision_id)
 
     if not decision:
         raise HTTPException(status_code=404, detail=f"Decision {decision_id} not found")
@@ -207,3 +264,99 @@ async def get_decision(
         features=decision.features,
         note=decision.note,
     )
+
+
+async def _paginate_with_archive(
+    db: AsyncSession,
+    query: Select,
+    archive: DecisionArchive,
+    horizon: datetime,
+    *,
+    archive_filters: dict[str, Any],
+    page_size: int,
+    cursor: str | None,
+    offset: int,
+    count: CountMode,
+) -> Page[DecisionLog]:
+    """Paginate database rows, then continue into archived months.
+
+    Archived rows are all older than `horizon` and every database row is at
+    or after it, so the combined newest-first order is the database rows
+    followed by the archived rows.
+    """
+    if cursor:
+        after = decode_cursor(cursor)
+        if after[0] < horizon:
+            # Cursor already points into the archive
+            rows = archive.search(**archive_filters, after=after, limit=page_size + 1)
+            archive_total = None
+            if count != CountMode.NONE:
+                archive_total = archive.count(**archive_filters)
+            return _archive_page(rows, page_size, archive_total)
+
+    db_page = await paginate(
+        db,
+        query,
+        sort_column=DecisionLog.timestamp,
+        id_column=DecisionLog.id,
+        limit=page_size,
+        cursor=cursor,
+        offset=offset,
+        count=count,
+    )
+    items = list(db_page.items)
+    missing = page_size - len(items)
+
+    # Archive total comes from per-month counts; no Parquet rows are read
+    archive_total = None
+    if db_page.total is not None:
+        archive_total = archive.count(**archive_filters)
+
+    if missing == 0:
+        next_cursor = db_page.next_cursor
+        if next_cursor is None:
+            # Database exhausted exactly at the page end: more only if archived
+            if archive_total is None:
+                more = bool(archive.search(**archive_filters, limit=1))
+            else:
+                more = archive_total > 0
+            if more:
+                next_cursor = encode_cursor(items[-1].timestamp, items[-1].id)
+    else:
+        # Database rows are exhausted; the page continues in the archive
+        archive_offset = 0
+        if not cursor and not items and offset:
+            archive_offset = offset - await count_rows(db, query)
+        rows = archive.search(
+            **archive_filters, offset=archive_offset, limit=missing + 1
+        )
+        items.extend(rows[:missing])
+        next_cursor = None
+        if len(rows) > missing:
+            next_cursor = encode_cursor(items[-1].timestamp, items[-1].id)
+
+    total = None
+    if db_page.total is not None and archive_total is not None:
+        total = db_page.total + archive_total
+
+    return Page(
+        items=items,
+        next_cursor=next_cursor,
+        total=total,
+        total_is_estimate=db_page.total_is_estimate,
+    )
+
+
+def _archive_page(
+    rows: list[DecisionLog], page_size: int, archive_total: int | None
+) -> Page[DecisionLog]:
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+    return Page(
+        items=rows,
+        next_cursor=next_cursor,
+        # Database share of the total is not recounted on archive pages
+        total=archive_total,
+    )
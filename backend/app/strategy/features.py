@@ -0,0 +1,265 @@
+"""Per-candle shared feature computation for multi-strategy execution.
+
+Every enabled strategy runs on the same closed candle and the same OHLC
+DataFrame, and several of them derive overlapping indicators (RSI, ATR,
+MACD...). FeatureContext computes each (indicator, parameters) pair once per
+candle and hands the memoized result to every strategy that asks for it.
+
+Design:
+    - Memo entries are asyncio futures, so strategies running concurrently
+      that request the same feature await one computation instead of racing
+      to compute it twice.
+    - Indicator functions are pure module-level functions of plain inputs,
+      so they can be shipped to a process pool. That keeps the event loop
+      free while strategies wait on features, so concurrent strategies
+      overlap and their timeouts can fire. Only frames shorter than
+      OFFLOAD_MIN_BARS (warm-up history) are computed inline, where
+      pickling would cost more than the computation itself.
+    - fib_rsi uses Wilder-smoothed RSI/ATR and PPO uses rolling-mean RSI/ATR.
+      These are different indicators and are memoized under different keys;
+      the converted price columns are shared by all of them.
+
+Example:
+    >>> features = FeatureContext(df, executor=get_feature_executor())
+    >>> rsi = await features.rsi(14)          # computed
+    >>> rsi_again = await features.rsi(14)    # memoized
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, TypeVar, cast
+
+import numpy as np
+import pandas as pd
+
+from backend.app.strategy.fib_rsi.indicators import (
+    ATRCalculator,
+    ROCCalculator,
+    RSICalculator,
+)
+
+logger = logging.getLogger(__name__)
+
+# Frames at least this long are computed in the executor (if any); below
+# the pipeline's CANDLE_HISTORY_SIZE so steady-state frames are offloaded
+OFFLOAD_MIN_BARS = 200
+
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------------------------
+# Pure indicator functions (picklable; used by FeatureContext and PPOStrategy)
+# ---------------------------------------------------------------------------
+
+
+def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    """True range series: max(high-low, |high-prev close|, |low-prev close|)."""
+    high_low = high - low
+    high_close = np.abs(high - close.shift())
+    low_close = np.abs(low - close.shift())
+    return pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+
+
+def rsi_sma_last(close: pd.Series, period: int = 14) -> float:
+    """Latest RSI using simple rolling-mean gains/losses (50.0 if undefined)."""
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(period).mean()
+
+    rs = gain / loss
+    rsi = 100 - (100 / (1 + rs))
+
+    return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
+
+
+def atr_sma_last(tr: pd.Series, period: int = 14) -> float:
+    """Latest rolling-mean ATR from a true-range series (10.0 if undefined)."""
+    atr = tr.rolling(period).mean()
+    return float(atr.iloc[-1]) if not pd.isna(atr.iloc[-1]) else 10.0
+
+
+def macd_last(close: pd.Series) -> float:
+    """Latest MACD line value (EMA12 - EMA26)."""
+    ema_12 = close.ewm(span=12, adjust=False).mean()
+    ema_26 = close.ewm(span=26, adjust=False).mean()
+    macd = ema_12 - ema_26
+
+    return float(macd.iloc[-1]) if not pd.isna(macd.iloc[-1]) else 0.0
+
+
+def bb_position_last(close: pd.Series, period: int = 20) -> float:
+    """Latest position within Bollinger Bands (0 = lower, 1 = upper)."""
+    sma = close.rolling(period).mean()
+    std = close.rolling(period).std()
+
+    upper = sma + (2 * std)
+    lower = sma - (2 * std)
+
+    current = close.iloc[-1]
+    bb_range = upper.iloc[-1] - lower.iloc[-1]
+
+    if bb_range == 0:
+        return 0.5
+
+    position = (current - lower.iloc[-1]) / bb_range
+
+    return float(np.clip(position, 0.0, 1.0))
+
+
+# ---------------------------------------------------------------------------
+# Feature context
+# ---------------------------------------------------------------------------
+
+
+class FeatureContext:
+    """Memoized features for one candle's OHLC DataFrame.
+
+    Attributes:
+        df: OHLC dataframe shared by all strategies for this candle
+        executor: Optional executor for CPU-bound indicator work
+        hits: Feature requests served from the memo
+        misses: Feature requests that triggered a computation
+    """
+
+    def __init__(self, df: pd.DataFrame, executor: Executor | None = None):
+        """Initialize feature context.
+
+        Args:
+            df: OHLC dataframe with columns [open, high, low, close, volume]
+            executor: Executor for large frames (None: always inline)
+        """
+        self.df = df
+        self.executor = executor
+        self.hits = 0
+        self.misses = 0
+        # Features of different types share one memo; compute() casts back
+        self._memo: dict[Hashable, asyncio.Future[Any]] = {}
+        self._columns: dict[str, list[float]] = {}
+
+    async def compute(self, key: Hashable, fn: Callable[..., T], *args: Any) -> T:
+        """Return the memoized value for key, computing fn(*args) on first use.
+
+        Args:
+            key: Feature identity, e.g. ("rsi", 14)
+            fn: Pure function producing the feature
+            *args: Arguments for fn (must be picklable when offloaded)
+
+        Returns:
+            The feature value
+        """
+        future = self._memo.get(key)
+        if future is not None:
+            self.hits += 1
+            return cast(T, await asyncio.shield(future))
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        if self.executor is not None and len(self.df) >= OFFLOAD_MIN_BARS:
+            future = loop.run_in_executor(self.executor, fn, *args)
+        else:
+            future = loop.create_future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        self._memo[key] = future
+        return cast(T, await asyncio.shield(future))
+
+    def _column(self, name: str) -> list[float]:
+        """Column as a plain list (converted once)."""
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = self.df[name].tolist()
+        return values
+
+    @property
+    def closes(self) -> list[float]:
+        return self._column("close")
+
+    @property
+    def highs(self) -> list[float]:
+        return self._column("high")
+
+    @property
+    def lows(self) -> list[float]:
+        return self._column("low")
+
+    # Wilder-smoothed series (fib_rsi)
+
+    async def rsi(self, period: int = 14) -> list[float]:
+        """Wilder RSI series (RSICalculator)."""
+        return await self.compute(
+            ("rsi", period), RSICalculator.calculate, self.closes, period
+        )
+
+    async def roc(self, period: int = 14) -> list[float]:
+        """Rate-of-change series (ROCCalculator)."""
+        return await self.compute(
+            ("roc", period), ROCCalculator.calculate, self.closes, period
+        )
+
+    async def atr(self, period: int = 14) -> list[float]:
+        """Wilder ATR series (ATRCalculator)."""
+        return await self.compute(
+            ("atr", period),
+            ATRCalculator.calculate,
+            self.highs,
+            self.lows,
+            self.closes,
+            period,
+        )
+
+    # Rolling-mean point values (PPO)
+
+    async def true_range(self) -> pd.Series:
+        """True range series."""
+        df = self.df
+        return await self.compute(
+            ("true_range",), true_range, df["high"], df["low"], df["close"]
+        )
+
+    async def rsi_sma(self, period: int = 14) -> float:
+        """Latest rolling-mean RSI."""
+        return await self.compute(
+            ("rsi_sma", period), rsi_sma_last, self.df["close"], period
+        )
+
+    async def atr_sma(self, period: int = 14) -> float:
+        """Latest rolling-mean ATR."""
+        tr = await self.true_range()
+        return await self.compute(("atr_sma", period), atr_sma_last, tr, period)
+
+    async def macd(self) -> float:
+        """Latest MACD line value."""
+        return await self.compute(("macd",), macd_last, self.df["close"])
+
+    async def bb_position(self, period: int = 20) -> float:
+        """Latest Bollinger Band position."""
+        return await self.compute(
+            ("bb_position", period), bb_position_last, self.df["close"], period
+        )
+
+
+# Process-wide executor for offloaded feature work
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_feature_executor() -> ProcessPoolExecutor | None:
+    """Get the process pool used for large feature computations.
+
+    Sized by STRATEGY_FEATURE_WORKERS (default 2; 0 disables offloading).
+    Worker processes start lazily on first use.
+
+    Returns:
+        ProcessPoolExecutor, or None if offloading is disabled
+    """
+    global _executor
+    if _executor is None:
+        workers = int(os.getenv("STRATEGY_FEATURE_WORKERS", "2"))
+        if workers <= 0:
+            return None
+        _executor = ProcessPoolExecutor(max_workers=workers)
+    return _executor
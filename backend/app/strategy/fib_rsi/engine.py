@@ -37,21 +37,21 @@ Example:
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
 from backend.app.strategy.fib_rsi.indicators import (
-    ATRCalculator,
     FibonacciAnalyzer,
-    ROCCalculator,
-    RSICalculator,
 )
 from backend.app.strategy.fib_rsi.params import StrategyParams
 from backend.app.strategy.fib_rsi.pattern_detector import RSIPatternDetector
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.trading.time import MarketCalendar
 
+if TYPE_CHECKING:
+    from backend.app.strategy.features import FeatureContext
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -114,6 +114,7 @@ class StrategyEngine:
         df: pd.DataFrame,
         instrument: str,
         current_time: datetime,
+        features: "FeatureContext | None" = None,
     ) -> SignalCandidate | None:
         """Generate trading signal from OHLC data.
 
@@ -129,6 +130,8 @@ class StrategyEngine:
             df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
             instrument: Trading symbol (e.g., "EURUSD", "GOLD")
             current_time: Current time for market hours validation (UTC)
+            features: Shared per-candle feature context (optional); indicators
+                already computed for this candle are reused
 
         Returns:
             SignalCandidate if signal generated, None otherwise
@@ -179,7 +182,7 @@ class StrategyEngine:
                 return None
 
             # Step 4: Calculate indicators
-            indicators = await self._calculate_indicators(df)
+            indicators = await self._calculate_indicators(df, features)
             self.logger.debug(
                 "Indicators calculated",
                 extra={
@@ -290,11 +293,13 @@ class StrategyEngine:
     async def _calculate_indicators(
         self,
         df: pd.DataFrame,
+        features: "FeatureContext | None" = None,
     ) -> dict[str, Any]:
         """Calculate all technical indicators.
 
         Args:
             df: OHLCV DataFrame
+            features: Shared feature context (computes or reuses RSI/ROC/ATR)
 
         Returns:
             dict: Indicators including RSI, ROC, ATR, Fib levels, etc.
@@ -303,20 +308,25 @@ class StrategyEngine:
             ValueError: If calculation fails
         """
         try:
-            closes = df["close"].tolist()
-            highs = df["high"].tolist()
-            lows = df["low"].tolist()
+            if features is None:
+                # Local import: features imports this package's indicators
+                from backend.app.strategy.features import FeatureContext
+
+                features = FeatureContext(df)
+            closes = features.closes
+            highs = features.highs
+            lows = features.lows
 
             # RSI
-            rsi_values = RSICalculator.calculate(closes, self.params.rsi_period)
+            rsi_values = await features.rsi(self.params.rsi_period)
             current_rsi = rsi_values[-1]
 
             # ROC
-            roc_values = ROCCalculator.calculate(closes, self.params.roc_period)
+            roc_values = await features.roc(self.params.roc_period)
             current_roc = roc_values[-1]
 
             # ATR
-            atr_values = ATRCalculator.calculate(highs, lows, closes, period=14)
+            atr_values = await features.atr(14)
             current_atr = atr_values[-1]
 
             # Fibonacci levels
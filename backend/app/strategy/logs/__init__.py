@@ -4,12 +4,23 @@ Records every trade decision with full context (features, rationale, thresholds)
 for audit trails, replay, and analytics.
 """
 
+from backend.app.strategy.logs.archive import (
+    DecisionArchive,
+    archive_decision_logs,
+    get_decision_archive,
+)
 from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
 from backend.app.strategy.logs.service import DecisionLogService, record_decision
+from backend.app.strategy.logs.writer import DecisionLogWriter, get_decision_log_writer
 
 __all__ = [
     "DecisionLog",
     "DecisionOutcome",
     "DecisionLogService",
     "record_decision",
+    "DecisionLogWriter",
+    "get_decision_log_writer",
+    "DecisionArchive",
+    "archive_decision_logs",
+    "get_decision_archive",
 ]
@@ -0,0 +1,456 @@
+"""Month partitions and Parquet archive for decision logs.
+
+On PostgreSQL decision_logs is range-partitioned by month (migration 101);
+ensure_partitions() creates the month partitions a batch of rows needs;
+remember_partitions() caches them once the batch has committed.
+
+Cold months are moved out of the database by archive_decision_logs(): each
+whole month older than the cutoff is written to one Parquet file
+(decision_logs_YYYYMM.parquet, with its row counts in
+decision_logs_YYYYMM.counts.json) and then removed from the table (its
+partition is dropped on PostgreSQL). Archiving always proceeds from the
+oldest month, so everything before DecisionArchive.horizon() is in Parquet
+and everything after it is in the database. decision_search uses that
+boundary to continue a search into the archive transparently.
+
+Example:
+    >>> archive = get_decision_archive()
+    >>> moved = await archive_decision_logs(db, before=datetime(2026, 7, 1))
+    >>> rows = archive.search(strategy="fib_rsi", limit=20)
+    >>> total = archive.count(strategy="fib_rsi")
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from collections.abc import Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
+
+logger = logging.getLogger(__name__)
+
+# Month partitions of decision_logs are named decision_logs_pYYYYMM
+PARTITION_PREFIX = "decision_logs_p"
+
+ARCHIVE_FILE = re.compile(r"^decision_logs_(\d{4})(\d{2})\.parquet$")
+
+ARCHIVE_COLUMNS = [
+    "id",
+    "timestamp",
+    "strategy",
+    "symbol",
+    "outcome",
+    "features",
+    "note",
+]
+
+
+def month_start(ts: datetime | date) -> date:
+    """First day of the month containing ts."""
+    return date(ts.year, ts.month, 1)
+
+
+def next_month(month: date) -> date:
+    """First day of the month after month."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _month_end(month: date) -> datetime:
+    """Start of the month after month, as a datetime."""
+    following = next_month(month)
+    return datetime(following.year, following.month, 1)
+
+
+def _partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+# ---------------------------------------------------------------------------
+# Partitions (PostgreSQL)
+# ---------------------------------------------------------------------------
+
+# Month partitions known to exist, shared across sessions
+_known_partitions: set[date] = set()
+_partitioned: bool | None = None
+
+
+async def is_partitioned(session: AsyncSession) -> bool:
+    """Whether decision_logs is a partitioned PostgreSQL table."""
+    global _partitioned
+    if _partitioned is None:
+        if session.get_bind().dialect.name != "postgresql":
+            return False
+        result = await session.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = 'decision_logs'::regclass)"
+            )
+        )
+        _partitioned = bool(result.scalar_one())
+    return _partitioned
+
+
+async def ensure_partitions(
+    session: AsyncSession, timestamps: Sequence[datetime]
+) -> set[date]:
+    """Create the month partitions needed for timestamps (PostgreSQL only).
+
+    The CREATE TABLEs run in the session's transaction; pass the result to
+    remember_partitions() only after that transaction commits.
+
+    Returns:
+        Months whose partitions were created in this transaction
+    """
+    missing = {month_start(ts) for ts in timestamps} - _known_partitions
+    if not missing or not await is_partitioned(session):
+        return set()
+
+    for month in sorted(missing):
+        await session.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{_partition_name(month)}" '
+                f"PARTITION OF decision_logs FOR VALUES "
+                f"FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')"
+            )
+        )
+    return missing
+
+
+def remember_partitions(months: set[date]) -> None:
+    """Cache month partitions created by a transaction that has committed."""
+    _known_partitions.update(months)
+
+
+# ---------------------------------------------------------------------------
+# Parquet archive
+# ---------------------------------------------------------------------------
+
+
+def _to_decision_log(row: Any) -> DecisionLog:
+    """Transient DecisionLog from an archived row (not attached to a session)."""
+    return DecisionLog(
+        id=row.id,
+        timestamp=row.timestamp.to_pydatetime(),
+        strategy=row.strategy,
+        symbol=row.symbol,
+        outcome=DecisionOutcome(row.outcome),
+        features=json.loads(row.features),
+        note=None if pd.isna(row.note) else row.note,
+    )
+
+
+class DecisionArchive:
+    """Monthly Parquet files of archived decision logs.
+
+    Attributes:
+        root: Directory holding decision_logs_YYYYMM.parquet files
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def months(self) -> list[date]:
+        """Archived months, oldest first."""
+        if not self.root.is_dir():
+            return []
+        months = []
+        for path in self.root.iterdir():
+            match = ARCHIVE_FILE.match(path.name)
+            if match:
+                months.append(date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+
+    def horizon(self) -> datetime | None:
+        """Start of the first month still in the database (None: no archive)."""
+        months = self.months()
+        if not months:
+            return None
+        end = next_month(months[-1])
+        return datetime(end.year, end.month, 1)
+
+    def path(self, month: date) -> Path:
+        return self.root / f"decision_logs_{month:%Y%m}.parquet"
+
+    def counts_path(self, month: date) -> Path:
+        return self.root / f"decision_logs_{month:%Y%m}.counts.json"
+
+    def write_month(self, month: date, frame: pd.DataFrame) -> None:
+        """Write (or extend) one month's archive file atomically.
+
+        Row counts per (strategy, symbol, outcome) are written next to it,
+        so totals never have to open the Parquet file.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(month)
+        if path.exists():
+            frame = pd.concat([pd.read_parquet(path), frame], ignore_index=True)
+            frame = frame.drop_duplicates("id", keep="last")
+        tmp = path.with_suffix(".parquet.tmp")
+        frame[ARCHIVE_COLUMNS].to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        self._write_counts(month, frame)
+
+    def _write_counts(self, month: date, frame: pd.DataFrame) -> list[list[Any]]:
+        counts = [
+            [strategy, symbol, outcome, int(n)]
+            for (strategy, symbol, outcome), n in frame.groupby(
+                ["strategy", "symbol", "outcome"]
+            )
+            .size()
+            .items()
+        ]
+        path = self.counts_path(month)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(counts))
+        os.replace(tmp, path)
+        return counts
+
+    def _counts(self, month: date) -> list[list[Any]]:
+        """Per-(strategy, symbol, outcome) row counts of one month."""
+        try:
+            counts: list[list[Any]] = json.loads(self.counts_path(month).read_text())
+            return counts
+        except (OSError, ValueError):
+            # Archived before counts were kept (or unreadable): rebuild once
+            frame = pd.read_parquet(
+                self.path(month), columns=["strategy", "symbol", "outcome"]
+            )
+            return self._write_counts(month, frame)
+
+    def _months_in(self, start: datetime | None, end: datetime | None) -> list[date]:
+        """Archived months overlapping [start, end], oldest first."""
+        return [
+            month
+            for month in self.months()
+            if (end is None or datetime(month.year, month.month, 1) <= end)
+            and (start is None or _month_end(month) > start)
+        ]
+
+    @staticmethod
+    def _filters(
+        strategy: str | None,
+        symbol: str | None,
+        outcome: DecisionOutcome | None,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> list[tuple[str, str, Any]]:
+        filters: list[tuple[str, str, Any]] = []
+        if strategy:
+            filters.append(("strategy", "==", strategy))
+        if symbol:
+            filters.append(("symbol", "==", symbol))
+        if outcome:
+            filters.append(("outcome", "==", outcome.value))
+        if start is not None:
+            filters.append(("timestamp", ">=", start))
+        if end is not None:
+            filters.append(("timestamp", "<=", end))
+        return filters
+
+    def count(
+        self,
+        *,
+        strategy: str | None = None,
+        symbol: str | None = None,
+        outcome: DecisionOutcome | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> int:
+        """Count archived decisions matching the filters.
+
+        Months wholly inside [start, end] are counted from their counts
+        file; only months cut by the range read their timestamp column.
+        """
+        filters = self._filters(strategy, symbol, outcome, start, end)
+        total = 0
+        for month in self._months_in(start, end):
+            lower = datetime(month.year, month.month, 1)
+            if (start is None or start <= lower) and (
+                end is None or end >= _month_end(month)
+            ):
+                total += sum(
+                    n
+                    for row_strategy, row_symbol, row_outcome, n in self._counts(month)
+                    if (not strategy or row_strategy == strategy)
+                    and (not symbol or row_symbol == symbol)
+                    and (not outcome or row_outcome == outcome.value)
+                )
+            else:
+                total += len(
+                    pd.read_parquet(
+                        self.path(month), columns=["timestamp"], filters=filters or None
+                    )
+                )
+        return total
+
+    def search(
+        self,
+        *,
+        strategy: str | None = None,
+        symbol: str | None = None,
+        outcome: DecisionOutcome | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        after: tuple[datetime, str] | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> list[DecisionLog]:
+        """Search archived decisions, newest first.
+
+        Months are read newest first and only their id and timestamp
+        columns, stopping once the page is covered; full rows are then
+        read for the page ids only. Use count() for the total.
+
+        Args:
+            strategy: Optional strategy filter
+            symbol: Optional symbol filter
+            outcome: Optional outcome filter
+            start: Optional start (inclusive)
+            end: Optional end (inclusive)
+            after: Keyset position (timestamp, id); rows strictly after it
+            offset: Rows to skip (ignored with after)
+            limit: Maximum rows
+
+        Returns:
+            Page of transient DecisionLog rows
+        """
+        if after is not None:
+            offset = 0
+            end = after[0] if end is None else min(end, after[0])
+        filters = self._filters(strategy, symbol, outcome, start, end)
+
+        keys: list[pd.DataFrame] = []
+        found = 0
+        for month in reversed(self._months_in(start, end)):
+            frame = pd.read_parquet(
+                self.path(month), columns=["id", "timestamp"], filters=filters or None
+            )
+            if after is not None:
+                ts, row_id = pd.Timestamp(after[0]), after[1]
+                frame = frame[(frame["timestamp"] < ts) | (frame["id"] < row_id)]
+            if frame.empty:
+                continue
+            frame["month"] = month
+            keys.append(frame.sort_values(["timestamp", "id"], ascending=False))
+            found += len(frame)
+            if found >= offset + limit:
+                break
+        if not keys:
+            return []
+
+        page = pd.concat(keys, ignore_index=True).iloc[offset : offset + limit]
+        rows: dict[str, DecisionLog] = {}
+        for month, ids in page.groupby("month")["id"]:
+            frame = pd.read_parquet(self.path(month), filters=[("id", "in", list(ids))])
+            rows.update((row.id, _to_decision_log(row)) for row in frame.itertuples())
+        return [rows[row_id] for row_id in page["id"]]
+
+    def get(self, decision_id: str) -> DecisionLog | None:
+        """Find one archived decision by id (newest months first)."""
+        for month in reversed(self.months()):
+            frame = pd.read_parquet(
+                self.path(month), filters=[("id", "==", decision_id)]
+            )
+            if not frame.empty:
+                return _to_decision_log(next(frame.itertuples()))
+        return None
+
+
+_archive: DecisionArchive | None = None
+
+
+def get_decision_archive() -> DecisionArchive:
+    """Get the process-wide decision archive (DECISION_ARCHIVE_DIR)."""
+    global _archive
+    if _archive is None:
+        _archive = DecisionArchive(
+            os.getenv("DECISION_ARCHIVE_DIR", "data/decision_archive")
+        )
+    return _archive
+
+
+async def archive_decision_logs(
+    db: AsyncSession,
+    before: datetime,
+    archive: DecisionArchive | None = None,
+) -> int:
+    """Move every whole month older than `before` to the Parquet archive.
+
+    Each month is written to Parquet first and only then removed from the
+    database (partition dropped on PostgreSQL), one commit per month, so an
+    interrupted run never loses rows and can simply be rerun.
+
+    Args:
+        db: Database session
+        before: Months ending at or before this month's start are archived
+        archive: Target archive (default: get_decision_archive())
+
+    Returns:
+        Number of decision logs archived
+    """
+    archive = archive or get_decision_archive()
+    cutoff = month_start(before)
+    cutoff_ts = datetime(cutoff.year, cutoff.month, 1)
+
+    oldest = await db.scalar(
+        select(func.min(DecisionLog.timestamp)).where(DecisionLog.timestamp < cutoff_ts)
+    )
+    if oldest is None:
+        return 0
+
+    archived = 0
+    month = month_start(oldest)
+    while month < cutoff:
+        lower = datetime(month.year, month.month, 1)
+        following = next_month(month)
+        upper = datetime(following.year, following.month, 1)
+
+        result = await db.execute(
+            select(
+                DecisionLog.id,
+                DecisionLog.timestamp,
+                DecisionLog.strategy,
+                DecisionLog.symbol,
+                DecisionLog.outcome,
+                DecisionLog.features,
+                DecisionLog.note,
+            ).where(DecisionLog.timestamp >= lower, DecisionLog.timestamp < upper)
+        )
+        rows = result.all()
+        if rows:
+            frame = pd.DataFrame(rows, columns=ARCHIVE_COLUMNS)
+            frame["outcome"] = [DecisionOutcome(o).value for o in frame["outcome"]]
+            frame["features"] = [json.dumps(f) for f in frame["features"]]
+            frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+            await asyncio.to_thread(archive.write_month, month, frame)
+
+            if await is_partitioned(db):
+                await db.execute(
+                    text(f'DROP TABLE IF EXISTS "{_partition_name(month)}"')
+                )
+                _known_partitions.discard(month)
+            # Rows outside a month partition (default partition, other DBs)
+            await db.execute(
+                delete(DecisionLog).where(
+                    DecisionLog.timestamp >= lower, DecisionLog.timestamp < upper
+                )
+            )
+            await db.commit()
+            archived += len(rows)
+
+            logger.info(
+                f"Archived {len(rows)} decision logs for {month:%Y-%m}",
+                extra={"month": month.isoformat(), "rows": len(rows)},
+            )
+        month = following
+
+    return archived
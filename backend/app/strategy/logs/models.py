@@ -8,6 +8,7 @@ Records every trade decision with:
 """
 
 import enum
+import functools
 from datetime import datetime
 from typing import Any
 
@@ -17,6 +18,38 @@ from sqlalchemy import Index, String, Text
 
 from backend.app.core.db import Base, JSONBType
 
+# Feature keys redacted by DecisionLog.sanitize_features (matched lowercased)
+PII_KEYS = frozenset(
+    {
+        "user_id",
+        "email",
+        "phone",
+        "phone_number",
+        "api_key",
+        "api_token",
+        "access_token",
+        "account_number",
+        "account_id",
+    }
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_pii_key(key: str) -> bool:
+    """Whether a feature key is redacted (cached: the same names recur)."""
+    return key.lower() in PII_KEYS
+
+
+def _redact(obj: Any) -> Any:
+    """Recursively redact PII keys from nested dicts/lists (returns copies)."""
+    if isinstance(obj, dict):
+        return {
+            k: "[REDACTED]" if _is_pii_key(k) else _redact(v) for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_redact(item) for item in obj]
+    return obj
+
 
 class DecisionOutcome(str, enum.Enum):
     """Possible outcomes of a trading decision."""
@@ -135,32 +168,5 @@ class DecisionLog(Base):
         Returns:
             Sanitized features dictionary
         """
-        sanitized = features.copy()
-
-        # List of keys to redact
-        pii_keys = {
-            "user_id",
-            "email",
-            "phone",
-            "phone_number",
-            "api_key",
-            "api_token",
-            "access_token",
-            "account_number",
-            "account_id",
-        }
-
-        def _redact_recursive(obj: Any) -> Any:
-            """Recursively redact PII from nested structures."""
-            if isinstance(obj, dict):
-                return {
-                    k: "[REDACTED]" if k.lower() in pii_keys else _redact_recursive(v)
-                    for k, v in obj.items()
-                }
-            elif isinstance(obj, list):
-                return [_redact_recursive(item) for item in obj]
-            else:
-                return obj
-
-        result: dict[str, Any] = _redact_recursive(sanitized)
+        result: dict[str, Any] = _redact(features)
         return result
@@ -2,6 +2,8 @@
 
 Provides:
 - Decision recording with automatic PII redaction
+- Optional buffered recording through DecisionLogWriter (no commit on the
+  signal path)
 - Query by date range, strategy, symbol, outcome
 - Analytics aggregation (decisions per strategy, outcomes distribution)
 - Telemetry integration
@@ -17,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.observability.metrics import metrics
 from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
+from backend.app.strategy.logs.writer import DecisionLogWriter
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +27,16 @@ logger = logging.getLogger(__name__)
 class DecisionLogService:
     """Service for recording and querying trading decisions."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, writer: DecisionLogWriter | None = None):
         """Initialize decision log service.
 
         Args:
             db: Async database session
+            writer: Buffered writer for record_decision (None: insert and
+                commit each decision on db)
         """
         self.db = db
+        self.writer = writer
 
     async def record_decision(
         self,
@@ -52,7 +58,8 @@ class DecisionLogService:
             sanitize_pii: Whether to redact PII from features (default: True)
 
         Returns:
-            Created DecisionLog instance
+            Created DecisionLog instance (transient when a writer is used;
+            it is persisted by the writer's next flush)
 
         Example:
             >>> service = DecisionLogService(db)
@@ -74,16 +81,23 @@ class DecisionLogService:
             if sanitize_pii:
                 features = DecisionLog.sanitize_features(features)
 
+            row = {
+                "id": str(uuid4()),
+                "timestamp": datetime.utcnow(),
+                "strategy": strategy,
+                "symbol": symbol,
+                "features": features,
+                "outcome": outcome,
+                "note": note,
+            }
+
+            if self.writer is not None:
+                # Queued; the writer inserts in batches and records metrics
+                await self.writer.submit(row)
+                return DecisionLog(**row)
+
             # Create decision log
-            decision_log = DecisionLog(
-                id=str(uuid4()),
-                timestamp=datetime.utcnow(),
-                strategy=strategy,
-                symbol=symbol,
-                features=features,
-                outcome=outcome,
-                note=note,
-            )
+            decision_log = DecisionLog(**row)
 
             self.db.add(decision_log)
             await self.db.commit()
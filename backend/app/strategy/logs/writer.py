@@ -0,0 +1,224 @@
+"""Buffered decision log writer.
+
+Recording a decision on the signal path only enqueues a row; a background
+flusher task writes queued rows with one multi-row INSERT and one commit
+per batch, either every flush_interval_ms or as soon as max_rows rows are
+waiting, whichever comes first. The queue is bounded: when it is full,
+submit() waits for the flusher (backpressure) instead of dropping audit
+records. A batch that fails for a transient reason (connection lost,
+database restarting) is retried with capped exponential backoff until it is
+written; a batch rejected for its data (integrity or data errors) is
+retried row by row, so only the offending rows are given up on.
+
+Example:
+    >>> writer = get_decision_log_writer()
+    >>> service = DecisionLogService(db, writer=writer)
+    >>> await service.record_decision("fib_rsi", "GOLD", features, outcome)
+    >>> await writer.flush()  # wait until everything queued is written
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.observability.metrics import metrics
+from backend.app.strategy.logs.archive import ensure_partitions, remember_partitions
+from backend.app.strategy.logs.models import DecisionLog
+
+logger = logging.getLogger(__name__)
+
+# Rows written per INSERT (flush early once this many are queued)
+DEFAULT_MAX_ROWS = 500
+
+# Longest a queued row waits before being written
+DEFAULT_FLUSH_INTERVAL_MS = 200
+
+# Queued rows before submit() blocks
+DEFAULT_MAX_QUEUE = 10_000
+
+# Backoff between retries of a failed batch (doubles up to the maximum)
+DEFAULT_RETRY_DELAY_MS = 500
+MAX_RETRY_DELAY_MS = 30_000
+
+# Errors caused by the rows themselves; retrying the same rows cannot help
+ROW_ERRORS = (IntegrityError, DataError)
+
+
+class DecisionLogWriter:
+    """Background batch writer for DecisionLog rows.
+
+    Attributes:
+        session_factory: Callable returning an async session context manager
+        max_rows: Maximum rows per INSERT
+        flush_interval_ms: Maximum time a row waits in the queue
+        max_queue: Queue bound (submit() waits when full)
+        retry_delay_ms: First backoff after a failed batch
+        written: Rows written so far
+        retries: Failed batch writes that were retried
+        failed: Rows rejected by the database (dropped)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        max_rows: int = DEFAULT_MAX_ROWS,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        retry_delay_ms: int = DEFAULT_RETRY_DELAY_MS,
+    ):
+        self.session_factory = session_factory
+        self.max_rows = max_rows
+        self.flush_interval_ms = flush_interval_ms
+        self.max_queue = max_queue
+        self.retry_delay_ms = retry_delay_ms
+        self.written = 0
+        self.retries = 0
+        self.failed = 0
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the flusher task (idempotent; called by submit())."""
+        if self._task is None or self._task.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, row: dict[str, Any]) -> None:
+        """Queue one DecisionLog row (column name -> value).
+
+        Waits only if the queue is full.
+        """
+        self.start()
+        assert self._queue is not None
+        await self._queue.put(row)
+
+    async def flush(self) -> None:
+        """Wait until every row queued so far has been written."""
+        if self._queue is not None and self._task is not None:
+            await self._queue.join()
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Write everything still queued, then stop the flusher.
+
+        Args:
+            timeout: Seconds to wait for queued rows (None: until written);
+                rows still unwritten after it are logged and abandoned
+        """
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except TimeoutError:
+            pending = self._queue.qsize() if self._queue is not None else 0
+            logger.error(
+                f"Stopped with {pending} decision logs still queued",
+                extra={"rows": pending},
+            )
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        interval = self.flush_interval_ms / 1000
+
+        while True:
+            batch = [await queue.get()]
+            deadline = time.monotonic() + interval
+            while len(batch) < self.max_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        """Write one batch, retrying until every row is written or rejected."""
+        delay = self.retry_delay_ms / 1000
+        while True:
+            try:
+                await self._insert(batch)
+                break
+            except ROW_ERRORS as e:
+                if len(batch) == 1:
+                    self.failed += 1
+                    logger.error(
+                        f"Decision log {batch[0].get('id')} rejected: {e}",
+                        extra={"decision_id": batch[0].get("id")},
+                    )
+                    return
+                # Find the offending rows; the rest are still written
+                for row in batch:
+                    await self._write([row])
+                return
+            except Exception as e:
+                self.retries += 1
+                logger.warning(
+                    f"Failed to write {len(batch)} decision logs, "
+                    f"retrying in {delay:.1f}s: {e}",
+                    extra={"rows": len(batch), "retry_in_s": delay},
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY_MS / 1000)
+
+        self.written += len(batch)
+        for strategy, count in Counter(row["strategy"] for row in batch).items():
+            metrics.decision_logs_total.labels(strategy=strategy).inc(count)
+
+    async def _insert(self, batch: list[dict[str, Any]]) -> None:
+        """Insert one batch with a single multi-row INSERT and commit."""
+        async with self.session_factory() as session:
+            try:
+                created = await ensure_partitions(
+                    session, [row["timestamp"] for row in batch]
+                )
+                await session.execute(insert(DecisionLog), batch)
+                await session.commit()
+                remember_partitions(created)
+            except Exception:
+                await session.rollback()
+                raise
+
+
+_writer: DecisionLogWriter | None = None
+
+
+def get_decision_log_writer() -> DecisionLogWriter:
+    """Get the process-wide decision log writer.
+
+    Batching is tuned by DECISION_LOG_BATCH_ROWS and
+    DECISION_LOG_FLUSH_MS.
+    """
+    global _writer
+    if _writer is None:
+        from backend.app.core.db import get_async_session
+
+        _writer = DecisionLogWriter(
+            get_async_session,
+            max_rows=int(os.getenv("DECISION_LOG_BATCH_ROWS", str(DEFAULT_MAX_ROWS))),
+            flush_interval_ms=int(
+                os.getenv("DECISION_LOG_FLUSH_MS", str(DEFAULT_FLUSH_INTERVAL_MS))
+            ),
+        )
+    return _writer
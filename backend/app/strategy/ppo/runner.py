@@ -23,6 +23,7 @@ Example:
     >>> signal = await strategy.generate_signal(df, "GOLD", datetime.utcnow())
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime
@@ -31,6 +32,14 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from backend.app.strategy.features import (
+    FeatureContext,
+    atr_sma_last,
+    bb_position_last,
+    macd_last,
+    rsi_sma_last,
+    true_range,
+)
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.strategy.ppo.loader import PPOModelLoader
 
@@ -68,7 +77,7 @@ class PPOStrategy:
             ... )
         """
         # Load from environment if not provided
-        self.model_path = model_path or os.getenv("PPO_MODEL_PATH", "/app/models/ppo")
+        self.model_path = model_path or os.getenv("PPO_MODEL_PATH") or "/app/models/ppo"
         self.threshold = float(os.getenv("PPO_THRESHOLD", str(threshold)))
 
         # Initialize loader
@@ -117,6 +126,7 @@ class PPOStrategy:
         df: pd.DataFrame,
         instrument: str,
         timestamp: datetime,
+        features: FeatureContext | None = None,
     ) -> SignalCandidate | None:
         """Generate trading signal using PPO model.
 
@@ -124,6 +134,8 @@ class PPOStrategy:
             df: OHLC dataframe with columns [open, high, low, close, volume]
             instrument: Trading instrument (e.g., "GOLD", "EURUSD")
             timestamp: Signal timestamp (UTC)
+            features: Shared per-candle feature context (optional); RSI, MACD,
+                BB position and ATR already computed for this candle are reused
 
         Returns:
             SignalCandidate if signal generated, None otherwise
@@ -146,14 +158,15 @@ class PPOStrategy:
             return None
 
         try:
-            # Extract features from dataframe
-            features = self._extract_features(df)
+            if features is None:
+                features = FeatureContext(df)
 
-            # Normalize features
-            features_scaled = self.scaler.transform(features.reshape(1, -1))
+            # Extract features from dataframe
+            feature_vector = await self._extract_features_shared(features)
 
-            # Run model inference
-            prediction = self.model.predict(features_scaled)[0]
+            # Normalize and run model inference off the event loop, so other
+            # strategies keep running and the scheduler's timeout can fire
+            prediction = await asyncio.to_thread(self._predict, feature_vector)
 
             # prediction format: [buy_confidence, sell_confidence]
             buy_confidence = float(prediction[0])
@@ -183,7 +196,7 @@ class PPOStrategy:
             latest_close = float(df["close"].iloc[-1])
 
             # Calculate SL/TP based on recent volatility
-            atr = self._calculate_atr(df)
+            atr = await features.atr_sma(14)
 
             if side == "buy":
                 entry_price = latest_close
@@ -209,7 +222,7 @@ class PPOStrategy:
                     "buy_confidence": buy_confidence,
                     "sell_confidence": sell_confidence,
                     "atr": atr,
-                    "features": features.tolist(),
+                    "features": feature_vector.tolist(),
                 },
             )
 
@@ -236,6 +249,12 @@ class PPOStrategy:
             )
             return None
 
+    def _predict(self, feature_vector: np.ndarray) -> Any:
+        """Scale a feature vector and return the model's [buy, sell] output."""
+        assert self.model is not None and self.scaler is not None
+        features_scaled = self.scaler.transform(feature_vector.reshape(1, -1))
+        return self.model.predict(features_scaled)[0]
+
     def _extract_features(self, df: pd.DataFrame) -> np.ndarray:
         """Extract features from OHLC dataframe.
 
@@ -276,6 +295,48 @@ class PPOStrategy:
         # Bollinger Bands position
         bb_position = self._calculate_bb_position(df["close"])
 
+        return self._assemble_features(df, returns, rsi, macd, bb_position)
+
+    async def _extract_features_shared(self, features: FeatureContext) -> np.ndarray:
+        """Extract the same features as _extract_features via a FeatureContext.
+
+        Indicators are taken from (or added to) the per-candle memo so other
+        strategies on the same candle reuse them.
+
+        Args:
+            features: Shared feature context for this candle
+
+        Returns:
+            Feature array
+        """
+        df = features.df
+        returns = df["close"].pct_change().fillna(0.0).iloc[-1]
+        rsi = await features.rsi_sma(14)
+        macd = await features.macd()
+        bb_position = await features.bb_position(20)
+
+        return self._assemble_features(df, returns, rsi, macd, bb_position)
+
+    def _assemble_features(
+        self,
+        df: pd.DataFrame,
+        returns: float,
+        rsi: float,
+        macd: float,
+        bb_position: float,
+    ) -> np.ndarray:
+        """Build the model feature vector from indicator values.
+
+        Args:
+            df: OHLC dataframe
+            returns: Latest close % change
+            rsi: Latest RSI
+            macd: Latest MACD
+            bb_position: Latest Bollinger Band position
+
+        Returns:
+            Feature array
+        """
         # Volume ratio
         volume_ratio = (
             df["volume"].iloc[-1] / df["volume"].rolling(20).mean().iloc[-1]
@@ -309,14 +370,7 @@ class PPOStrategy:
         Returns:
             RSI value (0-100)
         """
-        delta = series.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
+        return float(rsi_sma_last(series, period))
 
     def _calculate_macd(self, series: pd.Series) -> float:
         """Calculate MACD indicator.
@@ -327,11 +381,7 @@ class PPOStrategy:
         Returns:
             MACD value
         """
-        ema_12 = series.ewm(span=12, adjust=False).mean()
-        ema_26 = series.ewm(span=26, adjust=False).mean()
-        macd = ema_12 - ema_26
-
-        return float(macd.iloc[-1]) if not pd.isna(macd.iloc[-1]) else 0.0
+        return float(macd_last(series))
 
     def _calculate_bb_position(self, series: pd.Series, period: int = 20) -> float:
         """Calculate position within Bollinger Bands.
@@ -343,21 +393,7 @@ class PPOStrategy:
         Returns:
             Position (0.0 = lower band, 0.5 = middle, 1.0 = upper band)
         """
-        sma = series.rolling(period).mean()
-        std = series.rolling(period).std()
-
-        upper = sma + (2 * std)
-        lower = sma - (2 * std)
-
-        current = series.iloc[-1]
-        bb_range = upper.iloc[-1] - lower.iloc[-1]
-
-        if bb_range == 0:
-            return 0.5
-
-        position = (current - lower.iloc[-1]) / bb_range
-
-        return float(np.clip(position, 0.0, 1.0))
+        return float(bb_position_last(series, period))
 
     def _calculate_atr(self, df: pd.DataFrame, period: int = 14) -> float:
         """Calculate Average True Range.
@@ -369,11 +405,5 @@ class PPOStrategy:
         Returns:
             ATR value
         """
-        high_low = df["high"] - df["low"]
-        high_close = np.abs(df["high"] - df["close"].shift())
-        low_close = np.abs(df["low"] - df["close"].shift())
-
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(period).mean()
-
-        return float(atr.iloc[-1]) if not pd.isna(atr.iloc[-1]) else 10.0
+        tr = true_range(df["high"], df["low"], df["close"])
+        return float(atr_sma_last(tr, period))
@@ -4,17 +4,19 @@ Routes accepted signals to:
 1. Signals API (PR-021) for storage and approval workflow
 2. Admin Telegram channel (optional) for monitoring
 
-Includes persistent duplicate prevention (Redis-backed), error handling, and telemetry.
+Includes publish-once duplicate prevention keyed by (instrument, timeframe,
+candle_start, strategy), error handling, and telemetry. With a Redis-backed
+DedupeGuard the claim is atomic across workers, so horizontally scaled
+strategy runners never publish the same signal twice.
 
 Example:
     >>> from backend.app.strategy.publisher import SignalPublisher
-    >>> from backend.app.strategy.cache import get_signal_publish_cache
+    >>> from backend.app.strategy.cache import get_dedupe_guard
     >>>
-    >>> # With persistent caching
-    >>> signal_cache = await get_signal_publish_cache()
+    >>> # With distributed duplicate prevention
     >>> publisher = SignalPublisher(
     ...     signals_api_base="http://localhost:8000",
-    ...     signal_publish_cache=signal_cache
+    ...     dedupe=await get_dedupe_guard(),
     ... )
     >>>
     >>> signal_data = {
@@ -39,6 +41,8 @@ from typing import TYPE_CHECKING, Any
 import httpx
 from telegram import Bot
 
+from backend.app.strategy.cache import DedupeGuard
+
 if TYPE_CHECKING:
     from backend.app.strategy.cache import SignalPublishCache
 
@@ -48,7 +52,8 @@ logger = logging.getLogger(__name__)
 class SignalPublisher:
     """Publishes signals to API and notification channels.
 
-    Supports both in-memory (fallback) and Redis-backed (persistent) duplicate prevention.
+    Supports both in-memory (fallback) and Redis-backed (distributed) duplicate
+    prevention.
 
     Attributes:
         signals_api_base: Base URL for Signals API (PR-021)
@@ -56,7 +61,7 @@ class SignalPublisher:
         telegram_admin_chat_id: Chat ID for admin notifications
         _telegram_bot: Telegram bot instance (lazy-loaded)
         _published_signals: In-memory cache for duplicate prevention
-        _signal_publish_cache: Redis cache for persistent duplicate prevention
+        _dedupe: DedupeGuard for cross-process duplicate prevention
     """
 
     def __init__(
@@ -65,6 +70,7 @@ class SignalPublisher:
         telegram_token: str | None = None,
         telegram_admin_chat_id: str | None = None,
         signal_publish_cache: "SignalPublishCache | None" = None,
+        dedupe: DedupeGuard | None = None,
     ):
         """Initialize signal publisher.
 
@@ -72,7 +78,9 @@ class SignalPublisher:
             signals_api_base: Signals API base URL (default: from env)
             telegram_token: Telegram bot token (default: from env)
             telegram_admin_chat_id: Admin chat ID (default: from env)
-            signal_publish_cache: Optional SignalPublishCache for persistent caching
+            signal_publish_cache: Optional SignalPublishCache; its Redis client
+                backs a DedupeGuard when no dedupe guard is given
+            dedupe: Optional DedupeGuard shared with CandleDetector
 
         Example:
             >>> from backend.app.strategy.cache import get_signal_publish_cache
@@ -96,10 +104,13 @@ class SignalPublisher:
         self._telegram_bot: Bot | None = None
         self._published_signals: dict[tuple, datetime] = (
             {}
-        )  # (instrument, candle_start) -> timestamp (in-memory fallback)
+        )  # (instrument, timeframe, candle_start, strategy) -> timestamp (in-memory fallback)
 
-        # Redis cache for persistent duplicate prevention
-        self._signal_publish_cache = signal_publish_cache
+        # Atomic claim-once guard for persistent/distributed duplicate prevention
+        if dedupe is None and signal_publish_cache is not None:
+            dedupe = DedupeGuard(redis_client=signal_publish_cache.redis_client)
+        self._dedupe = dedupe
+        redis_enabled = dedupe is not None and dedupe.redis_client is not None
 
         # Validate configuration
         if not self.signals_api_base:
@@ -111,7 +122,7 @@ class SignalPublisher:
                 extra={
                     "api_base": self.signals_api_base,
                     "telegram_enabled": True,
-                    "redis_cache_enabled": signal_publish_cache is not None,
+                    "redis_cache_enabled": redis_enabled,
                 },
             )
         else:
@@ -119,7 +130,7 @@ class SignalPublisher:
                 "SignalPublisher initialized without Telegram notifications",
                 extra={
                     "api_base": self.signals_api_base,
-                    "redis_cache_enabled": signal_publish_cache is not None,
+                    "redis_cache_enabled": redis_enabled,
                 },
             )
 
@@ -127,6 +138,7 @@ class SignalPublisher:
         self,
         signal_data: dict[str, Any],
         notify_telegram: bool = False,
+        candle_start: datetime | None = None,
     ) -> dict[str, Any]:
         """Publish signal to API and optionally to Telegram.
 
@@ -140,7 +152,9 @@ class SignalPublisher:
                 - strategy: Strategy name (e.g., "ppo_gold")
                 - timestamp: Signal generation timestamp
                 - candle_start: Candle start timestamp (for duplicate prevention)
+                - timeframe: Optional timeframe (e.g., "15m") for the dedupe key
             notify_telegram: Whether to send admin Telegram notification
+            candle_start: Candle start timestamp (overrides signal_data)
 
         Returns:
             Dictionary with publishing results:
@@ -177,19 +191,23 @@ class SignalPublisher:
         if missing_fields:
             raise ValueError(f"Missing required fields: {missing_fields}")
 
-        # Check for duplicates
-        candle_start = signal_data.get("candle_start")
+        # Check for duplicates (claim before publishing: publish-once)
+        candle_start = candle_start or signal_data.get("candle_start")
+        dedupe_key: tuple | None = None
         if candle_start:
-            cache_key = (signal_data["instrument"], candle_start)
-            if cache_key in self._published_signals:
+            dedupe_key = (
+                signal_data["instrument"],
+                signal_data.get("timeframe", "*"),
+                candle_start,
+                signal_data["strategy"],
+            )
+            if not await self._claim(dedupe_key):
                 logger.warning(
                     "Duplicate signal detected, skipping publish",
                     extra={
                         "instrument": signal_data["instrument"],
+                        "strategy": signal_data["strategy"],
                         "candle_start": candle_start.isoformat(),
-                        "previous_publish": self._published_signals[
-                            cache_key
-                        ].isoformat(),
                     },
                 )
                 return {
@@ -224,9 +242,8 @@ class SignalPublisher:
             )
 
             # Mark as published (duplicate prevention)
-            if candle_start:
-                cache_key = (signal_data["instrument"], candle_start)
-                self._published_signals[cache_key] = signal_data["timestamp"]
+            if dedupe_key is not None:
+                self._published_signals[dedupe_key] = signal_data["timestamp"]
 
                 # Cleanup old entries
                 if len(self._published_signals) > 1000:
@@ -243,6 +260,10 @@ class SignalPublisher:
             )
             result["error"] = str(e)
 
+            # Give the claim back so a retry (here or on another worker) can publish
+            if dedupe_key is not None and self._dedupe is not None:
+                await self._dedupe.release(*dedupe_key)
+
         # Optional: Publish to Telegram admin channel
         if notify_telegram and result["api_success"]:
             signal_id = result["signal_id"]
@@ -264,6 +285,22 @@ class SignalPublisher:
 
         return result
 
+    async def _claim(self, dedupe_key: tuple) -> bool:
+        """Claim a (instrument, timeframe, candle_start, strategy) publish slot.
+
+        Args:
+            dedupe_key: Dedupe key tuple
+
+        Returns:
+            True if this call may publish, False if already published
+        """
+        if dedupe_key in self._published_signals:
+            return False
+        if self._dedupe is not None:
+            claimed: bool = await self._dedupe.claim(*dedupe_key)
+            return claimed
+        return True
+
     async def _publish_to_api(self, signal_data: dict[str, Any]) -> dict[str, Any]:
         """Publish signal to Signals API (PR-021).
 
@@ -379,6 +416,8 @@ class SignalPublisher:
         Useful for testing or manual resets.
         """
         self._published_signals.clear()
+        if self._dedupe is not None:
+            self._dedupe.clear_local()
         logger.info("Signal publish cache cleared")
 
 
@@ -35,7 +35,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.auth.models import User, UserRole
 from backend.app.core.db import get_db
 from backend.app.strategy.models import VersionStatus
-from backend.app.strategy.shadow import ShadowExecutor
+from backend.app.strategy.shadow import ShadowExecutor, get_comparison_cache
 from backend.app.strategy.versioning import VersionRegistry
 
 logger = logging.getLogger(__name__)
@@ -487,7 +487,7 @@ async def compare_shadow_vs_active(
         ...     ...
         ... }
     """
-    executor = ShadowExecutor(db)
+    executor = ShadowExecutor(db, comparison_cache=get_comparison_cache())
 
     comparison = await executor.compare_shadow_vs_active(
         shadow_version=request.shadow_version,
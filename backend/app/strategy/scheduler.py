@@ -6,10 +6,13 @@ boundary detection and unified signal publishing.
 
 Flow:
     1. Detect new 15-min candle boundary (PR-072 CandleDetector)
-    2. Prevent duplicate processing within same candle (PR-072)
-    3. Run all enabled strategies
+    2. Prevent duplicate processing within same candle, across workers when
+       a shared DedupeGuard is configured (PR-072)
+    3. Run all enabled strategies concurrently, each under its own timeout,
+       sharing one per-candle FeatureContext (indicators computed once)
     4. Collect SignalCandidate outputs
     5. Publish to Signals API + optional Telegram (PR-072 SignalPublisher)
+       as soon as each strategy finishes
     6. Track telemetry and errors (PR-060)
 
 Integration:
@@ -26,20 +29,57 @@ Example:
     >>> await scheduler.run_strategies(df, "GOLD", datetime.utcnow())
 """
 
+import asyncio
+import inspect
 import logging
-from datetime import datetime
+import time
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from httpx import AsyncClient
 
 from backend.app.observability.metrics import get_metrics
-from backend.app.strategy.candles import CandleDetector
+from backend.app.strategy.cache import DedupeGuard
+from backend.app.strategy.candles import CandleDetector, timeframe_minutes
+from backend.app.strategy.features import (
+    OFFLOAD_MIN_BARS,
+    FeatureContext,
+    get_feature_executor,
+)
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.strategy.publisher import SignalPublisher
 from backend.app.strategy.registry import StrategyRegistry
 
+if TYPE_CHECKING:
+    from backend.app.trading.data.pipeline import ClosedCandleEvent
+
 logger = logging.getLogger(__name__)
 
+# DataPipeline (MT5) timeframe → CandleDetector timeframe
+PIPELINE_TIMEFRAMES = {
+    "M1": "1m",
+    "M5": "5m",
+    "M15": "15m",
+    "M30": "30m",
+    "H1": "1h",
+    "H4": "4h",
+    "D1": "1d",
+}
+
+# Max time one strategy may spend generating signals for a candle
+DEFAULT_STRATEGY_TIMEOUT_SECONDS = 10.0
+
+
+def _accepts_features(strategy: Any) -> bool:
+    """Whether strategy.generate_signal declares a `features` parameter."""
+    try:
+        params = inspect.signature(strategy.generate_signal).parameters
+    except (TypeError, ValueError):
+        return False
+    return "features" in params
+
 
 class StrategyScheduler:
     """Orchestrates execution of multiple trading strategies.
@@ -52,6 +92,8 @@ class StrategyScheduler:
         registry: StrategyRegistry instance
         candle_detector: CandleDetector for boundary detection (PR-072)
         signal_publisher: SignalPublisher for API/Telegram routing (PR-072)
+        strategy_timeout_seconds: Per-strategy generation timeout
+        feature_executor: Executor for CPU-bound feature work (None: inline)
         signals_api_base: Base URL for signals API (deprecated, use signal_publisher)
         http_client: HTTP client for API calls (deprecated, use signal_publisher)
     """
@@ -63,6 +105,9 @@ class StrategyScheduler:
         http_client: AsyncClient | None = None,
         candle_detector: CandleDetector | None = None,
         signal_publisher: SignalPublisher | None = None,
+        strategy_timeout_seconds: float = DEFAULT_STRATEGY_TIMEOUT_SECONDS,
+        feature_executor: Executor | None = None,
+        dedupe: DedupeGuard | None = None,
     ):
         """Initialize strategy scheduler.
 
@@ -72,6 +117,12 @@ class StrategyScheduler:
             http_client: Optional HTTP client for API calls (deprecated)
             candle_detector: CandleDetector instance (default: auto-create from env)
             signal_publisher: SignalPublisher instance (default: auto-create from env)
+            strategy_timeout_seconds: Max generation time per strategy per candle
+            feature_executor: Executor for large feature computations
+                (default: shared process pool from get_feature_executor(),
+                created on the first frame large enough to offload)
+            dedupe: DedupeGuard shared by the default CandleDetector and
+                SignalPublisher (e.g. from get_dedupe_guard() for multi-node runs)
 
         Example:
             >>> from backend.app.strategy.registry import get_registry
@@ -82,11 +133,14 @@ class StrategyScheduler:
         self.http_client = http_client
 
         # PR-072 Integration: Use CandleDetector and SignalPublisher
-        self.candle_detector = candle_detector or CandleDetector()
+        self.candle_detector = candle_detector or CandleDetector(dedupe=dedupe)
         self.signal_publisher = signal_publisher or SignalPublisher(
-            signals_api_base=signals_api_base
+            signals_api_base=signals_api_base, dedupe=dedupe
         )
 
+        self.strategy_timeout_seconds = strategy_timeout_seconds
+        self._feature_executor = feature_executor
+
         # Track metrics
         self.metrics = get_metrics()
 
@@ -99,12 +153,20 @@ class StrategyScheduler:
             },
         )
 
+    @property
+    def feature_executor(self) -> Executor | None:
+        """Executor for offloaded feature work (shared pool created lazily)."""
+        if self._feature_executor is None:
+            self._feature_executor = get_feature_executor()
+        return self._feature_executor
+
     async def run_strategies(
         self,
         df: pd.DataFrame,
         instrument: str,
         timestamp: datetime,
         post_to_api: bool = True,
+        timeframe: str = "15m",
     ) -> dict[str, list[SignalCandidate]]:
         """Run all enabled strategies on new candle data.
 
@@ -113,6 +175,7 @@ class StrategyScheduler:
             instrument: Trading instrument (e.g., "GOLD", "EURUSD")
             timestamp: Candle timestamp (UTC)
             post_to_api: If True, POST signals to API (default: True)
+            timeframe: Candle timeframe the signals are published under
 
         Returns:
             Dict mapping strategy names to list of generated signals
@@ -146,72 +209,144 @@ class StrategyScheduler:
             },
         )
 
-        results: dict[str, list[SignalCandidate]] = {}
+        # One feature context per candle: indicators computed once, shared
+        executor = self.feature_executor if len(df) >= OFFLOAD_MIN_BARS else None
+        features = FeatureContext(df, executor=executor)
+
+        # Strategies run concurrently; each publishes as soon as it finishes
+        outcomes = await asyncio.gather(
+            *(
+                self._run_strategy(
+                    strategy_name,
+                    df,
+                    instrument,
+                    timestamp,
+                    features,
+                    post_to_api,
+                    timeframe,
+                )
+                for strategy_name in enabled_strategies
+            )
+        )
 
-        for strategy_name in enabled_strategies:
-            try:
-                # Get strategy instance
-                strategy = self.registry.get_strategy(strategy_name)
+        logger.debug(
+            "Strategy features shared",
+            extra={
+                "instrument": instrument,
+                "feature_hits": features.hits,
+                "feature_misses": features.misses,
+            },
+        )
 
-                # Track metrics
-                self.metrics.strategy_runs_total.labels(name=strategy_name).inc()
+        return dict(zip(enabled_strategies, outcomes, strict=True))
 
-                # Run strategy
-                start_time = datetime.utcnow()
+    async def _run_strategy(
+        self,
+        strategy_name: str,
+        df: pd.DataFrame,
+        instrument: str,
+        timestamp: datetime,
+        features: FeatureContext,
+        post_to_api: bool,
+        timeframe: str,
+    ) -> list[SignalCandidate]:
+        """Run one strategy under its timeout and publish its signals.
 
-                signal = await strategy.generate_signal(df, instrument, timestamp)
+        Failures and timeouts are isolated: they yield no signals for this
+        strategy and never delay or cancel the others.
 
-                elapsed = (datetime.utcnow() - start_time).total_seconds()
+        Args:
+            strategy_name: Registered strategy name
+            df: OHLC dataframe
+            instrument: Trading instrument
+            timestamp: Candle timestamp (UTC)
+            features: Shared per-candle feature context
+            post_to_api: If True, publish generated signals
+            timeframe: Candle timeframe the signals are published under
 
-                # Collect results
-                if signal is None:
-                    logger.debug(
-                        f"Strategy {strategy_name} returned no signal",
-                        extra={"strategy": strategy_name, "instrument": instrument},
-                    )
-                    results[strategy_name] = []
-                    continue
+        Returns:
+            Signals generated by the strategy (empty on none/failure/timeout)
+        """
+        try:
+            # Get strategy instance
+            strategy = self.registry.get_strategy(strategy_name)
 
-                # Handle single signal or list of signals
-                signals = [signal] if not isinstance(signal, list) else signal
+            # Track metrics
+            self.metrics.strategy_runs_total.labels(name=strategy_name).inc()
 
-                results[strategy_name] = signals
+            # Run strategy
+            start_time = time.perf_counter()
 
-                logger.info(
-                    f"Strategy {strategy_name} generated {len(signals)} signal(s)",
+            kwargs = {"features": features} if _accepts_features(strategy) else {}
+            try:
+                signal = await asyncio.wait_for(
+                    strategy.generate_signal(df, instrument, timestamp, **kwargs),
+                    timeout=self.strategy_timeout_seconds,
+                )
+            except TimeoutError:
+                self.metrics.strategy_timeouts_total.labels(name=strategy_name).inc()
+                logger.warning(
+                    f"Strategy {strategy_name} timed out after "
+                    f"{self.strategy_timeout_seconds}s",
                     extra={
                         "strategy": strategy_name,
-                        "signal_count": len(signals),
                         "instrument": instrument,
-                        "elapsed_seconds": elapsed,
+                        "timeout_seconds": self.strategy_timeout_seconds,
                     },
                 )
+                return []
+
+            elapsed = time.perf_counter() - start_time
+            self.metrics.strategy_run_seconds.labels(name=strategy_name).observe(
+                elapsed
+            )
 
-                # Track emit metrics
-                self.metrics.strategy_emit_total.labels(name=strategy_name).inc(
-                    len(signals)
+            # Collect results
+            if signal is None:
+                logger.debug(
+                    f"Strategy {strategy_name} returned no signal",
+                    extra={"strategy": strategy_name, "instrument": instrument},
                 )
+                return []
 
-                # POST signals to API (PR-072 integration)
-                if post_to_api and signals:
-                    await self._publish_signals(
-                        signals, strategy_name, instrument, timestamp
-                    )
+            # Handle single signal or list of signals
+            signals = [signal] if not isinstance(signal, list) else signal
 
-            except Exception as e:
-                logger.error(
-                    f"Strategy {strategy_name} failed",
-                    exc_info=True,
-                    extra={
-                        "strategy": strategy_name,
-                        "instrument": instrument,
-                        "error": str(e),
-                    },
+            logger.info(
+                f"Strategy {strategy_name} generated {len(signals)} signal(s)",
+                extra={
+                    "strategy": strategy_name,
+                    "signal_count": len(signals),
+                    "instrument": instrument,
+                    "elapsed_seconds": elapsed,
+                },
+            )
+
+            # Track emit metrics
+            self.metrics.strategy_emit_total.labels(name=strategy_name).inc(
+                len(signals)
+            )
+
+            # POST signals to API (PR-072 integration)
+            if post_to_api and signals:
+                await self._publish_signals(
+                    signals, strategy_name, instrument, timestamp, timeframe
                 )
-                results[strategy_name] = []
-                # Continue with other strategies instead of failing completely
 
-        return results
+            return signals
+
+        except Exception as e:
+            logger.error(
+                f"Strategy {strategy_name} failed",
+                exc_info=True,
+                extra={
+                    "strategy": strategy_name,
+                    "instrument": instrument,
+                    "error": str(e),
+                },
+            )
+            # Continue with other strategies instead of failing completely
+            return []
 
     async def _publish_signals(
         self,
@@ -219,6 +354,7 @@ class StrategyScheduler:
         strategy_name: str,
         instrument: str,
         timestamp: datetime,
+        timeframe: str,
     ) -> None:
         """Publish signals via SignalPublisher (PR-072).
 
@@ -230,6 +366,7 @@ class StrategyScheduler:
             strategy_name: Name of strategy that generated signals
             instrument: Trading instrument
             timestamp: Candle timestamp for duplicate prevention
+            timeframe: Timeframe of the candle the signals came from
 
         Example:
             >>> signal = SignalCandidate(
@@ -242,10 +379,12 @@ class StrategyScheduler:
             ...     timestamp=datetime.utcnow(),
             ...     reason="rsi_oversold"
             ... )
-            >>> await scheduler._publish_signals([signal], "fib_rsi", "GOLD", datetime.utcnow())
+            >>> await scheduler._publish_signals(
+            ...     [signal], "fib_rsi", "GOLD", datetime.utcnow(), "1h"
+            ... )
         """
         # Get candle start for duplicate prevention
-        candle_start = self.candle_detector.get_candle_start(timestamp, "15m")
+        candle_start = self.candle_detector.get_candle_start(timestamp, timeframe)
 
         for signal in signals:
             try:
@@ -258,6 +397,7 @@ class StrategyScheduler:
                     "take_profit": signal.take_profit,
                     "strategy": strategy_name,
                     "timestamp": signal.timestamp,
+                    "timeframe": timeframe,
                     "confidence": signal.confidence,
                     "reason": signal.reason,
                     "payload": signal.payload,
@@ -315,6 +455,8 @@ class StrategyScheduler:
 
         Uses CandleDetector for precise boundary detection and duplicate prevention.
         Checks if timestamp is at a candle boundary (e.g., :00, :15, :30, :45 for 15m).
+        If the run raises (or is cancelled) the candle claim is released, so
+        the candle can be retried rather than skipped for the dedupe TTL.
 
         Args:
             df: OHLC dataframe
@@ -340,7 +482,7 @@ class StrategyScheduler:
             >>> # signals will be None (not a new candle)
         """
         # PR-072: Use CandleDetector for boundary detection and duplicate prevention
-        if not self.candle_detector.should_process_candle(
+        if not await self.candle_detector.should_process_candle_async(
             instrument, timeframe, timestamp
         ):
             logger.debug(
@@ -362,7 +504,44 @@ class StrategyScheduler:
             },
         )
 
-        return await self.run_strategies(df, instrument, timestamp)
+        try:
+            return await self.run_strategies(
+                df, instrument, timestamp, timeframe=timeframe
+            )
+        except BaseException:
+            # Failed or cancelled run: free the candle for a retry instead of
+            # leaving it claimed for the dedupe TTL
+            await self.candle_detector.release_candle(instrument, timeframe, timestamp)
+            raise
+
+    async def on_closed_candle(
+        self, event: "ClosedCandleEvent"
+    ) -> dict[str, list[SignalCandidate]] | None:
+        """DataPipeline subscriber: run strategies on a newly closed candle.
+
+        The candle's open time plus one bar is the next candle's boundary, so
+        it passes CandleDetector's boundary check and duplicate prevention.
+
+        Args:
+            event: ClosedCandleEvent from DataPipeline
+
+        Returns:
+            Dict of signals if strategies ran, None otherwise
+
+        Example:
+            >>> pipeline.subscribe(scheduler.on_closed_candle)
+        """
+        timeframe = PIPELINE_TIMEFRAMES.get(event.timeframe, event.timeframe)
+        candle = event.candle
+        boundary = candle["time_open"] + timedelta(minutes=timeframe_minutes(timeframe))
+
+        df = pd.DataFrame(event.bars or [candle])
+        if "time_open" in df.columns:
+            df = df.set_index("time_open")
+
+        return await self.run_on_new_candle(
+            df, event.symbol, boundary, timeframe=timeframe
+        )
 
     def _is_new_candle(
         self, timestamp: datetime, timeframe: str, window_seconds: int
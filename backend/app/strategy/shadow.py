@@ -46,15 +46,24 @@ Example:
     ... )
     >>> print(f"Shadow signals: {comparison['shadow_signal_count']}")
     >>> print(f"Active signals: {comparison['active_signal_count']}")
+
+Performance:
+    compare_shadow_vs_active() never loads ORM rows. It reads only
+    (timestamp, decision, side) columns, pairs each shadow candle with the
+    active decision logged for it using a vectorized as-of merge, and
+    aggregates per time bucket. Buckets are kept in a ComparisonCache, so
+    repeated comparisons only re-read the partial first bucket and the
+    buckets written since the last refresh.
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
 import pandas as pd
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
@@ -89,6 +98,104 @@ except ImportError:
         pass
 
 
+# Default comparison bucket (pandas offset alias: "1h", "1D", ...)
+DEFAULT_COMPARISON_BUCKET = "1D"
+
+# Shadow decisions are stamped with the candle time, active decisions with
+# the time they were logged; an active decision logged within this long
+# after a shadow candle is paired with it (one 15m bar by default)
+DEFAULT_PAIR_TOLERANCE = timedelta(minutes=15)
+
+# Per-bucket aggregate columns kept by ComparisonCache
+BUCKET_COLUMNS = [
+    "shadow_decisions",
+    "shadow_buy",
+    "shadow_sell",
+    "shadow_hold",
+    "active_decisions",
+    "active_buy",
+    "active_sell",
+    "active_hold",
+    "paired",
+    "agreements",
+    "side_mismatches",
+]
+
+
+@dataclass
+class _ComparisonState:
+    """Cached per-bucket aggregates for one comparison key."""
+
+    built_at: datetime
+    refreshed_at: datetime
+    buckets: pd.DataFrame
+
+
+class ComparisonCache:
+    """Per-bucket shadow-vs-active aggregates, refreshed incrementally.
+
+    Keyed by (strategy, version, symbol, days, bucket, pair tolerance). A
+    refresh re-reads only the bucket cut by the window start and the buckets
+    since the last refresh; every full_refresh_seconds the key is rebuilt
+    from scratch so back-dated or deleted rows are eventually picked up.
+    """
+
+    def __init__(self, full_refresh_seconds: float = 300.0):
+        """Initialize cache.
+
+        Args:
+            full_refresh_seconds: Max age before a key is fully recomputed
+        """
+        self.full_refresh_seconds = full_refresh_seconds
+        self._states: dict[tuple[Any, ...], _ComparisonState] = {}
+
+    def get(self, key: tuple[Any, ...], now: datetime) -> _ComparisonState | None:
+        """Cached state for key, or None if missing or due a full rebuild."""
+        state = self._states.get(key)
+        if state is None:
+            return None
+        if (now - state.built_at).total_seconds() > self.full_refresh_seconds:
+            del self._states[key]
+            return None
+        return state
+
+    def put(self, key: tuple[Any, ...], state: _ComparisonState) -> None:
+        """Store state for key."""
+        self._states[key] = state
+
+    def invalidate(self, strategy_name: str | None = None) -> None:
+        """Drop cached comparisons for one strategy (or all)."""
+        if strategy_name is None:
+            self._states.clear()
+            return
+        for key in [k for k in self._states if k[0] == strategy_name]:
+            del self._states[key]
+
+
+# Process-wide comparison cache (shared by API requests)
+_comparison_cache: ComparisonCache | None = None
+
+
+def get_comparison_cache() -> ComparisonCache:
+    """Get the process-wide shadow comparison cache.
+
+    Returns:
+        ComparisonCache instance
+    """
+    global _comparison_cache
+    if _comparison_cache is None:
+        _comparison_cache = ComparisonCache()
+    return _comparison_cache
+
+
+def _utc_naive(values: pd.Series) -> pd.Series:
+    """Timestamps as naive UTC (both logs store UTC, not always tz-aware)."""
+    stamps = pd.to_datetime(values)
+    if stamps.dt.tz is not None:
+        stamps = stamps.dt.tz_convert("UTC").dt.tz_localize(None)
+    return stamps.astype("datetime64[ns]")
+
+
 class ShadowExecutor:
     """Executes strategies in shadow mode (log-only, no production impact).
 
@@ -103,15 +210,22 @@ class ShadowExecutor:
 
     Attributes:
         session: SQLAlchemy async session for logging shadow decisions
+        comparison_cache: Per-bucket comparison aggregates
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        comparison_cache: ComparisonCache | None = None,
+    ):
         """Initialize shadow executor with database session.
 
         Args:
             session: SQLAlchemy async session
+            comparison_cache: Shared comparison cache (default: private cache)
         """
         self.session = session
+        self.comparison_cache = comparison_cache or ComparisonCache()
 
     async def execute_shadow(
         self,
@@ -352,16 +466,25 @@ class ShadowExecutor:
         strategy_name: str,
         symbol: str,
         days: int = 7,
+        bucket: str = DEFAULT_COMPARISON_BUCKET,
+        pair_tolerance: timedelta = DEFAULT_PAIR_TOLERANCE,
     ) -> dict[str, Any]:
         """Compare shadow version decisions vs active version outcomes.
 
         Analyzes decision patterns over time window to validate shadow version.
+        Each shadow decision (stamped with its candle time) is paired with the
+        last active decision logged within pair_tolerance after it, to measure
+        agreement; active ENTERED decisions count as their logged side,
+        SKIPPED/REJECTED as hold.
 
         Args:
             shadow_version: Shadow version string (vNext, v2.0.0)
             strategy_name: Strategy name (fib_rsi, ppo_gold)
             symbol: Trading symbol (GOLD, XAUUSD)
             days: Number of days to compare (default: 7)
+            bucket: Time bucket for the per-bucket breakdown (pandas alias)
+            pair_tolerance: How long after a shadow candle an active decision
+                still belongs to it (use the strategy's timeframe)
 
         Returns:
             dict: Comparison metrics including:
@@ -375,6 +498,10 @@ class ShadowExecutor:
                 - active_hold_count: Active hold decisions
                 - divergence_rate: % of time decisions differ
                 - comparison_period_days: Time window
+                - paired_decisions: Candles with both a shadow and active decision
+                - agreement_rate: % of paired candles with the same decision
+                - side_mismatch_count: Paired candles with opposite sides
+                - buckets: Per-bucket breakdown of the above
 
         Example:
             >>> comparison = await executor.compare_shadow_vs_active(
@@ -387,51 +514,30 @@ class ShadowExecutor:
             >>> print(f"Active signals: {comparison['active_signal_count']}")
             >>> print(f"Divergence: {comparison['divergence_rate']:.1f}%")
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-
-        # Get shadow decisions
-        shadow_decisions = await self.get_shadow_decisions(
-            version=shadow_version,
-            strategy_name=strategy_name,
-            symbol=symbol,
-            start_date=start_date,
-        )
-
-        # Get active decisions
-        active_decisions = await self.get_active_decisions(
-            strategy_name=strategy_name, symbol=symbol, start_date=start_date
-        )
-
-        # Count decision types
-        shadow_buys = sum(1 for d in shadow_decisions if d.decision == "buy")
-        shadow_sells = sum(1 for d in shadow_decisions if d.decision == "sell")
-        shadow_holds = sum(1 for d in shadow_decisions if d.decision == "hold")
-
-        # Active decisions: count ENTERED outcomes (actual trades)
-        active_buys = sum(
-            1
-            for d in active_decisions
-            if d.outcome == DecisionOutcome.ENTERED
-            and d.features.get("side", "buy") == "buy"
-        )
-        active_sells = sum(
-            1
-            for d in active_decisions
-            if d.outcome == DecisionOutcome.ENTERED
-            and d.features.get("side", "sell") == "sell"
-        )
-        active_holds = sum(
-            1
-            for d in active_decisions
-            if d.outcome in (DecisionOutcome.SKIPPED, DecisionOutcome.REJECTED)
+        now = datetime.utcnow()
+        start_date = now - timedelta(days=days)
+        buckets = await self._comparison_buckets(
+            shadow_version,
+            strategy_name,
+            symbol,
+            days,
+            bucket,
+            pair_tolerance,
+            start_date,
+            now,
         )
+        totals = buckets.sum()
 
+        shadow_buys = int(totals["shadow_buy"])
+        shadow_sells = int(totals["shadow_sell"])
+        active_buys = int(totals["active_buy"])
+        active_sells = int(totals["active_sell"])
         shadow_signal_count = shadow_buys + shadow_sells
         active_signal_count = active_buys + active_sells
 
         # Calculate divergence rate (simplified: just count difference)
-        total_shadow_decisions = len(shadow_decisions)
-        total_active_decisions = len(active_decisions)
+        total_shadow_decisions = int(totals["shadow_decisions"])
+        total_active_decisions = int(totals["active_decisions"])
         divergence_count = abs(shadow_signal_count - active_signal_count)
         divergence_rate = (
             (divergence_count / max(total_shadow_decisions, 1)) * 100
@@ -439,28 +545,35 @@ class ShadowExecutor:
             else 0.0
         )
 
+        paired = int(totals["paired"])
+        agreements = int(totals["agreements"])
+
         comparison = {
             "shadow_version": shadow_version,
             "strategy_name": strategy_name,
             "symbol": symbol,
             "comparison_period_days": days,
             "start_date": start_date.isoformat(),
-            "end_date": datetime.utcnow().isoformat(),
+            "end_date": now.isoformat(),
             # Shadow metrics
             "shadow_signal_count": shadow_signal_count,
             "shadow_buy_count": shadow_buys,
             "shadow_sell_count": shadow_sells,
-            "shadow_hold_count": shadow_holds,
+            "shadow_hold_count": int(totals["shadow_hold"]),
             "total_shadow_decisions": total_shadow_decisions,
             # Active metrics
             "active_signal_count": active_signal_count,
             "active_buy_count": active_buys,
             "active_sell_count": active_sells,
-            "active_hold_count": active_holds,
+            "active_hold_count": int(totals["active_hold"]),
             "total_active_decisions": total_active_decisions,
             # Comparison
             "divergence_rate": divergence_rate,
             "divergence_count": divergence_count,
+            "paired_decisions": paired,
+            "agreement_count": agreements,
+            "agreement_rate": (agreements / paired) * 100 if paired else 0.0,
+            "side_mismatch_count": int(totals["side_mismatches"]),
         }
 
         logger.info(
@@ -468,8 +581,235 @@ class ShadowExecutor:
             extra=comparison,
         )
 
+        comparison["buckets"] = [
+            {
+                "bucket_start": ts.isoformat(),
+                "shadow_decisions": int(row.shadow_decisions),
+                "active_decisions": int(row.active_decisions),
+                "paired_decisions": int(row.paired),
+                "agreement_count": int(row.agreements),
+                "side_mismatch_count": int(row.side_mismatches),
+            }
+            for ts, row in zip(buckets.index, buckets.itertuples(), strict=True)
+        ]
+
         return comparison
 
+    async def _comparison_buckets(
+        self,
+        shadow_version: str,
+        strategy_name: str,
+        symbol: str,
+        days: int,
+        bucket: str,
+        pair_tolerance: timedelta,
+        start_date: datetime,
+        now: datetime,
+    ) -> pd.DataFrame:
+        """Per-bucket aggregates for the window, refreshed from the cache.
+
+        The bucket cut by start_date is always recomputed for exactly
+        [start_date, next bucket boundary). Cached full buckets older than
+        the last refresh are reused; newer buckets are re-read.
+        """
+        key = (strategy_name, shadow_version, symbol, days, bucket, pair_tolerance)
+        first_full = pd.Timestamp(start_date).ceil(bucket).to_pydatetime()
+        state = self.comparison_cache.get(key, now)
+
+        if state is None:
+            frame = await self._aggregate_buckets(
+                shadow_version,
+                strategy_name,
+                symbol,
+                bucket,
+                pair_tolerance,
+                start_date,
+                None,
+            )
+            self.comparison_cache.put(
+                key, _ComparisonState(built_at=now, refreshed_at=now, buckets=frame)
+            )
+            return frame
+
+        refresh_from = max(
+            pd.Timestamp(state.refreshed_at).floor(bucket).to_pydatetime(),
+            first_full,
+        )
+        parts = []
+        if first_full > start_date:
+            parts.append(
+                await self._aggregate_buckets(
+                    shadow_version,
+                    strategy_name,
+                    symbol,
+                    bucket,
+                    pair_tolerance,
+                    start_date,
+                    first_full,
+                )
+            )
+        cached = state.buckets
+        parts.append(
+            cached[(cached.index >= first_full) & (cached.index < refresh_from)]
+        )
+        parts.append(
+            await self._aggregate_buckets(
+                shadow_version,
+                strategy_name,
+                symbol,
+                bucket,
+                pair_tolerance,
+                refresh_from,
+                None,
+            )
+        )
+
+        frame = pd.concat(parts).sort_index()
+        state.buckets = frame
+        state.refreshed_at = now
+        return frame
+
+    async def _aggregate_buckets(
+        self,
+        shadow_version: str,
+        strategy_name: str,
+        symbol: str,
+        bucket: str,
+        pair_tolerance: timedelta,
+        start: datetime,
+        end: datetime | None,
+    ) -> pd.DataFrame:
+        """Aggregate decisions with start <= timestamp < end into buckets.
+
+        Reads only the columns needed, pairs each shadow candle with the last
+        active decision logged within pair_tolerance after it (an as-of
+        merge), and sums indicator columns per bucket. Pairs are bucketed by
+        the shadow candle time, so active decisions up to pair_tolerance past
+        end are read for pairing only.
+
+        Returns:
+            DataFrame indexed by bucket start with BUCKET_COLUMNS
+        """
+        shadow_query = select(
+            ShadowDecisionLog.timestamp,
+            ShadowDecisionLog.decision,
+        ).where(
+            ShadowDecisionLog.version == shadow_version,
+            ShadowDecisionLog.strategy_name == strategy_name,
+            ShadowDecisionLog.symbol == symbol,
+            ShadowDecisionLog.timestamp >= start,
+        )
+        active_query = select(
+            DecisionLog.timestamp,
+            DecisionLog.outcome,
+            self._json_field(DecisionLog.features, "side"),
+        ).where(
+            DecisionLog.strategy == strategy_name,
+            DecisionLog.symbol == symbol,
+            DecisionLog.timestamp >= start,
+        )
+        if end is not None:
+            shadow_query = shadow_query.where(ShadowDecisionLog.timestamp < end)
+            active_query = active_query.where(
+                DecisionLog.timestamp < end + pair_tolerance
+            )
+
+        shadow = pd.DataFrame(
+            (await self.session.execute(shadow_query)).all(),
+            columns=["timestamp", "decision"],
+        )
+        active = pd.DataFrame(
+            (await self.session.execute(active_query)).all(),
+            columns=["timestamp", "outcome", "side"],
+        )
+
+        # Shadow side
+        shadow["timestamp"] = _utc_naive(shadow["timestamp"])
+        shadow["shadow_decisions"] = 1
+        shadow["shadow_buy"] = shadow["decision"] == "buy"
+        shadow["shadow_sell"] = shadow["decision"] == "sell"
+        shadow["shadow_hold"] = shadow["decision"] == "hold"
+
+        # Active side: ENTERED without a logged side counts as buy and sell
+        active["timestamp"] = _utc_naive(active["timestamp"])
+        entered = active["outcome"] == DecisionOutcome.ENTERED
+        no_side = active["side"].isna()
+        active["active_decisions"] = 1
+        active["active_buy"] = entered & (no_side | (active["side"] == "buy"))
+        active["active_sell"] = entered & (no_side | (active["side"] == "sell"))
+        active["active_hold"] = active["outcome"].isin(
+            [DecisionOutcome.SKIPPED, DecisionOutcome.REJECTED]
+        )
+        active["action"] = None
+        active.loc[entered, "action"] = active.loc[entered, "side"].fillna("buy")
+        active.loc[active["active_hold"], "action"] = "hold"
+
+        # Pair each active action with the latest shadow candle at or before
+        # it (within tolerance); keep one pair per candle, the last logged
+        candles = (
+            shadow[["timestamp", "decision"]]
+            .drop_duplicates("timestamp", keep="last")
+            .sort_values("timestamp")
+        )
+        actions = (
+            active.loc[active["action"].notna(), ["timestamp", "action"]]
+            .rename(columns={"timestamp": "logged_at"})
+            .sort_values("logged_at")
+        )
+        paired = pd.merge_asof(
+            actions,
+            candles,
+            left_on="logged_at",
+            right_on="timestamp",
+            direction="backward",
+            tolerance=pd.Timedelta(pair_tolerance),
+        )
+        paired = paired.dropna(subset=["timestamp"]).drop_duplicates(
+            "timestamp", keep="last"
+        )
+        sides = ("buy", "sell")
+        paired["paired"] = 1
+        paired["agreements"] = paired["decision"] == paired["action"]
+        paired["side_mismatches"] = (
+            paired["decision"].isin(sides)
+            & paired["action"].isin(sides)
+            & (paired["decision"] != paired["action"])
+        )
+
+        def per_bucket(frame: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+            if frame.empty:
+                return pd.DataFrame(columns=columns, dtype=float)
+            return (
+                frame.assign(bucket=frame["timestamp"].dt.floor(bucket))
+                .groupby("bucket")[columns]
+                .sum()
+            )
+
+        if end is not None:
+            active = active[active["timestamp"] < end]
+
+        result = pd.concat(
+            [
+                per_bucket(shadow, [c for c in BUCKET_COLUMNS if c in shadow]),
+                per_bucket(active, [c for c in BUCKET_COLUMNS if c in active]),
+                per_bucket(paired, ["paired", "agreements", "side_mismatches"]),
+            ],
+            axis=1,
+        )
+        result = result.reindex(columns=BUCKET_COLUMNS).fillna(0).astype(float)
+        result.index = pd.DatetimeIndex(result.index, name="bucket")
+        return result.sort_index()
+
+    def _json_field(self, column: Any, key: str) -> Any:
+        """SQL expression extracting one top-level key from a JSON column."""
+        if self.session.get_bind().dialect.name == "postgresql":
+            return column.op("->>")(literal(key))
+        # Blobs holding NaN are stored as non-standard JSON on SQLite
+        return case(
+            (func.json_valid(column), func.json_extract(column, literal(f"$.{key}"))),
+            else_=None,
+        )
+
     async def validate_shadow_isolation(self, shadow_log_id: str) -> dict[str, Any]:
         """Validate that shadow decision had no production side effects.
 
@@ -33,21 +33,239 @@ Example usage:
     ...         strategy_name="fib_rsi"
     ...     )
     ...     print(f"User gets version: {user_version.version}")
+
+Routing is served from an in-memory VersionRoutingTable shared by every
+registry in the process: each strategy's active version, canary version and
+rollout percent are loaded once, and every lifecycle change drops the entry
+locally and publishes the strategy name on ROUTING_CHANNEL so that other
+processes (which called VersionRoutingTable.start()) drop theirs too.
+Entries also expire after ttl_seconds in case a message is missed.
 """
 
+import asyncio
+import functools
 import hashlib
 import logging
+import os
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import and_, select
+import redis.asyncio as aioredis
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.strategy.models import CanaryConfig, StrategyVersion, VersionStatus
 
 logger = logging.getLogger(__name__)
 
+# Pub/sub channel carrying the names of strategies whose routing changed
+ROUTING_CHANNEL = "strategy:versions:routing"
+
+# Safety net for missed invalidations
+DEFAULT_ROUTING_TTL_SECONDS = 60.0
+
+# Seconds between reconnect attempts of the invalidation listener
+LISTENER_RETRY_SECONDS = 5.0
+
+
+@functools.lru_cache(maxsize=65536)
+def user_bucket(user_id: str) -> int:
+    """Canary bucket (0-99) of a user; deterministic, cached per user."""
+    return int(hashlib.sha256(user_id.encode()).hexdigest(), 16) % 100
+
+
+def _snapshot(version: StrategyVersion) -> StrategyVersion:
+    """Transient copy of a version (not attached to any session)."""
+    return StrategyVersion(
+        **{
+            column.key: getattr(version, column.key)
+            for column in StrategyVersion.__table__.columns
+        }
+    )
+
+
+@dataclass(frozen=True)
+class StrategyRoute:
+    """Routing state of one strategy.
+
+    Attributes:
+        active: Active version, or None
+        canary: Canary version, or None when no canary is running
+        rollout_percent: Share of users routed to the canary (0.0-100.0)
+        loaded_at: Monotonic load time
+    """
+
+    active: StrategyVersion | None
+    canary: StrategyVersion | None
+    rollout_percent: float
+    loaded_at: float
+
+    def route(self, user_id: str) -> StrategyVersion | None:
+        """Version for a user (None when the strategy has no active version)."""
+        if self.canary is not None and self.rollout_percent > 0:
+            if user_bucket(user_id) < self.rollout_percent:
+                return self.canary
+        return self.active
+
+
+class VersionRoutingTable:
+    """Process-wide cache of per-strategy routing state.
+
+    Cached versions are transient snapshots shared between callers and must
+    not be modified; load a version through a session to change it.
+
+    Attributes:
+        redis_client: Redis client for invalidation pub/sub (None: local only)
+        ttl_seconds: Maximum age of a cached route
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis | None = None,
+        ttl_seconds: float = DEFAULT_ROUTING_TTL_SECONDS,
+    ):
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self._routes: dict[str, StrategyRoute] = {}
+        # Bumped on every invalidation so that a load racing with one is
+        # not cached
+        self._generations: dict[str, int] = {}
+        self._listener: asyncio.Task[None] | None = None
+
+    async def get(self, session: AsyncSession, strategy_name: str) -> StrategyRoute:
+        """Routing state of a strategy, loaded on first use."""
+        route = self._routes.get(strategy_name)
+        if route is not None and time.monotonic() - route.loaded_at < self.ttl_seconds:
+            return route
+
+        generation = self._generations.get(strategy_name, 0)
+        route = await self._load(session, strategy_name)
+        if self._generations.get(strategy_name, 0) == generation:
+            self._routes[strategy_name] = route
+        return route
+
+    async def _load(self, session: AsyncSession, strategy_name: str) -> StrategyRoute:
+        canary_config = await session.scalar(
+            select(CanaryConfig).where(CanaryConfig.strategy_name == strategy_name)
+        )
+        conditions = [StrategyVersion.status == VersionStatus.ACTIVE]
+        if canary_config is not None:
+            conditions.append(StrategyVersion.version == canary_config.version)
+
+        result = await session.execute(
+            select(StrategyVersion).where(
+                StrategyVersion.strategy_name == strategy_name, or_(*conditions)
+            )
+        )
+        active = canary = None
+        for version in result.scalars():
+            if canary_config is not None and version.version == canary_config.version:
+                canary = _snapshot(version)
+            if version.status == VersionStatus.ACTIVE:
+                active = _snapshot(version)
+
+        return StrategyRoute(
+            active=active,
+            canary=canary,
+            rollout_percent=canary_config.rollout_percent if canary_config else 0.0,
+            loaded_at=time.monotonic(),
+        )
+
+    def discard(self, strategy_name: str) -> None:
+        """Drop a strategy's cached route in this process only."""
+        self._generations[strategy_name] = self._generations.get(strategy_name, 0) + 1
+        self._routes.pop(strategy_name, None)
+
+    def clear(self) -> None:
+        """Drop every cached route in this process."""
+        for strategy_name in list(self._generations):
+            self.discard(strategy_name)
+        self._routes.clear()
+
+    async def invalidate(self, strategy_name: str) -> None:
+        """Drop a strategy's route here and in every listening process."""
+        self.discard(strategy_name)
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.publish(ROUTING_CHANNEL, strategy_name)
+        except Exception as e:
+            logger.warning(
+                f"Failed to publish routing invalidation for {strategy_name}: {e}",
+                extra={"strategy_name": strategy_name},
+            )
+
+    def start(self) -> None:
+        """Start listening for invalidations from other processes (idempotent)."""
+        if self.redis_client is not None and (
+            self._listener is None or self._listener.done()
+        ):
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        assert self.redis_client is not None
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(ROUTING_CHANNEL)
+                # Anything cached before subscribing may have missed a message
+                self.clear()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    strategy_name = message["data"]
+                    if isinstance(strategy_name, bytes):
+                        strategy_name = strategy_name.decode()
+                    self.discard(strategy_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Routing invalidation listener failed: {e}")
+                await asyncio.sleep(LISTENER_RETRY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+
+_routing_table: VersionRoutingTable | None = None
+
+
+def get_version_routing() -> VersionRoutingTable:
+    """Get the process-wide routing table.
+
+    Invalidations are published over Redis when it is enabled; the cache
+    TTL is VERSION_ROUTING_TTL_SECONDS.
+    """
+    global _routing_table
+    if _routing_table is None:
+        from backend.app.core.settings import get_settings
+
+        settings = get_settings()
+        redis_client = None
+        if settings.redis.enabled:
+            redis_client = aioredis.from_url(settings.redis.url, decode_responses=True)
+        _routing_table = VersionRoutingTable(
+            redis_client,
+            ttl_seconds=float(
+                os.getenv(
+                    "VERSION_ROUTING_TTL_SECONDS", str(DEFAULT_ROUTING_TTL_SECONDS)
+                )
+            ),
+        )
+    return _routing_table
+
 
 class VersionRegistry:
     """Manages strategy version registration, lifecycle, and user routing.
@@ -60,15 +278,20 @@ class VersionRegistry:
 
     Attributes:
         session: SQLAlchemy async session for database operations
+        routing: Routing table used by route_user_to_version
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self, session: AsyncSession, routing: VersionRoutingTable | None = None
+    ):
         """Initialize version registry with database session.
 
         Args:
             session: SQLAlchemy async session
+            routing: Routing table (default: get_version_routing())
         """
         self.session = session
+        self.routing = routing or get_version_routing()
 
     async def register_version(
         self,
@@ -146,6 +369,8 @@ class VersionRegistry:
         self.session.add(new_version)
         await self.session.commit()
         await self.session.refresh(new_version)
+        if status in (VersionStatus.ACTIVE, VersionStatus.CANARY):
+            await self.routing.invalidate(strategy_name)
 
         logger.info(
             f"Registered version {version} for {strategy_name}",
@@ -297,6 +522,7 @@ class VersionRegistry:
 
         await self.session.commit()
         await self.session.refresh(new_active)
+        await self.routing.invalidate(strategy_name)
 
         logger.info(
             f"Activated version {version} for {strategy_name}",
@@ -382,6 +608,7 @@ class VersionRegistry:
         await self.session.commit()
         await self.session.refresh(canary_version)
         await self.session.refresh(canary_config)
+        await self.routing.invalidate(strategy_name)
 
         logger.info(
             f"Started canary for {strategy_name} {version} at {rollout_percent:.1f}%",
@@ -430,6 +657,7 @@ class VersionRegistry:
 
         await self.session.commit()
         await self.session.refresh(canary)
+        await self.routing.invalidate(strategy_name)
 
         logger.info(
             f"Updated canary rollout for {strategy_name} to {rollout_percent:.1f}%",
@@ -485,6 +713,7 @@ class VersionRegistry:
 
         await self.session.commit()
         await self.session.refresh(ver)
+        await self.routing.invalidate(strategy_name)
 
         logger.info(
             f"Retired version {version} for {strategy_name}",
@@ -509,14 +738,17 @@ class VersionRegistry:
         4. Else: return active version
 
         User assignment is deterministic (same user always gets same version)
-        to ensure consistent experience during rollout.
+        to ensure consistent experience during rollout. The strategy's routing
+        state comes from the routing table, so a fan-out over many users
+        queries the database at most once per strategy.
 
         Args:
             user_id: User ID (UUID string)
             strategy_name: Strategy name
 
         Returns:
-            StrategyVersion: Version to use for this user
+            StrategyVersion: Version to use for this user (a shared, transient
+                snapshot; do not modify)
 
         Raises:
             ValueError: If no active version exists
@@ -529,50 +761,24 @@ class VersionRegistry:
             ... )
             >>> print(f"User gets version: {version.version}")
         """
-        # Check for active canary
-        canary = await self.get_canary_config(strategy_name)
-        if canary and canary.rollout_percent > 0:
-            # Deterministic hash-based assignment
-            user_hash = int(hashlib.sha256(user_id.encode()).hexdigest(), 16) % 100
-            if user_hash < canary.rollout_percent:
-                # User is in canary group
-                result = await self.session.execute(
-                    select(StrategyVersion).where(
-                        and_(
-                            StrategyVersion.strategy_name == strategy_name,
-                            StrategyVersion.version == canary.version,
-                        )
-                    )
-                )
-                canary_version = result.scalar_one_or_none()
-                if canary_version:
-                    logger.debug(
-                        f"Routed user {user_id} to canary version {canary.version}",
-                        extra={
-                            "user_id": user_id,
-                            "strategy_name": strategy_name,
-                            "version": canary.version,
-                            "user_hash": user_hash,
-                            "rollout_percent": canary.rollout_percent,
-                        },
-                    )
-                    return canary_version
-
-        # No canary or user not in canary group → use active version
-        active = await self.get_active_version(strategy_name)
-        if not active:
+        route = await self.routing.get(self.session, strategy_name)
+        version = route.route(user_id)
+        if version is None:
             raise ValueError(f"No active version for strategy {strategy_name}")
 
-        logger.debug(
-            f"Routed user {user_id} to active version {active.version}",
-            extra={
-                "user_id": user_id,
-                "strategy_name": strategy_name,
-                "version": active.version,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Routed user {user_id} to version {version.version}",
+                extra={
+                    "user_id": user_id,
+                    "strategy_name": strategy_name,
+                    "version": version.version,
+                    "canary": version is route.canary,
+                    "rollout_percent": route.rollout_percent,
+                },
+            )
 
-        return active
+        return version
 
     async def list_all_versions(
         self, strategy_name: str | None = None
@@ -15,6 +15,7 @@ from sqlalchemy import distinct, select
 from backend.app.core.db import get_async_session
 from backend.app.risk.models import ExposureSnapshot, RiskProfile
 from backend.app.risk.service import RiskService
+from backend.app.risk.state import risk_state
 from backend.app.trading.store.models import Trade
 
 logger = logging.getLogger(__name__)
@@ -48,20 +49,24 @@ def calculate_exposure_snapshots_task(self):
                     f"Calculating exposure snapshots for {len(client_ids)} clients"
                 )
 
-                # Calculate exposure for each client
+                # Load (or reuse) each client's risk state, then write every
+                # snapshot in a single transaction
                 successful = 0
                 failed = 0
+                loaded = []
 
                 for client_id in client_ids:
                     try:
-                        await RiskService.calculate_current_exposure(client_id, db)
-                        successful += 1
+                        await risk_state.get_client_state(client_id, db)
+                        loaded.append(client_id)
                     except Exception as e:
                         logger.warning(
                             f"Failed to calculate exposure for {client_id}: {e}"
                         )
                         failed += 1
 
+                successful = await risk_state.checkpoint(db, loaded)
+
                 logger.info(
                     f"Exposure snapshot calculation complete: "
                     f"{successful} successful, {failed} failed"
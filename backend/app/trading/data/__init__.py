@@ -4,8 +4,10 @@ Public API for trading data pipeline module.
 This module exports the main classes and functions for working with market data:
 - MT5DataPuller: Pulls OHLC and price data from MT5
 - DataPipeline: Orchestrates scheduled data pulling
+- CandleStore: Persistent upsert store for closed bars
 - Models: SymbolPrice, OHLCCandle, DataPullLog
 - Configuration: PullConfig, PipelineStatus
+- Events: ClosedCandleEvent
 
 Example:
     >>> from backend.app.trading.data import (
@@ -29,7 +31,13 @@ Example:
 
 from backend.app.trading.data.models import DataPullLog, OHLCCandle, SymbolPrice
 from backend.app.trading.data.mt5_puller import DataValidationError, MT5DataPuller
-from backend.app.trading.data.pipeline import DataPipeline, PipelineStatus, PullConfig
+from backend.app.trading.data.pipeline import (
+    ClosedCandleEvent,
+    DataPipeline,
+    PipelineStatus,
+    PullConfig,
+)
+from backend.app.trading.data.store import CandleStore
 
 __all__ = [
     # Models
@@ -43,4 +51,7 @@ __all__ = [
     "DataPipeline",
     "PullConfig",
     "PipelineStatus",
+    "ClosedCandleEvent",
+    # Store
+    "CandleStore",
 ]
@@ -168,6 +168,7 @@ class OHLCCandle(Base):
     Attributes:
         id: Unique identifier (primary key)
         symbol: Trading symbol (e.g., 'EURUSD')
+        timeframe: Candle timeframe (e.g., 'M5', 'H1')
         open: Opening price for the candle
         high: Highest price during the candle period
         low: Lowest price during the candle period
@@ -182,13 +183,13 @@ class OHLCCandle(Base):
         None - Standalone record
 
     Constraints:
-        - Unique constraint on (symbol, time_open) to prevent duplicates
+        - Unique constraint on (symbol, timeframe, time_open) to prevent duplicates
         - high >= low, high >= open/close, low <= open/close
 
     Indexes:
         - symbol: For symbol lookups
         - time_open: For chronological queries
-        - symbol + time_open: For symbol history
+        - symbol + timeframe + time_open: For symbol history and high-water marks
 
     Example:
         >>> candle = OHLCCandle(
@@ -211,6 +212,7 @@ class OHLCCandle(Base):
 
     # Symbol and time identification
     symbol = Column(String(20), nullable=False, index=True)
+    timeframe = Column(String(5), nullable=False, default="M5", server_default="M5")
     time_open = Column(DateTime(timezone=True), nullable=False, index=True)
     time_close = Column(DateTime(timezone=True), nullable=True)
 
@@ -238,8 +240,10 @@ class OHLCCandle(Base):
 
     # Constraints and indexes
     __table_args__ = (
-        UniqueConstraint("symbol", "time_open", name="uq_candles_symbol_time"),
-        Index("ix_ohlc_candles_symbol_time", "symbol", "time_open"),
+        UniqueConstraint(
+            "symbol", "timeframe", "time_open", name="uq_candles_symbol_time"
+        ),
+        Index("ix_ohlc_candles_symbol_time", "symbol", "timeframe", "time_open"),
         Index("ix_ohlc_candles_created", "created_at"),
     )
 
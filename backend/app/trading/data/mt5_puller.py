@@ -32,7 +32,9 @@ Example:
     >>> price_data = await puller.get_symbol_data("GOLD")
 """
 
+import asyncio
 import logging
+from datetime import datetime
 from typing import Any
 
 from backend.app.trading.mt5 import MT5SessionManager
@@ -41,6 +43,20 @@ from backend.app.trading.time import MarketCalendar
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Timeframe string → minutes (also the MT5 timeframe constant)
+TIMEFRAME_MINUTES = {
+    "M1": 1,
+    "M5": 5,
+    "M15": 15,
+    "M30": 30,
+    "H1": 60,
+    "H4": 240,
+    "D1": 1440,
+}
+
+# Concurrent MT5 requests issued by batch operations
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class DataValidationError(Exception):
     """Raised when pulled data fails validation."""
@@ -107,11 +123,13 @@ class MT5DataPuller:
         timeframe: str = "M5",
         count: int = 100,
         validate: bool = True,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """Pull OHLC candle data from MT5.
 
         Retrieves historical OHLC (Open, High, Low, Close) data for a symbol.
-        All candles are timestamped in UTC for consistency.
+        All candles are timestamped in UTC for consistency. With `since`, only
+        bars opened after that time are returned (incremental pulls).
 
         Args:
             symbol: Trading symbol (e.g., 'EURUSD', 'GOLD')
@@ -119,6 +137,7 @@ class MT5DataPuller:
                 Valid values: 'M1', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1'
             count: Number of candles to retrieve (default 100)
             validate: Whether to validate candle data (default True)
+            since: Only return bars with time_open after this UTC time
 
         Returns:
             List of candle dictionaries with keys:
@@ -180,6 +199,9 @@ class MT5DataPuller:
             # For now, return empty list (will be populated by integration)
             candles: list[dict[str, Any]] = []
 
+            if since is not None:
+                candles = [c for c in candles if c["time_open"] > since]
+
             # Validate if requested
             if validate and candles:
                 self._validate_candles(candles, symbol)
@@ -266,13 +288,16 @@ class MT5DataPuller:
     async def get_all_symbols_data(
         self,
         symbols: list[str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> dict[str, dict[str, Any]]:
         """Pull price data for multiple symbols.
 
-        Efficiently retrieves current prices for multiple symbols in batch.
+        Retrieves current prices for multiple symbols concurrently, with at
+        most `max_concurrency` requests in flight against the terminal.
 
         Args:
             symbols: List of symbols to pull (default: all known symbols)
+            max_concurrency: Max concurrent price requests (default 8)
 
         Returns:
             Dictionary mapping symbol → price data
@@ -298,18 +323,25 @@ class MT5DataPuller:
             extra={"count": len(symbols), "symbols": symbols[:5]},
         )
 
-        results = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        for symbol in symbols:
-            try:
-                price_data = await self.get_symbol_data(symbol)
-                if price_data:
-                    results[symbol] = price_data
-            except Exception as e:
-                logger.warning(
-                    f"Failed to pull data for {symbol}: {e}", extra={"symbol": symbol}
-                )
-                continue
+        async def _pull(symbol: str) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    return await self.get_symbol_data(symbol)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to pull data for {symbol}: {e}",
+                        extra={"symbol": symbol},
+                    )
+                    return None
+
+        prices = await asyncio.gather(*(_pull(symbol) for symbol in symbols))
+        results = {
+            symbol: price_data
+            for symbol, price_data in zip(symbols, prices, strict=True)
+            if price_data
+        }
 
         logger.info(
             f"Successfully pulled {len(results)}/{len(symbols)} symbol prices",
@@ -400,21 +432,10 @@ class MT5DataPuller:
         Raises:
             ValueError: If timeframe unknown
         """
-        # Mapping of string timeframes to MT5 constants
-        timeframe_map = {
-            "M1": 1,  # 1-minute
-            "M5": 5,  # 5-minute
-            "M15": 15,  # 15-minute
-            "M30": 30,  # 30-minute
-            "H1": 60,  # 1-hour
-            "H4": 240,  # 4-hour
-            "D1": 1440,  # 1-day
-        }
-
-        if timeframe not in timeframe_map:
+        if timeframe not in TIMEFRAME_MINUTES:
             raise ValueError(f"Unknown timeframe: {timeframe}")
 
-        return timeframe_map[timeframe]
+        return TIMEFRAME_MINUTES[timeframe]
 
     async def health_check(self) -> bool:
         """Verify puller is operational.
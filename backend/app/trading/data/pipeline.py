@@ -14,6 +14,13 @@ Architecture:
     to refresh market data. Multiple pull cycles can run concurrently for
     different symbols/timeframes.
 
+    Each cycle pulls its symbols concurrently (capped per terminal), asks only
+    for bars newer than each symbol's high-water mark, upserts closed bars into
+    the optional CandleStore and publishes a ClosedCandleEvent per symbol to
+    subscribers such as StrategyScheduler.on_closed_candle. The current
+    bid/ask of every symbol is passed to quote subscribers such as
+    PaperBook.mark, which marks paper positions to market.
+
 Example:
     >>> from backend.app.trading.data.pipeline import DataPipeline
     >>> from backend.app.trading.mt5 import MT5SessionManager
@@ -22,6 +29,7 @@ Example:
     >>> session_manager = MT5SessionManager()
     >>> puller = MT5DataPuller(session_manager)
     >>> pipeline = DataPipeline(puller)
+    >>> pipeline.subscribe_quotes(get_paper_book().mark)
     >>>
     >>> # Start pulling data every 5 minutes
     >>> await pipeline.start()
@@ -32,15 +40,31 @@ Example:
 
 import asyncio
 import logging
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from typing import Any
 
-from backend.app.trading.data.mt5_puller import MT5DataPuller
+from backend.app.trading.data.mt5_puller import (
+    DEFAULT_MAX_CONCURRENCY,
+    TIMEFRAME_MINUTES,
+    MT5DataPuller,
+)
+from backend.app.trading.data.store import CandleStore
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Bars requested for a symbol with no high-water mark yet
+INITIAL_PULL_BARS = 100
+# MT5 copy_rates limit per request
+MAX_PULL_BARS = 5000
+# Closed bars kept in memory per (symbol, timeframe) for subscribers
+CANDLE_HISTORY_SIZE = 500
+
 
 @dataclass
 class PullConfig:
@@ -61,6 +85,29 @@ class PullConfig:
     max_retries: int = 3
 
 
+@dataclass
+class ClosedCandleEvent:
+    """A newly closed candle, published once per symbol per pull cycle.
+
+    Attributes:
+        symbol: Trading symbol
+        timeframe: Candle timeframe (pipeline format, e.g. 'M15')
+        candle: The newest closed bar
+        bars: Recent closed bars, oldest first, ending with `candle`
+    """
+
+    symbol: str
+    timeframe: str
+    candle: dict[str, Any]
+    bars: list[dict[str, Any]] = field(default_factory=list)
+
+
+CandleSubscriber = Callable[[ClosedCandleEvent], Awaitable[Any]]
+
+# Called with (symbol, bid, ask) for every pulled quote
+QuoteSubscriber = Callable[[str, Decimal, Decimal], Any]
+
+
 @dataclass
 class PipelineStatus:
     """Current status of the data pipeline.
@@ -123,22 +170,41 @@ class DataPipeline:
     MIN_PULL_INTERVAL = 60  # 1 minute minimum
     MAX_PULL_INTERVAL = 3600  # 1 hour maximum
 
-    def __init__(self, puller: MT5DataPuller):
+    def __init__(
+        self,
+        puller: MT5DataPuller,
+        store: CandleStore | None = None,
+        max_concurrent_pulls: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         """Initialize data pipeline.
 
         Args:
             puller: MT5DataPuller instance for data operations
+            store: Optional persistent store for closed bars
+            max_concurrent_pulls: Max in-flight requests against the terminal
+                (shared by all pull configs, default 8)
 
         Raises:
-            ValueError: If puller is None
+            ValueError: If puller is None or max_concurrent_pulls < 1
         """
         if puller is None:
             raise ValueError("puller cannot be None")
+        if max_concurrent_pulls < 1:
+            raise ValueError("max_concurrent_pulls must be >= 1")
 
         self.puller = puller
+        self.store = store
+        self.max_concurrent_pulls = max_concurrent_pulls
         self.pull_configs: dict[str, PullConfig] = {}
         self.status = PipelineStatus()
 
+        # Incremental state per (symbol, timeframe)
+        self._high_water: dict[tuple[str, str], datetime] = {}
+        self._history: dict[tuple[str, str], deque[dict[str, Any]]] = {}
+        self._subscribers: list[CandleSubscriber] = []
+        self._quote_subscribers: list[QuoteSubscriber] = []
+        self._pull_semaphore = asyncio.Semaphore(max_concurrent_pulls)
+
         # Background tasks
         self._pull_tasks: dict[str, asyncio.Task] = {}
         self._shutdown_event = asyncio.Event()
@@ -204,6 +270,28 @@ class DataPipeline:
             },
         )
 
+    def subscribe(self, callback: CandleSubscriber) -> None:
+        """Register an async callback for new closed candles.
+
+        Args:
+            callback: Coroutine function taking a ClosedCandleEvent
+
+        Example:
+            >>> pipeline.subscribe(scheduler.on_closed_candle)
+        """
+        self._subscribers.append(callback)
+
+    def subscribe_quotes(self, callback: QuoteSubscriber) -> None:
+        """Register a callback for the current quotes pulled each cycle.
+
+        Args:
+            callback: Function taking (symbol, bid, ask)
+
+        Example:
+            >>> pipeline.subscribe_quotes(get_paper_book().mark)
+        """
+        self._quote_subscribers.append(callback)
+
     async def start(self) -> None:
         """Start the data pipeline.
 
@@ -365,30 +453,22 @@ class DataPipeline:
         )
 
         try:
-            # Pull OHLC data for each symbol
-            for symbol in config.symbols:
-                try:
-                    candles = await self.puller.get_ohlc_data(
-                        symbol=symbol,
-                        timeframe=config.timeframe,
-                        count=100,
-                        validate=True,
-                    )
-
-                    logger.debug(
-                        f"Pulled {len(candles)} candles for {symbol}",
-                        extra={"symbol": symbol, "candle_count": len(candles)},
-                    )
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to pull {symbol}: {e}",
-                        extra={"symbol": symbol, "error": str(e)},
-                    )
-                    continue
+            if self.store is not None:
+                await self._load_high_water_marks(config)
+
+            # Pull OHLC data for all symbols concurrently (failures isolated)
+            await asyncio.gather(
+                *(
+                    self._pull_symbol(symbol, config.timeframe)
+                    for symbol in config.symbols
+                )
+            )
 
             # Pull current prices
-            prices = await self.puller.get_all_symbols_data(config.symbols)
+            prices = await self.puller.get_all_symbols_data(
+                config.symbols, max_concurrency=self.max_concurrent_pulls
+            )
+            self._publish_quotes(prices)
 
             logger.info(
                 f"Pull cycle complete: {config_name}",
@@ -412,6 +492,157 @@ class DataPipeline:
             self.status.error_message = str(e)
             raise
 
+    async def _load_high_water_marks(self, config: PullConfig) -> None:
+        """Seed high-water marks from the store for symbols not yet seen.
+
+        Args:
+            config: PullConfig with symbols and timeframe
+        """
+        if self.store is None:
+            return
+        missing = [
+            symbol
+            for symbol in config.symbols
+            if (symbol, config.timeframe) not in self._high_water
+        ]
+        if not missing:
+            return
+
+        try:
+            marks = await self.store.get_high_water_marks(missing, config.timeframe)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load high-water marks: {e}",
+                extra={"timeframe": config.timeframe, "error": str(e)},
+            )
+            return
+
+        for symbol, mark in marks.items():
+            self._high_water[(symbol, config.timeframe)] = _to_naive_utc(mark)
+
+    async def _pull_symbol(self, symbol: str, timeframe: str) -> None:
+        """Pull, store and publish new closed bars for one symbol.
+
+        Only bars opened after the symbol's high-water mark are requested.
+        Bars still forming are skipped; they are picked up once closed.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+        """
+        key = (symbol, timeframe)
+        high_water = self._high_water.get(key)
+        bar_length = timedelta(minutes=TIMEFRAME_MINUTES.get(timeframe, 5))
+        now = datetime.utcnow()
+
+        if high_water is None:
+            count = INITIAL_PULL_BARS
+        else:
+            missed = math.ceil((now - high_water) / bar_length)
+            count = min(max(missed, 1), MAX_PULL_BARS)
+
+        try:
+            async with self._pull_semaphore:
+                candles = await self.puller.get_ohlc_data(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    count=count,
+                    validate=True,
+                    since=high_water,
+                )
+        except Exception as e:
+            logger.warning(
+                f"Failed to pull {symbol}: {e}",
+                extra={"symbol": symbol, "error": str(e)},
+            )
+            return
+
+        # Keep closed bars newer than the mark, deduplicated by open time
+        closed: dict[datetime, dict[str, Any]] = {}
+        for candle in candles or []:
+            if candle.get("time_open") is None:
+                continue
+            time_open = _to_naive_utc(candle["time_open"])
+            time_close = candle.get("time_close")
+            close_at = (
+                _to_naive_utc(time_close) if time_close else time_open + bar_length
+            )
+            if close_at > now:
+                continue
+            if high_water is not None and time_open <= high_water:
+                continue
+            closed[time_open] = candle
+
+        logger.debug(
+            f"Pulled {len(candles or [])} candles for {symbol} "
+            f"({len(closed)} new closed)",
+            extra={"symbol": symbol, "new_closed": len(closed)},
+        )
+        if not closed:
+            return
+
+        bars = [closed[time_open] for time_open in sorted(closed)]
+
+        if self.store is not None:
+            try:
+                await self.store.upsert_candles(symbol, timeframe, bars)
+            except Exception as e:
+                # Leave the mark untouched so the bars are re-pulled next cycle
+                logger.warning(
+                    f"Failed to store candles for {symbol}: {e}",
+                    extra={"symbol": symbol, "error": str(e)},
+                )
+                return
+
+        self._high_water[key] = max(closed)
+        history = self._history.setdefault(key, deque(maxlen=CANDLE_HISTORY_SIZE))
+        history.extend(bars)
+
+        await self._publish(
+            ClosedCandleEvent(
+                symbol=symbol,
+                timeframe=timeframe,
+                candle=bars[-1],
+                bars=list(history),
+            )
+        )
+
+    async def _publish(self, event: ClosedCandleEvent) -> None:
+        """Deliver an event to every subscriber (failures isolated).
+
+        Args:
+            event: Closed candle event
+        """
+        for callback in self._subscribers:
+            try:
+                await callback(event)
+            except Exception as e:
+                logger.error(
+                    f"Candle subscriber failed for {event.symbol}: {e}",
+                    exc_info=True,
+                    extra={"symbol": event.symbol, "timeframe": event.timeframe},
+                )
+
+    def _publish_quotes(self, prices: dict[str, dict[str, Any]]) -> None:
+        """Pass each pulled quote to every quote subscriber (failures isolated).
+
+        Args:
+            prices: Symbol -> price data with bid and ask
+        """
+        for symbol, price in prices.items():
+            if price.get("bid") is None or price.get("ask") is None:
+                continue
+            bid, ask = Decimal(str(price["bid"])), Decimal(str(price["ask"]))
+            for callback in self._quote_subscribers:
+                try:
+                    callback(symbol, bid, ask)
+                except Exception as e:
+                    logger.error(
+                        f"Quote subscriber failed for {symbol}: {e}",
+                        exc_info=True,
+                        extra={"symbol": symbol},
+                    )
+
     def get_status(self) -> PipelineStatus:
         """Get current pipeline status.
 
@@ -491,3 +722,10 @@ class DataPipeline:
                 1 for c in self.pull_configs.values() if c.enabled
             ),
         }
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC for comparisons."""
+    if value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
@@ -0,0 +1,152 @@
+"""
+Persistent bar store for closed OHLC candles.
+
+Closed bars pulled by DataPipeline are upserted into the ohlc_candles table,
+keyed by (symbol, timeframe, time_open), so re-pulling overlapping windows
+never creates duplicates. The store also answers per-symbol high-water marks
+(latest stored time_open) in a single grouped query, which lets the pipeline
+request only bars newer than what it already has.
+
+Example:
+    >>> from backend.app.core.db import get_async_session
+    >>> store = CandleStore(get_async_session)
+    >>> marks = await store.get_high_water_marks(["EURUSD", "GOLD"], "M5")
+    >>> await store.upsert_candles("EURUSD", "M5", closed_bars)
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.trading.data.models import OHLCCandle
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+# Columns overwritten when a bar is re-pulled (broker revisions)
+_UPSERT_COLUMNS = ("time_close", "open", "high", "low", "close", "volume")
+
+# Rows per multi-row INSERT: 12 bind parameters per row keeps each statement
+# well under the SQLite (32766) and PostgreSQL (65535) parameter limits
+UPSERT_CHUNK_SIZE = 1000
+
+
+class CandleStore:
+    """Upsert-based persistent store for closed candles.
+
+    Attributes:
+        session_factory: Async context manager factory yielding AsyncSession
+    """
+
+    def __init__(self, session_factory: SessionFactory):
+        """Initialize candle store.
+
+        Args:
+            session_factory: e.g. backend.app.core.db.get_async_session
+        """
+        self.session_factory = session_factory
+
+    async def get_high_water_marks(
+        self, symbols: Sequence[str], timeframe: str
+    ) -> dict[str, datetime]:
+        """Latest stored time_open per symbol (one grouped query).
+
+        Args:
+            symbols: Symbols to look up
+            timeframe: Candle timeframe
+
+        Returns:
+            Dict symbol → latest time_open (symbols with no bars are absent)
+        """
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(OHLCCandle.symbol, func.max(OHLCCandle.time_open))
+                .where(
+                    OHLCCandle.symbol.in_(list(symbols)),
+                    OHLCCandle.timeframe == timeframe,
+                )
+                .group_by(OHLCCandle.symbol)
+            )
+            latest: dict[str, datetime] = {}
+            for row in result.all():
+                symbol: str = row[0]
+                time_open: datetime | None = row[1]
+                if time_open is not None:
+                    latest[symbol] = time_open
+            return latest
+
+    async def upsert_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles: Sequence[dict[str, Any]],
+    ) -> int:
+        """Insert closed bars, updating any that already exist.
+
+        Large backfills are written in UPSERT_CHUNK_SIZE statements within
+        one transaction.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            candles: Closed bars (dicts with time_open, open/high/low/close...)
+
+        Returns:
+            int: Number of bars written
+        """
+        if not candles:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": str(uuid4()),
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "time_open": candle["time_open"],
+                "time_close": candle.get("time_close"),
+                "open": candle["open"],
+                "high": candle["high"],
+                "low": candle["low"],
+                "close": candle["close"],
+                "volume": int(candle.get("volume") or 0),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for candle in candles
+        ]
+
+        async with self.session_factory() as db:
+            insert = (
+                pg_insert
+                if db.get_bind().dialect.name == "postgresql"
+                else sqlite_insert
+            )
+            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                stmt = insert(OHLCCandle).values(
+                    rows[start : start + UPSERT_CHUNK_SIZE]
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["symbol", "timeframe", "time_open"],
+                    set_={
+                        **{col: stmt.excluded[col] for col in _UPSERT_COLUMNS},
+                        "updated_at": now,
+                    },
+                )
+                await db.execute(stmt)
+            await db.commit()
+
+        logger.debug(
+            f"Upserted {len(rows)} {timeframe} candles for {symbol}",
+            extra={"symbol": symbol, "timeframe": timeframe, "count": len(rows)},
+        )
+        return len(rows)
@@ -114,6 +114,30 @@ class CircuitBreaker:
         """
         return self._failure_count
 
+    def permitted_calls(self, closed_limit: int) -> int:
+        """How many concurrent calls callers should currently issue.
+
+        Lets callers apply back-pressure before dispatching work instead of
+        discovering the open circuit one rejected call at a time.
+
+        Args:
+            closed_limit: Concurrency to allow while the circuit is CLOSED
+
+        Returns:
+            int: 0 while OPEN and cooling down, half_open_max_calls while
+                probing recovery, closed_limit otherwise
+
+        Example:
+            >>> slots = cb.permitted_calls(closed_limit=8)
+        """
+        if self.is_open:
+            if time.time() - self._last_failure_time > self.timeout_seconds:
+                return self.half_open_max_calls
+            return 0
+        if self.is_half_open:
+            return max(self.half_open_max_calls - self._half_open_calls, 0)
+        return closed_limit
+
     async def call(
         self,
         func: Callable[..., Awaitable[T]],
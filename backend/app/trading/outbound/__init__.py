@@ -7,7 +7,11 @@ from backend.app.trading.outbound.exceptions import (
     OutboundError,
     OutboundSignatureError,
 )
-from backend.app.trading.outbound.hmac import build_signature, verify_signature
+from backend.app.trading.outbound.hmac import (
+    build_envelope_signature,
+    build_signature,
+    verify_signature,
+)
 from backend.app.trading.outbound.responses import SignalIngestResponse
 
 __all__ = [
@@ -16,6 +20,7 @@ __all__ = [
     "OutboundError",
     "OutboundClientError",
     "OutboundSignatureError",
+    "build_envelope_signature",
     "build_signature",
     "verify_signature",
     "SignalIngestResponse",
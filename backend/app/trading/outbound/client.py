@@ -1,25 +1,41 @@
 """Async HTTP client for posting HMAC-signed signals to server."""
 
+import asyncio
 import json
 import logging
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
-
+from pydantic import BaseModel, ValidationError
+
+from backend.app.signals.schema import (
+    SignalBatchCreate,
+    SignalBatchItem,
+    SignalBatchItemResult,
+    SignalBatchOut,
+)
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.trading.outbound.config import OutboundConfig
 from backend.app.trading.outbound.exceptions import OutboundClientError
-from backend.app.trading.outbound.hmac import build_signature
+from backend.app.trading.outbound.hmac import build_envelope_signature, build_signature
 from backend.app.trading.outbound.responses import SignalIngestResponse
 
+# Server endpoints (paths are part of the signed canonical request)
+INGEST_PATH = "/api/v1/signals/ingest"
+BATCH_INGEST_PATH = "/api/v1/signals/batch"
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
 
 class HmacClient:
     """Async HTTP client for posting HMAC-signed signals to server.
 
     Sends trading signals to the server's `/api/v1/signals/ingest` endpoint
-    with HMAC-SHA256 authentication and comprehensive error handling.
+    (or `/api/v1/signals/batch` for several at once) with HMAC-SHA256
+    authentication and comprehensive error handling. submit_signal() coalesces
+    signals produced in the same scheduler tick into one batch request.
 
     Attributes:
         config: Configuration containing credentials and server URL
@@ -60,6 +76,13 @@ class HmacClient:
         self.logger = logger
         self._session: httpx.AsyncClient | None = None
 
+        # Signals queued by submit_signal() for the next coalesced batch
+        self._pending: list[
+            tuple[SignalCandidate, asyncio.Future[SignalBatchItemResult]]
+        ] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_now = asyncio.Event()
+
         # Validate config on initialization
         self.config.validate()
 
@@ -69,7 +92,8 @@ class HmacClient:
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        """Context manager exit - close HTTP session."""
+        """Context manager exit - send queued signals, close HTTP session."""
+        await self.flush()
         await self.close()
 
     async def _ensure_session(self) -> None:
@@ -162,16 +186,258 @@ class HmacClient:
             self.logger.error(error_msg)
             raise OutboundClientError(error_msg)
 
+        # Log request
+        self.logger.info(
+            "Posting signal to server",
+            extra={
+                "producer_id": self.config.producer_id,
+                "signal_instrument": signal.instrument,
+                "signal_side": signal.side,
+                "idempotency_key": idempotency_key,
+                "endpoint": f"{self.config.server_base_url}{INGEST_PATH}",
+            },
+        )
+
+        server_response = await self._post_signed(
+            INGEST_PATH,
+            request_body_bytes,
+            idempotency_key,
+            timeout or self.config.timeout_seconds,
+            success_status=201,
+            what="signal",
+            response_model=SignalIngestResponse,
+        )
+
+        self.logger.info(
+            "Signal ingested by server",
+            extra={
+                "producer_id": self.config.producer_id,
+                "server_signal_id": server_response.signal_id,
+                "status": server_response.status,
+            },
+        )
+
+        return server_response
+
+    async def post_signals(
+        self,
+        signals: list[SignalCandidate],
+        idempotency_key: str | None = None,
+        timeout: float | None = None,
+    ) -> list[SignalBatchItemResult]:
+        """Post several signals in one signed request.
+
+        The envelope is built with the server's SignalBatchCreate schema and
+        signed once, exactly as the batch route verifies it; the server
+        dedupes and inserts the whole batch together and answers per signal.
+        Each item's external_id is derived from the idempotency key, so a
+        retried batch is reported as duplicates instead of re-inserted.
+
+        Args:
+            signals: Signals to send (1..config.max_batch_size)
+            idempotency_key: UUID for idempotent retries (generated if None)
+            timeout: Request timeout in seconds (overrides config)
+
+        Returns:
+            list[SignalBatchItemResult]: One result per signal, in order
+
+        Raises:
+            OutboundClientError: If validation, network, or HTTP error occurs
+            TimeoutError: If request timeout exceeded
+
+        Example:
+            >>> async with HmacClient(config, logger) as client:
+            ...     responses = await client.post_signals([gold_buy, eurusd_sell])
+            ...     print([r.status for r in responses])  # created / duplicate
+        """
+        if not signals:
+            raise OutboundClientError("Signal batch must not be empty")
+        if len(signals) > self.config.max_batch_size:
+            raise OutboundClientError(
+                f"Signal batch too large: {len(signals)} signals "
+                f"(max {self.config.max_batch_size})"
+            )
+
+        await self._ensure_session()
+
+        for signal in signals:
+            self._validate_signal(signal)
+
+        if not idempotency_key:
+            idempotency_key = str(uuid.uuid4())
+
+        try:
+            envelope = SignalBatchCreate(
+                signals=[
+                    self._serialize_batch_item(signal, f"{idempotency_key}:{i}")
+                    for i, signal in enumerate(signals)
+                ]
+            )
+        except ValidationError as e:
+            raise OutboundClientError(f"Signal batch rejected by schema: {e}") from e
+
+        # The server signs json.dumps(model_dump()); send exactly those bytes
+        request_json = json.dumps(envelope.model_dump())
+        request_body_bytes = request_json.encode("utf-8")
+
+        if len(request_body_bytes) > self.config.max_body_size:
+            error_msg = (
+                f"Signal batch body too large: {len(request_body_bytes)} bytes "
+                f"(max {self.config.max_body_size})"
+            )
+            self.logger.error(error_msg)
+            raise OutboundClientError(error_msg)
+
+        self.logger.info(
+            "Posting signal batch to server",
+            extra={
+                "producer_id": self.config.producer_id,
+                "batch_size": len(signals),
+                "idempotency_key": idempotency_key,
+                "endpoint": f"{self.config.server_base_url}{BATCH_INGEST_PATH}",
+            },
+        )
+
+        batch_response = await self._post_signed(
+            BATCH_INGEST_PATH,
+            request_body_bytes,
+            idempotency_key,
+            timeout or self.config.timeout_seconds,
+            success_status=200,
+            what="signal batch",
+            response_model=SignalBatchOut,
+            signature=build_envelope_signature(
+                self.config.producer_secret.encode("utf-8"), request_json
+            ),
+        )
+
+        results: list[SignalBatchItemResult] = batch_response.results
+        if len(results) != len(signals):
+            raise OutboundClientError(
+                f"Server returned {len(results)} results for {len(signals)} signals"
+            )
+
+        self.logger.info(
+            "Signal batch ingested by server",
+            extra={
+                "producer_id": self.config.producer_id,
+                "batch_size": len(signals),
+                "created": batch_response.created,
+                "duplicates": batch_response.duplicates,
+            },
+        )
+
+        return results
+
+    async def submit_signal(self, signal: SignalCandidate) -> SignalBatchItemResult:
+        """Queue a signal and send it with others produced in the same tick.
+
+        Signals submitted before the pending batch is flushed (one event-loop
+        tick, plus config.batch_linger_seconds) are coalesced into a single
+        post_signals() request.
+
+        Args:
+            signal: SignalCandidate to send
+
+        Returns:
+            SignalBatchItemResult: This signal's result from the batch
+
+        Raises:
+            OutboundClientError: If the signal is invalid or the batch fails
+            TimeoutError: If the batch request timed out
+
+        Example:
+            >>> responses = await asyncio.gather(
+            ...     *(client.submit_signal(s) for s in tick_signals)
+            ... )  # One HTTP request
+        """
+        self._validate_signal(signal)
+
+        future: asyncio.Future[SignalBatchItemResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.append((signal, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_now = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        if len(self._pending) >= self.config.max_batch_size:
+            self._flush_now.set()
+
+        return await future
+
+    async def flush(self) -> None:
+        """Send any signals queued by submit_signal() immediately."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_now.set()
+            await self._flush_task
+
+    async def _flush_pending(self) -> None:
+        """Background task: wait for the tick to end, then send batches."""
+        try:
+            await asyncio.wait_for(
+                self._flush_now.wait(), timeout=self.config.batch_linger_seconds
+            )
+        except TimeoutError:
+            pass
+
+        while self._pending:
+            batch = self._pending[: self.config.max_batch_size]
+            del self._pending[: self.config.max_batch_size]
+            try:
+                responses = await self.post_signals([signal for signal, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), response in zip(batch, responses, strict=True):
+                if not future.done():
+                    future.set_result(response)
+
+    async def _post_signed(
+        self,
+        path: str,
+        body: bytes,
+        idempotency_key: str,
+        request_timeout: float,
+        success_status: int,
+        what: str,
+        response_model: type[ResponseT],
+        signature: str | None = None,
+    ) -> ResponseT:
+        """Sign and POST a body, mapping failures to client errors.
+
+        Args:
+            path: Endpoint path (also part of the signed canonical request)
+            body: Serialized request body
+            idempotency_key: Idempotency key header value
+            request_timeout: Request timeout in seconds
+            success_status: Expected HTTP status on success
+            what: Noun used in error messages ("signal", "signal batch")
+            response_model: Model the success body is parsed into
+            signature: Precomputed X-Signature (default: canonical request
+                signature over path, timestamp, producer and body)
+
+        Returns:
+            Parsed success response
+
+        Raises:
+            OutboundClientError: On HTTP, network or unexpected errors
+            TimeoutError: If request timeout exceeded
+        """
         # Generate timestamp (RFC3339)
         timestamp = _get_rfc3339_timestamp()
 
         # Generate HMAC signature
-        signature = build_signature(
-            secret=self.config.producer_secret.encode("utf-8"),
-            body=request_body_bytes,
-            timestamp=timestamp,
-            producer_id=self.config.producer_id,
-        )
+        if signature is None:
+            signature = build_signature(
+                secret=self.config.producer_secret.encode("utf-8"),
+                body=body,
+                timestamp=timestamp,
+                producer_id=self.config.producer_id,
+                endpoint=path,
+            )
 
         # Build headers
         headers = {
@@ -183,23 +449,6 @@ class HmacClient:
             "User-Agent": "TeleBot/1.0 (MT5 Signal Client)",
         }
 
-        # Build endpoint URL
-        endpoint_url = f"{self.config.server_base_url}/api/v1/signals/ingest"
-
-        # Log request (redact signature for brevity)
-        self.logger.info(
-            "Posting signal to server",
-            extra={
-                "producer_id": self.config.producer_id,
-                "signal_instrument": signal.instrument,
-                "signal_side": signal.side,
-                "idempotency_key": idempotency_key,
-                "endpoint": endpoint_url,
-            },
-        )
-
-        request_timeout = timeout or self.config.timeout_seconds
-
         # Ensure session is initialized
         await self._ensure_session()
 
@@ -209,8 +458,8 @@ class HmacClient:
                 raise OutboundClientError("HTTP session not initialized")
 
             response = await self._session.post(
-                endpoint_url,
-                content=request_body_bytes,
+                f"{self.config.server_base_url}{path}",
+                content=body,
                 headers=headers,
                 timeout=request_timeout,
             )
@@ -226,25 +475,12 @@ class HmacClient:
             )
 
             # Handle response
-            if response.status_code == 201:
-                # Success
-                response_data = response.json()
-                server_response = SignalIngestResponse(**response_data)
-
-                self.logger.info(
-                    "Signal ingested by server",
-                    extra={
-                        "producer_id": self.config.producer_id,
-                        "server_signal_id": server_response.signal_id,
-                        "status": server_response.status,
-                    },
-                )
-
-                return server_response
+            if response.status_code == success_status:
+                return response_model(**response.json())
 
             elif 400 <= response.status_code < 500:
                 # Client error (4xx)
-                error_msg = f"Server rejected signal (HTTP {response.status_code})"
+                error_msg = f"Server rejected {what} (HTTP {response.status_code})"
 
                 try:
                     error_data = response.json()
@@ -311,7 +547,7 @@ class HmacClient:
             raise
 
         except Exception as e:
-            error_msg = f"Unexpected error posting signal: {str(e)}"
+            error_msg = f"Unexpected error posting {what}: {str(e)}"
             self.logger.error(
                 error_msg,
                 extra={
@@ -391,6 +627,40 @@ class HmacClient:
         # Return with keys sorted for canonical order
         return dict(sorted(body.items()))
 
+    def _serialize_batch_item(
+        self, signal: SignalCandidate, external_id: str
+    ) -> SignalBatchItem:
+        """Map a signal onto the server's batch item schema.
+
+        Fields the server has no column for (levels, confidence, reason,
+        timestamp) travel in the payload alongside the strategy metadata.
+
+        Args:
+            signal: Signal to serialize
+            external_id: Deduplication ID for this item
+
+        Returns:
+            SignalBatchItem: Validated batch item
+
+        Raises:
+            ValidationError: If the server schema rejects the signal
+        """
+        return SignalBatchItem(
+            instrument=signal.instrument,
+            side=signal.side,
+            price=float(signal.entry_price),
+            payload={
+                **(signal.payload or {}),
+                "stop_loss": float(signal.stop_loss),
+                "take_profit": float(signal.take_profit),
+                "confidence": float(signal.confidence),
+                "reason": signal.reason,
+                "timestamp": signal.timestamp.isoformat() if signal.timestamp else None,
+            },
+            version=signal.version,
+            external_id=external_id,
+        )
+
     def __repr__(self) -> str:
         """Return string representation."""
         return (
@@ -15,6 +15,9 @@ class OutboundConfig:
         enabled: Feature flag to enable/disable outbound posting
         timeout_seconds: HTTP request timeout
         max_body_size: Maximum signal body size in bytes (default 64 KB)
+        max_batch_size: Maximum signals per batch request (default 50)
+        batch_linger_seconds: Extra wait before flushing a coalesced batch
+            (default 0: flush at the end of the current event-loop tick)
 
     Example:
         >>> config = OutboundConfig(
@@ -33,6 +36,8 @@ class OutboundConfig:
     enabled: bool = True
     timeout_seconds: float = 30.0
     max_body_size: int = 65536  # 64 KB
+    max_batch_size: int = 50
+    batch_linger_seconds: float = 0.0
 
     def __post_init__(self) -> None:
         """Validate configuration on initialization."""
@@ -75,6 +80,12 @@ class OutboundConfig:
         if self.max_body_size > 10_485_760:  # 10 MB
             raise ValueError("max_body_size must be <= 10 MB")
 
+        if not 1 <= self.max_batch_size <= 100:
+            raise ValueError("max_batch_size must be between 1 and 100")
+
+        if not 0.0 <= self.batch_linger_seconds <= 1.0:
+            raise ValueError("batch_linger_seconds must be between 0.0 and 1.0")
+
     @classmethod
     def from_env(cls) -> "OutboundConfig":
         """Load configuration from environment variables.
@@ -86,6 +97,8 @@ class OutboundConfig:
             OUTBOUND_SERVER_URL: Server base URL (required)
             OUTBOUND_TIMEOUT_SECONDS: Request timeout (default: "30")
             OUTBOUND_MAX_BODY_SIZE: Max body size (default: "65536")
+            OUTBOUND_MAX_BATCH_SIZE: Max signals per batch (default: "50")
+            OUTBOUND_BATCH_LINGER_SECONDS: Batch linger (default: "0")
 
         Returns:
             OutboundConfig: Loaded and validated configuration
@@ -148,6 +161,22 @@ class OutboundConfig:
                 f"OUTBOUND_MAX_BODY_SIZE must be an integer, got {max_body_size_str!r}"
             ) from e
 
+        max_batch_size_str = os.getenv("OUTBOUND_MAX_BATCH_SIZE", "50")
+        try:
+            max_batch_size = int(max_batch_size_str)
+        except ValueError as e:
+            raise ValueError(
+                f"OUTBOUND_MAX_BATCH_SIZE must be an integer, got {max_batch_size_str!r}"
+            ) from e
+
+        linger_str = os.getenv("OUTBOUND_BATCH_LINGER_SECONDS", "0")
+        try:
+            batch_linger_seconds = float(linger_str)
+        except ValueError as e:
+            raise ValueError(
+                f"OUTBOUND_BATCH_LINGER_SECONDS must be a float, got {linger_str!r}"
+            ) from e
+
         return cls(
             producer_id=producer_id,
             producer_secret=producer_secret,
@@ -155,6 +184,8 @@ class OutboundConfig:
             enabled=True,
             timeout_seconds=timeout,
             max_body_size=max_body_size,
+            max_batch_size=max_batch_size,
+            batch_linger_seconds=batch_linger_seconds,
         )
 
     def __repr__(self) -> str:
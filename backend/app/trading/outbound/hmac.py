@@ -14,6 +14,7 @@ def build_signature(
     body: bytes,
     timestamp: str,
     producer_id: str,
+    endpoint: str = "/api/v1/signals/ingest",
 ) -> str:
     """Generate HMAC-SHA256 signature for signed signal delivery.
 
@@ -22,7 +23,7 @@ def build_signature(
 
     Canonical Request Format:
         METHOD:POST
-        ENDPOINT:/api/v1/signals/ingest
+        ENDPOINT:<endpoint-path>
         TIMESTAMP:<RFC3339-timestamp>
         PRODUCER_ID:<producer-id>
         BODY_SHA256:<base64(sha256(body))>
@@ -40,6 +41,7 @@ def build_signature(
         body: Request body bytes to sign
         timestamp: RFC3339 ISO format timestamp (e.g., "2025-10-25T14:30:45.123456Z")
         producer_id: Producer identifier
+        endpoint: Request path being signed (default: single-signal ingest)
 
     Returns:
         str: Base64-encoded HMAC-SHA256 signature
@@ -95,7 +97,7 @@ def build_signature(
     # Build canonical request
     canonical_request = (
         f"METHOD:POST\n"
-        f"ENDPOINT:/api/v1/signals/ingest\n"
+        f"ENDPOINT:{endpoint}\n"
         f"TIMESTAMP:{timestamp}\n"
         f"PRODUCER_ID:{producer_id}\n"
         f"BODY_SHA256:{body_hash_b64}"
@@ -120,6 +122,7 @@ def verify_signature(
     timestamp: str,
     producer_id: str,
     provided_signature: str,
+    endpoint: str = "/api/v1/signals/ingest",
 ) -> bool:
     """Verify an HMAC-SHA256 signature using timing-safe comparison.
 
@@ -133,6 +136,7 @@ def verify_signature(
         timestamp: RFC3339 timestamp used for signing
         producer_id: Producer ID used for signing
         provided_signature: Base64-encoded signature to verify
+        endpoint: Request path that was signed
 
     Returns:
         bool: True if signature is valid, False otherwise
@@ -156,7 +160,9 @@ def verify_signature(
     """
     try:
         # Regenerate signature from components
-        expected_signature = build_signature(secret, body, timestamp, producer_id)
+        expected_signature = build_signature(
+            secret, body, timestamp, producer_id, endpoint=endpoint
+        )
     except OutboundSignatureError:
         raise
 
@@ -165,6 +171,37 @@ def verify_signature(
     return hmac.compare_digest(expected_signature, provided_signature)
 
 
+def build_envelope_signature(secret: bytes, payload_json: str) -> str:
+    """Sign a JSON envelope the way the signal ingest routes verify it.
+
+    The server re-serializes the parsed request with json.dumps() and
+    compares a hex HMAC-SHA256 over it (SignalService.verify_hmac_signature),
+    so the client must sign and send that same serialization.
+
+    Args:
+        secret: HMAC secret key (the server's SIGNALS_HMAC_KEY)
+        payload_json: json.dumps() of the request model's model_dump()
+
+    Returns:
+        str: Hex-encoded HMAC-SHA256 signature
+
+    Raises:
+        OutboundSignatureError: If secret or payload is empty
+
+    Example:
+        >>> sig = build_envelope_signature(b"my-secret-key-min-16-bytes", '{"signals": []}')
+        >>> len(sig)
+        64
+    """
+    if not secret:
+        raise OutboundSignatureError("secret must not be empty")
+
+    if not payload_json:
+        raise OutboundSignatureError("payload_json must not be empty")
+
+    return hmac.new(secret, payload_json.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
 def _is_valid_rfc3339(timestamp: str) -> bool:
     """Validate RFC3339 timestamp format.
 
@@ -4,8 +4,22 @@ Fetches live positions from MT5 terminal, compares against bot's expected trades
 detects divergences (slippage, partial fills, broker closes), and records audit trail.
 
 This service runs every 10 seconds to ensure real-time account reconciliation.
+
+Per sync:
+- Bot trades are indexed once by (symbol, direction, volume bucket), so each
+  MT5 position is matched against a handful of candidates instead of every
+  open trade.
+- Log entries, the account snapshot and the audit record are flushed
+  together and committed in one transaction.
+- If the snapshot fingerprint (positions, open trades, balance, equity
+  rounded to SNAPSHOT_EQUITY_RESOLUTION) equals the last committed one,
+  nothing is written (at most SNAPSHOT_MAX_AGE_SECONDS between writes).
 """
 
+import hashlib
+import math
+import time
+from collections import defaultdict
 from datetime import UTC, datetime
 from typing import Any
 
@@ -23,6 +37,20 @@ from backend.app.trading.store.models import Trade
 
 logger = get_logger(__name__)
 
+# Matching tolerances (see MT5SyncService._find_matching_trade)
+VOLUME_TOLERANCE = 0.05  # 5% of the bot trade volume
+PRICE_TOLERANCE = 0.0002  # 2 pips for most pairs
+# Log-scale width of a volume bucket; must exceed log(1 / (1 - tolerance))
+# so that any in-tolerance pair lands in the same or an adjacent bucket
+VOLUME_BUCKET_LOG_WIDTH = math.log(1.10)
+
+# "No changes" short-circuit
+SNAPSHOT_EQUITY_RESOLUTION = 1.0  # Equity moves smaller than this are ignored
+SNAPSHOT_MAX_AGE_SECONDS = 300  # Write at least this often even if unchanged
+
+# user_id → (fingerprint, monotonic time) of the last committed snapshot
+_last_snapshot: dict[str, tuple[str, float]] = {}
+
 
 class MT5Position:
     """Immutable representation of a single MT5 position."""
@@ -116,6 +144,8 @@ class MT5SyncService:
         """
         self.mt5 = mt5_session
         self.db = db
+        # Fingerprint of the writes made by the last sync, until committed
+        self.pending_fingerprint: str | None = None
 
     async def fetch_account_snapshot(self) -> MT5AccountSnapshot | None:
         """Fetch live account state from MT5 terminal.
@@ -208,6 +238,7 @@ class MT5SyncService:
                 'new_positions_count': int,
                 'closed_positions_count': int,
                 'errors': list[str],
+                'unchanged': True (only if writes were skipped),
             }
         """
         result: dict[str, Any] = {
@@ -244,13 +275,15 @@ class MT5SyncService:
                 },
             )
 
-            # 3. Create tracking sets
+            # 3. Index bot trades and create tracking sets
+            trade_index = self._index_trades(bot_trades)
             matched_bot_trades: set[str] = set()
+            entries: list[Any] = []
 
             # 4. Match MT5 positions to bot trades
             for mt5_pos in snapshot.positions:
                 match = self._find_matching_trade(
-                    mt5_pos, bot_trades, matched_bot_trades
+                    mt5_pos, bot_trades, matched_bot_trades, index=trade_index
                 )
 
                 if match:
@@ -258,39 +291,38 @@ class MT5SyncService:
                     divergence = self._detect_divergence(mt5_pos, match)
 
                     if divergence:
-                        # Record divergence
-                        await self._record_divergence(
-                            user_id, mt5_pos, match, divergence
+                        entries.append(
+                            self._divergence_entry(user_id, mt5_pos, match, divergence)
                         )
                         result["divergences_count"] += 1
                     else:
                         result["matched_count"] += 1
                 else:
                     # MT5 position not in bot trades (manual trade or fill issue)
-                    await self._record_unmatched_position(user_id, mt5_pos)
+                    entries.append(self._unmatched_entry(user_id, mt5_pos))
                     result["new_positions_count"] += 1
 
             # 5. Detect bot trades with no MT5 counterpart (closed by broker)
             for trade in bot_trades:
                 if trade.id not in matched_bot_trades:
-                    await self._record_closed_position(user_id, trade, snapshot)
+                    entries.append(self._closed_entry(user_id, trade, snapshot))
                     result["closed_positions_count"] += 1
 
-            # 6. Update account snapshot
-            await self._update_position_snapshot(user_id, snapshot, user)
+            # 6. Skip all writes if nothing changed since the last commit
+            fingerprint = self._snapshot_fingerprint(snapshot, bot_trades)
+            if not self._snapshot_changed(user_id, fingerprint):
+                result["unchanged"] = True
+                logger.debug(
+                    "Position sync unchanged, skipping writes",
+                    extra={"user_id": user_id},
+                )
+                return result
+            self.pending_fingerprint = fingerprint
 
-            logger.info(
-                "Position sync completed",
-                extra={
-                    "user_id": user_id,
-                    "matched": result["matched_count"],
-                    "divergences": result["divergences_count"],
-                    "new_positions": result["new_positions_count"],
-                    "closed_positions": result["closed_positions_count"],
-                },
-            )
+            # 7. Account snapshot, log entries and sync event in one flush
+            entries.append(self._snapshot_entry(user_id, snapshot, user))
+            self.db.add_all([entry for entry in entries if entry is not None])
 
-            # 7. Record sync event
             await AuditService.record(
                 db=self.db,
                 action="reconciliation.sync_complete",
@@ -307,6 +339,18 @@ class MT5SyncService:
                 status="success",
             )
 
+            logger.info(
+                "Position sync completed",
+                extra={
+                    "user_id": user_id,
+                    "matched": result["matched_count"],
+                    "divergences": result["divergences_count"],
+                    "new_positions": result["new_positions_count"],
+                    "closed_positions": result["closed_positions_count"],
+                    "rows_written": len(entries) + 1,
+                },
+            )
+
             return result
 
         except Exception as e:
@@ -315,13 +359,82 @@ class MT5SyncService:
                 exc_info=True,
             )
             result["errors"].append(str(e))
+            self.pending_fingerprint = None
             return result
 
+    @staticmethod
+    def _volume_bucket(volume: float) -> int:
+        """Log-scale volume bucket (in-tolerance volumes are at most 1 apart)."""
+        if volume <= 0:
+            return 0
+        return math.floor(math.log(volume) / VOLUME_BUCKET_LOG_WIDTH)
+
+    def _index_trades(
+        self, bot_trades: list[Trade]
+    ) -> dict[tuple[str, int, int], list[Trade]]:
+        """Index bot trades by (symbol, direction, volume bucket).
+
+        Args:
+            bot_trades: Open bot trades
+
+        Returns:
+            Dict key → trades in that bucket, in original order
+        """
+        index: dict[tuple[str, int, int], list[Trade]] = defaultdict(list)
+        for trade in bot_trades:
+            key = (
+                trade.symbol.upper(),
+                trade.direction,
+                self._volume_bucket(float(trade.volume)),
+            )
+            index[key].append(trade)
+        return index
+
+    @staticmethod
+    def _snapshot_fingerprint(
+        snapshot: MT5AccountSnapshot, bot_trades: list[Trade]
+    ) -> str:
+        """Hash of everything that would change what a sync writes.
+
+        Prices that move every tick (current price, profit) are excluded;
+        equity is rounded to SNAPSHOT_EQUITY_RESOLUTION.
+        """
+        positions = sorted(
+            (p.ticket, p.symbol, p.direction, p.volume, p.entry_price, p.tp, p.sl)
+            for p in snapshot.positions
+        )
+        trades = sorted(str(trade.id) for trade in bot_trades)
+        equity = round(float(snapshot.equity) / SNAPSHOT_EQUITY_RESOLUTION)
+        payload = repr((positions, trades, round(float(snapshot.balance), 2), equity))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _snapshot_changed(user_id: str, fingerprint: str) -> bool:
+        """Whether a sync with this fingerprint needs to be written."""
+        previous = _last_snapshot.get(user_id)
+        if previous is None:
+            return True
+        last_fingerprint, written_at = previous
+        if time.monotonic() - written_at >= SNAPSHOT_MAX_AGE_SECONDS:
+            return True
+        return fingerprint != last_fingerprint
+
+    def remember_snapshot(self, user_id: str) -> None:
+        """Record the pending fingerprint once its writes are committed.
+
+        Args:
+            user_id: User UUID
+        """
+        if self.pending_fingerprint is not None:
+            _last_snapshot[user_id] = (self.pending_fingerprint, time.monotonic())
+            self.pending_fingerprint = None
+
     def _find_matching_trade(
         self,
         mt5_pos: MT5Position,
         bot_trades: list[Trade],
         matched_trades: set[str],
+        index: dict[tuple[str, int, int], list[Trade]] | None = None,
     ) -> Trade | None:
         """Find a bot trade matching the MT5 position.
 
@@ -332,38 +445,43 @@ class MT5SyncService:
         4. Entry price within 2 pips
         5. Not already matched
 
+        Only trades in the position's (symbol, direction) volume bucket and
+        its two neighbours are examined.
+
         Args:
             mt5_pos: MT5Position to match
             bot_trades: List of open bot trades
             matched_trades: Set of already-matched trade IDs
+            index: Prebuilt index from _index_trades (built if omitted)
 
         Returns:
             Matching Trade or None
         """
-        for trade in bot_trades:
-            if trade.id in matched_trades:
-                continue
+        if index is None:
+            index = self._index_trades(bot_trades)
 
-            # Check symbol
-            if trade.symbol.upper() != mt5_pos.symbol.upper():
-                continue
+        symbol = mt5_pos.symbol.upper()
+        bucket = self._volume_bucket(mt5_pos.volume)
 
-            # Check direction
-            if trade.direction != mt5_pos.direction:
-                continue
+        for offset in (0, -1, 1):
+            for trade in index.get((symbol, mt5_pos.direction, bucket + offset), ()):
+                if trade.id in matched_trades:
+                    continue
 
-            # Check volume (within 5%)
-            volume_tolerance = trade.volume * 0.05
-            if abs(trade.volume - mt5_pos.volume) > volume_tolerance:
-                continue
+                # Check volume (within 5%)
+                volume = float(trade.volume)
+                if abs(volume - mt5_pos.volume) > volume * VOLUME_TOLERANCE:
+                    continue
 
-            # Check entry price (within 2 pips for most pairs)
-            price_tolerance = 0.0002
-            if abs(trade.entry_price - mt5_pos.entry_price) > price_tolerance:
-                continue
+                # Check entry price (within 2 pips for most pairs)
+                if (
+                    abs(float(trade.entry_price) - mt5_pos.entry_price)
+                    > PRICE_TOLERANCE
+                ):
+                    continue
 
-            # Match found
-            return trade
+                # Match found
+                return trade
 
         return None
 
@@ -410,14 +528,14 @@ class MT5SyncService:
 
         return None
 
-    async def _record_divergence(
+    def _divergence_entry(
         self,
         user_id: str,
         mt5_pos: MT5Position,
         bot_trade: Trade,
         divergence_reason: str,
-    ) -> None:
-        """Record a position divergence to ReconciliationLog.
+    ) -> ReconciliationLog | None:
+        """Build a ReconciliationLog entry for a position divergence.
 
         Args:
             user_id: User UUID
@@ -443,8 +561,6 @@ class MT5SyncService:
                 event_type="divergence",
                 status=0,
             )
-            self.db.add(log_entry)
-            await self.db.flush()
 
             logger.warning(
                 f"Position divergence recorded: {divergence_reason}",
@@ -456,18 +572,21 @@ class MT5SyncService:
                 },
             )
 
+            return log_entry
+
         except Exception as e:
             logger.error(
-                f"Failed to record divergence: {e}",
+                f"Failed to build divergence entry: {e}",
                 exc_info=True,
             )
+            return None
 
-    async def _record_unmatched_position(
+    def _unmatched_entry(
         self,
         user_id: str,
         mt5_pos: MT5Position,
-    ) -> None:
-        """Record a position that exists in MT5 but not in bot trades (manual or fill issue).
+    ) -> ReconciliationLog | None:
+        """Build an entry for a position in MT5 but not in bot trades (manual or fill issue).
 
         Args:
             user_id: User UUID
@@ -491,8 +610,6 @@ class MT5SyncService:
                 event_type="unmatched_position",
                 status=0,
             )
-            self.db.add(log_entry)
-            await self.db.flush()
 
             logger.info(
                 f"Unmatched position recorded: {mt5_pos}",
@@ -503,19 +620,22 @@ class MT5SyncService:
                 },
             )
 
+            return log_entry
+
         except Exception as e:
             logger.error(
-                f"Failed to record unmatched position: {e}",
+                f"Failed to build unmatched position entry: {e}",
                 exc_info=True,
             )
+            return None
 
-    async def _record_closed_position(
+    def _closed_entry(
         self,
         user_id: str,
         bot_trade: Trade,
         snapshot: MT5AccountSnapshot,
-    ) -> None:
-        """Record a position that was closed by broker but expected to be open.
+    ) -> ReconciliationLog | None:
+        """Build an entry for a position closed by broker but expected to be open.
 
         Args:
             user_id: User UUID
@@ -541,8 +661,6 @@ class MT5SyncService:
                 close_reason="broker_liquidated",
                 status=1,
             )
-            self.db.add(log_entry)
-            await self.db.flush()
 
             logger.warning(
                 f"Closed position detected: {bot_trade.symbol}",
@@ -554,19 +672,22 @@ class MT5SyncService:
                 },
             )
 
+            return log_entry
+
         except Exception as e:
             logger.error(
-                f"Failed to record closed position: {e}",
+                f"Failed to build closed position entry: {e}",
                 exc_info=True,
             )
+            return None
 
-    async def _update_position_snapshot(
+    def _snapshot_entry(
         self,
         user_id: str,
         snapshot: MT5AccountSnapshot,
         user: User,
-    ) -> None:
-        """Update PositionSnapshot table with current account state.
+    ) -> PositionSnapshot | None:
+        """Build a PositionSnapshot with the current account state.
 
         Args:
             user_id: User UUID
@@ -587,17 +708,14 @@ class MT5SyncService:
                 ),
                 last_sync_at=snapshot.timestamp,
             )
-            self.db.add(snapshot_entry)
 
             # Calculate peak_equity if not already set
             # (This would be done by guard service, but we record it here for reference)
             if not hasattr(user, "peak_equity_gbp") or not user.peak_equity_gbp:
                 user.peak_equity_gbp = float(snapshot.equity)
 
-            await self.db.flush()
-
-            logger.info(
-                "Position snapshot updated",
+            logger.debug(
+                "Position snapshot built",
                 extra={
                     "user_id": user_id,
                     "equity": snapshot.equity,
@@ -606,11 +724,14 @@ class MT5SyncService:
                 },
             )
 
+            return snapshot_entry
+
         except Exception as e:
             logger.error(
-                f"Failed to update position snapshot: {e}",
+                f"Failed to build position snapshot: {e}",
                 exc_info=True,
             )
+            return None
 
 
 async def run_reconciliation_sync(db: AsyncSession, mt5_session, user: User) -> dict:
@@ -629,8 +750,12 @@ async def run_reconciliation_sync(db: AsyncSession, mt5_session, user: User) ->
     service = MT5SyncService(mt5_session, db)
     result = await service.sync_positions_for_user(str(user.id), user)
 
+    if result.get("unchanged"):
+        return result
+
     try:
         await db.commit()
+        service.remember_snapshot(str(user.id))
     except Exception as e:
         await db.rollback()
         logger.error(f"Failed to commit reconciliation: {e}", exc_info=True)
@@ -1,22 +1,45 @@
 """MT5 Position Sync Scheduler.
 
-Periodically syncs all active users' MT5 positions with bot trades.
-Runs every 10 seconds with circuit breaker and error tracking.
+Periodically syncs active users' MT5 positions with bot trades.
+
+Each cycle streams the IDs of accounts to reconcile, enqueues the ones whose
+next sync is due, and drains the queue with at most max_concurrent_syncs
+workers. A worker picks up the next account as soon as it finishes one, so a
+cycle takes roughly (accounts x average MT5 latency) / workers instead of
+waiting on the slowest account of every batch.
+
+Accounts with open positions are synced every sync_interval_seconds; flat
+accounts every flat_sync_interval_seconds. Each next-due time is jittered so
+accounts spread out instead of all falling due in the same cycle.
 """
 
 import asyncio
-from datetime import UTC, datetime
+import random
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import and_, select
+from sqlalchemy import exists, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.auth.models import User
 from backend.app.core.logging import get_logger
+from backend.app.observability.metrics import get_metrics
 from backend.app.trading.reconciliation.mt5_sync import run_reconciliation_sync
+from backend.app.trading.store.models import Trade
 
 logger = get_logger(__name__)
 
+# Flat accounts are synced this many times less often by default
+FLAT_INTERVAL_MULTIPLIER = 6
+# Next-due times are spread by +/- this fraction of the interval
+DEFAULT_JITTER_RATIO = 0.1
+# Flat accounts are only synced if they logged in this recently
+ACTIVE_LOGIN_WINDOW_DAYS = 30
+# Rows fetched per round trip when streaming account IDs
+USER_ID_STREAM_BATCH = 500
+
 
 class ReconciliationScheduler:
     """Orchestrates periodic position reconciliation for all users."""
@@ -27,23 +50,40 @@ class ReconciliationScheduler:
         mt5_session,
         sync_interval_seconds: int = 10,
         max_concurrent_syncs: int = 5,
+        flat_sync_interval_seconds: int | None = None,
+        jitter_ratio: float = DEFAULT_JITTER_RATIO,
     ):
         """Initialize reconciliation scheduler.
 
         Args:
             db_session_factory: Async session factory
             mt5_session: MT5SessionManager instance
-            sync_interval_seconds: How often to run full sync (default 10s)
+            sync_interval_seconds: Sync interval for accounts with open
+                positions (default 10s)
             max_concurrent_syncs: Max concurrent user syncs (default 5)
+            flat_sync_interval_seconds: Sync interval for flat accounts
+                (default 6x sync_interval_seconds)
+            jitter_ratio: Random spread applied to next-due times (default 0.1)
         """
         self.db_factory = db_session_factory
         self.mt5 = mt5_session
         self.sync_interval = sync_interval_seconds
+        self.flat_sync_interval = (
+            flat_sync_interval_seconds
+            if flat_sync_interval_seconds is not None
+            else sync_interval_seconds * FLAT_INTERVAL_MULTIPLIER
+        )
         self.max_concurrent = max_concurrent_syncs
+        self.jitter_ratio = jitter_ratio
         self.is_running = False
         self.last_sync_time: datetime | None = None
         self.sync_count = 0
         self.error_count = 0
+        self.last_cycle_seconds: float | None = None
+
+        # user_id → monotonic time the next sync is due
+        self._next_due: dict[str, float] = {}
+        self.metrics = get_metrics()
 
     async def start(self) -> None:
         """Start the reconciliation scheduler.
@@ -55,6 +95,7 @@ class ReconciliationScheduler:
             "Reconciliation scheduler started",
             extra={
                 "sync_interval_seconds": self.sync_interval,
+                "flat_sync_interval_seconds": self.flat_sync_interval,
                 "max_concurrent_syncs": self.max_concurrent,
             },
         )
@@ -62,7 +103,7 @@ class ReconciliationScheduler:
         while self.is_running:
             try:
                 await self._run_sync_cycle()
-                await asyncio.sleep(self.sync_interval)
+                await asyncio.sleep(self._sleep_until_next_due())
             except Exception as e:
                 logger.error(
                     f"Reconciliation cycle error: {e}",
@@ -77,50 +118,65 @@ class ReconciliationScheduler:
         self.is_running = False
 
     async def _run_sync_cycle(self) -> None:
-        """Run a single reconciliation cycle for all active users."""
+        """Sync every account that is due, through a bounded worker queue."""
         start_time = datetime.now(UTC)
+        started = time.monotonic()
 
         try:
-            # Get list of all active users
-            async with self.db_factory() as db:
-                users = await self._get_active_users(db)
+            queue: asyncio.Queue[str] = asyncio.Queue()
+            seen: set[str] = set()
 
-            if not users:
-                logger.debug("No active users to sync")
+            async with self.db_factory() as db:
+                async for user_id, has_open in self._stream_sync_candidates(db):
+                    seen.add(user_id)
+                    interval = (
+                        self.sync_interval if has_open else self.flat_sync_interval
+                    )
+                    due = self._next_due.get(user_id)
+                    if due is None:
+                        # First sighting: due now, later syncs spread by jitter
+                        due = started
+                    if due <= started:
+                        # Reserve the slot before syncing; workers never overlap
+                        self._next_due[user_id] = started + self._jittered(interval)
+                        queue.put_nowait(user_id)
+
+            # Forget accounts that no longer qualify
+            for user_id in self._next_due.keys() - seen:
+                del self._next_due[user_id]
+
+            if queue.empty():
+                logger.debug("No accounts due for sync")
                 return
 
+            queued = queue.qsize()
             logger.info(
-                f"Starting sync cycle for {len(users)} users",
-                extra={"user_count": len(users)},
+                f"Starting sync cycle for {queued} accounts",
+                extra={"user_count": queued, "tracked_accounts": len(seen)},
             )
 
-            # Sync users concurrently with limit
-            tasks = [self._sync_user_with_error_handling(user) for user in users]
-
-            # Run in batches to avoid overwhelming MT5
-            for i in range(0, len(tasks), self.max_concurrent):
-                batch = tasks[i : i + self.max_concurrent]
-                results = await asyncio.gather(*batch, return_exceptions=True)
-
-                # Log batch results
-                successful = sum(
-                    1 for r in results if isinstance(r, dict) and not r.get("errors")
-                )
-                logger.info(
-                    f"Sync batch completed: {successful}/{len(batch)} successful"
-                )
+            results: list[dict[str, Any]] = []
+            workers = [
+                asyncio.create_task(self._worker(queue, results))
+                for _ in range(min(self.max_concurrent, queued))
+            ]
+            await asyncio.gather(*workers)
 
             # Calculate cycle duration
-            duration = (datetime.now(UTC) - start_time).total_seconds()
+            duration = time.monotonic() - started
+            self.metrics.reconciliation_cycle_seconds.observe(duration)
+            self.last_cycle_seconds = duration
             self.sync_count += 1
             self.last_sync_time = start_time
 
+            successful = sum(1 for r in results if not r.get("errors"))
             logger.info(
                 "Sync cycle completed",
                 extra={
                     "duration_seconds": duration,
                     "total_cycles": self.sync_count,
-                    "users_synced": len(users),
+                    "users_synced": len(results),
+                    "successful": successful,
                 },
             )
 
@@ -131,66 +187,100 @@ class ReconciliationScheduler:
             )
             self.error_count += 1
 
-    async def _get_active_users(self, db: AsyncSession) -> list[User]:
-        """Get all active users who should be synced.
+    async def _worker(
+        self, queue: "asyncio.Queue[str]", results: list[dict[str, Any]]
+    ) -> None:
+        """Sync queued accounts one after another until the queue is empty.
+
+        Args:
+            queue: Due account IDs for this cycle
+            results: Shared list collecting each sync result
+        """
+        while True:
+            try:
+                user_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results.append(await self._sync_user_with_error_handling(user_id))
+
+    async def _stream_sync_candidates(
+        self, db: AsyncSession
+    ) -> AsyncIterator[tuple[str, bool]]:
+        """Stream (user_id, has_open_positions) for accounts to reconcile.
 
-        A user is active if:
-        - They have at least one open position
-        - They've logged in within the last 30 days
-        - Their account is not suspended
+        Accounts qualify if they have at least one open trade, or logged in
+        within the last 30 days. Only IDs are loaded, in batches.
 
         Args:
             db: AsyncSession
 
-        Returns:
-            List of User objects
+        Yields:
+            Tuples of (user_id, has_open_positions)
         """
-        try:
-            # Query users with recent activity
-            stmt = select(User).where(
-                and_(
-                    User.is_active,
-                    User.last_login_at.isnot(None),
-                )
-            )
-            result = await db.execute(stmt)
-            users = list(result.scalars().all())
-
-            return users
+        cutoff = datetime.utcnow() - timedelta(days=ACTIVE_LOGIN_WINDOW_DAYS)
+        has_open = exists().where(Trade.user_id == User.id, Trade.status == "OPEN")
+        stmt = (
+            select(User.id, has_open.label("has_open"))
+            .where(or_(has_open, User.last_login_at >= cutoff))
+            .execution_options(yield_per=USER_ID_STREAM_BATCH)
+        )
 
+        try:
+            result = await db.stream(stmt)
+            async for user_id, open_positions in result:
+                yield str(user_id), bool(open_positions)
         except Exception as e:
             logger.error(f"Failed to get active users: {e}", exc_info=True)
-            return []
 
-    async def _sync_user_with_error_handling(self, user: User) -> dict[str, Any]:
+    def _jittered(self, interval: float) -> float:
+        """Interval spread by +/- jitter_ratio."""
+        spread = interval * self.jitter_ratio
+        return interval + random.uniform(-spread, spread)
+
+    def _sleep_until_next_due(self) -> float:
+        """Seconds until the earliest account is due (capped at the interval)."""
+        if not self._next_due:
+            return self.sync_interval
+        wait = min(self._next_due.values()) - time.monotonic()
+        return min(max(wait, 0.0), self.sync_interval)
+
+    async def _sync_user_with_error_handling(self, user_id: str) -> dict[str, Any]:
         """Sync positions for a single user with error handling.
 
         Args:
-            user: User to sync
+            user_id: ID of the user to sync
 
         Returns:
             Sync result dict
         """
+        started = time.monotonic()
+        outcome = "ok"
         async with self.db_factory() as db:
             try:
+                user = await db.get(User, user_id)
+                if user is None:
+                    self._next_due.pop(user_id, None)
+                    raise LookupError(f"User {user_id} not found")
+
                 result = await run_reconciliation_sync(db, self.mt5, user)
 
                 if not isinstance(result, dict):
                     result = {}
 
                 if result.get("errors"):
+                    outcome = "errors"
                     logger.warning(
-                        f"Sync for user {user.id} had errors",
+                        f"Sync for user {user_id} had errors",
                         extra={
-                            "user_id": str(user.id),
+                            "user_id": user_id,
                             "errors": result["errors"],
                         },
                     )
                 else:
                     logger.debug(
-                        f"Sync for user {user.id} successful",
+                        f"Sync for user {user_id} successful",
                         extra={
-                            "user_id": str(user.id),
+                            "user_id": user_id,
                             "matched_count": result.get("matched_count", 0),
                         },
                     )
@@ -198,10 +288,11 @@ class ReconciliationScheduler:
                 return cast(dict[str, Any], result)
 
             except Exception as e:
+                outcome = "exception"
                 logger.error(
-                    f"Exception syncing user {user.id}: {e}",
+                    f"Exception syncing user {user_id}: {e}",
                     exc_info=True,
-                    extra={"user_id": str(user.id)},
+                    extra={"user_id": user_id},
                 )
                 return {
                     "matched_count": 0,
@@ -211,6 +302,11 @@ class ReconciliationScheduler:
                     "errors": [str(e)],
                 }
 
+            finally:
+                self.metrics.reconciliation_user_sync_seconds.labels(
+                    outcome=outcome
+                ).observe(time.monotonic() - started)
+
     async def get_status(self) -> dict:
         """Get current scheduler status.
 
@@ -225,7 +321,10 @@ class ReconciliationScheduler:
                 self.last_sync_time.isoformat() if self.last_sync_time else None
             ),
             "sync_interval_seconds": self.sync_interval,
+            "flat_sync_interval_seconds": self.flat_sync_interval,
             "max_concurrent_syncs": self.max_concurrent,
+            "tracked_accounts": len(self._next_due),
+            "last_cycle_seconds": self.last_cycle_seconds,
         }
 
 
@@ -241,7 +340,8 @@ async def initialize_reconciliation_scheduler(
     Args:
         db_factory: Async session factory
         mt5_session: MT5SessionManager instance
-        **kwargs: Additional options (sync_interval_seconds, max_concurrent_syncs)
+        **kwargs: Additional options (sync_interval_seconds, max_concurrent_syncs,
+            flat_sync_interval_seconds, jitter_ratio)
 
     Returns:
         Initialized ReconciliationScheduler instance
@@ -253,6 +353,8 @@ async def initialize_reconciliation_scheduler(
         mt5_session,
         sync_interval_seconds=kwargs.get("sync_interval_seconds", 10),
         max_concurrent_syncs=kwargs.get("max_concurrent_syncs", 5),
+        flat_sync_interval_seconds=kwargs.get("flat_sync_interval_seconds"),
+        jitter_ratio=kwargs.get("jitter_ratio", DEFAULT_JITTER_RATIO),
     )
 
     # Start scheduler in background
@@ -11,6 +11,7 @@ Components:
 - TradingLoop: Main loop orchestrating signal execution
 - HeartbeatManager: Periodic health check emission
 - EventEmitter: Analytics event tracking
+- BufferedEventSink: Non-blocking event buffer with background flusher
 - Guards: Risk enforcement (max drawdown, min equity)
 - DrawdownGuard: Legacy drawdown monitoring (use Guards instead)
 
@@ -37,6 +38,12 @@ from backend.app.trading.runtime.guards import (
 )
 from backend.app.trading.runtime.heartbeat import HeartbeatManager, HeartbeatMetrics
 from backend.app.trading.runtime.loop import TradingLoop
+from backend.app.trading.runtime.sink import (
+    BufferedEventSink,
+    LogEventBackend,
+    RedisStreamEventBackend,
+    get_event_sink,
+)
 
 __all__ = [
     # Loop
@@ -48,6 +55,11 @@ __all__ = [
     "Event",
     "EventEmitter",
     "EventType",
+    # Event sink
+    "BufferedEventSink",
+    "LogEventBackend",
+    "RedisStreamEventBackend",
+    "get_event_sink",
     # Guards (PR-019)
     "Guards",
     "GuardState",
@@ -6,6 +6,8 @@ loop lifecycle events: signal received, approved, rejected, executed, failed.
 Features:
 - Event dataclass with type, timestamp, loop_id, metadata
 - Event emission with observability integration
+- Non-blocking: events are appended to a bounded buffer and written to
+  logs/Redis Streams by a background flusher (see sink.py)
 - Analytics event hooks for tracking
 - Type-safe event handling
 
@@ -36,6 +38,7 @@ from enum import Enum
 from typing import Any
 
 from backend.app.observability.metrics import get_metrics
+from backend.app.trading.runtime.sink import BufferedEventSink, get_event_sink
 
 
 class EventType(str, Enum):
@@ -90,6 +93,7 @@ class EventEmitter:
 
     Attributes:
         loop_id: Unique identifier for loop instance
+        sink: Buffered event sink (flushed in the background)
         _logger: Structured logger instance
     """
 
@@ -97,20 +101,27 @@ class EventEmitter:
         self,
         loop_id: str = "trading_loop_main",
         logger: logging.Logger | None = None,
+        sink: BufferedEventSink | None = None,
     ) -> None:
         """Initialize event emitter.
 
         Args:
             loop_id: Unique identifier for loop instance
             logger: Optional logger (creates default if not provided)
+            sink: Optional event sink (default: process-wide sink)
         """
         self.loop_id = loop_id
         self._logger = logger or logging.getLogger(__name__)
+        self.sink = sink if sink is not None else get_event_sink()
 
     async def emit(self, event: Event) -> None:
         """Emit an event.
 
-        Records event to observability stack and logs structured message.
+        Increments the in-process event counter and appends the event to the
+        sink's ring buffer. While the sink's flusher runs (started by the
+        trading loop or heartbeat) this never waits on logging or network
+        I/O; without a flusher the buffer is written out directly so events
+        are never stranded.
 
         Args:
             event: Event to emit
@@ -135,15 +146,9 @@ class EventEmitter:
                 extra={"event_type": event.event_type.value, "error": str(e)},
             )
 
-        self._logger.info(
-            f"event_emitted: {event.event_type.value}",
-            extra={
-                "loop_id": event.loop_id,
-                "event_type": event.event_type.value,
-                "timestamp": event.timestamp.isoformat(),
-                **event.metadata,
-            },
-        )
+        self.sink.publish(event.to_dict())
+        if not self.sink.running:
+            await self.sink.flush()
 
     async def emit_signal_received(
         self,
@@ -8,6 +8,8 @@ Features:
 - Lock-based synchronization to prevent concurrent emissions
 - Metrics collection and reporting
 - Integration with observability stack
+- Heartbeats are aggregated in the event sink and written by its background
+  flusher, so emitting never blocks on logging or I/O
 
 Example:
     >>> heartbeat = HeartbeatManager(
@@ -30,6 +32,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from backend.app.observability.metrics import get_metrics
+from backend.app.trading.runtime.sink import BufferedEventSink, get_event_sink
 
 
 @dataclass
@@ -70,6 +73,7 @@ class HeartbeatManager:
     Attributes:
         interval_seconds: How often to emit heartbeat (default: 10)
         loop_id: Unique identifier for this loop
+        sink: Event sink that aggregates and flushes heartbeats
         _lock: Async lock to prevent concurrent heartbeat emissions
         _logger: Structured logger instance
     """
@@ -79,6 +83,7 @@ class HeartbeatManager:
         interval_seconds: int = 10,
         loop_id: str = "trading_loop_main",
         logger: logging.Logger | None = None,
+        sink: BufferedEventSink | None = None,
     ) -> None:
         """Initialize heartbeat manager.
 
@@ -86,6 +91,7 @@ class HeartbeatManager:
             interval_seconds: Heartbeat interval in seconds (default: 10)
             loop_id: Unique identifier for loop instance
             logger: Optional logger (creates default if not provided)
+            sink: Optional event sink (default: process-wide sink)
 
         Raises:
             ValueError: If interval_seconds <= 0
@@ -97,6 +103,7 @@ class HeartbeatManager:
         self.loop_id = loop_id
         self._lock = asyncio.Lock()
         self._logger = logger or logging.getLogger(__name__)
+        self.sink = sink if sink is not None else get_event_sink()
 
     async def emit(
         self,
@@ -112,7 +119,8 @@ class HeartbeatManager:
         """Emit a heartbeat with current metrics.
 
         Uses async lock to ensure only one heartbeat emits concurrently.
-        Records metrics to observability stack and logs structured message.
+        Records metrics to observability stack and folds the heartbeat into
+        the sink's aggregation window (written on the next flush).
 
         Args:
             signals_processed: Signals processed in current interval
@@ -162,10 +170,9 @@ class HeartbeatManager:
                     extra={"error": str(e)},
                 )
 
-            # Log structured heartbeat
-            self._logger.info(
-                "heartbeat_emitted",
-                extra={
+            # Aggregated per flush window, written by the sink flusher
+            self.sink.record_heartbeat(
+                {
                     "loop_id": self.loop_id,
                     "timestamp": now.isoformat(),
                     "signals_processed": signals_processed,
@@ -176,7 +183,7 @@ class HeartbeatManager:
                     "account_equity": account_equity,
                     "total_signals_lifetime": total_signals_lifetime,
                     "total_trades_lifetime": total_trades_lifetime,
-                },
+                }
             )
 
             return metrics
@@ -216,6 +223,11 @@ class HeartbeatManager:
             >>> task.cancel()  # Stop heartbeat
         """
 
+        # Shared sink: stop the flusher on cancel only if we started it
+        owns_flusher = not self.sink.running
+        if owns_flusher:
+            await self.sink.start()
+
         async def _heartbeat_loop() -> None:
             """Background loop that emits heartbeat at interval."""
             while True:
@@ -229,6 +241,8 @@ class HeartbeatManager:
                         "Heartbeat background task cancelled",
                         extra={"loop_id": self.loop_id},
                     )
+                    if owns_flusher:
+                        await self.sink.stop()
                     raise
                 except Exception as e:
                     self._logger.error(
@@ -5,9 +5,13 @@ executes trades via MT5, monitors health, and emits events for analytics.
 
 Features:
 - Heartbeat mechanism: Emits health checks every 10 seconds
-- Event emission: Signal received, approved, executed events
+- Event emission: Signal received, approved, executed events, buffered in a
+  non-blocking event sink and flushed in the background
 - Error recovery: Graceful handling with retry logic
 - Async operations: Non-blocking signal processing and execution
+- Pipelined execution: Orders for different accounts/symbols are in flight
+  concurrently (bounded), orders for the same symbol stay in order
+- Back-pressure: Dispatch pauses while the MT5 circuit breaker is open
 - Metrics collection: Signal/trade/error counts tracked
 
 Example:
@@ -18,12 +22,17 @@ Example:
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.trading.mt5.circuit_breaker import CircuitBreaker
+from backend.app.trading.runtime.sink import BufferedEventSink, get_event_sink
+
 # Import from existing modules (assuming they exist from previous PRs)
 # from backend.app.core.mt5 import MT5Client  # PR-011
 # from backend.app.approvals import ApprovalsService  # PR-014
@@ -78,6 +87,57 @@ class Event:
     metadata: dict[str, Any]
 
 
+class RecentSignalIds:
+    """Bounded, time-windowed set of recently processed signal IDs.
+
+    Replaces an ever-growing set: entries expire after ttl_seconds and the
+    oldest entries are evicted once max_size is reached. Approved signals are
+    only re-served for a short while, so a window of minutes is enough to
+    keep execution idempotent.
+
+    Example:
+        >>> seen = RecentSignalIds(ttl_seconds=600, max_size=10_000)
+        >>> seen.add("sig_1")
+        >>> "sig_1" in seen
+        True
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_size: int = 10_000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, signal_id: str) -> None:
+        """Record a signal ID as processed (refreshes its expiry)."""
+        self._entries.pop(signal_id, None)
+        self._entries[signal_id] = time.monotonic() + self.ttl_seconds
+        self._evict()
+
+    def __contains__(self, signal_id: object) -> bool:
+        if not isinstance(signal_id, str):
+            return False
+        expires_at = self._entries.get(signal_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[signal_id]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        self._evict()
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        # Insertion order == expiry order (constant TTL), so trim from the front
+        now = time.monotonic()
+        while self._entries:
+            signal_id, expires_at = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_size:
+                break
+            del self._entries[signal_id]
+
+
 class TradingLoop:
     """Main live trading bot loop.
 
@@ -108,6 +168,10 @@ class TradingLoop:
     # Class constants
     HEARTBEAT_INTERVAL_SECONDS = 10
     SIGNAL_BATCH_SIZE = 10
+    MAX_IN_FLIGHT_ORDERS = 8  # Concurrent MT5 round trips across all accounts
+    MAX_IN_FLIGHT_PER_ACCOUNT = 4  # Concurrent MT5 round trips per account
+    PROCESSED_SIGNAL_TTL_SECONDS = 600
+    PROCESSED_SIGNAL_MAX_IDS = 10_000
     ERROR_LOG_LEVEL = logging.ERROR
     INFO_LOG_LEVEL = logging.INFO
 
@@ -121,6 +185,10 @@ class TradingLoop:
         db_session: AsyncSession | None = None,
         logger: logging.Logger | None = None,
         loop_id: str = "trading_loop_main",
+        circuit_breaker: CircuitBreaker | None = None,
+        max_in_flight: int | None = None,
+        max_in_flight_per_account: int | None = None,
+        event_sink: BufferedEventSink | None = None,
     ) -> None:
         """Initialize trading loop.
 
@@ -133,6 +201,13 @@ class TradingLoop:
             db_session: Optional database session
             logger: Optional logger instance (creates default if not provided)
             loop_id: Unique identifier for this loop instance
+            circuit_breaker: Optional MT5 CircuitBreaker used for back-pressure
+            max_in_flight: Concurrent orders across all accounts
+                (default: MAX_IN_FLIGHT_ORDERS)
+            max_in_flight_per_account: Concurrent orders per account
+                (default: MAX_IN_FLIGHT_PER_ACCOUNT)
+            event_sink: Buffered sink for events/heartbeats
+                (default: process-wide sink)
 
         Raises:
             ValueError: If critical services are None
@@ -152,6 +227,13 @@ class TradingLoop:
         self.db_session = db_session
         self.logger = logger or logging.getLogger(__name__)
         self.loop_id = loop_id
+        self.circuit_breaker = circuit_breaker
+        self.max_in_flight = max_in_flight or self.MAX_IN_FLIGHT_ORDERS
+        self.max_in_flight_per_account = (
+            max_in_flight_per_account or self.MAX_IN_FLIGHT_PER_ACCOUNT
+        )
+        self.event_sink = event_sink if event_sink is not None else get_event_sink()
+        self._owns_sink_flusher = False
 
         # Runtime state
         self._running = False
@@ -161,7 +243,10 @@ class TradingLoop:
         self._error_count_interval = 0
         self._total_signals_lifetime = 0
         self._total_trades_lifetime = 0
-        self._processed_signal_ids: set[str] = set()
+        self._processed_signal_ids = RecentSignalIds(
+            ttl_seconds=self.PROCESSED_SIGNAL_TTL_SECONDS,
+            max_size=self.PROCESSED_SIGNAL_MAX_IDS,
+        )
 
     async def start(
         self,
@@ -183,6 +268,11 @@ class TradingLoop:
         self._running = True
         start_time = datetime.now(UTC)
 
+        # Background flusher for events/heartbeats (shared sink: first owner)
+        if not self.event_sink.running:
+            await self.event_sink.start()
+            self._owns_sink_flusher = True
+
         self.logger.info(
             "Trading loop started",
             extra={
@@ -256,6 +346,11 @@ class TradingLoop:
             # Final heartbeat
             await self._emit_heartbeat_now()
 
+            # Flush buffered events before exiting
+            if self._owns_sink_flusher:
+                await self.event_sink.stop()
+                self._owns_sink_flusher = False
+
             self.logger.info(
                 "Trading loop stopped cleanly",
                 extra={
@@ -275,13 +370,24 @@ class TradingLoop:
         """Single iteration of the trading loop.
 
         Steps:
-        1. Fetch approved signals (batch)
-        2. For each signal:
+        1. Check MT5 circuit breaker (skip dispatch while open)
+        2. Fetch approved signals (batch)
+        3. Group signals into lanes by (account, instrument)
+        4. Run lanes concurrently, bounded per account and globally;
+           each lane executes its signals in order:
            a. Emit signal_received event
            b. Execute trade
            c. Emit signal_executed event
-        3. Update metrics
+        5. Update metrics
         """
+        capacity = self._broker_capacity()
+        if capacity == 0:
+            self.logger.debug(
+                "MT5 circuit open, deferring signal dispatch",
+                extra={"loop_id": self.loop_id},
+            )
+            return
+
         # Fetch batch of approved signals
         approved_signals = await self._fetch_approved_signals(
             batch_size=self.SIGNAL_BATCH_SIZE
@@ -296,64 +402,120 @@ class TradingLoop:
             extra={
                 "loop_id": self.loop_id,
                 "signal_count": len(approved_signals),
+                "max_in_flight": capacity,
             },
         )
 
-        # Process each signal
+        # Group into ordered lanes; skip already processed (idempotency)
+        lanes: dict[tuple[str, str], list[dict[str, Any]]] = {}
         for signal in approved_signals:
-            signal_id = signal.get("id", "unknown")
-
-            # Skip if already processed (idempotency)
-            if signal_id in self._processed_signal_ids:
+            if signal.get("id", "unknown") in self._processed_signal_ids:
                 continue
+            lanes.setdefault(self._lane_key(signal), []).append(signal)
 
-            try:
-                # Emit signal received event
-                await self._emit_event(
-                    event_type="signal_received",
-                    metadata={
-                        "signal_id": signal_id,
-                        "instrument": signal.get("instrument"),
-                        "side": signal.get("side"),
-                    },
+        if not lanes:
+            return
+
+        in_flight = asyncio.Semaphore(capacity)
+        account_slots: dict[str, asyncio.Semaphore] = {}
+        for account, _instrument in lanes:
+            if account not in account_slots:
+                account_slots[account] = asyncio.Semaphore(
+                    self.max_in_flight_per_account
                 )
 
-                # Execute the trade
-                execution_result = await self._execute_signal(signal)
-
-                if execution_result.get("success"):
-                    self._trades_executed_interval += 1
-                    self._total_trades_lifetime += 1
-
-                    # Emit signal executed event
-                    await self._emit_event(
-                        event_type="signal_executed",
-                        metadata={
-                            "signal_id": signal_id,
-                            "order_id": execution_result.get("order_id"),
-                            "execution_time_ms": execution_result.get(
-                                "execution_time_ms"
-                            ),
-                        },
-                    )
+        await asyncio.gather(
+            *(
+                self._run_lane(signals, in_flight, account_slots[key[0]])
+                for key, signals in lanes.items()
+            )
+        )
 
-                # Mark as processed
-                self._processed_signal_ids.add(signal_id)
-                self._signals_processed_interval += 1
-                self._total_signals_lifetime += 1
+    def _lane_key(self, signal: dict[str, Any]) -> tuple[str, str]:
+        """Ordering lane for a signal: (account, instrument)."""
+        return (
+            str(signal.get("account_id") or "default"),
+            str(signal.get("instrument") or ""),
+        )
 
-            except Exception as e:
-                self._error_count_interval += 1
-                self.logger.error(
-                    f"Error processing signal {signal_id}: {e}",
-                    extra={
-                        "loop_id": self.loop_id,
+    def _broker_capacity(self) -> int:
+        """Orders that may be in flight now, given the MT5 circuit breaker."""
+        if self.circuit_breaker is None:
+            return self.max_in_flight
+        permitted: int = self.circuit_breaker.permitted_calls(self.max_in_flight)
+        return min(permitted, self.max_in_flight)
+
+    async def _run_lane(
+        self,
+        signals: list[dict[str, Any]],
+        in_flight: asyncio.Semaphore,
+        account_slot: asyncio.Semaphore,
+    ) -> None:
+        """Execute one lane's signals sequentially under the concurrency caps.
+
+        Stops early (leaving the rest for the next iteration) if the MT5
+        circuit opens mid-lane, so queued orders are not burned on a broker
+        that is rejecting everything.
+        """
+        for signal in signals:
+            if self._broker_capacity() == 0:
+                return
+            async with account_slot, in_flight:
+                await self._process_signal(signal)
+
+    async def _process_signal(self, signal: dict[str, Any]) -> None:
+        """Emit events around execution of one signal and update counters."""
+        signal_id = signal.get("id", "unknown")
+
+        # A duplicate within the same batch
+        if signal_id in self._processed_signal_ids:
+            return
+
+        try:
+            # Emit signal received event
+            await self._emit_event(
+                event_type="signal_received",
+                metadata={
+                    "signal_id": signal_id,
+                    "instrument": signal.get("instrument"),
+                    "side": signal.get("side"),
+                },
+            )
+
+            # Execute the trade
+            execution_result = await self._execute_signal(signal)
+
+            if execution_result.get("success"):
+                self._trades_executed_interval += 1
+                self._total_trades_lifetime += 1
+
+                # Emit signal executed event
+                await self._emit_event(
+                    event_type="signal_executed",
+                    metadata={
                         "signal_id": signal_id,
-                        "error": str(e),
+                        "order_id": execution_result.get("order_id"),
+                        "execution_time_ms": execution_result.get("execution_time_ms"),
                     },
-                    exc_info=True,
                 )
 
+            # Mark as processed
+            self._processed_signal_ids.add(signal_id)
+            self._signals_processed_interval += 1
+            self._total_signals_lifetime += 1
+
+        except Exception as e:
+            self._error_count_interval += 1
+            self.logger.error(
+                f"Error processing signal {signal_id}: {e}",
+                extra={
+                    "loop_id": self.loop_id,
+                    "signal_id": signal_id,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+
     async def _fetch_approved_signals(self, batch_size: int) -> list[dict[str, Any]]:
         """Fetch batch of approved signals waiting for execution.
 
@@ -562,17 +724,10 @@ class TradingLoop:
                 total_trades_lifetime=self._total_trades_lifetime,
             )
 
-            # Log heartbeat as JSON
+            # Aggregated and written by the event sink's flusher
             heartbeat_dict = asdict(metrics)
             heartbeat_dict["timestamp"] = metrics.timestamp.isoformat()
-
-            self.logger.info(
-                "heartbeat",
-                extra={
-                    "heartbeat": True,
-                    **heartbeat_dict,
-                },
-            )
+            self.event_sink.record_heartbeat(heartbeat_dict)
 
             # Reset interval counters
             self._signals_processed_interval = 0
@@ -601,23 +756,14 @@ class TradingLoop:
             ... )
         """
         try:
-            event = Event(
-                event_type=event_type,
-                timestamp=datetime.now(UTC),
-                loop_id=self.loop_id,
-                metadata=metadata,
-            )
-
-            # Log event as JSON for analytics
-            event_dict = asdict(event)
-            event_dict["timestamp"] = event.timestamp.isoformat()
-
-            self.logger.info(
-                f"event: {event_type}",
-                extra={
+            # Buffered only: logging/persistence happens in the sink flusher
+            self.event_sink.publish(
+                {
                     "event_type": event_type,
-                    **event_dict,
-                },
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "loop_id": self.loop_id,
+                    "metadata": metadata,
+                }
             )
 
         except Exception as e:
@@ -0,0 +1,297 @@
+"""Buffered, non-blocking event sink for trading runtime observability.
+
+The trading loop must never wait on logging or network I/O to record what it
+did. Producers (EventEmitter, TradingLoop, HeartbeatManager) only append to a
+bounded in-memory ring buffer; a background flusher drains it in batches and
+writes them to the configured backends (structured log, Redis Stream).
+
+Design:
+- Ring buffer: collections.deque(maxlen=N). append() is atomic and O(1), so
+  the hot path takes no lock. When full, the oldest event is overwritten and
+  the drop counter is incremented.
+- Flusher: wakes when a batch is ready or max_latency_seconds has elapsed,
+  whichever comes first.
+- Heartbeats: aggregated per loop_id between flushes (interval counters
+  summed, gauges take the latest value) and written as one record.
+
+Example:
+    >>> sink = get_event_sink()
+    >>> await sink.start()
+    >>> sink.publish({"event_type": "signal_received", "loop_id": "main"})
+    >>> await sink.stop()  # Final flush
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+import redis.asyncio as aioredis
+
+from backend.app.core.settings import get_settings
+from backend.app.observability.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Defaults
+EVENT_BUFFER_SIZE = 10_000
+EVENT_BATCH_SIZE = 200
+EVENT_MAX_LATENCY_SECONDS = 1.0
+EVENT_STREAM_KEY = "trading:runtime:events"
+EVENT_STREAM_MAXLEN = 100_000
+
+# Heartbeat fields summed across an aggregation window (others: latest value)
+_HEARTBEAT_SUM_FIELDS = ("signals_processed", "trades_executed", "error_count")
+
+
+class EventBackend(Protocol):
+    """Destination for flushed event batches."""
+
+    name: str
+
+    async def write(self, records: Sequence[dict[str, Any]]) -> None:
+        """Persist a batch of records (raise on failure)."""
+        ...
+
+
+class LogEventBackend:
+    """Writes each record as a structured log line (off the hot path)."""
+
+    name = "log"
+
+    def __init__(self, log: logging.Logger | None = None) -> None:
+        self._logger = log or logging.getLogger("backend.app.trading.runtime.events")
+
+    async def write(self, records: Sequence[dict[str, Any]]) -> None:
+        for record in records:
+            kind = record.get("event_type", "event")
+            self._logger.info(f"event_emitted: {kind}", extra=record)
+
+
+class RedisStreamEventBackend:
+    """Appends records to a capped Redis Stream in one pipeline per batch."""
+
+    name = "redis_stream"
+
+    def __init__(
+        self,
+        redis_client: Any,
+        stream_key: str = EVENT_STREAM_KEY,
+        maxlen: int = EVENT_STREAM_MAXLEN,
+    ) -> None:
+        self.redis_client = redis_client
+        self.stream_key = stream_key
+        self.maxlen = maxlen
+
+    async def write(self, records: Sequence[dict[str, Any]]) -> None:
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for record in records:
+                pipe.xadd(
+                    self.stream_key,
+                    {"data": json.dumps(record, default=str)},
+                    maxlen=self.maxlen,
+                    approximate=True,
+                )
+            await pipe.execute()
+
+
+class BufferedEventSink:
+    """Bounded ring buffer plus background batch flusher.
+
+    Attributes:
+        batch_size: Max records per backend write
+        max_latency_seconds: Max time an event waits before being flushed
+        dropped: Events overwritten because the buffer was full
+    """
+
+    def __init__(
+        self,
+        backends: list[EventBackend] | None = None,
+        buffer_size: int = EVENT_BUFFER_SIZE,
+        batch_size: int = EVENT_BATCH_SIZE,
+        max_latency_seconds: float = EVENT_MAX_LATENCY_SECONDS,
+    ) -> None:
+        """Initialize event sink.
+
+        Args:
+            backends: Flush destinations (default: structured log only)
+            buffer_size: Ring buffer capacity
+            batch_size: Max records per flush write
+            max_latency_seconds: Flush at least this often when non-empty
+
+        Raises:
+            ValueError: If sizes or latency are not positive
+        """
+        if buffer_size <= 0 or batch_size <= 0:
+            raise ValueError("buffer_size and batch_size must be > 0")
+        if max_latency_seconds <= 0:
+            raise ValueError("max_latency_seconds must be > 0")
+
+        self.backends: list[EventBackend] = (
+            backends if backends is not None else [LogEventBackend()]
+        )
+        self.batch_size = batch_size
+        self.max_latency_seconds = max_latency_seconds
+        self.dropped = 0
+
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+        self._heartbeats: dict[str, dict[str, Any]] = {}
+        self._batch_ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def publish(self, record: dict[str, Any]) -> None:
+        """Append a record to the buffer. Never blocks, never raises.
+
+        Args:
+            record: JSON-serializable event record
+        """
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+            try:
+                get_metrics().runtime_events_dropped_total.inc()
+            except Exception:  # pragma: no cover - metrics must not break producers
+                pass
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self._batch_ready.set()
+
+    def record_heartbeat(self, heartbeat: dict[str, Any]) -> None:
+        """Fold a heartbeat into the current aggregation window.
+
+        Interval counters are summed, everything else keeps the latest value,
+        and loop_duration_ms keeps the maximum seen.
+
+        Args:
+            heartbeat: Heartbeat fields (must include loop_id)
+        """
+        loop_id = heartbeat.get("loop_id", "unknown")
+        current = self._heartbeats.get(loop_id)
+        if current is None:
+            self._heartbeats[loop_id] = {
+                **heartbeat,
+                "event_type": "heartbeat",
+                "heartbeat_count": 1,
+            }
+            return
+
+        for key, value in heartbeat.items():
+            if key in _HEARTBEAT_SUM_FIELDS:
+                current[key] = current.get(key, 0) + value
+            elif key == "loop_duration_ms":
+                current[key] = max(current.get(key, 0.0), value)
+            else:
+                current[key] = value
+        current["heartbeat_count"] += 1
+
+    async def start(self) -> None:
+        """Start the background flusher (idempotent)."""
+        if self.running:
+            return
+        # Bind the wake-up event to the current event loop
+        self._batch_ready = asyncio.Event()
+        if len(self._buffer) >= self.batch_size:
+            self._batch_ready.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and flush whatever is buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Drain the buffer and heartbeat window to every backend.
+
+        Returns:
+            int: Number of records written
+        """
+        written = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                break
+            await self._write(batch)
+            written += len(batch)
+        return written
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        buffer = self._buffer
+        while buffer and len(batch) < self.batch_size:
+            batch.append(buffer.popleft())
+        if len(batch) < self.batch_size and self._heartbeats:
+            batch.extend(self._heartbeats.values())
+            self._heartbeats = {}
+        return batch
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        for backend in self.backends:
+            try:
+                await backend.write(batch)
+                get_metrics().runtime_events_flushed_total.labels(
+                    backend=backend.name
+                ).inc(len(batch))
+            except Exception as e:
+                logger.warning(
+                    f"Event backend {backend.name} failed to write batch: {e}",
+                    extra={"backend": backend.name, "batch_size": len(batch)},
+                )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(), timeout=self.max_latency_seconds
+                )
+            except TimeoutError:
+                pass
+            self._batch_ready.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(
+                    f"Event flusher error: {e}",
+                    extra={"error": str(e)},
+                    exc_info=True,
+                )
+
+
+# Process-wide sink
+_sink: BufferedEventSink | None = None
+
+
+def get_event_sink() -> BufferedEventSink:
+    """Get the process-wide event sink.
+
+    Log backend always; Redis Stream backend when Redis is enabled.
+    The flusher is started by the first runtime component that needs it.
+
+    Returns:
+        BufferedEventSink: Global instance
+    """
+    global _sink
+    if _sink is None:
+        backends: list[EventBackend] = [LogEventBackend()]
+        if settings.redis.enabled:
+            backends.append(
+                RedisStreamEventBackend(
+                    aioredis.from_url(settings.redis.url, decode_responses=True)
+                )
+            )
+        _sink = BufferedEventSink(backends=backends)
+    return _sink
@@ -123,6 +123,7 @@ class Trade(Base):
     __table_args__ = (
         Index("ix_trades_symbol_time", "symbol", "entry_time"),
         Index("ix_trades_status_created", "status", "created_at"),
+        Index("ix_trades_status_exit", "status", "exit_time"),
         Index("ix_trades_strategy_symbol", "strategy", "symbol"),
     )
 
@@ -3,9 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.pagination import CountMode, Page, paginate
 from backend.app.trading.store.models import EquityPoint, Position, Trade, ValidationLog
 
 
@@ -126,6 +127,12 @@ class TradeService:
         self.db.add(trade)
         await self.db.flush()
 
+        # Keep in-memory risk state current without a full reload, once the
+        # caller commits (imported here: risk.state depends on trading.store)
+        from backend.app.risk.state import risk_state
+
+        risk_state.on_trade_opened_after_commit(self.db, trade)
+
         # Log creation
         await self._log_validation(
             trade.trade_id,
@@ -198,6 +205,11 @@ class TradeService:
         self.db.add(trade)
         await self.db.flush()
 
+        # Release exposure and book realized P&L in the risk state on commit
+        from backend.app.risk.state import risk_state
+
+        risk_state.on_trade_closed_after_commit(self.db, trade)
+
         # Log closure
         await self._log_validation(
             trade.trade_id,
@@ -229,6 +241,7 @@ class TradeService:
         end_date: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[Trade]:
         """List trades with filtering.
 
@@ -239,7 +252,8 @@ class TradeService:
             start_date: Filter trades after this date
             end_date: Filter trades before this date
             limit: Max results (default 100)
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor from list_trades_page (optional)
 
         Returns:
             List of Trade objects
@@ -251,6 +265,57 @@ class TradeService:
             ...     limit=50
             ... )
         """
+        page = await self.list_trades_page(
+            symbol=symbol,
+            status=status,
+            strategy=strategy,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=CountMode.NONE,
+        )
+        trades: list[Trade] = page.items
+        return trades
+
+    async def list_trades_page(
+        self,
+        symbol: str | None = None,
+        status: str | None = None,
+        strategy: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+        count: CountMode = CountMode.NONE,
+    ) -> Page[Trade]:
+        """List trades newest first, keyed on (entry_time, trade_id).
+
+        Args:
+            symbol: Filter by symbol (GOLD, EURUSD, etc.)
+            status: Filter by status (OPEN, CLOSED, CANCELLED)
+            strategy: Filter by strategy name
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+            limit: Max results (default 100)
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor from a previous page (optional)
+            count: How to compute the total (default: skip)
+
+        Returns:
+            Page of Trade objects with next_cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        Example:
+            >>> page = await service.list_trades_page(symbol="GOLD", limit=50)
+            >>> more = await service.list_trades_page(
+            ...     symbol="GOLD", limit=50, cursor=page.next_cursor
+            ... )
+        """
         stmt = select(Trade)
 
         # Apply filters
@@ -266,10 +331,16 @@ class TradeService:
             stmt = stmt.where(Trade.entry_time <= end_date)
 
         # Sort and paginate
-        stmt = stmt.order_by(desc(Trade.entry_time)).limit(limit).offset(offset)
-
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await paginate(
+            self.db,
+            stmt,
+            sort_column=Trade.entry_time,
+            id_column=Trade.trade_id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            count=count,
+        )
 
     async def get_trade_stats(self, symbol: str | None = None) -> dict:
         """Calculate overall trade statistics.
@@ -304,30 +375,27 @@ class TradeService:
                 "total_profit": Decimal("0"),
             }
 
-        # Calculate stats
-        winning_trades = [t for t in closed_trades if t.profit > 0]
-        losing_trades = [t for t in closed_trades if t.profit < 0]
+        # Calculate stats (a closed trade without a recorded profit counts as 0)
+        profits = [t.profit or Decimal("0") for t in closed_trades]
+        wins = [p for p in profits if p > 0]
+        losses = [p for p in profits if p < 0]
 
-        total_profit = sum((t.profit or Decimal("0")) for t in closed_trades)
-        total_loss = sum((t.profit or Decimal("0")) for t in losing_trades)
-        total_win = sum((t.profit or Decimal("0")) for t in winning_trades)
+        total_profit = sum(profits, Decimal("0"))
+        total_loss = sum(losses, Decimal("0"))
+        total_win = sum(wins, Decimal("0"))
 
-        win_rate = len(winning_trades) / len(closed_trades) if closed_trades else 0.0
+        win_rate = len(wins) / len(closed_trades) if closed_trades else 0.0
         profit_factor = abs(total_win / total_loss) if total_loss != 0 else 0.0
 
-        largest_win = max((t.profit for t in winning_trades), default=Decimal("0"))
-        largest_loss = min((t.profit for t in losing_trades), default=Decimal("0"))
+        largest_win = max(wins, default=Decimal("0"))
+        largest_loss = min(losses, default=Decimal("0"))
 
         return {
             "total_trades": len(closed_trades),
             "win_rate": win_rate,
             "profit_factor": float(profit_factor),
-            "avg_profit": (
-                total_win / len(winning_trades) if winning_trades else Decimal("0")
-            ),
-            "avg_loss": (
-                total_loss / len(losing_trades) if losing_trades else Decimal("0")
-            ),
+            "avg_profit": total_win / len(wins) if wins else Decimal("0"),
+            "avg_loss": total_loss / len(losses) if losses else Decimal("0"),
             "largest_win": largest_win,
             "largest_loss": largest_loss,
             "total_profit": total_profit,
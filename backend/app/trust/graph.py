@@ -6,16 +6,25 @@ Implements a weighted graph model where:
 - Score: Weighted combination of performance + tenure + social endorsements
 
 All calculations are deterministic: same graph → same scores.
+
+``TrustScoreIndex`` keeps the same scores incrementally: endorsements live in
+a CSR (NumPy) adjacency, only nodes touched by a change are rescored, and
+percentile ranks come from an order-statistic tree instead of a full sort.
 """
 
-from datetime import datetime
+import math
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
 
 import networkx as nx
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.logging import get_logger
-from backend.app.trust.models import Endorsement, UserTrustScore
+from backend.app.trust.models import Endorsement, TrustCalculationLog, UserTrustScore
 
 logger = get_logger(__name__)
 
@@ -27,6 +36,15 @@ TENURE_DAYS_FOR_MAX = 365
 WEIGHT_PERFORMANCE = 0.5  # 50% from performance
 WEIGHT_TENURE = 0.2  # 20% from tenure
 WEIGHT_ENDORSEMENTS = 0.3  # 30% from social endorsements
+# Scores are rounded to 2 decimals in 0-100: one rank bucket per 0.01
+SCORE_BUCKETS = 10_001
+# Overlay edits folded into the CSR arrays once they exceed this (or nnz / 8)
+CSR_COMPACT_MIN = 1024
+# Rows per IN (...) / bulk statement when syncing and persisting
+TRUST_SYNC_CHUNK_SIZE = 1000
+# Re-read window behind the sync watermark (re-applying a change is a no-op)
+TRUST_SYNC_OVERLAP = timedelta(seconds=5)
+MICROSECONDS_PER_DAY = 86_400_000_000
 
 
 def _build_graph_from_endorsements(endorsements: list[Endorsement]) -> nx.DiGraph:
@@ -64,9 +82,7 @@ def _build_graph_from_endorsements(endorsements: list[Endorsement]) -> nx.DiGrap
     return graph
 
 
-def _calculate_performance_score(
-    user_id: str, performance_data: dict | None
-) -> float:
+def _calculate_performance_score(user_id: str, performance_data: dict | None) -> float:
     """Calculate performance component of trust score.
 
     Based on: win rate, Sharpe ratio, profit factor from analytics.
@@ -366,3 +382,689 @@ async def get_single_user_score(user_id: str, db: AsyncSession) -> dict | None:
         "endorsement_component": trust_score_record.endorsement_component,
         "calculated_at": trust_score_record.calculated_at.isoformat(),
     }
+
+
+class EndorsementCSR:
+    """Incoming endorsement adjacency in compressed sparse row form.
+
+    Row ``i`` holds the endorsers of node ``i`` (``indices``, sorted) and
+    their capped weights (``weights``). Edits since the last build sit in a
+    small per-row overlay and are folded in by ``compact()``, so changing one
+    endorsement costs O(degree) instead of a graph rebuild. ``in_weight``
+    holds each node's summed incoming weight and is current after every edit.
+
+    Row sums use ``math.fsum`` so they do not depend on edge order: a row
+    edited incrementally sums to exactly what a fresh build gives.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: list[str] = []
+        self.index: dict[str, int] = {}
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.weights = np.zeros(0, dtype=np.float64)
+        self.in_weight = np.zeros(0, dtype=np.float64)
+        self.edge_count = 0
+        self._overlay: dict[int, dict[int, float]] = {}
+        self._overlay_size = 0
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_node(self, user_id: str) -> int:
+        """Return the node index of user_id, adding it if new."""
+        node = self.index.get(user_id)
+        if node is None:
+            node = len(self.nodes)
+            self.nodes.append(user_id)
+            self.index[user_id] = node
+            if node >= len(self.in_weight):
+                self.in_weight = _grow(self.in_weight, node + 1)
+        return node
+
+    def build(self, edges: Iterable[tuple[str, str, float]]) -> None:
+        """Replace all edges with (endorser, endorsee, weight) triples.
+
+        Weights are capped at MAX_EDGE_WEIGHT; a repeated pair keeps the last
+        weight, as ``_build_graph_from_endorsements`` does.
+        """
+        pairs: dict[tuple[int, int], float] = {}
+        for endorser, endorsee, weight in edges:
+            key = (self.add_node(endorser), self.add_node(endorsee))
+            pairs[key] = min(float(weight), MAX_EDGE_WEIGHT)
+        src = np.fromiter((k[0] for k in pairs), dtype=np.int64, count=len(pairs))
+        dst = np.fromiter((k[1] for k in pairs), dtype=np.int64, count=len(pairs))
+        weights = np.fromiter(pairs.values(), dtype=np.float64, count=len(pairs))
+        self._assemble(src, dst, weights)
+
+    def weight(self, src: int, dst: int) -> float:
+        """Current capped weight of src → dst (0.0 when absent)."""
+        row = self._overlay.get(dst)
+        if row is not None and src in row:
+            return row[src]
+        lo, hi = self._row(dst)
+        pos = lo + int(np.searchsorted(self.indices[lo:hi], src))
+        if pos < hi and self.indices[pos] == src:
+            return float(self.weights[pos])
+        return 0.0
+
+    def set_edge(self, endorser: str, endorsee: str, weight: float) -> bool:
+        """Set (or with weight 0.0, remove) one endorsement.
+
+        Returns:
+            True if the stored weight changed
+        """
+        src, dst = self.add_node(endorser), self.add_node(endorsee)
+        new = min(max(float(weight), 0.0), MAX_EDGE_WEIGHT)
+        old = self.weight(src, dst)
+        if new == old:
+            return False
+        self.edge_count += (new > 0.0) - (old > 0.0)
+        row = self._overlay.setdefault(dst, {})
+        self._overlay_size += src not in row
+        row[src] = new
+        self.in_weight[dst] = self._row_sum(dst)
+        if self._overlay_size > max(CSR_COMPACT_MIN, len(self.indices) // 8):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Fold the overlay into the CSR arrays."""
+        if not self._overlay:
+            return
+        built = len(self.indptr) - 1
+        dst = np.repeat(np.arange(built, dtype=np.int64), np.diff(self.indptr))
+        keys = dst * len(self.nodes) + self.indices
+        edited = np.fromiter(
+            (d * len(self.nodes) + s for d, row in self._overlay.items() for s in row),
+            dtype=np.int64,
+        )
+        keep = ~np.isin(keys, edited)
+        extra = [(s, d, w) for d, row in self._overlay.items() for s, w in row.items()]
+        self._assemble(
+            np.concatenate([self.indices[keep], [e[0] for e in extra]]).astype(
+                np.int64
+            ),
+            np.concatenate([dst[keep], [e[1] for e in extra]]).astype(np.int64),
+            np.concatenate([self.weights[keep], [e[2] for e in extra]]),
+        )
+
+    def _assemble(self, src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> None:
+        present = weights > 0.0
+        src, dst, weights = src[present], dst[present], weights[present]
+        order = np.lexsort((src, dst))
+        counts = np.bincount(dst, minlength=len(self.nodes))
+        self.indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.indices = src[order]
+        self.weights = weights[order]
+        self.edge_count = len(self.indices)
+        self._overlay, self._overlay_size = {}, 0
+        self.in_weight[: len(self.nodes)] = [
+            math.fsum(self.weights[lo:hi])
+            for lo, hi in zip(self.indptr[:-1], self.indptr[1:], strict=True)
+        ]
+
+    def _row(self, dst: int) -> tuple[int, int]:
+        if dst >= len(self.indptr) - 1:
+            return 0, 0
+        return int(self.indptr[dst]), int(self.indptr[dst + 1])
+
+    def _row_sum(self, dst: int) -> float:
+        lo, hi = self._row(dst)
+        row = dict(
+            zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist(), strict=True)
+        )
+        row.update(self._overlay.get(dst, {}))
+        return math.fsum(row.values())
+
+
+class _ScoreRanks:
+    """Order-statistic counts of scores (Fenwick tree over 0.01 buckets)."""
+
+    def __init__(self) -> None:
+        self._tree = [0] * (SCORE_BUCKETS + 1)
+        self._counts = np.zeros(SCORE_BUCKETS, dtype=np.int64)
+        self.total = 0
+
+    @staticmethod
+    def _bucket(score: float) -> int:
+        return min(max(round(score * 100), 0), SCORE_BUCKETS - 1)
+
+    def add(self, score: float, count: int = 1) -> None:
+        self.total += count
+        self._counts[self._bucket(score)] += count
+        i = self._bucket(score) + 1
+        while i <= SCORE_BUCKETS:
+            self._tree[i] += count
+            i += i & -i
+
+    def count_below(self, score: float) -> int:
+        """Number of scores strictly lower than score."""
+        i, count = self._bucket(score), 0
+        while i > 0:
+            count += self._tree[i]
+            i -= i & -i
+        return count
+
+    def count_below_many(self, scores: np.ndarray) -> np.ndarray:
+        """count_below() for an array of scores (one prefix-sum pass)."""
+        buckets = np.clip(np.rint(scores * 100), 0, SCORE_BUCKETS - 1).astype(np.intp)
+        prefix = np.concatenate(([0], np.cumsum(self._counts)))
+        below: np.ndarray = prefix[buckets]
+        return below
+
+
+class TrustScoreIndex:
+    """Incrementally maintained trust scores for every user.
+
+    Produces the same scores as ``calculate_trust_scores`` and the same
+    percentiles as ``_calculate_percentiles``, but after the first build a
+    change only rescores the nodes it touches:
+
+    - An endorsement change dirties its endorser and endorsee (the 1-hop
+      neighborhood of the edge); a performance or join-date change dirties
+      that user. The endorsement component reads only a node's incoming
+      weights, so nothing further away can change.
+    - A change in the user count renormalizes the endorsement component,
+      which dirties only users with incoming endorsements.
+    - Tenure is re-evaluated for all users as one vectorized NumPy pass;
+      only users whose tenure moved are rescored.
+
+    Users are never removed. Percentiles are live (``percentile()``); the
+    stored percentile of a user whose score did not change is rewritten
+    (with a fresh valid_until) only when their rank moved or the stored
+    row has expired.
+
+    Example:
+        >>> index = TrustScoreIndex()
+        >>> index.add_user("u1", created_at)
+        >>> index.set_endorsement("u2", "u1", 0.4)
+        >>> index.recompute()
+        ['u1', 'u2']
+        >>> index.scores(["u1"])["u1"]["tier"]
+        'bronze'
+    """
+
+    def __init__(self) -> None:
+        self.graph = EndorsementCSR()
+        self._performance = np.zeros(0, dtype=np.float64)
+        self._created = np.zeros(0, dtype="datetime64[us]")
+        self._tenure = np.zeros(0, dtype=np.float64)
+        self._info: list[dict[str, Any] | None] = []
+        self._scores = np.zeros(0, dtype=np.float64)
+        self._ranks = _ScoreRanks()
+        # Percentile and valid_until of each stored UserTrustScore row
+        self._stored_percentile = np.zeros(0, dtype=np.int64)
+        self._valid_until = np.zeros(0, dtype="datetime64[us]")
+        self._normalized_count = 0
+        self._dirty: set[int] = set()
+        self._unpersisted: set[int] = set()
+        self._watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self.graph)
+
+    # ------------------------------------------------------------------
+    # Changes
+    # ------------------------------------------------------------------
+
+    def add_user(self, user_id: str, created_at: datetime | None) -> None:
+        """Add a user, or update their join date."""
+        node = self._node(user_id)
+        created = (
+            np.datetime64(created_at, "us") if created_at else np.datetime64("NaT")
+        )
+        if not _same_time(self._created[node], created):
+            self._created[node] = created
+            self._dirty.add(node)
+
+    def set_performance(self, user_id: str, performance_data: dict | None) -> None:
+        """Set a user's performance metrics (win_rate, sharpe_ratio, ...)."""
+        node = self._node(user_id)
+        score = _calculate_performance_score(user_id, performance_data)
+        if score != self._performance[node]:
+            self._performance[node] = score
+            self._dirty.add(node)
+
+    def set_endorsement(
+        self, endorser_id: str, endorsee_id: str, weight: float
+    ) -> None:
+        """Add or re-weight an endorsement; weight 0.0 removes it."""
+        src, dst = self._node(endorser_id), self._node(endorsee_id)
+        if self.graph.set_edge(endorser_id, endorsee_id, weight):
+            self._dirty.update((src, dst))
+
+    def revoke_endorsement(self, endorser_id: str, endorsee_id: str) -> None:
+        """Remove an endorsement."""
+        self.set_endorsement(endorser_id, endorsee_id, 0.0)
+
+    def load(
+        self,
+        user_created_map: dict[str, datetime],
+        user_performance_map: dict[str, dict],
+        endorsements: Iterable[tuple[str, str, float]],
+    ) -> None:
+        """Bulk-load users and (endorser, endorsee, weight) endorsements."""
+        for user_id, created_at in user_created_map.items():
+            self.add_user(user_id, created_at)
+        for user_id, performance_data in user_performance_map.items():
+            self.set_performance(user_id, performance_data)
+        self.graph.build(endorsements)
+        self._ensure_capacity()
+        self._dirty.update(range(len(self.graph)))
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def recompute(self, now: datetime | None = None) -> list[str]:
+        """Rescore dirty users.
+
+        Args:
+            now: Reference time for tenure (default: utcnow)
+
+        Returns:
+            User IDs whose score, tier or components changed
+        """
+        count = len(self.graph)
+        dirty = self._dirty
+        self._dirty = set()
+        if count != self._normalized_count:
+            dirty.update(np.flatnonzero(self.graph.in_weight[:count]).tolist())
+            self._normalized_count = count
+
+        tenure = self._tenure_scores(now or datetime.utcnow())
+        dirty.update(np.flatnonzero(tenure != self._tenure[:count]).tolist())
+        self._tenure[:count] = tenure
+
+        max_possible = count * MAX_EDGE_WEIGHT
+        changed = []
+        for node in sorted(dirty):
+            in_weight = float(self.graph.in_weight[node])
+            endorsement = min(
+                (in_weight / max_possible * 100) if max_possible > 0 else 0.0, 100.0
+            )
+            total = (
+                (float(self._performance[node]) * WEIGHT_PERFORMANCE)
+                + (float(self._tenure[node]) * WEIGHT_TENURE)
+                + (endorsement * WEIGHT_ENDORSEMENTS)
+            )
+            info: dict[str, Any] = {
+                "score": round(total, 2),
+                "tier": _calculate_tier(total),
+                "performance_component": round(float(self._performance[node]), 2),
+                "tenure_component": round(float(self._tenure[node]), 2),
+                "endorsement_component": round(endorsement, 2),
+            }
+            previous = self._info[node]
+            if info == previous:
+                continue
+            if previous is not None:
+                self._ranks.add(previous["score"], -1)
+            self._ranks.add(info["score"])
+            self._info[node] = info
+            self._scores[node] = info["score"]
+            self._unpersisted.add(node)
+            changed.append(self.graph.nodes[node])
+
+        if changed:
+            logger.debug(
+                f"Rescored {len(changed)} of {len(dirty)} dirty trust nodes",
+                extra={"dirty": len(dirty), "changed": len(changed)},
+            )
+        return changed
+
+    def scores(self, user_ids: Iterable[str] | None = None) -> dict[str, dict]:
+        """Scores in the ``calculate_trust_scores`` format."""
+        nodes = (
+            range(len(self.graph))
+            if user_ids is None
+            else [self.graph.index[u] for u in user_ids if u in self.graph.index]
+        )
+        return {
+            self.graph.nodes[node]: dict(info)
+            for node in nodes
+            if (info := self._info[node]) is not None
+        }
+
+    def percentile(self, user_id: str) -> float | None:
+        """Percentile rank (0-100) of a user, as ``_calculate_percentiles``."""
+        node = self.graph.index.get(user_id)
+        info = None if node is None else self._info[node]
+        if info is None:
+            return None
+        below = self._ranks.count_below(info["score"])
+        return round(below / self._ranks.total * 100, 1)
+
+    def tier_counts(self) -> dict[str, int]:
+        """Number of scored users per tier."""
+        counts = {"bronze": 0, "silver": 0, "gold": 0}
+        for info in self._info:
+            if info is not None:
+                counts[info["tier"]] += 1
+        return counts
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    async def refresh(
+        self,
+        db: AsyncSession,
+        user_performance_map: dict[str, dict] | None = None,
+    ) -> list[str]:
+        """Pull user and endorsement changes from the database and rescore.
+
+        The first call loads everything and compares against the stored
+        UserTrustScore rows, so only scores that differ are rewritten. Later
+        calls read only users and endorsements created or revoked since the
+        last watermark.
+
+        Args:
+            db: Database session
+            user_performance_map: Performance metrics that changed, by user ID
+
+        Returns:
+            User IDs whose score changed
+        """
+        from backend.app.auth.models import User
+
+        started = datetime.utcnow()
+        since = self._watermark
+
+        users = select(User.id, User.created_at)
+        if since is not None:
+            users = users.where(User.created_at >= since)
+        for row in await db.execute(users):
+            self.add_user(row.id, row.created_at)
+        for user_id, performance_data in (user_performance_map or {}).items():
+            self.set_performance(user_id, performance_data)
+
+        if since is None:
+            result = await db.execute(
+                select(
+                    Endorsement.endorser_id, Endorsement.endorsee_id, Endorsement.weight
+                )
+                .where(Endorsement.revoked_at.is_(None))
+                .order_by(Endorsement.created_at)
+            )
+            self.graph.build(tuple(row) for row in result)
+            self._ensure_capacity()
+            self._dirty.update(range(len(self.graph)))
+            changed = self.recompute(started)
+            await self._drop_stored(db)
+        else:
+            result = await db.execute(
+                select(Endorsement.endorser_id, Endorsement.endorsee_id).where(
+                    or_(
+                        Endorsement.created_at >= since,
+                        Endorsement.revoked_at >= since,
+                    )
+                )
+            )
+            await self._apply_endorsements(db, {tuple(row) for row in result})
+            changed = self.recompute(started)
+
+        self._watermark = started - TRUST_SYNC_OVERLAP
+        return changed
+
+    async def persist(self, db: AsyncSession) -> int:
+        """Write changed scores with bulk statements and one commit.
+
+        Existing UserTrustScore rows are updated in place, new ones are
+        inserted, and each write gets a TrustCalculationLog entry. Rows
+        whose score is unchanged but whose percentile moved (other users
+        overtook or fell behind them) or whose valid_until has passed get
+        only their percentile and valid_until rewritten.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of scores written
+        """
+        now = datetime.utcnow()
+        valid_until = now + timedelta(hours=24)
+        count = len(self.graph)
+        percentiles = self._percentiles(count)
+        stale = (percentiles >= 0) & (
+            (percentiles != self._stored_percentile[:count])
+            | (self._valid_until[:count] <= np.datetime64(now, "us"))
+        )
+        nodes = sorted(self._unpersisted)
+        moved = sorted(set(np.flatnonzero(stale).tolist()) - self._unpersisted)
+        if not nodes and not moved:
+            return 0
+        user_ids = [self.graph.nodes[node] for node in nodes]
+
+        stored: dict[str, tuple[str, float]] = {}
+        for chunk in _chunks(user_ids + [self.graph.nodes[node] for node in moved]):
+            result = await db.execute(
+                select(
+                    UserTrustScore.id, UserTrustScore.user_id, UserTrustScore.score
+                ).where(UserTrustScore.user_id.in_(chunk))
+            )
+            stored.update({row.user_id: (row.id, row.score) for row in result})
+
+        updates, inserts, logs = [], [], []
+        for node, user_id in zip(nodes, user_ids, strict=True):
+            info = self._scored(node)
+            row = {
+                "score": info["score"],
+                "performance_component": info["performance_component"],
+                "tenure_component": info["tenure_component"],
+                "endorsement_component": info["endorsement_component"],
+                "tier": info["tier"],
+                "percentile": int(percentiles[node]),
+                "calculated_at": now,
+                "valid_until": valid_until,
+            }
+            previous = stored.get(user_id)
+            if previous:
+                updates.append({"id": previous[0], **row})
+            else:
+                inserts.append({"id": str(uuid4()), "user_id": user_id, **row})
+            logs.append(
+                {
+                    "id": str(uuid4()),
+                    "user_id": user_id,
+                    "previous_score": previous[1] if previous else None,
+                    "new_score": info["score"],
+                    "input_graph_nodes": len(self.graph),
+                    "input_graph_edges": self.graph.edge_count,
+                    "algorithm_version": "1.0",
+                    "calculated_at": now,
+                    "notes": f"Incremental recalculation - tier {info['tier']}",
+                }
+            )
+
+        reranked, ranks = [], []
+        for node in moved:
+            previous = stored.get(self.graph.nodes[node])
+            if previous:
+                reranked.append(node)
+                ranks.append(
+                    {
+                        "id": previous[0],
+                        "percentile": int(percentiles[node]),
+                        "valid_until": valid_until,
+                    }
+                )
+
+        try:
+            for rows, statement in (
+                (updates, update(UserTrustScore)),
+                (ranks, update(UserTrustScore)),
+                (inserts, insert(UserTrustScore)),
+                (logs, insert(TrustCalculationLog)),
+            ):
+                for start in range(0, len(rows), TRUST_SYNC_CHUNK_SIZE):
+                    await db.execute(
+                        statement, rows[start : start + TRUST_SYNC_CHUNK_SIZE]
+                    )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        self._unpersisted.difference_update(nodes)
+        written = nodes + reranked
+        self._stored_percentile[written] = percentiles[written]
+        self._valid_until[written] = np.datetime64(valid_until, "us")
+        logger.info(
+            f"Persisted {len(nodes)} trust scores, "
+            f"{len(ranks)} percentiles refreshed",
+            extra={
+                "updated": len(updates),
+                "inserted": len(inserts),
+                "reranked": len(ranks),
+            },
+        )
+        return len(nodes)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _node(self, user_id: str) -> int:
+        node = self.graph.add_node(user_id)
+        if node >= len(self._info):
+            self._ensure_capacity()
+        if node >= self._normalized_count:
+            self._dirty.add(node)
+        return node
+
+    def _scored(self, node: int) -> dict[str, Any]:
+        """Score info of a node that recompute() has scored."""
+        info = self._info[node]
+        if info is None:
+            raise KeyError(f"Trust node {self.graph.nodes[node]} is not scored")
+        return info
+
+    def _percentiles(self, count: int) -> np.ndarray:
+        """Stored-format percentile (int 0-100) of each node; -1 if unscored."""
+        scores = self._scores[:count]
+        scored = ~np.isnan(scores)
+        percentiles = np.full(count, -1, dtype=np.int64)
+        if self._ranks.total:
+            below = self._ranks.count_below_many(scores[scored])
+            percentiles[scored] = np.minimum(
+                100, (below / self._ranks.total * 100).astype(np.int64)
+            )
+        return percentiles
+
+    def _ensure_capacity(self) -> None:
+        size = len(self.graph)
+        self._performance = _grow(self._performance, size)
+        self._created = _grow(self._created, size, np.datetime64("NaT"))
+        self._tenure = _grow(self._tenure, size)
+        self._scores = _grow(self._scores, size, np.nan)
+        self._stored_percentile = _grow(self._stored_percentile, size, -1)
+        self._valid_until = _grow(self._valid_until, size, np.datetime64("NaT"))
+        self._info.extend([None] * (size - len(self._info)))
+
+    def _tenure_scores(self, now: datetime) -> np.ndarray:
+        created = self._created[: len(self.graph)]
+        known = ~np.isnat(created)
+        days = np.zeros(len(created), dtype=np.float64)
+        # Whole days (floored, as timedelta.days) from microsecond timestamps
+        elapsed = np.datetime64(now, "us").astype(np.int64) - created[known].astype(
+            np.int64
+        )
+        days[known] = elapsed // MICROSECONDS_PER_DAY
+        return np.maximum(np.minimum((days / TENURE_DAYS_FOR_MAX) * 100, 100.0), 0.0)
+
+    async def _apply_endorsements(
+        self, db: AsyncSession, pairs: set[tuple[str, str]]
+    ) -> None:
+        """Set touched pairs to their newest active endorsement (or remove)."""
+        if not pairs:
+            return
+        weights: dict[tuple[str, str], float] = {}
+        endorsees = sorted({endorsee for _, endorsee in pairs})
+        for chunk in _chunks(endorsees):
+            result = await db.execute(
+                select(
+                    Endorsement.endorser_id, Endorsement.endorsee_id, Endorsement.weight
+                )
+                .where(
+                    Endorsement.endorsee_id.in_(chunk),
+                    Endorsement.revoked_at.is_(None),
+                )
+                .order_by(Endorsement.created_at)
+            )
+            for endorser_id, endorsee_id, weight in result:
+                if (endorser_id, endorsee_id) in pairs:
+                    weights[(endorser_id, endorsee_id)] = weight
+        for endorser_id, endorsee_id in sorted(pairs):
+            self.set_endorsement(
+                endorser_id, endorsee_id, weights.get((endorser_id, endorsee_id), 0.0)
+            )
+
+    async def _drop_stored(self, db: AsyncSession) -> None:
+        """Skip persisting scores that already match their stored row.
+
+        Also records each stored row's percentile and valid_until, so
+        persist() refreshes them only once they go stale.
+        """
+        for chunk in _chunks([self.graph.nodes[n] for n in sorted(self._unpersisted)]):
+            result = await db.execute(
+                select(
+                    UserTrustScore.user_id,
+                    UserTrustScore.score,
+                    UserTrustScore.performance_component,
+                    UserTrustScore.tenure_component,
+                    UserTrustScore.endorsement_component,
+                    UserTrustScore.tier,
+                    UserTrustScore.percentile,
+                    UserTrustScore.valid_until,
+                ).where(UserTrustScore.user_id.in_(chunk))
+            )
+            for row in result:
+                node = self.graph.index[row.user_id]
+                info = self._scored(node)
+                self._stored_percentile[node] = row.percentile
+                self._valid_until[node] = np.datetime64(row.valid_until, "us")
+                if (
+                    row.score,
+                    row.performance_component,
+                    row.tenure_component,
+                    row.endorsement_component,
+                    row.tier,
+                ) == (
+                    info["score"],
+                    info["performance_component"],
+                    info["tenure_component"],
+                    info["endorsement_component"],
+                    info["tier"],
+                ):
+                    self._unpersisted.discard(node)
+
+
+def _grow(array: np.ndarray, size: int, fill: float | np.datetime64 = 0) -> np.ndarray:
+    """Return array with room for size items (capacity doubles)."""
+    if size <= len(array):
+        return array
+    grown = np.full(max(size, 2 * len(array), 16), fill, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _same_time(a: np.datetime64, b: np.datetime64) -> bool:
+    return bool(a == b) or bool(np.isnat(a) and np.isnat(b))
+
+
+def _chunks(items: list) -> Iterable[list]:
+    for start in range(0, len(items), TRUST_SYNC_CHUNK_SIZE):
+        yield items[start : start + TRUST_SYNC_CHUNK_SIZE]
+
+
+_trust_score_index: TrustScoreIndex | None = None
+
+
+def get_trust_score_index() -> TrustScoreIndex:
+    """Get the process-wide trust score index."""
+    global _trust_score_index
+    if _trust_score_index is None:
+        _trust_score_index = TrustScoreIndex()
+    return _trust_score_index
@@ -15,12 +15,6 @@ from backend.app.trust.models import UserTrustScore
 logger = get_logger(__name__)
 
 # Prometheus telemetry
-trust_scores_calculated_total = Counter(
-    "trust_scores_calculated_total",
-    "Total trust scores calculated",
-    labelnames=["tier"],
-)
-
 trust_score_accessed_total = Counter(
     "trust_score_accessed_total", "Trust score access requests"
 )
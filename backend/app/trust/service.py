@@ -8,16 +8,8 @@ from prometheus_client import Counter, Histogram
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.trust.graph import (
-    _build_graph_from_endorsements,
-    calculate_trust_scores,
-)
-from backend.app.trust.models import (
-    Endorsement,
-    TrustCalculationLog,
-    User,
-    UserTrustScore,
-)
+from backend.app.auth.models import User
+from backend.app.trust.graph import TrustScoreIndex, get_trust_score_index
 
 logger = logging.getLogger(__name__)
 
@@ -42,21 +34,24 @@ users_processed = Histogram(
 
 
 class TrustScoringService:
-    """Service for calculating and managing trust scores."""
+    """Service for calculating and managing trust scores.
+
+    Scores are maintained by the process-wide TrustScoreIndex, so each call
+    rescores and writes only the users whose inputs changed.
+    """
 
     @staticmethod
     async def calculate_all_trust_scores(db: AsyncSession) -> dict[str, Any]:
         """
-        Calculate trust scores for all users in the system.
+        Bring trust scores for all users up to date.
 
         This is the main orchestration function for trust score calculation.
         It:
-        1. Fetches all endorsements
-        2. Builds the endorsement graph
-        3. Fetches user performance data
-        4. Calculates trust scores for all users
-        5. Stores results in database
-        6. Updates telemetry
+        1. Pulls user and endorsement changes into the trust score index
+        2. Sets performance data for users new to the index
+        3. Rescores the users those changes touch
+        4. Stores changed scores in the database
+        5. Updates telemetry
 
         Args:
             db: Async database session
@@ -76,111 +71,35 @@ class TrustScoringService:
         Example:
             >>> result = await TrustScoringService.calculate_all_trust_scores(db)
             >>> print(result["users_scored"])
-            5432
+            12
         """
         import time
 
         start_time = time.time()
 
         try:
-            # Fetch all endorsements
-            stmt = select(Endorsement).where(Endorsement.revoked_at.is_(None))
-            result = await db.execute(stmt)
-            endorsements = result.scalars().all()
+            index = get_trust_score_index()
+            changed = await _refresh_index(db, index)
+            users_processed.observe(len(changed))
 
-            logger.info(
-                f"Processing {len(endorsements)} endorsements for trust calculation"
-            )
+            stored_count = await index.persist(db)
 
-            # Build graph
-            graph = _build_graph_from_endorsements(endorsements)
-
-            # Fetch all users with their creation dates
-            stmt = select(User).where(User.is_active.is_(True))
-            result = await db.execute(stmt)
-            users = result.scalars().all()
-
-            created_map = {user.id: user.created_at for user in users}
-            users_processed.observe(len(users))
-
-            # Fetch performance data for all users (from performance metrics table)
-            # This assumes performance_data is available in the database
-            perf_data = await _get_performance_data(db, list(created_map.keys()))
-
-            # Calculate trust scores (deterministic algorithm)
-            scores = calculate_trust_scores(graph, perf_data, created_map)
-
-            # Calculate percentiles
-            score_values = {uid: data["score"] for uid, data in scores.items()}
-            percentiles = _calculate_percentiles(score_values)
-
-            # Store in database
-            tier_counts = {"bronze": 0, "silver": 0, "gold": 0}
-            stored_count = 0
-
-            for user_id, score_data in scores.items():
-                tier = score_data["tier"]
-                tier_counts[tier] = tier_counts.get(tier, 0) + 1
-
-                # Get previous score for audit log
-                stmt = select(UserTrustScore).where(UserTrustScore.user_id == user_id)
-                result = await db.execute(stmt)
-                previous_record = result.scalar_one_or_none()
-                previous_score = previous_record.score if previous_record else None
-
-                # Create or update trust score
-                trust_score = UserTrustScore(
-                    id=str(__import__("uuid").uuid4()),
-                    user_id=user_id,
-                    score=score_data["score"],
-                    performance_component=score_data["performance"],
-                    tenure_component=score_data["tenure"],
-                    endorsement_component=score_data["endorsements"],
-                    tier=tier,
-                    percentile=percentiles.get(user_id, 0),
-                    calculated_at=datetime.utcnow(),
-                    valid_until=datetime.utcnow()
-                    + __import__("datetime").timedelta(hours=24),
-                )
-
-                # Update if exists (upsert pattern)
-                if previous_record:
-                    # Delete old record
-                    await db.delete(previous_record)
-
-                db.add(trust_score)
-                stored_count += 1
-
-                # Log calculation
-                audit_log = TrustCalculationLog(
-                    id=str(__import__("uuid").uuid4()),
-                    user_id=user_id,
-                    previous_score=previous_score,
-                    new_score=score_data["score"],
-                    input_graph_nodes=graph.number_of_nodes(),
-                    input_graph_edges=graph.number_of_edges(),
-                    algorithm_version="1.0",
-                    calculated_at=datetime.utcnow(),
-                    notes=f"Batch recalculation - tier {tier}",
-                )
-                db.add(audit_log)
-
-                # Increment telemetry counter
-                trust_scores_calculated_total.labels(tier=tier).inc()
-
-            # Commit all changes
-            await db.commit()
+            for score_data in index.scores(changed).values():
+                trust_scores_calculated_total.labels(tier=score_data["tier"]).inc()
 
             duration = time.time() - start_time
             trust_score_calculation_duration_seconds.observe(duration)
 
+            tier_counts = index.tier_counts()
             logger.info(
-                f"Trust score calculation complete: {stored_count} scores, "
-                f"{duration:.2f}s, Bronze:{tier_counts['bronze']} Silver:{tier_counts['silver']} Gold:{tier_counts['gold']}"
+                f"Trust score calculation complete: {len(changed)} changed, "
+                f"{stored_count} stored, {duration:.2f}s, "
+                f"Bronze:{tier_counts['bronze']} Silver:{tier_counts['silver']} "
+                f"Gold:{tier_counts['gold']}"
             )
 
             return {
-                "total_users_processed": len(users),
+                "total_users_processed": len(index),
                 "users_scored": stored_count,
                 "calculation_duration_seconds": duration,
                 "scores_by_tier": tier_counts,
@@ -199,7 +118,8 @@ class TrustScoringService:
         Calculate trust score for a single user.
 
         This is useful for on-demand score updates when a user's performance changes
-        or when they receive a new endorsement.
+        or when they receive a new endorsement. The index is refreshed first, so
+        only users touched since the last refresh are rescored.
 
         Args:
             user_id: User ID to score
@@ -210,7 +130,7 @@ class TrustScoringService:
                 "user_id": str,
                 "score": float,
                 "tier": str,
-                "percentile": int,
+                "percentile": float,
                 "components": {...}
             } or None if user not found
 
@@ -220,60 +140,26 @@ class TrustScoringService:
             ...     print(f"User score: {score['score']}")
         """
         try:
-            # Fetch user
-            stmt = select(User).where(User.id == user_id)
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
+            index = get_trust_score_index()
+            await _refresh_index(db, index)
 
-            if not user:
+            score_data = index.scores([user_id]).get(user_id)
+            if score_data is None:
                 logger.warning(f"User not found: {user_id}")
                 return None
 
-            # Fetch endorsements for this user
-            stmt = select(Endorsement).where(Endorsement.revoked_at.is_(None))
-            result = await db.execute(stmt)
-            endorsements = result.scalars().all()
-
-            # Build graph
-            graph = _build_graph_from_endorsements(endorsements)
-
-            # Fetch all users for context
-            stmt = select(User).where(User.is_active.is_(True))
-            result = await db.execute(stmt)
-            all_users = result.scalars().all()
-
-            created_map = {u.id: u.created_at for u in all_users}
-
-            # Fetch performance data
-            perf_data = await _get_performance_data(db, [user_id])
-
-            # Calculate scores for all users
-            scores = calculate_trust_scores(graph, perf_data, created_map)
-
-            if user_id not in scores:
-                logger.warning(f"Could not calculate score for user: {user_id}")
-                return None
-
-            score_data = scores[user_id]
-
-            # Calculate percentiles
-            score_values = {uid: data["score"] for uid, data in scores.items()}
-            percentiles = _calculate_percentiles(score_values)
-
-            result_score = {
+            return {
                 "user_id": user_id,
                 "score": score_data["score"],
                 "tier": score_data["tier"],
-                "percentile": percentiles.get(user_id, 0),
+                "percentile": index.percentile(user_id),
                 "components": {
-                    "performance": score_data["performance"],
-                    "tenure": score_data["tenure"],
-                    "endorsements": score_data["endorsements"],
+                    "performance": score_data["performance_component"],
+                    "tenure": score_data["tenure_component"],
+                    "endorsements": score_data["endorsement_component"],
                 },
             }
 
-            return result_score
-
         except Exception as e:
             logger.error(
                 f"Error calculating score for user {user_id}: {e}", exc_info=True
@@ -281,6 +167,38 @@ class TrustScoringService:
             raise
 
 
+async def _refresh_index(db: AsyncSession, index: TrustScoreIndex) -> list[str]:
+    """
+    Pull changes into the index and set performance data for new users.
+
+    Every user in the users table is scored (the table has no active flag).
+    The first refresh is given performance data for all users, so its scores
+    can be compared against the stored rows; later refreshes add it for
+    users that joined since.
+
+    Args:
+        db: Database session
+        index: Trust score index to refresh
+
+    Returns:
+        User IDs whose score changed
+    """
+    known = len(index)
+    performance: dict[str, dict[str, float]] = {}
+    if known == 0:
+        result = await db.execute(select(User.id))
+        performance = await _get_performance_data(db, list(result.scalars()))
+
+    changed = set(await index.refresh(db, performance))
+
+    joined = [u for u in index.graph.nodes[known:] if u not in performance]
+    if joined:
+        for user_id, data in (await _get_performance_data(db, joined)).items():
+            index.set_performance(user_id, data)
+        changed.update(index.recompute())
+    return sorted(changed)
+
+
 async def _get_performance_data(
     db: AsyncSession, user_ids: list
 ) -> dict[str, dict[str, float]]:
@@ -314,33 +232,3 @@ async def _get_performance_data(
         }
 
     return perf_data
-
-
-def _calculate_percentiles(scores: dict[str, float]) -> dict[str, int]:
-    """
-    Calculate percentile rank for each user score.
-
-    Args:
-        scores: {user_id: score_value}
-
-    Returns:
-        {user_id: percentile (0-100)}
-
-    Example:
-        >>> percentiles = _calculate_percentiles({"u1": 90, "u2": 70, "u3": 80})
-        >>> percentiles["u1"]
-        100
-    """
-    if not scores:
-        return {}
-
-    sorted_scores = sorted(scores.values(), reverse=True)
-    percentiles = {}
-
-    for user_id, score in scores.items():
-        # Count how many users scored lower
-        lower_count = sum(1 for s in sorted_scores if s < score)
-        percentile = int((lower_count / len(sorted_scores)) * 100)
-        percentiles[user_id] = min(100, max(0, percentile))
-
-    return percentiles
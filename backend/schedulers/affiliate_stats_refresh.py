@@ -0,0 +1,53 @@
+"""Affiliate stats rollup refresh scheduler.
+
+Rebuilds every affiliate's stats rollup (AffiliateStats) from ReferralEvent
+with one grouped aggregate query, so dashboard reads stay on the rollup
+table. Tracked events keep rollups current between refreshes; this job
+corrects any drift (e.g. events written outside AffiliateService).
+"""
+
+import asyncio
+import logging
+
+from backend.app.affiliates.service import STATS_REFRESH_SECONDS, AffiliateService
+from backend.app.core.db import get_async_session
+
+logger = logging.getLogger(__name__)
+
+
+async def run_affiliate_stats_refresh() -> int:
+    """Rebuild all affiliate stats rollups.
+
+    Returns:
+        Number of rollups rebuilt
+    """
+    async with get_async_session() as db:
+        refreshed = await AffiliateService(db).refresh_stats()
+        logger.info(f"Affiliate stats refreshed: {refreshed} affiliates")
+        return refreshed
+
+
+async def affiliate_stats_daemon(interval_seconds: int = STATS_REFRESH_SECONDS):
+    """Continuous affiliate stats refresh daemon.
+
+    Args:
+        interval_seconds: How often to rebuild rollups
+    """
+    logger.info(f"Starting affiliate stats daemon (interval={interval_seconds}s)")
+
+    while True:
+        try:
+            await run_affiliate_stats_refresh()
+        except Exception as e:
+            logger.error(f"Affiliate stats daemon error: {e}", exc_info=True)
+
+        await asyncio.sleep(interval_seconds)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    asyncio.run(run_affiliate_stats_refresh())
@@ -0,0 +1,47 @@
+"""Decision log archival scheduler.
+
+Moves whole months of decision logs older than the hot retention window
+from the database to the Parquet archive (see strategy.logs.archive).
+Archived months stay searchable through the decision search API.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+
+from backend.app.core.db import get_async_session
+from backend.app.strategy.logs.archive import archive_decision_logs
+
+logger = logging.getLogger(__name__)
+
+# Days of decision logs kept in the database
+DECISION_LOG_HOT_DAYS = int(os.getenv("DECISION_LOG_HOT_DAYS", "90"))
+
+
+async def run_decision_log_archive(hot_days: int = DECISION_LOG_HOT_DAYS) -> int:
+    """Archive months that ended before the hot window.
+
+    Args:
+        hot_days: Days of decisions to keep in the database
+
+    Returns:
+        Number of decision logs archived
+    """
+    before = datetime.utcnow() - timedelta(days=hot_days)
+    async with get_async_session() as db:
+        archived = await archive_decision_logs(db, before=before)
+        logger.info(
+            f"Decision log archive complete: {archived} rows archived",
+            extra={"before": before.isoformat(), "rows": archived},
+        )
+        return archived
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    asyncio.run(run_decision_log_archive())
@@ -1,24 +1,34 @@
 """Fraud detection scheduler for automated scanning.
 
 Runs periodic scans of recent trades to detect anomalies.
+
+The daemon scans incrementally: after the first window it only scores
+trades closed since the last watermark (newest exit_time already
+scanned), so each trade is scored and reported once. The watermark is
+kept in-process; a restarted daemon starts again from the `hours` window.
 """
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from backend.app.core.db import get_async_session
-from backend.app.fraud.detectors import scan_recent_trades
+from backend.app.fraud.detectors import scan_recent_trades, scan_trades_since
 from backend.app.observability.metrics import metrics_collector
 
 logger = logging.getLogger(__name__)
 
+# exit_time of the newest trade scanned by an incremental run
+_watermark: datetime | None = None
+
 
-async def run_fraud_scan(hours: int = 24) -> int:
+async def run_fraud_scan(hours: int = 24, incremental: bool = False) -> int:
     """Run fraud detection scan on recent trades.
 
     Args:
         hours: How many hours back to scan (default 24)
+        incremental: Only scan trades newer than the last watermark (the
+            first incremental run scans the last `hours`)
 
     Returns:
         Number of anomalies detected
@@ -30,13 +40,18 @@ async def run_fraud_scan(hours: int = 24) -> int:
         4. Increment fraud_events_total metric for each type
         5. Log summary
     """
+    global _watermark
     logger.info(f"Starting fraud scan for last {hours} hours")
     start_time = datetime.utcnow()
 
     async with get_async_session() as db:
         try:
             # Run scan
-            anomalies = await scan_recent_trades(db, hours=hours)
+            if incremental:
+                since = _watermark or start_time - timedelta(hours=hours)
+                anomalies, _watermark = await scan_trades_since(db, since)
+            else:
+                anomalies = await scan_recent_trades(db, hours=hours)
 
             # Increment metrics by type
             for anomaly in anomalies:
@@ -73,7 +88,7 @@ async def fraud_scan_daemon(interval_hours: int = 1):
         interval_hours: How often to run scans (default every 1 hour)
 
     Business Logic:
-        - Runs fraud scan every N hours
+        - Runs fraud scan every N hours (incremental after the first)
         - Handles errors gracefully (logs but continues)
         - Never exits (daemon mode)
     """
@@ -81,7 +96,7 @@ async def fraud_scan_daemon(interval_hours: int = 1):
 
     while True:
         try:
-            await run_fraud_scan(hours=24)
+            await run_fraud_scan(hours=24, incremental=True)
         except Exception as e:
             logger.error(f"Fraud scan daemon error: {e}", exc_info=True)
 
@@ -260,6 +260,28 @@ def reset_context():
     _request_id_var.reset(token)
 
 
+@pytest.fixture(autouse=True)
+def reset_risk_state():
+    """Drop in-memory risk state so each test's fresh database is re-read."""
+    from backend.app.risk.state import risk_state
+
+    risk_state.invalidate()
+    yield
+    risk_state.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_public_performance_cache():
+    """Drop materialized public performance data between test databases."""
+    from backend.app.public.performance_cache import get_public_performance_cache
+
+    cache = get_public_performance_cache()
+    cache.redis_client = None
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest_asyncio.fixture
 async def db_postgres() -> AsyncGenerator[AsyncSession, None]:
     """Create test database session with REAL PostgreSQL backend.
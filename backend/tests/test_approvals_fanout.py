@@ -0,0 +1,280 @@
+"""Tests for the approval fan-out engine.
+
+Validates:
+- Subscribers resolved in bulk (active subscriptions only, owner excluded)
+- Pending approvals for manual users, approved approval + execution for copy traders
+- Copy-trading guard rails and signals_per_day quota applied in batch
+- EA and Telegram notifications published in one pipeline
+- Re-running a fan-out is a no-op
+- Concurrent approvals and failed writes give the consumed quota back
+- Subscribers with a paper account paper-trade the signal through the book
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.approvals.fanout import ApprovalFanout
+from backend.app.approvals.models import Approval, ApprovalDecision
+from backend.app.auth.models import User
+from backend.app.clients.models import Client
+from backend.app.copytrading.service import CopyTradeExecution, CopyTradeSettings
+from backend.app.messaging.bus import TRANSACTIONAL_QUEUE
+from backend.app.paper.book import PaperBook, PaperFillLog
+from backend.app.paper.models import PaperAccount, TradeSide
+from backend.app.quotas.service import QuotaService
+from backend.app.signals.models import Signal, SignalStatus
+from backend.app.subscriptions.models import Subscription
+
+
+async def _user(db: AsyncSession, tier: str = "premium", **kwargs) -> User:
+    user = User(
+        id=str(uuid4()),
+        email=f"{uuid4().hex[:12]}@example.com",
+        password_hash="test",
+        **kwargs,
+    )
+    db.add(user)
+    db.add(_subscription(user.id, tier, "active"))
+    return user
+
+
+def _subscription(user_id: str, tier: str, status: str) -> Subscription:
+    return Subscription(
+        user_id=user_id,
+        tier=tier,
+        status=status,
+        plan_id="plan-1",
+        price_gbp=0,
+        started_at=datetime.utcnow(),
+    )
+
+
+@pytest_asyncio.fixture
+async def signal(db_session: AsyncSession) -> Signal:
+    owner = User(id=str(uuid4()), email="owner@example.com", password_hash="test")
+    db_session.add(owner)
+    signal = Signal(
+        id=str(uuid4()),
+        user_id=owner.id,
+        instrument="XAUUSD",
+        side=0,
+        price=1950.50,
+        status=SignalStatus.NEW.value,
+        payload={"lot_size": 0.5},
+    )
+    db_session.add(signal)
+    await db_session.commit()
+    return signal
+
+
+@pytest.mark.asyncio
+async def test_fan_out_creates_approvals_and_copy_executions(
+    db_session: AsyncSession, signal: Signal
+):
+    manual = await _user(db_session, telegram_user_id="111")
+    copier = await _user(db_session, tier="pro", telegram_user_id="222")
+    db_session.add(Client(id=str(uuid4()), email=copier.email))
+    db_session.add(
+        CopyTradeSettings(
+            user_id=copier.id,
+            enabled=True,
+            risk_multiplier=2.0,
+            max_position_size_lot=0.8,
+        )
+    )
+    lapsed = User(id=str(uuid4()), email="lapsed@example.com", password_hash="test")
+    db_session.add(lapsed)
+    db_session.add(_subscription(lapsed.id, "premium", "canceled"))
+    await db_session.commit()
+
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    pubsub = redis_client.pubsub()
+    await pubsub.psubscribe("ea:approvals:*")
+
+    counts = await ApprovalFanout(db_session, redis_client).fan_out(signal)
+
+    assert counts["subscribers"] == 2
+    assert counts["approvals"] == 2
+    assert counts["pending"] == 1
+    assert counts["copy_executions"] == 1
+
+    approvals = {
+        a.user_id: a
+        for a in (
+            await db_session.execute(
+                select(Approval).where(Approval.signal_id == signal.id)
+            )
+        ).scalars()
+    }
+    assert set(approvals) == {manual.id, copier.id}
+    assert approvals[manual.id].decision is None
+    assert approvals[copier.id].decision == ApprovalDecision.APPROVED.value
+    assert approvals[copier.id].client_id is not None
+
+    execution = (
+        await db_session.execute(
+            select(CopyTradeExecution).where(CopyTradeExecution.user_id == copier.id)
+        )
+    ).scalar_one()
+    assert execution.original_volume == 0.5
+    assert execution.executed_volume == 0.8  # 0.5 * 2.0 capped at 0.8
+    settings = (
+        await db_session.execute(
+            select(CopyTradeSettings).where(CopyTradeSettings.user_id == copier.id)
+        )
+    ).scalar_one()
+    await db_session.refresh(settings)
+    assert settings.trades_today == 1
+
+    queued = [
+        json.loads(m) for m in await redis_client.lrange(TRANSACTIONAL_QUEUE, 0, -1)
+    ]
+    assert {(m["user_id"], m["template_name"]) for m in queued} == {
+        (manual.id, "signal_approval_request"),
+        (copier.id, "copy_trade_executed"),
+    }
+    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+    if message is None:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+    assert json.loads(message["data"])["approval_id"] == approvals[copier.id].id
+    await pubsub.aclose()
+
+    # Everyone already has an approval: nothing more to do
+    again = await ApprovalFanout(db_session, redis_client).fan_out(signal)
+    assert again["subscribers"] == 0
+    assert again["approvals"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_applies_quota_and_copy_limits(
+    db_session: AsyncSession, signal: Signal
+):
+    exhausted = await _user(db_session, tier="free")
+    capped = await _user(db_session)
+    db_session.add(
+        CopyTradeSettings(
+            user_id=capped.id, enabled=True, trades_today=3, max_daily_trades=3
+        )
+    )
+    await db_session.commit()
+
+    # Use up the free tier's signals_per_day allowance (10)
+    quotas = QuotaService(db_session)
+    for _ in range(10):
+        await quotas.check_and_consume(exhausted.id, "free", "signals_per_day")
+
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    counts = await ApprovalFanout(db_session, redis_client).fan_out(signal)
+
+    assert counts["quota_blocked"] == 1
+    assert counts["copy_blocked"] == 1
+    assert counts["copy_executions"] == 0
+
+    approvals = (
+        (
+            await db_session.execute(
+                select(Approval).where(Approval.signal_id == signal.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    # Over the daily copy limit: falls back to a pending approval
+    assert [(a.user_id, a.decision) for a in approvals] == [(capped.id, None)]
+
+    status = await quotas.get_quota_status(exhausted.id, "free", "signals_per_day")
+    assert status["current"] == 10
+
+
+@pytest.mark.asyncio
+async def test_fan_out_skips_concurrent_approvals_and_refunds_quota(
+    db_session: AsyncSession, signal: Signal, monkeypatch
+):
+    raced = await _user(db_session)
+    other = await _user(db_session)
+    await db_session.commit()
+
+    load_subscribers = ApprovalFanout._load_subscribers
+
+    async def load_then_race(self, signal):
+        subscribers = await load_subscribers(self, signal)
+        # Another fan-out approves `raced` between the read and the insert
+        self.db.add(
+            Approval(
+                id=str(uuid4()),
+                signal_id=signal.id,
+                user_id=raced.id,
+                client_id=str(uuid4()),
+            )
+        )
+        await self.db.flush()
+        return subscribers
+
+    monkeypatch.setattr(ApprovalFanout, "_load_subscribers", load_then_race)
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    counts = await ApprovalFanout(db_session, redis_client).fan_out(signal)
+
+    assert counts["subscribers"] == 2
+    assert counts["approvals"] == 1
+    quotas = QuotaService(db_session)
+    for user, used in ((raced, 0), (other, 1)):
+        status = await quotas.get_quota_status(user.id, "premium", "signals_per_day")
+        assert status["current"] == used
+
+
+@pytest.mark.asyncio
+async def test_fan_out_failure_refunds_quota(
+    db_session: AsyncSession, signal: Signal, monkeypatch
+):
+    user_id = (await _user(db_session)).id
+    await db_session.commit()
+
+    async def conflict(self, approvals):
+        raise IntegrityError("INSERT", {}, Exception("uq_approval_signal_user"))
+
+    monkeypatch.setattr(ApprovalFanout, "_insert_approvals", conflict)
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    with pytest.raises(IntegrityError):
+        await ApprovalFanout(db_session, redis_client).fan_out(signal)
+
+    status = await QuotaService(db_session).get_quota_status(
+        user_id, "premium", "signals_per_day"
+    )
+    assert status["current"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_fills_paper_accounts(
+    db_session: AsyncSession, signal: Signal, tmp_path
+):
+    trader = await _user(db_session)
+    await _user(db_session)  # no paper account
+    account = PaperAccount(
+        user_id=trader.id,
+        balance=Decimal("10000"),
+        equity=Decimal("10000"),
+        enabled=True,
+    )
+    db_session.add(account)
+    await db_session.commit()
+
+    book = PaperBook(PaperFillLog(tmp_path))
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    counts = await ApprovalFanout(db_session, redis_client, paper_book=book).fan_out(
+        signal
+    )
+    book.log.close()
+
+    assert counts["approvals"] == 2
+    assert counts["paper_fills"] == 1
+    position = book.accounts[account.id].positions[("XAUUSD", TradeSide.BUY)]
+    assert position.volume == Decimal("0.5")
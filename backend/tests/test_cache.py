@@ -13,14 +13,16 @@ import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import AsyncMock
 
+import fakeredis.aioredis
 import pytest
 
 # Add backend to path for imports
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path.parent))
 
-from backend.app.strategy.cache import CandleCache, SignalPublishCache
+from backend.app.strategy.cache import CandleCache, DedupeGuard, SignalPublishCache
 
 
 class TestCandleCache:
@@ -479,6 +481,67 @@ class TestCacheMetrics:
         assert signal_exists is True
 
 
+class TestDedupeGuard:
+    """Test atomic claim-once DedupeGuard."""
+
+    CANDLE = datetime(2025, 1, 1, 10, 15, 0)
+
+    @pytest.mark.asyncio
+    async def test_claim_once_in_memory(self):
+        """Test a key can be claimed once; other keys are independent."""
+        guard = DedupeGuard()
+
+        assert await guard.claim("GOLD", "15m", self.CANDLE, "ppo") is True
+        assert await guard.claim("GOLD", "15m", self.CANDLE, "ppo") is False
+        assert await guard.claim("GOLD", "15m", self.CANDLE, "fib_rsi") is True
+        assert await guard.claim("GOLD", "1h", self.CANDLE, "ppo") is True
+
+    @pytest.mark.asyncio
+    async def test_release_allows_reclaim(self):
+        """Test releasing a claim lets it be claimed again."""
+        guard = DedupeGuard()
+        await guard.claim("GOLD", "15m", self.CANDLE)
+
+        await guard.release("GOLD", "15m", self.CANDLE)
+
+        assert await guard.claim("GOLD", "15m", self.CANDLE) is True
+
+    @pytest.mark.asyncio
+    async def test_one_winner_across_guards(self):
+        """Test guards sharing Redis (separate workers) yield one winner."""
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        workers = [DedupeGuard(redis_client=redis_client) for _ in range(5)]
+
+        results = await asyncio.gather(
+            *(w.claim("GOLD", "15m", self.CANDLE, "ppo") for w in workers)
+        )
+
+        assert sorted(results) == [False, False, False, False, True]
+        key = DedupeGuard.make_key("GOLD", "15m", self.CANDLE, "ppo")
+        assert await redis_client.ttl(key) > 0
+
+    @pytest.mark.asyncio
+    async def test_repeat_checks_served_locally(self):
+        """Test a key seen claimed is rejected without another Redis call."""
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        guard = DedupeGuard(redis_client=redis_client)
+        await guard.claim("GOLD", "15m", self.CANDLE)
+
+        redis_client.set = AsyncMock(side_effect=AssertionError("Redis hit"))
+
+        assert await guard.claim("GOLD", "15m", self.CANDLE) is False
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_local(self):
+        """Test Redis errors degrade to process-local dedupe."""
+        redis_client = AsyncMock()
+        redis_client.set.side_effect = ConnectionError("Redis down")
+        guard = DedupeGuard(redis_client=redis_client)
+
+        assert await guard.claim("GOLD", "15m", self.CANDLE) is True
+        assert await guard.claim("GOLD", "15m", self.CANDLE) is False
+
+
 @pytest.fixture
 async def cache_teardown():
     """Fixture to teardown caches after each test."""
@@ -22,16 +22,26 @@ Example:
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import func, select
 
 # Imports from the modules under test
+from backend.app.strategy.scheduler import StrategyScheduler
 from backend.app.trading.data.models import DataPullLog, OHLCCandle, SymbolPrice
 from backend.app.trading.data.mt5_puller import DataValidationError, MT5DataPuller
-from backend.app.trading.data.pipeline import DataPipeline, PipelineStatus, PullConfig
+from backend.app.trading.data.pipeline import (
+    ClosedCandleEvent,
+    DataPipeline,
+    PipelineStatus,
+    PullConfig,
+)
+from backend.app.trading.data.store import CandleStore
 
 # ============================================================================
 # FIXTURES
@@ -906,6 +916,28 @@ class TestAsyncPipelineOps:
         # Should handle the failure gracefully
         await data_pipeline._pull_cycle("test", data_pipeline.pull_configs["test"])
 
+    @pytest.mark.asyncio
+    async def test_pull_cycle_publishes_quotes(self, data_pipeline):
+        """Test pulled quotes reach quote subscribers as Decimals."""
+        data_pipeline.add_pull_config(
+            name="test", symbols=["GOLD"], interval_seconds=300
+        )
+        data_pipeline.puller.get_ohlc_data = AsyncMock(return_value=[])
+        data_pipeline.puller.get_all_symbols_data = AsyncMock(
+            return_value={"GOLD": {"bid": 1950.50, "ask": 1950.75}}
+        )
+        quotes = []
+
+        def failing(symbol, bid, ask):
+            raise RuntimeError("subscriber down")
+
+        data_pipeline.subscribe_quotes(failing)
+        data_pipeline.subscribe_quotes(lambda *quote: quotes.append(quote))
+
+        await data_pipeline._pull_cycle("test", data_pipeline.pull_configs["test"])
+
+        assert quotes == [("GOLD", Decimal("1950.5"), Decimal("1950.75"))]
+
     @pytest.mark.asyncio
     async def test_pull_loop_with_shutdown(self, data_pipeline):
         """Test pull loop respects shutdown signal."""
@@ -966,5 +998,197 @@ class TestAsyncPipelineOps:
         await data_pipeline.stop()
 
 
+# ============================================================================
+# TEST CLASS 11: Incremental Ingestion Tests
+# ============================================================================
+
+
+def _bar(time_open: datetime, close: float = 1.05) -> dict:
+    """Closed M5 bar opened at time_open."""
+    return {
+        "symbol": "EURUSD",
+        "time_open": time_open,
+        "time_close": time_open + timedelta(minutes=5),
+        "open": 1.0,
+        "high": 1.1,
+        "low": 0.9,
+        "close": close,
+        "volume": 100,
+    }
+
+
+@pytest.fixture
+def candle_store(db):
+    """CandleStore bound to the test session."""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db
+
+    return CandleStore(session_factory)
+
+
+class TestIncrementalIngestion:
+    """Tests for concurrent, incremental candle ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_symbols_pulled_concurrently_under_cap(self, mt5_puller):
+        """Symbols overlap but never exceed max_concurrent_pulls."""
+        pipeline = DataPipeline(mt5_puller, max_concurrent_pulls=2)
+        pipeline.add_pull_config(
+            name="fx", symbols=["EURUSD", "GBPUSD", "USDJPY", "GOLD"]
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_pull(symbol, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        pipeline.puller.get_ohlc_data = AsyncMock(side_effect=slow_pull)
+        pipeline.puller.get_all_symbols_data = AsyncMock(return_value={})
+
+        await pipeline._pull_cycle("fx", pipeline.pull_configs["fx"])
+
+        assert peak == 2
+        assert pipeline.puller.get_ohlc_data.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_only_bars_after_high_water_mark_requested(self, data_pipeline):
+        """Second cycle passes since= and a count covering the gap only."""
+        data_pipeline.add_pull_config(name="fx", symbols=["EURUSD"])
+        config = data_pipeline.pull_configs["fx"]
+        last_open = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(
+            minutes=10
+        )
+        data_pipeline.puller.get_ohlc_data = AsyncMock(
+            return_value=[_bar(last_open - timedelta(minutes=5)), _bar(last_open)]
+        )
+        data_pipeline.puller.get_all_symbols_data = AsyncMock(return_value={})
+
+        await data_pipeline._pull_cycle("fx", config)
+        first = data_pipeline.puller.get_ohlc_data.await_args.kwargs
+        await data_pipeline._pull_cycle("fx", config)
+        second = data_pipeline.puller.get_ohlc_data.await_args.kwargs
+
+        assert first["since"] is None
+        assert first["count"] == 100
+        assert second["since"] == last_open
+        assert 1 <= second["count"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_forming_bar_skipped_and_event_published_once(self, data_pipeline):
+        """Only closed, unseen bars reach subscribers, one event per symbol."""
+        data_pipeline.add_pull_config(name="fx", symbols=["EURUSD"])
+        config = data_pipeline.pull_configs["fx"]
+        closed_open = datetime.utcnow() - timedelta(minutes=7)
+        forming = _bar(datetime.utcnow() - timedelta(minutes=1))
+        data_pipeline.puller.get_ohlc_data = AsyncMock(
+            return_value=[_bar(closed_open), _bar(closed_open), forming]
+        )
+        data_pipeline.puller.get_all_symbols_data = AsyncMock(return_value={})
+        events: list[ClosedCandleEvent] = []
+
+        async def on_candle(event):
+            events.append(event)
+
+        data_pipeline.subscribe(on_candle)
+        await data_pipeline._pull_cycle("fx", config)
+        await data_pipeline._pull_cycle("fx", config)
+
+        assert len(events) == 1
+        assert events[0].symbol == "EURUSD"
+        assert events[0].timeframe == "M5"
+        assert events[0].candle["time_open"] == closed_open
+        assert len(events[0].bars) == 1
+
+    @pytest.mark.asyncio
+    async def test_subscriber_failure_does_not_fail_cycle(self, data_pipeline):
+        """A raising subscriber is logged and the cycle still succeeds."""
+        data_pipeline.add_pull_config(name="fx", symbols=["EURUSD"])
+        data_pipeline.puller.get_ohlc_data = AsyncMock(
+            return_value=[_bar(datetime.utcnow() - timedelta(minutes=10))]
+        )
+        data_pipeline.puller.get_all_symbols_data = AsyncMock(return_value={})
+        data_pipeline.subscribe(AsyncMock(side_effect=RuntimeError("boom")))
+
+        await data_pipeline._pull_cycle("fx", data_pipeline.pull_configs["fx"])
+
+        assert data_pipeline.status.successful_pulls == 1
+
+    @pytest.mark.asyncio
+    async def test_store_upsert_dedupes_and_seeds_high_water(
+        self, mt5_puller, candle_store
+    ):
+        """Re-upserting a bar updates it in place; marks come from the store."""
+        t0 = datetime(2025, 1, 1, 10, 0)
+        await candle_store.upsert_candles(
+            "EURUSD", "M5", [_bar(t0), _bar(t0 + timedelta(minutes=5))]
+        )
+        await candle_store.upsert_candles(
+            "EURUSD", "M5", [_bar(t0 + timedelta(minutes=5), close=1.07)]
+        )
+
+        async with candle_store.session_factory() as db:
+            rows = (
+                (await db.execute(select(OHLCCandle).order_by(OHLCCandle.time_open)))
+                .scalars()
+                .all()
+            )
+        marks = await candle_store.get_high_water_marks(["EURUSD", "GOLD"], "M5")
+
+        assert len(rows) == 2
+        assert rows[1].close == pytest.approx(1.07)
+        assert marks["EURUSD"].replace(tzinfo=None) == t0 + timedelta(minutes=5)
+        assert "GOLD" not in marks
+
+        pipeline = DataPipeline(mt5_puller, store=candle_store)
+        pipeline.add_pull_config(name="fx", symbols=["EURUSD"])
+        pipeline.puller.get_ohlc_data = AsyncMock(return_value=[])
+        pipeline.puller.get_all_symbols_data = AsyncMock(return_value={})
+
+        await pipeline._pull_cycle("fx", pipeline.pull_configs["fx"])
+
+        kwargs = pipeline.puller.get_ohlc_data.await_args.kwargs
+        assert kwargs["since"] == t0 + timedelta(minutes=5)
+
+    @pytest.mark.asyncio
+    async def test_store_upsert_chunks_large_backfill(self, candle_store):
+        """A backfill larger than one statement's bind limit is chunked."""
+        t0 = datetime(2025, 1, 1)
+        bars = [_bar(t0 + timedelta(minutes=5 * i)) for i in range(5000)]
+
+        assert await candle_store.upsert_candles("EURUSD", "M5", bars) == 5000
+
+        async with candle_store.session_factory() as db:
+            count = await db.scalar(select(func.count()).select_from(OHLCCandle))
+        assert count == 5000
+
+    @pytest.mark.asyncio
+    async def test_scheduler_runs_on_closed_candle(self):
+        """StrategyScheduler.on_closed_candle runs strategies at the boundary."""
+        scheduler = StrategyScheduler(
+            registry=MagicMock(get_enabled_strategies=MagicMock(return_value=[])),
+            signal_publisher=MagicMock(),
+        )
+        scheduler.run_strategies = AsyncMock(return_value={})
+        bar = _bar(datetime(2025, 1, 1, 10, 0))
+        event = ClosedCandleEvent(
+            symbol="EURUSD", timeframe="M15", candle=bar, bars=[bar]
+        )
+
+        result = await scheduler.on_closed_candle(event)
+
+        assert result == {}
+        df, instrument, timestamp = scheduler.run_strategies.await_args.args
+        assert instrument == "EURUSD"
+        assert timestamp == datetime(2025, 1, 1, 10, 15)
+        assert list(df["close"]) == [1.05]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
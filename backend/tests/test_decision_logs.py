@@ -11,14 +11,20 @@ Tests cover:
 - Database operations with JSONB
 """
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import sqlalchemy as sa
 from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
 
+from backend.app.strategy.logs import archive
+from backend.app.strategy.logs.archive import month_start
 from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
 from backend.app.strategy.logs.service import DecisionLogService, record_decision
+from backend.app.strategy.logs.writer import DecisionLogWriter
 
 
 @pytest.fixture
@@ -877,3 +883,141 @@ class TestMetrics:
         # Verify decision was recorded (implies metrics were incremented)
         assert log.id is not None
         assert log.strategy == "ppo_gold"
+
+
+class TestBufferedWriter:
+    """Test buffered recording through DecisionLogWriter."""
+
+    @staticmethod
+    def _writer(db_session, **kwargs) -> DecisionLogWriter:
+        @asynccontextmanager
+        async def session_factory():
+            yield db_session
+
+        return DecisionLogWriter(session_factory, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_record_decision_is_queued_then_written(
+        self, db_session, sample_features
+    ):
+        """Test decisions are written in batches by the flusher."""
+        writer = self._writer(db_session, max_rows=3, flush_interval_ms=50)
+        service = DecisionLogService(db_session, writer=writer)
+
+        logs = [
+            await service.record_decision(
+                strategy="fib_rsi",
+                symbol=f"SYM{i}",
+                features={**sample_features, "email": "a@b.com"},
+                outcome=DecisionOutcome.SKIPPED,
+            )
+            for i in range(7)
+        ]
+        await writer.stop()
+
+        result = await db_session.execute(select(DecisionLog))
+        stored = {log.id: log for log in result.scalars().all()}
+        assert set(stored) == {log.id for log in logs}
+        assert stored[logs[0].id].features["email"] == "[REDACTED]"
+        assert writer.written == 7
+        assert writer.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_counted(self, db_session):
+        """Test a failing INSERT is logged and counted, not raised to callers."""
+        writer = self._writer(db_session, flush_interval_ms=10)
+        row = {
+            "id": "dup",
+            "timestamp": datetime.utcnow(),
+            "strategy": "fib_rsi",
+            "symbol": "GOLD",
+            "features": {},
+            "outcome": DecisionOutcome.ENTERED,
+            "note": None,
+        }
+        await writer.submit(row)
+        await writer.flush()
+        await writer.submit(dict(row))  # duplicate primary key
+        await writer.stop()
+
+        assert writer.written == 1
+        assert writer.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self, db_session):
+        """Test a batch that fails transiently is retried, not dropped."""
+        attempts = []
+
+        @asynccontextmanager
+        async def session_factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OperationalError("INSERT", {}, Exception("connection lost"))
+            yield db_session
+
+        writer = DecisionLogWriter(
+            session_factory, flush_interval_ms=10, retry_delay_ms=1
+        )
+        await writer.submit(
+            {
+                "id": "retried",
+                "timestamp": datetime.utcnow(),
+                "strategy": "fib_rsi",
+                "symbol": "GOLD",
+                "features": {},
+                "outcome": DecisionOutcome.ENTERED,
+                "note": None,
+            }
+        )
+        await writer.stop()
+
+        assert len(attempts) == 2
+        assert writer.retries == 1
+        assert writer.written == 1
+        assert writer.failed == 0
+        assert await db_session.get(DecisionLog, "retried") is not None
+
+    @pytest.mark.asyncio
+    async def test_partitions_cached_only_after_commit(self):
+        """Test a partition created by a rolled-back batch is created again."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.rollback = AsyncMock()
+        session.commit = AsyncMock(
+            side_effect=[OperationalError("COMMIT", {}, Exception("lost")), None]
+        )
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        ts = datetime(2031, 3, 15, 12, 0)
+        writer = DecisionLogWriter(
+            session_factory, flush_interval_ms=10, retry_delay_ms=1
+        )
+        with patch(
+            "backend.app.strategy.logs.archive.is_partitioned",
+            AsyncMock(return_value=True),
+        ):
+            await writer.submit(
+                {
+                    "id": "partitioned",
+                    "timestamp": ts,
+                    "strategy": "fib_rsi",
+                    "symbol": "GOLD",
+                    "features": {},
+                    "outcome": DecisionOutcome.ENTERED,
+                    "note": None,
+                }
+            )
+            await writer.stop()
+
+        ddl = [
+            str(call.args[0])
+            for call in session.execute.await_args_list
+            if "PARTITION OF decision_logs" in str(call.args[0])
+        ]
+        assert len(ddl) == 2
+        assert writer.retries == 1
+        assert month_start(ts) in archive._known_partitions
+        archive._known_partitions.discard(month_start(ts))
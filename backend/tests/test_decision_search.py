@@ -457,3 +457,155 @@ async def test_search_decisions_increments_telemetry(
 
     # Verify metric incremented
     assert len(inc_called) == 1, "decision_search_total should be incremented once"
+
+
+@pytest.fixture
+def decision_archive(tmp_path):
+    """Parquet archive in a temp dir, injected into the decision routes."""
+    from backend.app.main import app
+    from backend.app.strategy.logs.archive import (
+        DecisionArchive,
+        get_decision_archive,
+    )
+
+    archive = DecisionArchive(tmp_path / "decision_archive")
+    app.dependency_overrides[get_decision_archive] = lambda: archive
+    yield archive
+    app.dependency_overrides.pop(get_decision_archive, None)
+
+
+@pytest.mark.asyncio
+async def test_search_continues_into_archive(
+    client: AsyncClient, db_session, decision_archive
+):
+    """Test archived months are searched and paged after database rows."""
+    from backend.app.strategy.logs.archive import archive_decision_logs
+
+    now = datetime.utcnow().replace(microsecond=0)
+    old = datetime(now.year - 1, 1, 15, 12, 0, 0)
+    ids = []
+    for i, ts in enumerate(
+        [now - timedelta(minutes=1), now - timedelta(minutes=2)]
+        + [old + timedelta(days=i) for i in range(3)]
+    ):
+        decision = DecisionLog(
+            id=str(uuid4()),
+            timestamp=ts,
+            strategy="fib_rsi",
+            symbol="GOLD",
+            outcome=DecisionOutcome.ENTERED,
+            features={"rsi_14": 60.0 + i},
+            note="archived" if ts < now - timedelta(days=1) else None,
+        )
+        db_session.add(decision)
+        ids.append(decision.id)
+    await db_session.commit()
+
+    archived = await archive_decision_logs(
+        db_session, before=datetime(now.year, 1, 1), archive=decision_archive
+    )
+    assert archived == 3
+
+    response = await client.get("/api/v1/decisions/search?page_size=3")
+    data = response.json()
+    assert data["total"] == 5
+    assert [r["id"] for r in data["results"]] == [ids[0], ids[1], ids[4]]
+    assert data["results"][2]["features"] == {"rsi_14": 64.0}
+    assert data["results"][2]["note"] == "archived"
+
+    # Offset page lands entirely in the archive
+    response = await client.get("/api/v1/decisions/search?page=2&page_size=3")
+    assert [r["id"] for r in response.json()["results"]] == [ids[3], ids[2]]
+
+    # Keyset cursor crosses the archive boundary
+    response = await client.get(
+        f"/api/v1/decisions/search?page_size=3&cursor={data['next_cursor']}"
+    )
+    page = response.json()
+    assert [r["id"] for r in page["results"]] == [ids[3], ids[2]]
+    assert page["next_cursor"] is None
+
+    # Archived decisions are still retrievable by id
+    response = await client.get(f"/api/v1/decisions/{ids[2]}")
+    assert response.status_code == 200
+    assert response.json()["features"] == {"rsi_14": 62.0}
+
+
+@pytest.mark.asyncio
+async def test_archive_filters_and_recent_start_date(
+    client: AsyncClient, db_session, decision_archive
+):
+    """Test filters apply to archived rows and recent ranges skip the archive."""
+    from backend.app.strategy.logs.archive import archive_decision_logs
+
+    now = datetime.utcnow().replace(microsecond=0)
+    old = datetime(now.year - 1, 3, 1)
+    for i, strategy in enumerate(["fib_rsi", "ppo_gold", "fib_rsi"]):
+        db_session.add(
+            DecisionLog(
+                id=str(uuid4()),
+                timestamp=old + timedelta(hours=i),
+                strategy=strategy,
+                symbol="GOLD",
+                outcome=DecisionOutcome.SKIPPED,
+                features={},
+            )
+        )
+    await db_session.commit()
+    await archive_decision_logs(
+        db_session, before=datetime(now.year, 1, 1), archive=decision_archive
+    )
+
+    response = await client.get("/api/v1/decisions/search?strategy=ppo_gold")
+    assert response.json()["total"] == 1
+
+    response = await client.get(
+        "/api/v1/decisions/search",
+        params={"start_date": (now - timedelta(days=1)).isoformat()},
+    )
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_archive_counts_without_reading_rows(
+    client: AsyncClient, db_session, decision_archive
+):
+    """Test totals come from per-month counts and pages read only what they need."""
+    from backend.app.strategy.logs.archive import archive_decision_logs
+
+    now = datetime.utcnow().replace(microsecond=0)
+    first = datetime(now.year - 1, 2, 10)
+    for month_offset, strategy in [(0, "fib_rsi"), (0, "ppo_gold"), (2, "fib_rsi")]:
+        db_session.add(
+            DecisionLog(
+                id=str(uuid4()),
+                timestamp=first + timedelta(days=31 * month_offset),
+                strategy=strategy,
+                symbol="GOLD",
+                outcome=DecisionOutcome.SKIPPED,
+                features={},
+            )
+        )
+    await db_session.commit()
+    await archive_decision_logs(
+        db_session, before=datetime(now.year, 1, 1), archive=decision_archive
+    )
+
+    months = decision_archive.months()
+    assert len(months) == 2
+    assert all(decision_archive.counts_path(m).exists() for m in months)
+    assert decision_archive.count() == 3
+    assert decision_archive.count(strategy="fib_rsi") == 2
+    # A range cutting a month counts that month from its timestamps
+    assert decision_archive.count(start=first + timedelta(days=1)) == 1
+
+    # Archives written before counts were kept rebuild them on demand
+    decision_archive.counts_path(months[0]).unlink()
+    response = await client.get("/api/v1/decisions/search?strategy=ppo_gold")
+    assert response.json()["total"] == 1
+    assert decision_archive.counts_path(months[0]).exists()
+
+    # The newest month covers a one-row page; the older file is not opened
+    decision_archive.path(months[0]).write_bytes(b"not parquet")
+    rows = decision_archive.search(limit=1)
+    assert [r.timestamp for r in rows] == [first + timedelta(days=62)]
@@ -0,0 +1,178 @@
+"""Tests for streaming feature sketches and sketch-based drift checks."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.features.quality import QualityMonitor, ViolationType
+from backend.app.features.sketches import (
+    DriftSketch,
+    FeatureSketch,
+    QuantileSketch,
+    SketchRegistry,
+)
+
+
+def _gauss(n: int, mu: float = 0.0, sigma: float = 1.0, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [rng.gauss(mu, sigma) for _ in range(n)]
+
+
+class TestQuantileSketch:
+    """Test KLL accuracy and merging."""
+
+    def test_quantiles_within_rank_error(self):
+        """Test quantiles of a large stream stay close to the exact ones."""
+        values = _gauss(20_000)
+        sketch = QuantileSketch(k=200)
+        for v in values:
+            sketch.add(v)
+
+        exact = sorted(values)
+        for q in (0.1, 0.5, 0.9):
+            estimate = sketch.quantile(q)
+            rank = sum(1 for v in exact if v <= estimate) / len(exact)
+            assert abs(rank - q) < 0.02
+
+        assert sketch.count == 20_000
+        assert len(sketch.weighted_items()) < 1_000
+
+    def test_merge_matches_single_stream(self):
+        """Test merging two halves approximates the combined stream."""
+        values = _gauss(10_000)
+        left, right, whole = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for v in values[:5_000]:
+            left.add(v)
+        for v in values[5_000:]:
+            right.add(v)
+        for v in values:
+            whole.add(v)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert abs(left.cdf(0.0) - whole.cdf(0.0)) < 0.02
+
+
+class TestFeatureSketch:
+    """Test running moments."""
+
+    def test_merge_moments_exact(self):
+        """Test Chan's merge gives the same mean/stdev as one pass."""
+        values = _gauss(1_000, mu=50.0, sigma=5.0)
+        a, b, whole = FeatureSketch(), FeatureSketch(), FeatureSketch()
+        for v in values[:300]:
+            a.add(v)
+        for v in values[300:]:
+            b.add(v)
+        for v in values:
+            whole.add(v)
+
+        a.merge(b)
+
+        assert a.count == 1_000
+        assert a.mean == pytest.approx(whole.mean)
+        assert a.stdev == pytest.approx(whole.stdev)
+
+
+class TestDriftSketch:
+    """Test PSI/KS drift scores."""
+
+    def test_stable_stream_scores_low(self):
+        """Test same-distribution windows score well below drift thresholds."""
+        sketch = DriftSketch(window=500)
+        for v in _gauss(2_800):
+            sketch.add(v)
+
+        assert sketch.psi() < 0.1
+        assert sketch.ks() < 0.1
+
+    def test_shifted_stream_scores_high(self):
+        """Test a mean shift in the recent window raises PSI and KS."""
+        sketch = DriftSketch(window=500)
+        for v in _gauss(2_000):
+            sketch.add(v)
+        for v in _gauss(400, mu=1.5, seed=11):
+            sketch.add(v)
+
+        assert sketch.psi() > 0.25
+        assert sketch.ks() > 0.3
+
+    def test_scores_need_samples(self):
+        """Test PSI/KS are undefined until both sides have enough data."""
+        sketch = DriftSketch(window=500)
+        for v in _gauss(20):
+            sketch.add(v)
+
+        assert sketch.psi() is None
+        assert sketch.ks() is None
+
+
+class TestSketchRegistry:
+    """Test registry updates and persistence."""
+
+    def test_update_skips_non_numeric(self):
+        """Test bools, strings and NaN are not sketched."""
+        registry = SketchRegistry()
+        registry.update(
+            "GOLD",
+            {"rsi_14": 60.0, "flag": True, "label": "up", "roc": float("nan")},
+        )
+
+        assert registry.get("GOLD", "rsi_14").count == 1
+        assert registry.get("GOLD", "flag") is None
+        assert registry.get("GOLD", "label") is None
+        assert registry.get("GOLD", "roc") is None
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test a restarted registry resumes with the same sketches."""
+        path = str(tmp_path / "sketches.json")
+        registry = SketchRegistry(path=path, window=100)
+        for v in _gauss(750):
+            registry.update("GOLD", {"rsi_14": v})
+        registry.save()
+
+        restored = SketchRegistry.load(path, window=100)
+        before = registry.get("GOLD", "rsi_14")
+        after = restored.get("GOLD", "rsi_14")
+
+        assert after.count == before.count
+        assert after.moments() == pytest.approx(before.moments())
+        assert after.psi() == pytest.approx(before.psi())
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        """Test an unreadable file yields an empty registry."""
+        path = tmp_path / "sketches.json"
+        path.write_text("{not json")
+
+        registry = SketchRegistry.load(str(path))
+
+        assert registry.get("GOLD", "rsi_14") is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_drift_from_sketches(db_session: AsyncSession):
+    """Test QualityMonitor flags drift from sketches fed by FeatureStore."""
+    registry = SketchRegistry()
+    monitor = QualityMonitor(db_session, sketches=registry)
+    now = datetime.now(UTC)
+
+    for v in _gauss(50, mu=50.0, sigma=1.0):
+        registry.update("GOLD", {"rsi_14": v})
+    # Latest snapshot goes through the store and updates the sketch too
+    await monitor.store.put_features(
+        symbol="GOLD",
+        timestamp=now - timedelta(seconds=1),
+        features={"rsi_14": 80.0},
+        quality_score=0.95,
+    )
+
+    report = await monitor.check_quality("GOLD")
+
+    drift = [v for v in report.violations if v.type == ViolationType.DRIFT_DETECTED]
+    assert len(drift) == 1
+    assert drift[0].metadata["feature"] == "rsi_14"
+    assert drift[0].metadata["baseline_samples"] == 51
+    assert registry.get("GOLD", "rsi_14").count == 51
@@ -9,17 +9,20 @@ Coverage targets:
 - Timestamp ordering
 - JSONB validation
 - Count operations
-- Cleanup (delete_old_snapshots)
+- Cleanup (delete_old_snapshots, apply_retention)
+- Batched ingest, projected frame reads, latest-snapshot cache
 - Edge cases (missing data, boundary conditions)
 """
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
+import pandas as pd
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.features.models import FeatureSnapshot
-from backend.app.features.store import FeatureStore
+from backend.app.features.store import FeatureStore, LatestSnapshotCache
 
 
 @pytest.mark.asyncio
@@ -508,3 +511,150 @@ async def test_multiple_symbols_isolation(db_session: AsyncSession):
     assert gold_latest.features["rsi"] == 65.0
     assert silver_latest.features["rsi"] == 55.0
     assert xauusd_latest.features["rsi"] == 70.0
+
+
+@pytest.mark.asyncio
+async def test_put_features_batch_columnar(db_session: AsyncSession):
+    """✅ REAL TEST: Batch ingest stores one snapshot per frame row."""
+    store = FeatureStore(db_session)
+    base_time = datetime(2025, 11, 9, 12, 0)
+    frame = pd.DataFrame(
+        {"rsi_14": [60.0, 61.0, None], "atr_14": [12.0, 12.5, 13.0]},
+        index=[base_time + timedelta(minutes=15 * i) for i in range(3)],
+    )
+
+    stored = await store.put_features_batch("GOLD", frame, quality_score=[1, 0.9, 0.8])
+
+    assert stored == 3
+    assert await store.count_snapshots(symbol="GOLD") == 3
+    latest = await store.get_latest("GOLD")
+    assert latest.features == {"atr_14": 13.0}  # NaN dropped, not stored
+    assert latest.quality_score == 0.8
+
+
+@pytest.mark.asyncio
+async def test_put_features_batch_validates_quality(db_session: AsyncSession):
+    """✅ REAL TEST: Batch ingest rejects out-of-range or misaligned scores."""
+    store = FeatureStore(db_session)
+    frame = pd.DataFrame({"rsi_14": [60.0, 61.0]}, index=[datetime(2025, 1, 1)] * 2)
+
+    with pytest.raises(ValueError, match="quality_score"):
+        await store.put_features_batch("GOLD", frame, quality_score=1.5)
+    with pytest.raises(ValueError, match="Expected 2"):
+        await store.put_features_batch("GOLD", frame, quality_score=[1.0])
+
+
+@pytest.mark.asyncio
+async def test_get_features_frame_projects_and_orders(db_session: AsyncSession):
+    """✅ REAL TEST: Frame read covers several symbols with projected columns."""
+    store = FeatureStore(db_session)
+    base_time = datetime(2025, 11, 9, 12, 0)
+    for i in range(3):
+        for symbol, offset in (("GOLD", 0.0), ("SILVER", 100.0)):
+            await store.put_features(
+                symbol=symbol,
+                timestamp=base_time + timedelta(hours=i),
+                features={"rsi_14": offset + i, "atr_14": 10.0, "label": "x"},
+            )
+
+    frame = await store.get_features_frame(
+        ["GOLD", "SILVER"],
+        start=base_time + timedelta(hours=1),
+        feature_names=["rsi_14", "label", "missing"],
+    )
+
+    assert list(frame.columns) == [
+        "symbol",
+        "timestamp",
+        "quality_score",
+        "rsi_14",
+        "label",
+        "missing",
+    ]
+    assert frame["symbol"].tolist() == ["GOLD", "GOLD", "SILVER", "SILVER"]
+    assert frame["rsi_14"].tolist() == [1.0, 2.0, 101.0, 102.0]
+    assert frame["label"].isna().all()  # non-numeric -> NaN
+    assert frame["missing"].isna().all()
+
+
+@pytest.mark.asyncio
+async def test_get_features_frame_all_features(db_session: AsyncSession):
+    """✅ REAL TEST: Without feature_names every feature becomes a column."""
+    store = FeatureStore(db_session)
+    base_time = datetime(2025, 11, 9, 12, 0)
+    await store.put_features("GOLD", base_time, {"rsi_14": 60.0})
+    await store.put_features("GOLD", base_time + timedelta(hours=1), {"atr_14": 9.0})
+
+    frame = await store.get_features_frame("GOLD")
+
+    assert set(frame.columns) >= {"rsi_14", "atr_14"}
+    assert frame["rsi_14"].tolist()[0] == 60.0
+    assert frame["atr_14"].tolist()[1] == 9.0
+
+
+@pytest.mark.asyncio
+async def test_latest_cache_serves_without_query(db_session: AsyncSession):
+    """✅ REAL TEST: Shared cache serves get_latest without hitting the DB."""
+    cache = LatestSnapshotCache()
+    writer = FeatureStore(db_session, latest_cache=cache)
+    stored = await writer.put_features("GOLD", datetime.now(UTC), {"rsi_14": 65.0})
+
+    reader = FeatureStore(db_session, latest_cache=cache)
+    with patch.object(db_session, "execute", side_effect=AssertionError("DB hit")):
+        latest = await reader.get_latest("GOLD")
+
+    assert latest.id == stored.id
+    assert latest.features == {"rsi_14": 65.0}
+
+
+@pytest.mark.asyncio
+async def test_latest_cache_ignores_older_writes(db_session: AsyncSession):
+    """✅ REAL TEST: A backfilled older snapshot does not replace the latest."""
+    store = FeatureStore(db_session)
+    now = datetime.now(UTC)
+    newest = await store.put_features("GOLD", now, {"rsi_14": 70.0})
+    await store.put_features("GOLD", now - timedelta(hours=1), {"rsi_14": 50.0})
+
+    latest = await store.get_latest("GOLD")
+
+    assert latest.id == newest.id
+
+
+@pytest.mark.asyncio
+async def test_apply_retention_all_symbols(db_session: AsyncSession):
+    """✅ REAL TEST: Retention removes old snapshots of every symbol at once."""
+    store = FeatureStore(db_session)
+    now = datetime.now(UTC)
+    for symbol in ("GOLD", "SILVER"):
+        await store.put_features(symbol, now - timedelta(days=40), {"rsi": 1.0})
+        await store.put_features(symbol, now, {"rsi": 2.0})
+
+    removed = await store.apply_retention(now - timedelta(days=30))
+
+    assert removed == 2
+    assert await store.count_snapshots() == 2
+
+
+@pytest.mark.asyncio
+async def test_partitions_cached_only_after_commit(db_session: AsyncSession):
+    """✅ REAL TEST: A rolled-back partition is not remembered as created."""
+    store = FeatureStore(db_session)
+    ts = datetime(2031, 1, 2, 12, tzinfo=UTC)
+    frame = pd.DataFrame({"rsi_14": [65.3]}, index=[ts])
+
+    with (
+        patch.object(FeatureStore, "_is_partitioned", return_value=True),
+        patch.object(db_session, "execute") as execute,
+    ):
+        with patch.object(db_session, "commit", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                await store.put_features_batch("GOLD", frame)
+        assert ts.date() not in FeatureStore._known_partitions
+
+        await store.put_features_batch("GOLD", frame)
+
+    # The partition DDL was issued again for the retried write
+    ddl = [str(call.args[0]) for call in execute.await_args_list]
+    assert sum("PARTITION OF feature_snapshots" in sql for sql in ddl) == 2
+    assert ts.date() in FeatureStore._known_partitions
+    FeatureStore._known_partitions.discard(ts.date())
@@ -578,6 +578,156 @@ async def test_scan_recent_trades_empty_result(db_session: AsyncSession):
     assert len(anomalies) == 0, "Scanner should return empty list with no trades"
 
 
+async def _add_closed_trades(
+    db_session: AsyncSession, user_id: str, prices: list[str], symbol: str = "GOLD"
+) -> list[Trade]:
+    """Insert closed trades (with signals) at the given entry prices."""
+    base_time = datetime.utcnow() - timedelta(hours=6)
+    trades = [
+        Trade(
+            user_id=user_id,
+            signal_id=f"signal-bulk-{i}",
+            symbol=symbol,
+            strategy="fib_rsi",
+            timeframe="H1",
+            trade_type="BUY",
+            direction=0,
+            entry_price=Decimal(price),
+            entry_time=base_time + timedelta(minutes=i),
+            stop_loss=Decimal("1900.00"),
+            take_profit=Decimal("2100.00"),
+            volume=Decimal("0.10"),
+            status="CLOSED",
+            exit_price=Decimal(price),
+            exit_time=base_time + timedelta(minutes=i + 60),
+        )
+        for i, price in enumerate(prices)
+    ]
+    db_session.add_all(trades)
+    await db_session.commit()
+    return trades
+
+
+@pytest.mark.asyncio
+async def test_scan_matches_per_trade_slippage_detector(
+    db_session: AsyncSession, test_user: User
+):
+    """Test bulk scoring flags the same trades with the same z-scores.
+
+    Business Logic:
+        - 15 tightly clustered fills plus one far outlier
+        - Per-trade detector (one query per trade) is the reference
+        - Bulk scan must agree trade-for-trade
+    """
+    prices = [f"{1950 + (i % 5) * 0.1:.2f}" for i in range(15)] + ["2000.00"]
+    trades = await _add_closed_trades(db_session, test_user.id, prices)
+
+    expected = {}
+    for trade in trades:
+        anomaly = await detect_slippage_zscore(db_session, trade)
+        if anomaly is not None:
+            expected[trade.trade_id] = anomaly.details["z_score"]
+
+    anomalies = await scan_recent_trades(db_session, hours=24)
+    actual = {
+        a.trade_id: a.details["z_score"]
+        for a in anomalies
+        if a.anomaly_type == AnomalyType.SLIPPAGE_EXTREME
+    }
+
+    assert expected, "Outlier fill should be flagged"
+    assert actual.keys() == expected.keys()
+    for trade_id, z_score in expected.items():
+        assert actual[trade_id] == pytest.approx(z_score)
+
+
+@pytest.mark.asyncio
+async def test_scan_trades_since_only_scores_new_trades(
+    db_session: AsyncSession, test_user: User
+):
+    """Test incremental scans advance the watermark and skip scanned trades."""
+    from backend.app.fraud.detectors import scan_trades_since
+
+    await _add_closed_trades(db_session, test_user.id, ["1950.00", "1951.00"])
+    start = datetime.utcnow() - timedelta(days=1)
+
+    first, watermark = await scan_trades_since(db_session, start)
+    again, same_watermark = await scan_trades_since(db_session, watermark)
+
+    assert {a.trade_id for a in first} and watermark > start
+    assert again == []
+    assert same_watermark == watermark
+
+    new_trade = Trade(
+        user_id=test_user.id,
+        signal_id="signal-bulk-new",
+        symbol="EURUSD",
+        strategy="fib_rsi",
+        timeframe="H1",
+        trade_type="BUY",
+        direction=0,
+        entry_price=Decimal("1.1000"),
+        entry_time=datetime.utcnow(),
+        stop_loss=Decimal("1.0900"),
+        take_profit=Decimal("1.1100"),
+        volume=Decimal("0.10"),
+        status="CLOSED",
+        exit_price=Decimal("1.1050"),
+        exit_time=watermark + timedelta(seconds=1),
+    )
+    db_session.add(new_trade)
+    await db_session.commit()
+
+    latest, _ = await scan_trades_since(db_session, watermark)
+
+    assert {a.trade_id for a in latest} == {new_trade.trade_id}
+
+
+@pytest.mark.asyncio
+async def test_scan_trades_since_picks_up_trades_closed_after_watermark(
+    db_session: AsyncSession, test_user: User
+):
+    """Test a trade opened before the watermark is scanned once it closes."""
+    from backend.app.fraud.detectors import scan_trades_since
+
+    await _add_closed_trades(db_session, test_user.id, ["1950.00", "1951.00"])
+    _, watermark = await scan_trades_since(
+        db_session, datetime.utcnow() - timedelta(days=1)
+    )
+
+    # Created (opened) well before the watermark, still open at scan time
+    long_trade = Trade(
+        user_id=test_user.id,
+        signal_id="signal-bulk-long",
+        symbol="EURUSD",
+        strategy="fib_rsi",
+        timeframe="H1",
+        trade_type="BUY",
+        direction=0,
+        entry_price=Decimal("1.1000"),
+        entry_time=watermark - timedelta(hours=2),
+        stop_loss=Decimal("1.0900"),
+        take_profit=Decimal("1.1100"),
+        volume=Decimal("0.10"),
+        status="OPEN",
+        created_at=watermark - timedelta(hours=2),
+    )
+    db_session.add(long_trade)
+    await db_session.commit()
+
+    assert await scan_trades_since(db_session, watermark) == ([], watermark)
+
+    long_trade.status = "CLOSED"
+    long_trade.exit_price = Decimal("1.1050")
+    long_trade.exit_time = watermark + timedelta(minutes=5)
+    await db_session.commit()
+
+    latest, new_watermark = await scan_trades_since(db_session, watermark)
+
+    assert {a.trade_id for a in latest} == {long_trade.trade_id}
+    assert new_watermark == long_trade.exit_time
+
+
 # ============================================================================
 # API ROUTE TESTS
 # ============================================================================
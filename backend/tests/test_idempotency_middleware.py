@@ -1,7 +1,22 @@
+import asyncio
 import uuid
 
+import fakeredis.aioredis
 import pytest
-from httpx import AsyncClient
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.core.idempotency import (
+    CHECK_BUSY,
+    CHECK_HIT,
+    CHECK_LOCKED,
+    RedisIdempotencyStorage,
+    decode_response_payload,
+    encode_response_payload,
+)
+from backend.app.core.middleware import MAX_CACHED_BODY_BYTES, IdempotencyMiddleware
+from backend.app.core.redis import get_redis
 
 
 @pytest.mark.asyncio
@@ -40,3 +55,140 @@ async def test_idempotency_concurrent_lock(client: AsyncClient):
     # This is hard to test with just client calls without mocking the storage delay.
     # But we can verify that different keys don't conflict.
     pass
+
+
+# ============================================================================
+# STORAGE FAST PATH
+# ============================================================================
+
+
+def test_response_payload_roundtrip_preserves_raw_bytes():
+    """Encoded payload decodes to identical status, headers and body bytes."""
+    body = b'{"id": 1, "note": "caf\xc3\xa9"}' * 100
+    headers = [("content-type", "application/json"), ("set-cookie", "a=1")]
+
+    payload = encode_response_payload(201, headers, body)
+
+    assert len(payload) < len(body)
+    assert decode_response_payload(payload) == (201, headers, body)
+
+
+@pytest.mark.asyncio
+async def test_check_or_lock_hit_locked_busy():
+    """check_or_lock returns LOCKED, then BUSY, then HIT after complete()."""
+    storage = RedisIdempotencyStorage(fakeredis.aioredis.FakeRedis())
+    key = str(uuid.uuid4())
+
+    assert await storage.check_or_lock(key, ttl=60) == (CHECK_LOCKED, None)
+    assert await storage.check_or_lock(key, ttl=60) == (CHECK_BUSY, None)
+
+    payload = encode_response_payload(200, [], b"ok")
+    await storage.complete(key, payload, ttl=60)
+
+    assert await storage.check_or_lock(key, ttl=60) == (CHECK_HIT, payload)
+
+
+@pytest.mark.asyncio
+async def test_waiter_unblocks_on_completion():
+    """A duplicate request waits for the completion notification."""
+    storage = RedisIdempotencyStorage(fakeredis.aioredis.FakeRedis())
+    key = str(uuid.uuid4())
+    await storage.check_or_lock(key, ttl=60)
+
+    async def finish():
+        await asyncio.sleep(0.1)
+        await storage.complete(key, encode_response_payload(200, [], b"ok"), 60)
+
+    task = asyncio.create_task(finish())
+    assert await storage.wait_for_completion(key, timeout=5) is True
+    await task
+    assert await storage.get_payload(key) is not None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_times_out():
+    """Waiting on a lock that is never released returns False."""
+    storage = RedisIdempotencyStorage(fakeredis.aioredis.FakeRedis())
+    key = str(uuid.uuid4())
+    await storage.check_or_lock(key, ttl=60)
+
+    assert await storage.wait_for_completion(key, timeout=0.1) is False
+
+
+# ============================================================================
+# MIDDLEWARE CAPTURE
+# ============================================================================
+
+
+def _idempotent_app(calls: list[str]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(IdempotencyMiddleware)
+
+    @app.post("/small")
+    async def small():
+        calls.append("small")
+        return {"n": len(calls)}
+
+    @app.post("/large")
+    async def large():
+        calls.append("large")
+
+        async def chunks():
+            for _ in range(4):
+                yield b"x" * (MAX_CACHED_BODY_BYTES // 2)
+
+        return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_middleware_replays_raw_bytes():
+    """Second request with the same key replays the exact cached bytes."""
+    calls: list[str] = []
+    transport = ASGITransport(app=_idempotent_app(calls))
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/small", headers=headers)
+        second = await ac.post("/small", headers=headers)
+
+    assert calls == ["small"]
+    assert second.headers["X-Idempotency-Hit"] == "true"
+    assert second.content == first.content
+
+
+@pytest.mark.asyncio
+async def test_middleware_large_body_passthrough_not_cached():
+    """Bodies over the cap stream through intact; retries are refused."""
+    calls: list[str] = []
+    transport = ASGITransport(app=_idempotent_app(calls))
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/large", headers=headers)
+        second = await ac.post("/large", headers=headers)
+
+    assert len(first.content) == 2 * MAX_CACHED_BODY_BYTES
+    assert second.status_code == 409
+    assert calls == ["large"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_ignores_legacy_and_corrupt_entries():
+    """Legacy JSON entries are not read; corrupt payloads are never re-run."""
+    calls: list[str] = []
+    transport = ASGITransport(app=_idempotent_app(calls))
+    legacy, corrupt = str(uuid.uuid4()), str(uuid.uuid4())
+    storage = RedisIdempotencyStorage(await get_redis())
+    await storage.set(legacy, {"status_code": 200, "body": "{}"}, ttl=60)
+    await storage.redis.set(f"idempotency:v2:response:{corrupt}", b"garbage")
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/small", headers={"Idempotency-Key": legacy})
+        second = await ac.post("/small", headers={"Idempotency-Key": corrupt})
+        replay = await ac.post("/small", headers={"Idempotency-Key": corrupt})
+
+    assert first.status_code == 200
+    assert second.status_code == replay.status_code == 409
+    assert calls == ["small"]
@@ -0,0 +1,192 @@
+"""Tests for the shared hierarchical sender rate limiter.
+
+Tests cover:
+- Bucket hierarchies (telegram global/chat/group, email domain, push user)
+- Reservation semantics (wait returned, deny beyond max_wait)
+- Penalize after upstream 429
+- Local fallback when Redis is unavailable
+- SendScheduler: per-lane ordering, hot lane does not block others
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.app.messaging.rate_limiter import (
+    BucketSpec,
+    MessageRateLimiter,
+    SendScheduler,
+    email_buckets,
+    push_buckets,
+    telegram_buckets,
+)
+
+
+@pytest.fixture
+def limiter():
+    """Limiter without Redis (process-local buckets)."""
+    return MessageRateLimiter()
+
+
+class TestBucketHierarchies:
+    """Test bucket hierarchy builders."""
+
+    def test_telegram_private_chat_has_global_and_chat_buckets(self):
+        """Private chats get the global and per-chat buckets only."""
+        keys = [b.key for b in telegram_buckets("123456789")]
+        assert keys == ["telegram:global", "telegram:chat:123456789"]
+
+    def test_telegram_group_adds_group_bucket(self):
+        """Group chats (negative IDs) also get the 20/minute group bucket."""
+        buckets = telegram_buckets("-100123")
+        assert buckets[-1].key == "telegram:group:-100123"
+        assert buckets[-1].refill_per_second == pytest.approx(20 / 60)
+
+    def test_email_buckets_keyed_by_domain(self):
+        """Email recipients share a bucket per domain (case-insensitive)."""
+        assert email_buckets("a@Gmail.com")[1] == email_buckets("b@gmail.com")[1]
+
+    def test_push_buckets_keyed_by_user(self):
+        """Push notifications get a per-user bucket."""
+        assert push_buckets("user-1")[1].key == "push:user:user-1"
+
+
+class TestMessageRateLimiter:
+    """Test reservation, denial and penalties on local buckets."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity_has_no_wait(self, limiter):
+        """First message to a chat is sent immediately."""
+        assert await limiter.acquire(telegram_buckets("1")) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_denied_beyond_max_wait(self, limiter):
+        """Second message to same chat within 1s is denied with max_wait=0."""
+        buckets = telegram_buckets("1")
+        await limiter.acquire(buckets)
+        assert await limiter.acquire(buckets, max_wait=0.0) is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_reserves_with_wait(self, limiter):
+        """With max_wait the token is reserved and the wait is returned."""
+        buckets = telegram_buckets("1")
+        await limiter.acquire(buckets)
+        wait = await limiter.acquire(buckets, max_wait=2.0)
+        assert wait == pytest.approx(1.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_denied_acquire_consumes_nothing(self, limiter):
+        """A denied acquire leaves every bucket in the hierarchy untouched."""
+        await limiter.acquire(telegram_buckets("1"))
+        assert await limiter.acquire(telegram_buckets("1")) is None
+
+        # Global bucket still has 19 tokens: other chats are unaffected
+        for chat in range(2, 21):
+            assert await limiter.acquire(telegram_buckets(str(chat))) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_global_bucket_limits_all_chats(self, limiter):
+        """Global bucket caps total sends across different chats."""
+        for chat in range(20):
+            assert await limiter.acquire(telegram_buckets(str(chat))) == 0.0
+        assert await limiter.acquire(telegram_buckets("new")) is None
+
+    @pytest.mark.asyncio
+    async def test_penalize_delays_next_acquire(self, limiter):
+        """After a 429 with retry_after, the next acquire waits that long."""
+        buckets = telegram_buckets("1")
+        await limiter.penalize(buckets[1], 3)
+        wait = await limiter.acquire(buckets, max_wait=10.0)
+        assert wait == pytest.approx(3.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_falls_back_to_local(self, limiter, monkeypatch):
+        """Script errors fall back to local buckets instead of failing open."""
+
+        class BrokenRedis:
+            async def eval(self, *args, **kwargs):
+                raise ConnectionError("down")
+
+        limiter.redis_client = BrokenRedis()
+        limiter._initialized = True
+
+        buckets = telegram_buckets("1")
+        assert await limiter.acquire(buckets) == 0.0
+        assert await limiter.acquire(buckets) is None
+
+
+class TestSendScheduler:
+    """Test rate-aware reordering of queued sends."""
+
+    @pytest.mark.asyncio
+    async def test_results_returned_in_input_order(self, limiter):
+        """Results align with input positions regardless of dispatch order."""
+        items = [{"chat": str(i)} for i in range(5)]
+
+        async def send(item):
+            return item["chat"]
+
+        results = await SendScheduler(limiter, concurrency=3).run(
+            items,
+            lane_key=lambda m: m["chat"],
+            buckets=lambda m: telegram_buckets(m["chat"]),
+            send=send,
+        )
+        assert results == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_hot_lane_does_not_block_other_lanes(self, limiter):
+        """Messages to other chats go out while a throttled chat waits."""
+        bucket = [BucketSpec("test:hot", 1, 20)]  # 1 token, refills in 50ms
+        items = [("hot", 1), ("hot", 2), ("cold", 3)]
+        sent_order = []
+
+        async def send(item):
+            sent_order.append(item[1])
+            return item[1]
+
+        await SendScheduler(limiter).run(
+            items,
+            lane_key=lambda m: m[0],
+            buckets=lambda m: bucket if m[0] == "hot" else [],
+            send=send,
+        )
+        assert sent_order == [1, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_lane_order_preserved_and_paced(self, limiter):
+        """Items in the same lane go out in order, paced by the bucket."""
+        bucket = [BucketSpec("test:lane", 1, 20)]
+        sent_at = []
+
+        async def send(item):
+            sent_at.append((item, time.monotonic()))
+
+        await SendScheduler(limiter).run(
+            [1, 2, 3],
+            lane_key=lambda m: "lane",
+            buckets=lambda m: bucket,
+            send=send,
+        )
+        assert [item for item, _ in sent_at] == [1, 2, 3]
+        assert sent_at[-1][1] - sent_at[0][1] >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_send_exceptions_are_returned(self, limiter):
+        """A failing send is captured in the results, others still complete."""
+
+        async def send(item):
+            if item == 2:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0)
+            return item
+
+        results = await SendScheduler(limiter).run(
+            [1, 2, 3],
+            lane_key=lambda m: m,
+            buckets=lambda m: [],
+            send=send,
+        )
+        assert results[0] == 1 and results[2] == 3
+        assert isinstance(results[1], RuntimeError)
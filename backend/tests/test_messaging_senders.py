@@ -49,6 +49,10 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 from pywebpush import WebPushException
 
+from backend.app.messaging.rate_limiter import (
+    get_message_rate_limiter,
+    telegram_buckets,
+)
 from backend.app.messaging.senders.email import MAX_EMAILS_PER_MINUTE
 from backend.app.messaging.senders.email import MAX_RETRIES as EMAIL_MAX_RETRIES
 from backend.app.messaging.senders.email import (
@@ -59,9 +63,6 @@ from backend.app.messaging.senders.push import MAX_RETRIES as PUSH_MAX_RETRIES
 from backend.app.messaging.senders.push import send_push
 from backend.app.messaging.senders.telegram import MAX_MESSAGES_PER_SECOND
 from backend.app.messaging.senders.telegram import MAX_RETRIES as TELEGRAM_MAX_RETRIES
-from backend.app.messaging.senders.telegram import (
-    _check_rate_limit as telegram_check_rate_limit,
-)
 from backend.app.messaging.senders.telegram import send_telegram
 
 
@@ -175,16 +176,18 @@ def clear_rate_limits():
 
     email_module._email_timestamps = []
 
-    # Clear telegram rate limits
-    import backend.app.messaging.senders.telegram as telegram_module
+    # Clear shared limiter buckets (process-local fallback state)
+    import backend.app.messaging.rate_limiter as rate_limiter_module
 
-    telegram_module._telegram_timestamps = []
+    if rate_limiter_module._limiter is not None:
+        rate_limiter_module._limiter.reset_local()
 
     yield
 
     # Cleanup after test
     email_module._email_timestamps = []
-    telegram_module._telegram_timestamps = []
+    if rate_limiter_module._limiter is not None:
+        rate_limiter_module._limiter.reset_local()
 
 
 # ===== EMAIL SENDER TESTS =====
@@ -699,31 +702,66 @@ class TestTelegramSenderErrors:
                 # Verify retried and succeeded
                 assert result["status"] == "sent"
 
+    @pytest.mark.asyncio
+    async def test_send_telegram_long_retry_after_still_retries(
+        self, mock_telegram_settings, mock_telegram_metrics, clear_rate_limits
+    ):
+        """A 429 longer than MAX_RATE_LIMIT_WAIT waits it out and retries."""
+        mock_response_429 = AsyncMock()
+        mock_response_429.status = 429
+        mock_response_429.json = AsyncMock(
+            return_value={
+                "ok": False,
+                "error_code": 429,
+                "description": "Too Many Requests",
+                "parameters": {"retry_after": 30},
+            }
+        )
+        mock_response_success = AsyncMock()
+        mock_response_success.status = 200
+        mock_response_success.json = AsyncMock(
+            return_value={"ok": True, "result": {"message_id": 124}}
+        )
 
-class TestTelegramRateLimiting:
-    """Test Telegram rate limiting (20/second)."""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_session.__aexit__ = AsyncMock(return_value=None)
+            posts = []
+            for response in (mock_response_429, mock_response_success):
+                post = MagicMock()
+                post.__aenter__ = AsyncMock(return_value=response)
+                post.__aexit__ = AsyncMock(return_value=None)
+                posts.append(post)
+            mock_session.post = MagicMock(side_effect=posts)
+            mock_session_class.return_value = mock_session
 
-    def test_telegram_rate_limit_allows_under_limit(self, clear_rate_limits):
-        """Test rate limit allows under 20 messages/second."""
-        import backend.app.messaging.senders.telegram as telegram_module
+            with patch(
+                "backend.app.messaging.senders.telegram.asyncio.sleep"
+            ) as mock_sleep:
+                result = await send_telegram(chat_id="123456789", text="Test")
 
-        # Send 19 messages
-        for _ in range(19):
-            telegram_module._telegram_timestamps.append(time.time())
+        assert result["status"] == "sent"
+        assert mock_sleep.await_args.args[0] >= 29
 
-        # 20th should be allowed
-        assert telegram_check_rate_limit() is True
 
-    def test_telegram_rate_limit_blocks_over_limit(self, clear_rate_limits):
-        """Test rate limit blocks over 20 messages/second."""
-        import backend.app.messaging.senders.telegram as telegram_module
+class TestTelegramRateLimiting:
+    """Test Telegram rate limiting (20/second, shared global bucket)."""
 
-        # Send 20 messages
-        for _ in range(20):
-            telegram_module._telegram_timestamps.append(time.time())
+    @pytest.mark.asyncio
+    async def test_telegram_rate_limit_allows_under_limit(self, clear_rate_limits):
+        """Test the global bucket allows 20 messages/second."""
+        limiter = await get_message_rate_limiter()
+        for i in range(MAX_MESSAGES_PER_SECOND):
+            assert await limiter.acquire(telegram_buckets(str(i))) == 0.0
 
-        # 21st should be blocked
-        assert telegram_check_rate_limit() is False
+    @pytest.mark.asyncio
+    async def test_telegram_rate_limit_blocks_over_limit(self, clear_rate_limits):
+        """Test the global bucket blocks the 21st message in a second."""
+        limiter = await get_message_rate_limiter()
+        for i in range(MAX_MESSAGES_PER_SECOND):
+            await limiter.acquire(telegram_buckets(str(i)))
+        assert await limiter.acquire(telegram_buckets("overflow")) is None
 
     def test_telegram_rate_limit_constant_value(self):
         """Test MAX_MESSAGES_PER_SECOND is 20."""
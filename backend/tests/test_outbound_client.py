@@ -1,10 +1,15 @@
 """Integration tests for HmacClient."""
 
+import asyncio
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from backend.app.core.settings import get_settings
+from backend.app.signals.schema import SignalBatchCreate
+from backend.app.signals.service import SignalService
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.trading.outbound.client import HmacClient, _get_rfc3339_timestamp
 from backend.app.trading.outbound.config import OutboundConfig
@@ -293,6 +298,270 @@ class TestHmacClientPostSignal:
             assert headers["X-Producer-Id"] == "test-producer"
 
 
+def _batch_response(count: int) -> MagicMock:
+    """Build a mocked 200 SignalBatchOut response with `count` results."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "results": [
+            {
+                "index": i,
+                "status": "created",
+                "external_id": f"key:{i}",
+                "signal": {
+                    "id": f"sig-{i}",
+                    "instrument": "XAUUSD",
+                    "side": 0,
+                    "price": 1950.50,
+                    "status": 0,
+                    "payload": {},
+                },
+            }
+            for i in range(count)
+        ],
+        "created": count,
+        "duplicates": 0,
+    }
+    return response
+
+
+class TestHmacClientPostSignals:
+    """Test HmacClient.post_signals and submit_signal batching."""
+
+    @pytest.fixture
+    def signal(self) -> SignalCandidate:
+        """Signal on an instrument the server's batch schema accepts."""
+        return SignalCandidate(
+            instrument="XAUUSD",
+            side="buy",
+            entry_price=1950.50,
+            stop_loss=1945.00,
+            take_profit=1960.00,
+            confidence=0.85,
+            timestamp=datetime(2025, 10, 25, 14, 30, 45),
+            reason="rsi_oversold_fib_support",
+            payload={"rsi": 28.5},
+        )
+
+    @pytest.mark.asyncio
+    async def test_post_signals_sends_one_signed_envelope(
+        self, config, logger, signal
+    ) -> None:
+        """Test N signals go out as one request signed the way the server checks."""
+        client = HmacClient(config, logger)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_session = AsyncMock()
+            mock_client_class.return_value = mock_session
+            mock_session.post.return_value = _batch_response(3)
+
+            await client._ensure_session()
+            responses = await client.post_signals(
+                [signal, signal, signal], idempotency_key="key"
+            )
+
+            assert [r.signal.id for r in responses] == ["sig-0", "sig-1", "sig-2"]
+            mock_session.post.assert_called_once()
+
+            call_args = mock_session.post.call_args
+            assert call_args.args[0].endswith("/api/v1/signals/batch")
+            body = call_args.kwargs["content"]
+            envelope = SignalBatchCreate.model_validate_json(body)
+            assert [item.external_id for item in envelope.signals] == [
+                "key:0",
+                "key:1",
+                "key:2",
+            ]
+            assert envelope.signals[0].price == 1950.50
+            assert envelope.signals[0].payload["stop_loss"] == 1945.00
+
+            service = SignalService(AsyncMock(), hmac_key=config.producer_secret)
+            assert service.verify_hmac_signature(
+                json.dumps(envelope.model_dump()),
+                call_args.kwargs["headers"]["X-Signature"],
+            )
+
+    @pytest.mark.asyncio
+    async def test_post_signals_rejects_unsupported_instrument(
+        self, config, logger, signal
+    ) -> None:
+        """Test signals the server schema would reject never leave the client."""
+        client = HmacClient(config, logger)
+        signal.instrument = "GOLD"
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_session = AsyncMock()
+            mock_client_class.return_value = mock_session
+
+            await client._ensure_session()
+            with pytest.raises(OutboundClientError, match="rejected by schema"):
+                await client.post_signals([signal])
+            mock_session.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_post_signals_rejects_oversized_batch(
+        self, config, logger, signal
+    ) -> None:
+        """Test batches above max_batch_size are rejected before sending."""
+        config.max_batch_size = 2
+        client = HmacClient(config, logger)
+
+        with pytest.raises(OutboundClientError, match="too large"):
+            await client.post_signals([signal, signal, signal])
+
+    @pytest.mark.asyncio
+    async def test_post_signals_result_count_mismatch(
+        self, config, logger, signal
+    ) -> None:
+        """Test a short server answer is an error, not a silent misalignment."""
+        client = HmacClient(config, logger)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_session = AsyncMock()
+            mock_client_class.return_value = mock_session
+            mock_session.post.return_value = _batch_response(1)
+
+            await client._ensure_session()
+            with pytest.raises(OutboundClientError, match="1 results for 2"):
+                await client.post_signals([signal, signal])
+
+    @pytest.mark.asyncio
+    async def test_submit_signal_coalesces_same_tick(
+        self, config, logger, signal
+    ) -> None:
+        """Test signals submitted in the same tick share one request."""
+        client = HmacClient(config, logger)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_session = AsyncMock()
+            mock_client_class.return_value = mock_session
+            mock_session.post.return_value = _batch_response(4)
+
+            await client._ensure_session()
+            responses = await asyncio.gather(
+                *(client.submit_signal(signal) for _ in range(4))
+            )
+
+            mock_session.post.assert_called_once()
+            assert [r.index for r in responses] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_submit_signal_splits_at_max_batch_size(
+        self, config, logger, signal
+    ) -> None:
+        """Test a tick larger than max_batch_size is sent in chunks."""
+        config.max_batch_size = 2
+        client = HmacClient(config, logger)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_session = AsyncMock()
+            mock_client_class.return_value = mock_session
+            mock_session.post.side_effect = [_batch_response(2), _batch_response(1)]
+
+            await client._ensure_session()
+            responses = await asyncio.gather(
+                *(client.submit_signal(signal) for _ in range(3))
+            )
+
+            assert mock_session.post.call_count == 2
+            assert len(responses) == 3
+
+    @pytest.mark.asyncio
+    async def test_submit_signal_propagates_batch_failure(
+        self, config, logger, signal
+    ) -> None:
+        """Test every waiter sees the error when the batch request fails."""
+        client = HmacClient(config, logger)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_session = AsyncMock()
+            mock_client_class.return_value = mock_session
+            mock_response = MagicMock()
+            mock_response.status_code = 500
+            mock_response.text = "Internal Server Error"
+            mock_session.post.return_value = mock_response
+
+            await client._ensure_session()
+            results = await asyncio.gather(
+                client.submit_signal(signal),
+                client.submit_signal(signal),
+                return_exceptions=True,
+            )
+
+            assert all(isinstance(r, OutboundClientError) for r in results)
+            mock_session.post.assert_called_once()
+
+
+class TestHmacClientBatchContract:
+    """Test post_signals against the real POST /api/v1/signals/batch route."""
+
+    def _batch_client(
+        self, config: OutboundConfig, logger, client, auth_headers: dict, secret: str
+    ) -> HmacClient:
+        """HmacClient whose session is the test app client, authenticated."""
+        config.producer_secret = secret
+        config.server_base_url = str(client.base_url).rstrip("/")
+        client.headers.update(auth_headers)
+        hmac_client = HmacClient(config, logger)
+        hmac_client._session = client
+        return hmac_client
+
+    @pytest.mark.asyncio
+    async def test_server_accepts_and_dedupes_client_batch(
+        self, config, logger, client, auth_headers
+    ) -> None:
+        """Test the route verifies the client's signature and parses its envelope."""
+        hmac_client = self._batch_client(
+            config, logger, client, auth_headers, get_settings().signals.hmac_key
+        )
+        signals = [
+            SignalCandidate(
+                instrument=instrument,
+                side="buy",
+                entry_price=price,
+                stop_loss=price * 0.99,
+                take_profit=price * 1.01,
+                confidence=0.8,
+                timestamp=datetime(2025, 10, 25, 14, 30, 45),
+                reason="contract_test",
+            )
+            for instrument, price in (("XAUUSD", 1950.50), ("EURUSD", 1.085))
+        ]
+
+        results = await hmac_client.post_signals(signals, idempotency_key="contract")
+
+        assert [r.status for r in results] == ["created", "created"]
+        assert [r.signal.instrument for r in results] == ["XAUUSD", "EURUSD"]
+        assert results[0].signal.payload["reason"] == "contract_test"
+
+        # Retrying the same batch is answered per item as duplicates
+        retried = await hmac_client.post_signals(signals, idempotency_key="contract")
+        assert [r.status for r in retried] == ["duplicate", "duplicate"]
+
+    @pytest.mark.asyncio
+    async def test_server_rejects_client_batch_signed_with_wrong_key(
+        self, config, logger, client, auth_headers
+    ) -> None:
+        """Test a signature under another key is refused with 401."""
+        hmac_client = self._batch_client(
+            config, logger, client, auth_headers, "not-the-server-key-1234"
+        )
+        signal = SignalCandidate(
+            instrument="XAUUSD",
+            side="sell",
+            entry_price=1950.50,
+            stop_loss=1955.00,
+            take_profit=1940.00,
+            confidence=0.8,
+            timestamp=datetime(2025, 10, 25, 14, 30, 45),
+            reason="contract_test",
+        )
+
+        with pytest.raises(OutboundClientError) as exc_info:
+            await hmac_client.post_signals([signal])
+        assert exc_info.value.http_code == 401
+
+
 class TestHmacClientSerialization:
     """Test signal serialization."""
 
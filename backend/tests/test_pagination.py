@@ -0,0 +1,175 @@
+"""Tests for shared keyset pagination and list counts."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from backend.app.core.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+from backend.app.signals.models import Signal
+from backend.app.signals.service import SignalService
+
+
+async def _add_signals(db_session, user_id: str, count: int, **overrides) -> None:
+    """Insert signals sharing created_at in pairs (to exercise the id tiebreak)."""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    for i in range(count):
+        db_session.add(
+            Signal(
+                id=str(uuid4()),
+                user_id=user_id,
+                instrument=overrides.get("instrument", "XAUUSD"),
+                side=0,
+                price=1950.0 + i,
+                status=overrides.get("status", 0),
+                payload={},
+                version="1.0",
+                created_at=base - timedelta(minutes=i // 2),
+                updated_at=base,
+            )
+        )
+    await db_session.commit()
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round trip."""
+
+    def test_cursor_round_trip(self):
+        """Test decode_cursor inverts encode_cursor."""
+        ts = datetime(2025, 1, 1, 12, 30, 45, 123456)
+        cursor = encode_cursor(ts, "abc-123")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (ts, "abc-123")
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "e30", "WzEsMl0"])
+    def test_invalid_cursor_rejected(self, cursor):
+        """Test malformed cursors raise a 400 error."""
+        with pytest.raises(InvalidCursorError) as exc:
+            decode_cursor(cursor)
+
+        assert exc.value.status_code == 400
+
+
+class TestKeysetPagination:
+    """Test paginate() over real rows."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_every_row_once(self, db_session):
+        """Test following next_cursor visits all rows newest first, no repeats."""
+        await _add_signals(db_session, "user_keyset", 7)
+        query = select(Signal).where(Signal.user_id == "user_keyset")
+
+        seen: list[Signal] = []
+        cursor = None
+        while True:
+            page = await paginate(
+                db_session,
+                query,
+                sort_column=Signal.created_at,
+                id_column=Signal.id,
+                limit=3,
+                cursor=cursor,
+                count=CountMode.NONE,
+            )
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert len({s.id for s in seen}) == 7
+        keys = [(s.created_at, s.id) for s in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self, db_session):
+        """Test an exactly-full last page does not advertise another page."""
+        await _add_signals(db_session, "user_exact", 3)
+
+        page = await paginate(
+            db_session,
+            select(Signal).where(Signal.user_id == "user_exact"),
+            sort_column=Signal.created_at,
+            id_column=Signal.id,
+            limit=3,
+        )
+
+        assert len(page.items) == 3
+        assert page.next_cursor is None
+        assert page.total == 3
+
+    @pytest.mark.asyncio
+    async def test_count_respects_filters(self, db_session):
+        """Test COUNT(*) uses the list filters."""
+        await _add_signals(db_session, "user_count", 4, status=0)
+        await _add_signals(db_session, "user_count", 2, status=1)
+
+        total = await count_rows(
+            db_session,
+            select(Signal).where(Signal.user_id == "user_count", Signal.status == 1),
+        )
+
+        assert total == 2
+
+    @pytest.mark.asyncio
+    async def test_estimate_falls_back_to_exact_off_postgres(self, db_session):
+        """Test ESTIMATE mode returns an exact total when no planner is available."""
+        await _add_signals(db_session, "user_estimate", 2)
+
+        page = await paginate(
+            db_session,
+            select(Signal).where(Signal.user_id == "user_estimate"),
+            sort_column=Signal.created_at,
+            id_column=Signal.id,
+            limit=10,
+            count=CountMode.ESTIMATE,
+        )
+
+        assert page.total == 2
+        assert page.total_is_estimate is False
+
+
+class TestSignalListing:
+    """Test SignalService listing on top of the shared layer."""
+
+    @pytest.mark.asyncio
+    async def test_list_signals_total_matches_filter(self, db_session):
+        """Test total counts only signals matching the status filter."""
+        await _add_signals(db_session, "user_filter_total", 3, status=0)
+        await _add_signals(db_session, "user_filter_total", 2, status=2)
+        service = SignalService(db_session, hmac_key="test-secret-key-12345")
+
+        signals, total = await service.list_signals(
+            user_id="user_filter_total", status=2
+        )
+
+        assert len(signals) == 2
+        assert total == 2
+
+    @pytest.mark.asyncio
+    async def test_list_signals_page_cursor(self, db_session):
+        """Test list_signals_page returns a cursor that continues the list."""
+        await _add_signals(db_session, "user_signal_cursor", 5)
+        service = SignalService(db_session, hmac_key="test-secret-key-12345")
+
+        first = await service.list_signals_page(
+            user_id="user_signal_cursor", page_size=3, count=CountMode.NONE
+        )
+        second = await service.list_signals_page(
+            user_id="user_signal_cursor", page_size=3, cursor=first.next_cursor
+        )
+
+        assert first.total is None
+        assert len(first.items) == 3
+        assert len(second.items) == 2
+        assert second.next_cursor is None
+        assert not {s.id for s in first.items} & {s.id for s in second.items}
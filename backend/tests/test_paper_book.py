@@ -0,0 +1,186 @@
+"""
+Tests for the in-memory Paper Trading Book
+
+Validates in-memory fills (same math as the engine), mark-to-market equity,
+batched checkpoints and crash recovery from the fill log.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from backend.app.auth.models import User
+from backend.app.paper.book import PaperBook, PaperFillLog
+from backend.app.paper.engine import FillPriceMode, PaperTradingEngine, SlippageMode
+from backend.app.paper.models import PaperAccount, PaperPosition, PaperTrade, TradeSide
+
+BID = Decimal("1950.00")
+ASK = Decimal("1950.50")
+
+
+def _book(path) -> PaperBook:
+    return PaperBook(
+        PaperFillLog(path),
+        PaperTradingEngine(
+            fill_mode=FillPriceMode.MID, slippage_mode=SlippageMode.NONE
+        ),
+    )
+
+
+async def _accounts(db_session, count: int, balance: str = "10000") -> list[str]:
+    ids = []
+    for _ in range(count):
+        user = User(
+            id=str(uuid4()),
+            email=f"{uuid4().hex[:12]}@example.com",
+            password_hash="test",
+        )
+        account = PaperAccount(
+            id=str(uuid4()),
+            user_id=user.id,
+            balance=Decimal(balance),
+            equity=Decimal(balance),
+            enabled=True,
+        )
+        db_session.add_all([user, account])
+        ids.append(account.id)
+    await db_session.commit()
+    return ids
+
+
+async def _persisted(db_session, account_id: str) -> PaperAccount:
+    result = await db_session.execute(
+        select(PaperAccount)
+        .where(PaperAccount.id == account_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_fills_mark_to_market_and_checkpoint(db_session, tmp_path):
+    """Test batch fills, tick-accurate equity and one batched checkpoint."""
+    rich, poor = await _accounts(db_session, 2)
+    (broke,) = await _accounts(db_session, 1, balance="100")
+    book = _book(tmp_path)
+
+    fills = await book.fill_orders(
+        db_session,
+        "GOLD",
+        TradeSide.BUY,
+        BID,
+        ASK,
+        {rich: Decimal("2.0"), poor: Decimal("1.0"), broke: Decimal("1.0")},
+    )
+
+    assert set(fills) == {rich, poor}
+    assert fills[rich].price == Decimal("1950.25")
+    # Margin deducted, nothing written yet
+    assert book.accounts[rich].balance == Decimal("6099.50")
+    assert (await _persisted(db_session, rich)).balance == Decimal("10000")
+
+    book.mark("GOLD", Decimal("1960.00"), Decimal("1960.50"))
+    assert book.equity(rich) == Decimal("6119.50")  # 6099.50 + 2 * 10.00
+    assert book.equities() == {
+        rich: Decimal("6119.50"),
+        poor: Decimal("8059.75"),
+        broke: Decimal("100.00"),
+    }
+
+    assert await book.checkpoint(db_session) == 2
+
+    account = await _persisted(db_session, rich)
+    assert account.balance == Decimal("6099.50")
+    assert account.equity == Decimal("6119.50")
+    assert account.book_seq == fills[rich].seq
+    position = (
+        await db_session.execute(
+            select(PaperPosition).where(PaperPosition.account_id == rich)
+        )
+    ).scalar_one()
+    assert position.volume == Decimal("2.0")
+    assert position.unrealized_pnl == Decimal("20.00")
+    trades = (await db_session.execute(select(PaperTrade))).scalars().all()
+    assert len(trades) == 2
+
+    # Ticks alone re-checkpoint only the holders of the ticked symbol
+    book.mark("GOLD", Decimal("1940.00"), Decimal("1940.50"))
+    assert await book.checkpoint(db_session) == 2
+    assert (await _persisted(db_session, poor)).equity == Decimal("8039.75")
+    assert await book.checkpoint(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_recover_replays_unpersisted_fills(db_session, tmp_path):
+    """Test crash recovery replays only fills newer than the checkpoint."""
+    (account_id,) = await _accounts(db_session, 1)
+    book = _book(tmp_path)
+
+    await book.fill_order(
+        db_session, account_id, "GOLD", TradeSide.BUY, Decimal("1.0"), BID, ASK
+    )
+    await book.checkpoint(db_session)
+
+    # Not checkpointed before the "crash"
+    await book.fill_order(
+        db_session, account_id, "EURUSD", TradeSide.SELL, Decimal("1.0"), BID, ASK
+    )
+    close = await book.close_position(
+        db_session,
+        account_id,
+        "GOLD",
+        TradeSide.BUY,
+        Decimal("1960.00"),
+        Decimal("1960.50"),
+    )
+    expected = book.accounts[account_id].balance
+    book.log.close()
+
+    recovered = _book(tmp_path)
+    assert await recovered.recover(db_session) == 2
+
+    assert recovered.accounts[account_id].balance == expected
+    assert set(recovered.accounts[account_id].positions) == {("EURUSD", TradeSide.SELL)}
+    account = await _persisted(db_session, account_id)
+    assert account.balance == expected
+    assert account.book_seq == close.seq
+
+    trades = (
+        (
+            await db_session.execute(
+                select(PaperTrade).where(PaperTrade.account_id == account_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert len(trades) == 3
+    closed = next(t for t in trades if t.id == close.trade_id)
+    assert closed.realized_pnl == Decimal("10.00")
+
+    # Everything is in the database: the log is pruned and a rerun is a no-op
+    assert recovered.log.segments() == []
+    assert await _book(tmp_path).recover(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_rejected_orders(db_session, tmp_path):
+    """Test the engine's validation rules hold in the book."""
+    (account_id,) = await _accounts(db_session, 1, balance="100")
+    book = _book(tmp_path)
+
+    with pytest.raises(ValueError, match="Insufficient balance"):
+        await book.fill_order(
+            db_session, account_id, "GOLD", TradeSide.BUY, Decimal("1.0"), BID, ASK
+        )
+    with pytest.raises(ValueError, match="No open"):
+        await book.close_position(
+            db_session, account_id, "GOLD", TradeSide.BUY, BID, ASK
+        )
+    with pytest.raises(ValueError, match="not found"):
+        await book.fill_order(
+            db_session, str(uuid4()), "GOLD", TradeSide.BUY, Decimal("1.0"), BID, ASK
+        )
+    assert book.log.segments() == []
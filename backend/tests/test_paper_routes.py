@@ -4,8 +4,26 @@ Tests for Paper Trading API Routes
 Validates enable/disable toggle, isolation from live, order placement, and statement retrieval.
 """
 
+from decimal import Decimal
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from backend.app.paper.book import PaperBook, PaperFillLog, get_paper_book
+from backend.app.paper.models import PaperTrade
+
+
+@pytest.fixture(autouse=True)
+def paper_book(tmp_path):
+    """Fresh paper book (fill log in a temp dir) injected into the routes."""
+    from backend.app.main import app
+
+    book = PaperBook(PaperFillLog(tmp_path / "paper_book"))
+    app.dependency_overrides[get_paper_book] = lambda: book
+    yield book
+    app.dependency_overrides.pop(get_paper_book, None)
+    book.log.close()
 
 
 @pytest.mark.asyncio
@@ -406,7 +424,9 @@ async def test_paper_trading_telemetry(
         metrics.paper_fills_total,
         "labels",
         lambda symbol, side: type(
-            "MockCounter", (), {"inc": lambda amount=1: mock_fills_inc(symbol, side)}
+            "MockCounter",
+            (),
+            {"inc": lambda self, amount=1: mock_fills_inc(symbol, side)},
         )(),
     )
     monkeypatch.setattr(metrics.paper_pnl_total, "set", mock_pnl_set)
@@ -427,3 +447,42 @@ async def test_paper_trading_telemetry(
     # Verify metrics incremented
     assert len(fills_calls) == 1
     assert fills_calls[0] == ("GOLD", "buy")
+
+
+@pytest.mark.asyncio
+async def test_order_fills_in_book_and_marks_to_market(
+    client: AsyncClient, test_user, db_session, paper_book
+):
+    """Test orders fill in memory and equity follows the price stream."""
+    await client.post("/api/v1/paper/enable", json={"initial_balance": 10000.00})
+    await client.post(
+        "/api/v1/paper/order",
+        json={
+            "symbol": "GOLD",
+            "side": "buy",
+            "volume": 1.0,
+            "bid": 1950.00,
+            "ask": 1950.50,
+        },
+    )
+
+    # Nothing committed per order; the trade is served from the book
+    stored = await db_session.execute(select(PaperTrade))
+    assert stored.scalars().all() == []
+    trades = (await client.get("/api/v1/paper/trades")).json()
+    assert [t["symbol"] for t in trades] == ["GOLD"]
+
+    paper_book.mark("GOLD", Decimal("1960.00"), Decimal("1960.50"))
+    account = (await client.get("/api/v1/paper/account")).json()
+    assert float(account["balance"]) == 10000.00 - 1950.27
+    # Balance excludes the position's margin; equity adds its unrealized PnL
+    assert Decimal(account["equity"]) == Decimal(account["balance"]) + Decimal("9.98")
+    positions = (await client.get("/api/v1/paper/positions")).json()
+    assert float(positions[0]["current_price"]) == 1960.25
+    assert float(positions[0]["unrealized_pnl"]) == 9.98
+
+    assert await paper_book.checkpoint(db_session) == 1
+    stored = await db_session.execute(select(PaperTrade))
+    assert [t.symbol for t in stored.scalars()] == ["GOLD"]
+    trades = (await client.get("/api/v1/paper/trades")).json()
+    assert len(trades) == 1
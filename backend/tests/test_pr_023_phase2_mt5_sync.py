@@ -8,19 +8,24 @@ Tests cover:
 - Reconciliation scheduler
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.auth.models import User
 from backend.app.trading.reconciliation.mt5_sync import (
     MT5AccountSnapshot,
     MT5Position,
     MT5SyncService,
 )
 from backend.app.trading.reconciliation.scheduler import ReconciliationScheduler
+from backend.app.trading.store.models import Trade
 
 # ============================================================================
 # MT5Position Tests
@@ -308,6 +313,82 @@ class TestMT5SyncService:
 
         assert matched is None
 
+    @staticmethod
+    def _trade(symbol="EURUSD", direction=0, volume=1.0, entry_price=1.0950):
+        trade = MagicMock()
+        trade.id = uuid4()
+        trade.symbol = symbol
+        trade.direction = direction
+        trade.volume = volume
+        trade.entry_price = entry_price
+        return trade
+
+    async def test_find_matching_trade_across_volume_buckets(self, sync_service):
+        """Volumes within 5% match even when they fall in adjacent buckets."""
+        trade = self._trade(volume=Decimal("1.00"), entry_price=Decimal("1.0950"))
+
+        for volume in (0.96, 1.0, 1.04):
+            mt5_pos = MT5Position(1, "eurusd", 0, volume, 1.0951, 1.0960)
+            assert sync_service._find_matching_trade(mt5_pos, [trade], set()) is trade
+
+    async def test_find_matching_trade_uses_index(self, sync_service):
+        """Only trades in the position's symbol/direction buckets are scanned."""
+        taken = self._trade()
+        free = self._trade()
+        others = [self._trade(symbol=f"SYM{i}") for i in range(50)]
+        trades = [*others, taken, free]
+        index = sync_service._index_trades(trades)
+
+        mt5_pos = MT5Position(1, "EURUSD", 0, 1.0, 1.0950, 1.0960)
+        matched = sync_service._find_matching_trade(
+            mt5_pos, trades, {taken.id}, index=index
+        )
+
+        assert matched is free
+        assert len(index[("EURUSD", 0, sync_service._volume_bucket(1.0))]) == 2
+
+    async def test_sync_skips_writes_when_snapshot_unchanged(
+        self, sync_service, mock_db, monkeypatch
+    ):
+        """One batched write per change; identical snapshots write nothing."""
+        from backend.app.trading.reconciliation import mt5_sync
+
+        monkeypatch.setattr(mt5_sync, "_last_snapshot", {})
+        record = AsyncMock()
+        monkeypatch.setattr(mt5_sync.AuditService, "record", record)
+        trade = self._trade()
+        trades_result = MagicMock()
+        trades_result.scalars.return_value.all.return_value = [trade]
+        mock_db.execute = AsyncMock(return_value=trades_result)
+        mock_db.add_all = MagicMock()
+        position = MT5Position(1, "EURUSD", 0, 1.0, 1.0950, 1.0960)
+
+        async def sync(equity):
+            sync_service.fetch_account_snapshot = AsyncMock(
+                return_value=MT5AccountSnapshot(
+                    balance=10000.0,
+                    equity=equity,
+                    positions=[position],
+                    timestamp=datetime.now(UTC),
+                )
+            )
+            result = await sync_service.sync_positions_for_user("user-1", MagicMock())
+            sync_service.remember_snapshot("user-1")
+            return result
+
+        first = await sync(10010.0)
+        second = await sync(10010.2)  # Below equity resolution
+        third = await sync(10050.0)
+
+        assert first["matched_count"] == 1
+        assert "unchanged" not in first
+        assert second["unchanged"] is True
+        assert second["matched_count"] == 1
+        assert "unchanged" not in third
+        assert mock_db.add_all.call_count == 2
+        assert record.await_count == 2
+        mock_db.flush.assert_not_awaited()
+
     async def test_detect_divergence_entry_slippage(self, sync_service):
         """Test divergence detection for entry price slippage."""
         mt5_pos = MT5Position(
@@ -461,6 +542,106 @@ class TestReconciliationScheduler:
 
         assert not scheduler.is_running
 
+    @staticmethod
+    def _candidates(*rows):
+        """Replacement for _stream_sync_candidates yielding fixed rows."""
+
+        async def stream(db):
+            for row in rows:
+                yield row
+
+        return stream
+
+    async def test_slow_account_does_not_block_queue(self, scheduler):
+        """Free workers keep draining the queue while one account is slow."""
+        scheduler.db_factory = MagicMock()
+        scheduler._stream_sync_candidates = self._candidates(
+            ("slow", True), ("a", True), ("b", True), ("c", True), ("d", True)
+        )
+        in_flight = 0
+        peak = 0
+        finished: list[str] = []
+
+        async def sync(user_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.2 if user_id == "slow" else 0.01)
+            in_flight -= 1
+            finished.append(user_id)
+            return {"errors": []}
+
+        scheduler._sync_user_with_error_handling = sync
+
+        await scheduler._run_sync_cycle()
+
+        assert peak == 2
+        assert finished[-1] == "slow"
+        assert sorted(finished) == ["a", "b", "c", "d", "slow"]
+        assert scheduler.sync_count == 1
+
+    async def test_flat_accounts_use_longer_interval(self, scheduler):
+        """Open-position accounts fall due again before flat ones."""
+        scheduler.db_factory = MagicMock()
+        scheduler.jitter_ratio = 0
+        scheduler._stream_sync_candidates = self._candidates(
+            ("open", True), ("flat", False)
+        )
+        scheduler._sync_user_with_error_handling = AsyncMock(
+            return_value={"errors": []}
+        )
+
+        await scheduler._run_sync_cycle()
+        await scheduler._run_sync_cycle()
+
+        # Second cycle runs immediately: nothing is due yet
+        assert scheduler._sync_user_with_error_handling.await_count == 2
+        gap = scheduler._next_due["flat"] - scheduler._next_due["open"]
+        assert gap == pytest.approx(scheduler.flat_sync_interval - 1)
+
+    async def test_stream_selects_open_and_recent_accounts(self, db: AsyncSession):
+        """Only IDs of accounts with open trades or recent logins are streamed."""
+
+        @asynccontextmanager
+        async def factory():
+            yield db
+
+        for user_id, last_login in (
+            ("with-open", None),
+            ("recent-flat", datetime.utcnow()),
+            ("dormant", None),
+        ):
+            db.add(
+                User(
+                    id=user_id,
+                    email=f"{user_id}@example.com",
+                    password_hash="x",
+                    last_login_at=last_login,
+                )
+            )
+        db.add(
+            Trade(
+                user_id="with-open",
+                symbol="GOLD",
+                strategy="fib_rsi",
+                timeframe="H1",
+                trade_type="BUY",
+                direction=0,
+                entry_price=Decimal("1950.00"),
+                entry_time=datetime.utcnow(),
+                stop_loss=Decimal("1940.00"),
+                take_profit=Decimal("1970.00"),
+                volume=Decimal("0.1"),
+                status="OPEN",
+            )
+        )
+        await db.commit()
+
+        scheduler = ReconciliationScheduler(factory, MagicMock())
+        rows = [row async for row in scheduler._stream_sync_candidates(db)]
+
+        assert sorted(rows) == [("recent-flat", False), ("with-open", True)]
+
 
 # ============================================================================
 # Integration Tests
@@ -5,12 +5,13 @@ Tests affiliate registration, referral tracking, commission calculation, and pay
 Covers both happy path and edge cases.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.affiliates.service import AffiliateService
+from backend.app.affiliates.models import AffiliateStats, ReferralEvent
+from backend.app.affiliates.service import STATS_REFRESH_SECONDS, AffiliateService
 from backend.app.auth.models import User
 
 
@@ -327,6 +328,84 @@ class TestAffiliateStats:
         assert summary["pending_earnings"] == 45.0
         assert summary["paid_earnings"] == 0.0
 
+    async def test_stats_rollup_updated_by_new_events(
+        self,
+        db_session: AsyncSession,
+        test_affiliate: User,
+        affiliate_service: AffiliateService,
+    ):
+        """Test events tracked after the first read update the rollup in place."""
+        affiliate = await affiliate_service.register_affiliate(test_affiliate.id)
+        code = affiliate.referral_code
+        await affiliate_service.track_signup(code, "user_1")
+
+        first = await affiliate_service.get_stats(affiliate.id)
+        rollup = await db_session.get(AffiliateStats, code)
+        built_at = rollup.refreshed_at
+
+        await affiliate_service.track_signup(code, "user_2")
+        await affiliate_service.track_subscription(code, "user_2", 99.99)
+        await affiliate_service.track_first_trade(code, "user_2")
+        second = await affiliate_service.get_stats(affiliate.id)
+
+        await db_session.refresh(rollup)
+        assert first["total_signups"] == 1
+        assert second["total_clicks"] == 2
+        assert second["total_signups"] == 2
+        assert second["total_subscriptions"] == 1
+        assert second["conversion_rate"] == pytest.approx(0.5)
+        assert rollup.total_first_trades == 1
+        # Served from the rollup, not rebuilt
+        assert rollup.refreshed_at == built_at
+
+    async def test_stale_rollup_rebuilt_from_events(
+        self,
+        db_session: AsyncSession,
+        test_affiliate: User,
+        affiliate_service: AffiliateService,
+    ):
+        """Test a rollup past the refresh interval is recounted from events."""
+        affiliate = await affiliate_service.register_affiliate(test_affiliate.id)
+        code = affiliate.referral_code
+        await affiliate_service.get_stats(affiliate.id)
+
+        # Event written outside the service (rollup not updated)
+        db_session.add(
+            ReferralEvent(referral_code=code, event_type="signup", user_id="x")
+        )
+        rollup = await db_session.get(AffiliateStats, code)
+        rollup.refreshed_at = datetime.utcnow() - timedelta(
+            seconds=STATS_REFRESH_SECONDS + 1
+        )
+        await db_session.commit()
+
+        stats = await affiliate_service.get_stats(affiliate.id)
+
+        assert stats["total_clicks"] == 1
+        assert stats["total_signups"] == 1
+
+    async def test_get_stats_batch(
+        self,
+        db_session: AsyncSession,
+        test_affiliate: User,
+        test_referred_user: User,
+        affiliate_service: AffiliateService,
+    ):
+        """Test batch stats match per-affiliate stats."""
+        first = await affiliate_service.register_affiliate(test_affiliate.id)
+        second = await affiliate_service.register_affiliate(test_referred_user.id)
+        await affiliate_service.track_signup(first.referral_code, "user_1")
+        await affiliate_service.track_subscription(first.referral_code, "user_1", 10.0)
+
+        batch = await affiliate_service.get_stats_batch(
+            [first.id, second.id, "missing"]
+        )
+
+        assert set(batch) == {first.id, second.id}
+        assert batch[first.id] == await affiliate_service.get_stats(first.id)
+        assert batch[second.id]["total_clicks"] == 0
+        assert await affiliate_service.refresh_stats() == 2
+
 
 @pytest.mark.asyncio
 class TestPayoutRequests:
@@ -1070,5 +1070,124 @@ class TestEdgeCasesAndErrorsAsync:
         assert len(history) == 2
 
 
+# ============================================================================
+# BATCH EVALUATION
+# ============================================================================
+
+
+class TestBatchRiskEvaluationAsync:
+    """Test evaluate_risk_batch against the single-user checks."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_user_checks(
+        self, db_session_test, risk_evaluator_fixture, create_user_func
+    ):
+        """Test: Every breach type decided per user, breached users paused."""
+        states = {
+            "batch_ok": {"equity": 10000, "open_positions_value": 1000},
+            "batch_leverage": {"equity": 100},
+            "batch_risk": {"equity": 10000},
+            "batch_exposure": {"equity": 10000, "open_positions_value": 4900},
+            "batch_daily": {"equity": 10000, "todays_loss": 1500},
+            "batch_paused": {"equity": 10000},
+            "batch_disabled": {"equity": 10000},
+            "batch_missing": {"equity": 10000},
+        }
+        for user_id in states:
+            await create_user_func(user_id)
+            if user_id == "batch_missing":
+                continue
+            db_session_test.add(
+                CopyTradeSettings(
+                    user_id=user_id,
+                    enabled=user_id != "batch_disabled",
+                    is_paused=user_id == "batch_paused",
+                    pause_reason=(
+                        BREACH_DAILY_STOP if user_id == "batch_paused" else None
+                    ),
+                    max_per_trade_risk_percent=(
+                        0.4 if user_id == "batch_risk" else 2.0
+                    ),
+                )
+            )
+        await db_session_test.commit()
+
+        decisions = await risk_evaluator_fixture.evaluate_risk_batch(
+            db_session_test,
+            {"instrument": "GOLD", "entry_price": 2000, "sl_price": 1900},
+            states,
+            volumes=dict.fromkeys(states, 0.5),
+        )
+
+        assert decisions == {
+            "batch_ok": (True, None),
+            "batch_leverage": (False, BREACH_MAX_LEVERAGE),
+            "batch_risk": (False, BREACH_MAX_TRADE_RISK),
+            "batch_exposure": (False, BREACH_TOTAL_EXPOSURE),
+            "batch_daily": (False, BREACH_DAILY_STOP),
+            "batch_paused": (False, f"copy_trading_paused: {BREACH_DAILY_STOP}"),
+            "batch_disabled": (False, "copy_trading_not_enabled"),
+            "batch_missing": (False, "copy_trading_not_enabled"),
+        }
+
+        # Same verdict as the single-user path for a fresh user
+        await create_user_func("single_leverage")
+        db_session_test.add(CopyTradeSettings(user_id="single_leverage", enabled=True))
+        await db_session_test.commit()
+        single = await risk_evaluator_fixture.evaluate_risk(
+            db_session_test,
+            "single_leverage",
+            {"entry_price": 2000, "sl_price": 1900, "volume": 0.5},
+            states["batch_leverage"],
+        )
+        assert single == decisions["batch_leverage"]
+
+        result = await db_session_test.execute(
+            select(CopyTradeSettings).execution_options(populate_existing=True)
+        )
+        paused = {s.user_id: s.pause_reason for s in result.scalars() if s.is_paused}
+        assert paused == {
+            "batch_leverage": BREACH_MAX_LEVERAGE,
+            "batch_risk": BREACH_MAX_TRADE_RISK,
+            "batch_exposure": BREACH_TOTAL_EXPOSURE,
+            "batch_daily": BREACH_DAILY_STOP,
+            "batch_paused": BREACH_DAILY_STOP,
+            "single_leverage": BREACH_MAX_LEVERAGE,
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_queues_breach_alerts(
+        self, db_session_test, risk_evaluator_fixture, create_user_func
+    ):
+        """Test: Alerts and audit events sent in the background, once per breach."""
+        states = {f"alert_{i}": {"equity": 1000 if i < 3 else 100000} for i in range(5)}
+        for user_id in states:
+            await create_user_func(user_id)
+            db_session_test.add(CopyTradeSettings(user_id=user_id, enabled=True))
+        await db_session_test.commit()
+
+        decisions = await risk_evaluator_fixture.evaluate_risk_batch(
+            db_session_test,
+            {"instrument": "GOLD", "entry_price": 2000, "volume": 3.0},
+            states,
+        )
+        await risk_evaluator_fixture.drain()
+
+        blocked = sorted(u for u, (ok, _) in decisions.items() if not ok)
+        assert blocked == ["alert_0", "alert_1", "alert_2"]
+
+        telegram = risk_evaluator_fixture.telegram_service.send_user_alert
+        assert sorted(c.args[0] for c in telegram.await_args_list) == blocked
+        audit = risk_evaluator_fixture.audit_service.log_event
+        assert audit.await_count == 3
+        assert audit.await_args.kwargs["action"] == "copy_trading_paused"
+
+        # Nothing to evaluate: no queries, no side-effects
+        assert (
+            await risk_evaluator_fixture.evaluate_risk_batch(db_session_test, {}, {})
+            == {}
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
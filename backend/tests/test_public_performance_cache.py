@@ -0,0 +1,188 @@
+"""Tests for materialized, cached public performance payloads.
+
+Validates:
+- Delays are rounded up to published buckets (never less delay)
+- Closed trades are fetched incrementally
+- Endpoints serve cached payloads with ETag / Cache-Control and 304s
+- Date-filtered requests are cached per range
+- Single-flight rebuilds within a process and across workers (Redis)
+- Corrupt shared entries are rebuilt
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.public.performance_cache import (
+    PublicPerformanceCache,
+    cache_key,
+    delay_bucket,
+    get_public_performance_cache,
+)
+from backend.app.trading.store.models import Trade
+
+
+def _trade(profit: str, closed_ago: timedelta) -> Trade:
+    exit_time = datetime.utcnow() - closed_ago
+    return Trade(
+        trade_id=str(uuid4()),
+        user_id="user-001",
+        symbol="GOLD",
+        strategy="rsi",
+        timeframe="H1",
+        trade_type="BUY",
+        direction=0,
+        entry_price=Decimal("1950.00"),
+        entry_time=exit_time - timedelta(hours=1),
+        exit_price=Decimal("1960.00"),
+        exit_time=exit_time,
+        stop_loss=Decimal("1940.00"),
+        take_profit=Decimal("1960.00"),
+        volume=Decimal("1.0"),
+        profit=Decimal(profit),
+        risk_reward_ratio=Decimal("2.0"),
+        status="CLOSED",
+    )
+
+
+def test_delay_bucket_rounds_up():
+    """Rounding only ever increases the applied delay."""
+    assert delay_bucket(1) == 1
+    assert delay_bucket(2) == 5
+    assert delay_bucket(1440) == 1440
+    assert delay_bucket(1441) == 10080
+    assert delay_bucket(50000) == 86400
+    assert all(delay_bucket(d) >= d for d in range(1, 100_000, 97))
+
+
+@pytest.mark.asyncio
+async def test_refresh_fetches_only_new_closes(db_session: AsyncSession):
+    """Only trades closed after the last one seen are fetched."""
+    db_session.add_all(
+        [_trade("100", timedelta(days=2)), _trade("-40", timedelta(days=1))]
+    )
+    await db_session.commit()
+
+    cache = PublicPerformanceCache(ttl_seconds=0)
+    assert await cache.refresh_trades(db_session) == 2
+
+    db_session.add(_trade("25", timedelta(minutes=30)))
+    await db_session.commit()
+    assert await cache.refresh_trades(db_session) == 1
+    assert await cache.refresh_trades(db_session) == 0
+
+    # Bucket prefixes: 1h delay excludes the trade closed 30 minutes ago
+    assert len(cache.trades(60)) == 2
+    assert len(cache.trades(1)) == 3
+    assert len(cache.trades(1, from_date=datetime.utcnow() - timedelta(hours=36))) == 2
+
+
+@pytest.mark.asyncio
+async def test_endpoints_serve_cached_payloads(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Cached payloads with ETag and Cache-Control; If-None-Match gives 304."""
+    db_session.add_all(
+        [_trade("100", timedelta(days=2)), _trade("-40", timedelta(days=1))]
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/v1/public/performance/summary?delay_minutes=90")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_trades"] == 2
+    assert data["delay_applied_minutes"] == 240
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    # A new close is not visible until the payload expires
+    db_session.add(_trade("10", timedelta(days=1, hours=1)))
+    await db_session.commit()
+    cached = await client.get("/api/v1/public/performance/summary?delay_minutes=100")
+    assert cached.json()["total_trades"] == 2
+    assert cached.headers["etag"] == etag
+
+    not_modified = await client.get(
+        "/api/v1/public/performance/summary?delay_minutes=240",
+        headers={"If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    # Date-filtered requests are cached per range
+    params = {
+        "delay_minutes": 60,
+        "from_date": (datetime.utcnow() - timedelta(hours=36)).isoformat(),
+    }
+    equity = await client.get("/api/v1/public/performance/equity", params=params)
+    assert equity.status_code == 200
+    assert [p["equity"] for p in equity.json()["points"]] == [9960.0]
+    assert "etag" in equity.headers
+
+    db_session.add(_trade("5", timedelta(hours=2)))
+    await db_session.commit()
+    cached = await client.get("/api/v1/public/performance/equity", params=params)
+    assert cached.headers["etag"] == equity.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_rebuilds(db_session: AsyncSession, monkeypatch):
+    """One rebuild per expiry, in-process and across workers."""
+    db_session.add(_trade("100", timedelta(days=2)))
+    await db_session.commit()
+
+    redis_client = fakeredis.aioredis.FakeRedis()
+    worker_a = PublicPerformanceCache(redis_client)
+    worker_b = PublicPerformanceCache(redis_client)
+
+    builds = 0
+    build = worker_a.build
+
+    async def counting_build(*args, **kwargs):
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return await build(*args, **kwargs)
+
+    monkeypatch.setattr(worker_a, "build", counting_build)
+
+    payloads = await asyncio.gather(
+        *(worker_a.get(db_session, "summary", 1440) for _ in range(10))
+    )
+    assert builds == 1
+    assert len({p.etag for p in payloads}) == 1
+
+    async def no_build(*args, **kwargs):
+        raise AssertionError("worker B should read the shared payload")
+
+    monkeypatch.setattr(worker_b, "build", no_build)
+    shared = await worker_b.get(db_session, "summary", 1440)
+    assert shared.etag == payloads[0].etag
+    assert json.loads(shared.body)["total_trades"] == 1
+
+    # The process-wide cache used by the routes is reset per test
+    assert get_public_performance_cache().trades(1) == []
+
+
+@pytest.mark.asyncio
+async def test_corrupt_shared_payload_is_rebuilt(db_session: AsyncSession):
+    """An unreadable Redis entry is a miss: rebuilt and overwritten."""
+    db_session.add(_trade("100", timedelta(days=2)))
+    await db_session.commit()
+
+    redis_client = fakeredis.aioredis.FakeRedis()
+    key = cache_key("summary", 1440)
+    await redis_client.set(key, b"{not json", px=60_000)
+
+    cache = PublicPerformanceCache(redis_client)
+    payload = await cache.get(db_session, "summary", 1440)
+    assert json.loads(payload.body)["total_trades"] == 1
+    stored = json.loads(await redis_client.get(key))
+    assert stored["etag"] == payload.etag
@@ -0,0 +1,250 @@
+"""Tests for the batch client report pipeline (PR-101)."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.auth.models import User
+from backend.app.billing.entitlements.models import EntitlementType, UserEntitlement
+from backend.app.reports.models import Report, ReportPeriod, ReportStatus, ReportType
+from backend.app.reports.pipeline import (
+    ReportPipeline,
+    compute_client_metrics,
+    render_reports,
+)
+from backend.app.trading.store.models import Trade
+
+NOW = datetime(2026, 10, 18, 6, 0, 0)
+START = datetime(2026, 10, 17, 0, 0, 0)
+END = datetime(2026, 10, 18, 0, 0, 0)
+
+
+class FakeBus:
+    """Messaging bus double recording enqueued messages."""
+
+    def __init__(self, db: AsyncSession | None = None):
+        self.db = db
+        self.messages: list[dict] = []
+        self.uncommitted_at_enqueue: list[int] = []
+
+    async def enqueue_message(self, **kwargs):
+        if self.db is not None:
+            self.uncommitted_at_enqueue.append(len(self.db.new))
+        self.messages.append(kwargs)
+        return str(uuid4())
+
+
+async def _create_user(
+    db: AsyncSession, email: str, entitlement: EntitlementType | None, **kwargs
+) -> User:
+    user = User(email=email, password_hash="hash", **kwargs)
+    db.add(user)
+    await db.flush()
+    if entitlement is not None:
+        db.add(
+            UserEntitlement(
+                id=str(uuid4()),
+                user_id=user.id,
+                entitlement_type_id=entitlement.id,
+                is_active=1,
+            )
+        )
+    return user
+
+
+def _trade(user: User, symbol: str, profit: float, exit_time: datetime) -> Trade:
+    return Trade(
+        user_id=user.id,
+        symbol=symbol,
+        strategy="fib_rsi",
+        timeframe="H1",
+        trade_type="BUY",
+        direction=0,
+        entry_price=Decimal("1950.00"),
+        entry_time=exit_time - timedelta(hours=1),
+        stop_loss=Decimal("1945.00"),
+        take_profit=Decimal("1960.00"),
+        volume=Decimal("0.10"),
+        status="CLOSED",
+        exit_price=Decimal("1955.00"),
+        exit_time=exit_time,
+        profit=Decimal(str(profit)),
+    )
+
+
+def test_compute_client_metrics_vectorized():
+    """Test per-user metrics from one frame match hand-computed values."""
+    t = START + timedelta(hours=1)
+    trades = pd.DataFrame(
+        [
+            ("u1", "GOLD", 100.0, t),
+            ("u1", "EURUSD", -50.0, t + timedelta(hours=1)),
+            ("u1", "GOLD", 30.0, t + timedelta(hours=2)),
+            ("u2", "GOLD", -20.0, t),
+        ],
+        columns=["user_id", "symbol", "profit", "exit_time"],
+    )
+
+    metrics = compute_client_metrics(trades, START, END)
+
+    u1 = metrics["u1"]
+    assert u1["total_trades"] == 3
+    assert u1["total_pnl"] == pytest.approx(80.0)
+    assert u1["win_rate"] == pytest.approx(2 / 3)
+    assert u1["best_trade"] == 100.0
+    assert u1["worst_trade"] == -50.0
+    assert u1["avg_win"] == pytest.approx(65.0)
+    assert u1["avg_loss"] == pytest.approx(50.0)
+    assert u1["max_drawdown"] == pytest.approx(50.0 / 10_100.0)
+    assert u1["recovery_factor"] == pytest.approx(80.0 / 50.0)
+    assert u1["current_equity"] == pytest.approx(10_080.0)
+    assert [i["name"] for i in u1["top_instruments"]] == ["GOLD", "EURUSD"]
+    assert isinstance(u1["total_trades"], int)
+
+    u2 = metrics["u2"]
+    assert u2["sharpe_ratio"] == 0.0
+    assert u2["max_drawdown"] == pytest.approx(20.0 / 10_000.0)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_generates_and_delivers(db_session: AsyncSession, tmp_path):
+    """Test paid users get rendered, delivered reports; free users are skipped."""
+    premium = EntitlementType(id=str(uuid4()), name="premium_signals")
+    db_session.add(premium)
+    paid = await _create_user(
+        db_session, "paid@example.com", premium, telegram_user_id="12345"
+    )
+    idle = await _create_user(db_session, "idle@example.com", premium)
+    await _create_user(db_session, "free@example.com", None)
+
+    db_session.add(_trade(paid, "GOLD", 120.0, START + timedelta(hours=2)))
+    db_session.add(_trade(paid, "GOLD", -40.0, START + timedelta(hours=5)))
+    # Outside the period
+    db_session.add(_trade(paid, "GOLD", 999.0, END + timedelta(hours=1)))
+    await db_session.commit()
+
+    bus = FakeBus(db_session)
+    pipeline = ReportPipeline(db_session, bus=bus, shard_size=1, html_dir=tmp_path)
+    counts = await pipeline.run(ReportPeriod.DAILY, now=NOW)
+
+    assert counts["users"] == 2
+    assert counts["generated"] == 2
+    assert counts["failed"] == 0
+    assert counts["delivered"] == 2
+
+    reports = {
+        r.user_id: r for r in (await db_session.execute(select(Report))).scalars().all()
+    }
+    assert set(reports) == {paid.id, idle.id}
+
+    report = reports[paid.id]
+    assert report.type == ReportType.CLIENT
+    assert report.status == ReportStatus.COMPLETED
+    assert report.period_start == START
+    assert report.data["total_trades"] == 2
+    assert report.data["total_pnl"] == pytest.approx(80.0)
+    assert report.html_url == f"/reports/{report.id}.html"
+    assert (tmp_path / f"{report.id}.html").read_text(encoding="utf-8")
+    assert report.delivered_channels == ["email", "telegram"]
+    assert reports[idle.id].data["total_trades"] == 0
+    assert reports[idle.id].delivered_channels == ["email"]
+
+    assert len(bus.messages) == 3
+    assert {m["template_name"] for m in bus.messages} == {"report_ready"}
+    # Every report was committed before its notification went out
+    assert bus.uncommitted_at_enqueue == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resumes_after_watermark(db_session: AsyncSession):
+    """Test a rerun of the same period skips users that already have reports."""
+    premium = EntitlementType(id=str(uuid4()), name="premium_signals")
+    db_session.add(premium)
+    for i in range(3):
+        await _create_user(db_session, f"user{i}@example.com", premium)
+    await db_session.commit()
+
+    bus = FakeBus()
+    first = await ReportPipeline(db_session, bus=bus).run(ReportPeriod.DAILY, now=NOW)
+    second = await ReportPipeline(db_session, bus=bus).run(ReportPeriod.DAILY, now=NOW)
+
+    assert first["generated"] == 3
+    assert second["users"] == 0
+    assert second["resumed_after"] == 1
+    total = (await db_session.execute(select(Report))).scalars().all()
+    assert len(total) == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_retries_failed_reports_on_resume(
+    db_session: AsyncSession, tmp_path
+):
+    """Test FAILED reports do not advance the watermark and are retried."""
+    premium = EntitlementType(id=str(uuid4()), name="premium_signals")
+    db_session.add(premium)
+    users = [
+        await _create_user(db_session, f"user{i}@example.com", premium)
+        for i in range(3)
+    ]
+    await db_session.commit()
+    first_id = min(user.id for user in users)
+
+    calls = 0
+
+    def flaky_render(*args):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("template error")
+        return render_reports(*args)
+
+    bus = FakeBus()
+    with patch("backend.app.reports.pipeline.render_reports", flaky_render):
+        first = await ReportPipeline(
+            db_session, bus=bus, shard_size=1, html_dir=tmp_path
+        ).run(ReportPeriod.DAILY, now=NOW)
+        second = await ReportPipeline(
+            db_session, bus=bus, shard_size=1, html_dir=tmp_path
+        ).run(ReportPeriod.DAILY, now=NOW)
+        third = await ReportPipeline(
+            db_session, bus=bus, shard_size=1, html_dir=tmp_path
+        ).run(ReportPeriod.DAILY, now=NOW)
+
+    assert first["failed"] == 1
+    assert first["generated"] == 2
+    assert second["retried"] == 1
+    assert second["users"] == 1
+    assert second["generated"] == 1
+    assert third["users"] == 0
+
+    reports = (await db_session.execute(select(Report))).scalars().all()
+    statuses = sorted(r.status.value for r in reports if r.user_id == first_id)
+    assert statuses == sorted([ReportStatus.FAILED.value, ReportStatus.COMPLETED.value])
+
+
+@pytest.mark.asyncio
+async def test_pipeline_without_html_dir_renders_nothing(
+    db_session: AsyncSession, tmp_path, monkeypatch
+):
+    """Test no HTML is rendered when there is nowhere to keep it."""
+    monkeypatch.delenv("REPORT_HTML_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    premium = EntitlementType(id=str(uuid4()), name="premium_signals")
+    db_session.add(premium)
+    await _create_user(db_session, "paid@example.com", premium)
+    await db_session.commit()
+
+    with patch("backend.app.reports.pipeline.render_reports") as render:
+        counts = await ReportPipeline(db_session, bus=FakeBus()).run(
+            ReportPeriod.DAILY, now=NOW
+        )
+
+    assert counts["generated"] == 1
+    render.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,255 @@
+"""Tests for the incremental in-memory risk state.
+
+Tests cover:
+- Warm-up from the database (exposure, peak equity, daily P&L)
+- Incremental updates from TradeService open/close events
+- Idempotency of events already reflected in a loaded state
+- Re-sync after the staleness bound
+- Platform aggregate used by check_global_limits
+- Batched checkpoint of exposure snapshots
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.accounts.models import AccountInfo, AccountLink
+from backend.app.auth.models import User, UserRole
+from backend.app.auth.utils import hash_password
+from backend.app.risk.models import ExposureSnapshot
+from backend.app.risk.service import RiskService
+from backend.app.risk.state import (
+    RiskStateTracker,
+    drawdown_percent,
+    peak_equity_from_history,
+    risk_state,
+)
+from backend.app.trading.store.models import Trade
+from backend.app.trading.store.service import TradeService
+
+USER_ID = "risk-state-user"
+
+
+@pytest_asyncio.fixture
+async def account(db: AsyncSession):
+    """Linked account with a 10,000 balance."""
+    db.add(
+        User(
+            id=USER_ID,
+            email="risk-state@example.com",
+            password_hash=hash_password("test_password"),
+            role=UserRole.USER,
+        )
+    )
+    await db.commit()
+
+    link = AccountLink(
+        user_id=USER_ID,
+        mt5_account_id="654321",
+        mt5_login="654321",
+        broker_name="TestBroker",
+        is_primary=True,
+    )
+    db.add(link)
+    await db.commit()
+    await db.refresh(link)
+
+    db.add(
+        AccountInfo(
+            account_link_id=link.id,
+            balance=Decimal("10000.00"),
+            equity=Decimal("10000.00"),
+            free_margin=Decimal("10000.00"),
+            margin_level=Decimal("0.00"),
+        )
+    )
+    await db.commit()
+    return link
+
+
+async def _open_trade(service: TradeService, symbol="EURUSD", volume="1.0"):
+    return await service.create_trade(
+        symbol=symbol,
+        trade_type="BUY",
+        entry_price=Decimal("1.0850"),
+        stop_loss=Decimal("1.0800"),
+        take_profit=Decimal("1.0900"),
+        volume=Decimal(volume),
+        user_id=USER_ID,
+    )
+
+
+class TestHelpers:
+    """Test equity curve helpers."""
+
+    def test_peak_unwinds_newest_first(self):
+        """Peak is found by subtracting P&L from the balance backwards."""
+        # Balance 900 after: +200 (oldest), -300 (newest) → equity 1200 before loss
+        assert peak_equity_from_history(Decimal("900"), [-300, 200]) == Decimal("1200")
+
+    def test_drawdown_never_negative(self):
+        """Balance above peak gives zero drawdown."""
+        assert drawdown_percent(Decimal("100"), Decimal("120")) == Decimal("0.00")
+        assert drawdown_percent(Decimal("0"), Decimal("120")) == Decimal("0.00")
+
+
+class TestClientState:
+    """Test per-client incremental state."""
+
+    @pytest.mark.asyncio
+    async def test_open_event_updates_loaded_state(self, db: AsyncSession):
+        """A trade opened via TradeService is reflected without a reload."""
+        state = await risk_state.get_client_state(USER_ID, db)
+        assert state.open_positions_count == 0
+
+        await _open_trade(TradeService(db))
+        assert state.open_positions_count == 0  # not before the commit
+        await db.commit()
+
+        assert state.open_positions_count == 1
+        assert state.total_exposure == Decimal("1.0850")
+        assert state.exposure_by_instrument == {"EURUSD": Decimal("1.0850")}
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_trades_leave_state_untouched(
+        self, db: AsyncSession, account
+    ):
+        """Opens and closes that roll back never reach the state."""
+        service = TradeService(db)
+        trade_id = (await _open_trade(service)).trade_id
+        await db.commit()
+        state = await risk_state.get_client_state(USER_ID, db)
+
+        await _open_trade(service, symbol="GBPUSD")
+        await db.rollback()
+        assert state.exposure_by_instrument == {"EURUSD": Decimal("1.0850")}
+
+        await service.close_trade(trade_id, Decimal("1.0800"))
+        await db.rollback()
+        assert state.open_positions_count == 1
+        assert state.daily_pnl == Decimal("0")
+
+    @pytest.mark.asyncio
+    async def test_event_for_already_loaded_trade_not_double_counted(
+        self, db: AsyncSession
+    ):
+        """Events are idempotent per trade_id."""
+        trade = await _open_trade(TradeService(db))
+        await db.commit()
+
+        state = await risk_state.get_client_state(USER_ID, db)
+        risk_state.on_trade_opened(trade)
+
+        assert state.open_positions_count == 1
+
+    @pytest.mark.asyncio
+    async def test_close_event_books_pnl_and_drawdown(self, db: AsyncSession, account):
+        """Closing at a loss reduces balance, raises drawdown and daily P&L."""
+        service = TradeService(db)
+        trade = await _open_trade(service, volume="10.0")
+        state = await risk_state.get_client_state(USER_ID, db)
+
+        await service.close_trade(trade.trade_id, Decimal("1.0800"))
+        await db.commit()
+
+        assert state.open_positions_count == 0
+        assert state.total_exposure == Decimal("0")
+        assert state.daily_pnl == trade.profit
+        assert state.balance == Decimal("10000.00") + trade.profit
+        assert state.current_drawdown_percent > 0
+
+    @pytest.mark.asyncio
+    async def test_state_matches_database_recalculation(
+        self, db: AsyncSession, account
+    ):
+        """Incremental state agrees with a full re-sync from the database."""
+        service = TradeService(db)
+        state = await risk_state.get_client_state(USER_ID, db)
+        first = await _open_trade(service)
+        await _open_trade(service, symbol="GBPUSD", volume="2.0")
+        await service.close_trade(first.trade_id, Decimal("1.0870"))
+        await db.commit()
+
+        fresh = await RiskStateTracker().refresh_client(USER_ID, db)
+
+        assert state.total_exposure == fresh.total_exposure
+        assert state.exposure_by_instrument == fresh.exposure_by_instrument
+        assert state.current_daily_pnl() == fresh.current_daily_pnl()
+
+    @pytest.mark.asyncio
+    async def test_stale_state_resyncs_from_database(self, db: AsyncSession):
+        """Trades written outside TradeService appear after the max age."""
+        tracker = RiskStateTracker(max_age_seconds=0)
+        await tracker.get_client_state(USER_ID, db)
+
+        db.add(
+            Trade(
+                user_id=USER_ID,
+                symbol="GOLD",
+                strategy="external",
+                timeframe="H1",
+                trade_type="BUY",
+                direction=0,
+                entry_price=Decimal("1950.00"),
+                entry_time=datetime.utcnow(),
+                stop_loss=Decimal("1940.00"),
+                take_profit=Decimal("1970.00"),
+                volume=Decimal("0.1"),
+                status="OPEN",
+            )
+        )
+        await db.commit()
+
+        state = await tracker.get_client_state(USER_ID, db)
+        assert state.open_positions_count == 1
+
+
+class TestServiceIntegration:
+    """Test RiskService reads from the tracker."""
+
+    @pytest.mark.asyncio
+    async def test_check_risk_limits_does_not_write_snapshot(self, db: AsyncSession):
+        """Pre-trade checks no longer persist an ExposureSnapshot."""
+        await _open_trade(TradeService(db))
+        await db.commit()
+
+        class _Signal:
+            instrument = "EURUSD"
+
+        result = await RiskService.check_risk_limits(USER_ID, _Signal(), db)
+        count = await db.scalar(select(func.count()).select_from(ExposureSnapshot))
+
+        assert result["exposure"].open_positions_count == 1
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_global_limits_follow_trade_events(self, db: AsyncSession):
+        """Platform aggregate is updated by open/close events."""
+        service = TradeService(db)
+        before = await RiskService.check_global_limits("EURUSD", Decimal("1"), db)
+        trade = await _open_trade(service)
+        await db.commit()
+        during = await RiskService.check_global_limits("EURUSD", Decimal("1"), db)
+        await service.close_trade(trade.trade_id, Decimal("1.0860"))
+        await db.commit()
+        after = await RiskService.check_global_limits("EURUSD", Decimal("1"), db)
+
+        assert before["total_open_positions"] == 0
+        assert during["total_open_positions"] == 1
+        assert after["total_open_positions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_writes_dirty_states_once(self, db: AsyncSession):
+        """Checkpoint persists changed states in one batch and clears dirty."""
+        await risk_state.get_client_state(USER_ID, db)
+        await risk_state.get_client_state("other-user", db)
+
+        assert await risk_state.checkpoint(db) == 2
+        assert await risk_state.checkpoint(db) == 0
+
+        count = await db.scalar(select(func.count()).select_from(ExposureSnapshot))
+        assert count == 2
@@ -19,7 +19,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.app.trading.runtime.loop import TradingLoop
+from backend.app.trading.mt5.circuit_breaker import CircuitBreaker
+from backend.app.trading.runtime.loop import RecentSignalIds, TradingLoop
+
+
+def _slow_order_service(delay: float, log: list | None = None) -> AsyncMock:
+    """Order service whose place_order takes `delay` seconds."""
+    order_service = AsyncMock()
+
+    async def place_order(**kwargs):
+        if log is not None:
+            log.append(("start", kwargs["instrument"], kwargs["price"]))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", kwargs["instrument"], kwargs["price"]))
+        return {"id": f"order_{kwargs['price']}"}
+
+    order_service.place_order.side_effect = place_order
+    return order_service
+
 
 # ============================================================================
 # TRADINLOOP INITIALIZATION TESTS
@@ -848,3 +866,129 @@ class TestTradingLoopIntegration:
 
             # Should have emitted at least signal_received event
             assert mock_emit.called
+
+
+# ============================================================================
+# PIPELINED EXECUTION TESTS
+# ============================================================================
+
+
+class TestPipelinedExecution:
+    """Test bounded concurrent execution, ordering and back-pressure."""
+
+    @pytest.mark.asyncio
+    async def test_signals_for_different_symbols_run_concurrently(self):
+        """A burst across symbols takes ~1 broker round trip, not N."""
+        approvals_service = AsyncMock()
+        approvals_service.get_pending_signals.return_value = [
+            {"id": f"sig_{i}", "instrument": f"SYM{i}", "side": "buy", "price": i}
+            for i in range(8)
+        ]
+        loop = TradingLoop(
+            mt5_client=MagicMock(),
+            approvals_service=approvals_service,
+            order_service=_slow_order_service(0.1),
+        )
+
+        started = asyncio.get_running_loop().time()
+        await loop._loop_iteration()
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert loop._total_trades_lifetime == 8
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_same_symbol_signals_execute_in_order(self):
+        """Orders for one symbol never overlap and keep fetch order."""
+        log: list = []
+        approvals_service = AsyncMock()
+        approvals_service.get_pending_signals.return_value = [
+            {"id": f"sig_{i}", "instrument": "GOLD", "side": "buy", "price": i}
+            for i in range(3)
+        ]
+        loop = TradingLoop(
+            mt5_client=MagicMock(),
+            approvals_service=approvals_service,
+            order_service=_slow_order_service(0.01, log),
+        )
+
+        await loop._loop_iteration()
+
+        assert log == [
+            ("start", "GOLD", 0),
+            ("end", "GOLD", 0),
+            ("start", "GOLD", 1),
+            ("end", "GOLD", 1),
+            ("start", "GOLD", 2),
+            ("end", "GOLD", 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_per_account_concurrency_is_bounded(self):
+        """No more than max_in_flight_per_account orders per account."""
+        in_flight = 0
+        peak = 0
+        order_service = AsyncMock()
+
+        async def place_order(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return {"id": "order"}
+
+        order_service.place_order.side_effect = place_order
+        approvals_service = AsyncMock()
+        approvals_service.get_pending_signals.return_value = [
+            {"id": f"sig_{i}", "instrument": f"SYM{i}", "account_id": "acc_1"}
+            for i in range(6)
+        ]
+        loop = TradingLoop(
+            mt5_client=MagicMock(),
+            approvals_service=approvals_service,
+            order_service=order_service,
+            max_in_flight_per_account=2,
+        )
+
+        await loop._loop_iteration()
+
+        assert peak == 2
+        assert loop._total_trades_lifetime == 6
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_defers_dispatch(self):
+        """While the MT5 circuit is open, signals are not fetched."""
+        breaker = CircuitBreaker(failure_threshold=1, timeout_seconds=60)
+        breaker._on_failure()
+        approvals_service = AsyncMock()
+        loop = TradingLoop(
+            mt5_client=MagicMock(),
+            approvals_service=approvals_service,
+            order_service=AsyncMock(),
+            circuit_breaker=breaker,
+        )
+
+        await loop._loop_iteration()
+
+        approvals_service.get_pending_signals.assert_not_called()
+
+
+class TestRecentSignalIds:
+    """Test the bounded time-windowed dedupe structure."""
+
+    def test_expired_ids_are_forgotten(self):
+        """IDs older than the TTL are no longer reported as seen."""
+        seen = RecentSignalIds(ttl_seconds=0)
+        seen.add("sig_1")
+        assert "sig_1" not in seen
+
+    def test_size_is_bounded(self):
+        """Oldest IDs are evicted once max_size is exceeded."""
+        seen = RecentSignalIds(ttl_seconds=600, max_size=3)
+        for i in range(5):
+            seen.add(f"sig_{i}")
+
+        assert len(seen) == 3
+        assert "sig_0" not in seen
+        assert "sig_4" in seen
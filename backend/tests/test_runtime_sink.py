@@ -0,0 +1,265 @@
+"""Tests for the buffered trading runtime event sink.
+
+Tests cover:
+- Non-blocking publish into a bounded ring buffer
+- Drop counter on overflow
+- Batched flush by size and by latency
+- Heartbeat aggregation per loop
+- Redis Stream backend
+- Backend failures do not break the flusher
+- EventEmitter/HeartbeatManager route through the sink
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import fakeredis.aioredis
+import pytest
+
+from backend.app.trading.runtime.events import Event, EventEmitter, EventType
+from backend.app.trading.runtime.heartbeat import HeartbeatManager
+from backend.app.trading.runtime.sink import (
+    BufferedEventSink,
+    RedisStreamEventBackend,
+)
+
+
+class RecordingBackend:
+    """Backend that records each batch written."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.batches: list[list[dict]] = []
+
+    async def write(self, records):
+        self.batches.append(list(records))
+
+    @property
+    def records(self):
+        return [r for batch in self.batches for r in batch]
+
+
+class FailingBackend:
+    name = "failing"
+
+    async def write(self, records):
+        raise ConnectionError("down")
+
+
+class TestBuffering:
+    """Test ring buffer semantics."""
+
+    def test_invalid_sizes_rejected(self):
+        """Zero buffer/batch sizes are rejected."""
+        with pytest.raises(ValueError):
+            BufferedEventSink(buffer_size=0)
+        with pytest.raises(ValueError):
+            BufferedEventSink(max_latency_seconds=0)
+
+    def test_overflow_drops_oldest_and_counts(self):
+        """A full buffer overwrites the oldest events and counts drops."""
+        sink = BufferedEventSink(backends=[], buffer_size=3)
+        for i in range(5):
+            sink.publish({"n": i})
+
+        assert len(sink) == 3
+        assert sink.dropped == 2
+        assert [r["n"] for r in sink._buffer] == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_in_batches(self):
+        """Flush drains the buffer in batch_size chunks."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend], batch_size=2)
+        for i in range(5):
+            sink.publish({"n": i})
+
+        assert await sink.flush() == 5
+        assert [len(b) for b in backend.batches] == [2, 2, 1]
+        assert len(sink) == 0
+
+
+class TestFlusher:
+    """Test the background flusher."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self):
+        """Reaching batch_size wakes the flusher before the latency bound."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(
+            backends=[backend], batch_size=3, max_latency_seconds=30
+        )
+        await sink.start()
+        try:
+            for i in range(3):
+                sink.publish({"n": i})
+            await asyncio.sleep(0.05)
+            assert len(backend.records) == 3
+        finally:
+            await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_latency(self):
+        """A partial batch is written once max_latency_seconds elapses."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(
+            backends=[backend], batch_size=100, max_latency_seconds=0.05
+        )
+        await sink.start()
+        try:
+            sink.publish({"n": 1})
+            await asyncio.sleep(0.15)
+            assert backend.records == [{"n": 1}]
+        finally:
+            await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining(self):
+        """Stopping the sink writes what is still buffered."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend], max_latency_seconds=30)
+        await sink.start()
+        sink.publish({"n": 1})
+        await sink.stop()
+
+        assert backend.records == [{"n": 1}]
+        assert not sink.running
+
+    @pytest.mark.asyncio
+    async def test_failing_backend_does_not_block_others(self):
+        """One failing backend is logged; other backends still receive data."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[FailingBackend(), backend])
+        sink.publish({"n": 1})
+
+        await sink.flush()
+
+        assert backend.records == [{"n": 1}]
+
+
+class TestHeartbeatAggregation:
+    """Test heartbeat aggregation across a flush window."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_aggregated_per_loop(self):
+        """Counters are summed, gauges keep the latest value, one record/loop."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend])
+        sink.record_heartbeat(
+            {
+                "loop_id": "a",
+                "signals_processed": 2,
+                "loop_duration_ms": 50.0,
+                "account_equity": 1000.0,
+            }
+        )
+        sink.record_heartbeat(
+            {
+                "loop_id": "a",
+                "signals_processed": 3,
+                "loop_duration_ms": 20.0,
+                "account_equity": 1100.0,
+            }
+        )
+        sink.record_heartbeat({"loop_id": "b", "signals_processed": 1})
+
+        await sink.flush()
+
+        by_loop = {r["loop_id"]: r for r in backend.records}
+        assert by_loop["a"]["signals_processed"] == 5
+        assert by_loop["a"]["loop_duration_ms"] == 50.0
+        assert by_loop["a"]["account_equity"] == 1100.0
+        assert by_loop["a"]["heartbeat_count"] == 2
+        assert by_loop["b"]["event_type"] == "heartbeat"
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_manager_records_into_sink(self):
+        """HeartbeatManager.emit folds into the sink instead of logging."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend])
+        manager = HeartbeatManager(loop_id="main", sink=sink)
+
+        await manager.emit(signals_processed=1)
+        await manager.emit(signals_processed=2)
+        await sink.flush()
+
+        assert len(backend.records) == 1
+        assert backend.records[0]["signals_processed"] == 3
+
+
+class TestBackends:
+    """Test concrete backends and emitter integration."""
+
+    @pytest.mark.asyncio
+    async def test_redis_stream_backend_appends_batch(self):
+        """Each record becomes one stream entry with a JSON payload."""
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        backend = RedisStreamEventBackend(redis_client, stream_key="test:events")
+
+        await backend.write([{"event_type": "a"}, {"event_type": "b"}])
+
+        entries = await redis_client.xrange("test:events")
+        assert [json.loads(fields["data"])["event_type"] for _, fields in entries] == [
+            "a",
+            "b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_event_emitter_publishes_to_sink(self):
+        """With a flusher running, EventEmitter.emit only buffers."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend], max_latency_seconds=30)
+        emitter = EventEmitter(loop_id="main", sink=sink)
+        await sink.start()
+        try:
+            await emitter.emit(_trade_event("t1"))
+            assert backend.records == []
+        finally:
+            await sink.stop()
+
+        assert backend.records[0]["event_type"] == "trade_executed"
+        assert backend.records[0]["metadata"] == {"trade_id": "t1"}
+
+    @pytest.mark.asyncio
+    async def test_event_emitter_writes_through_without_flusher(self):
+        """Without a running flusher, events are written immediately."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend])
+        emitter = EventEmitter(loop_id="main", sink=sink)
+
+        await emitter.emit(_trade_event("t1"))
+
+        assert [r["metadata"] for r in backend.records] == [{"trade_id": "t1"}]
+        assert len(sink) == 0
+
+    @pytest.mark.asyncio
+    async def test_background_heartbeat_stops_flusher_it_started(self):
+        """Cancelling the heartbeat task stops (and flushes) its flusher."""
+        backend = RecordingBackend()
+        sink = BufferedEventSink(backends=[backend], max_latency_seconds=30)
+        manager = HeartbeatManager(loop_id="main", interval_seconds=1, sink=sink)
+
+        async def metrics():
+            return {"signals_processed": 1}
+
+        task = await manager.start_background_heartbeat(metrics)
+        assert sink.running
+        sink.publish({"n": 1})
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not sink.running
+        assert backend.records == [{"n": 1}]
+
+
+def _trade_event(trade_id: str) -> Event:
+    return Event(
+        event_type=EventType.TRADE_EXECUTED,
+        timestamp=datetime.now(UTC),
+        loop_id="main",
+        metadata={"trade_id": trade_id},
+    )
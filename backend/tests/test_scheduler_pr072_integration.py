@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pandas as pd
 import pytest
 
+from backend.app.strategy.cache import DedupeGuard
 from backend.app.strategy.candles import CandleDetector
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.strategy.publisher import SignalPublisher
@@ -124,6 +125,35 @@ class TestSchedulerPR072Integration:
             )
             assert result2 is None  # Duplicate prevented
 
+    @pytest.mark.asyncio
+    async def test_failed_run_releases_candle_claim(
+        self, mock_registry, sample_dataframe
+    ):
+        """Test a run that raises frees the candle so a retry processes it."""
+        scheduler = StrategyScheduler(
+            registry=mock_registry,
+            candle_detector=CandleDetector(window_seconds=60, dedupe=DedupeGuard()),
+        )
+        timestamp = datetime(2025, 1, 1, 10, 15, 5, tzinfo=UTC)
+
+        with patch.object(
+            scheduler, "run_strategies", new_callable=AsyncMock
+        ) as mock_run:
+            mock_run.side_effect = RuntimeError("feature pool crashed")
+            with pytest.raises(RuntimeError):
+                await scheduler.run_on_new_candle(
+                    sample_dataframe, "GOLD", timestamp, "15m"
+                )
+
+            mock_run.side_effect = None
+            mock_run.return_value = {"test_strategy": []}
+            result = await scheduler.run_on_new_candle(
+                sample_dataframe, "GOLD", timestamp, "15m"
+            )
+
+        assert result == {"test_strategy": []}
+        assert mock_run.await_count == 2
+
     @pytest.mark.asyncio
     async def test_scheduler_uses_signal_publisher(
         self, mock_registry, sample_dataframe
@@ -216,6 +246,25 @@ class TestSchedulerPR072Integration:
             )
             assert result is not None  # 4h boundary detected
 
+    @pytest.mark.asyncio
+    async def test_scheduler_publishes_candle_timeframe(
+        self, mock_registry, sample_dataframe
+    ):
+        """Test published signals carry the candle's timeframe and start."""
+        scheduler = StrategyScheduler(registry=mock_registry)
+
+        with patch.object(
+            scheduler.signal_publisher, "publish", new_callable=AsyncMock
+        ) as mock_publish:
+            mock_publish.return_value = {"api_success": True, "signal_id": "123"}
+
+            timestamp = datetime(2025, 1, 1, 12, 0, 10, tzinfo=UTC)
+            await scheduler.run_on_new_candle(sample_dataframe, "GOLD", timestamp, "4h")
+
+            call_args = mock_publish.call_args
+            assert call_args.kwargs["signal_data"]["timeframe"] == "4h"
+            assert call_args.kwargs["candle_start"] == datetime(2025, 1, 1, 12, 0)
+
     @pytest.mark.asyncio
     async def test_scheduler_handles_signal_publish_failure(
         self, mock_registry, sample_dataframe
@@ -18,6 +18,7 @@ import pytest
 from sqlalchemy import select
 
 from backend.app.strategy.logs.models import DecisionLog, DecisionOutcome
+from backend.app.strategy.logs.service import record_decision
 from backend.app.strategy.models import ShadowDecisionLog
 from backend.app.strategy.shadow import ShadowExecutor
 
@@ -532,3 +533,129 @@ async def test_shadow_decision_count_over_week(db_session):
     )
 
     assert len(decisions) == 7
+
+
+def _paired_logs(ts, shadow_decision, active_outcome, active_side=None, lag=5):
+    """Shadow log for a candle and the active log written lag seconds later."""
+    features = {} if active_side is None else {"side": active_side}
+    return [
+        ShadowDecisionLog(
+            id=str(uuid4()),
+            version="v2.0.0",
+            strategy_name="fib_rsi",
+            symbol="GOLD",
+            timestamp=ts,
+            decision=shadow_decision,
+            features={},
+        ),
+        DecisionLog(
+            id=str(uuid4()),
+            timestamp=ts + timedelta(seconds=lag),
+            strategy="fib_rsi",
+            symbol="GOLD",
+            features=features,
+            outcome=active_outcome,
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_compare_pairs_decisions_by_candle(db_session):
+    """Test agreement and side mismatches from paired candles."""
+    executor = ShadowExecutor(db_session)
+    base = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    db_session.add_all(
+        _paired_logs(base - timedelta(hours=1), "buy", DecisionOutcome.ENTERED, "buy")
+        + _paired_logs(
+            base - timedelta(hours=2), "sell", DecisionOutcome.ENTERED, "buy"
+        )
+        + _paired_logs(base - timedelta(hours=3), "hold", DecisionOutcome.SKIPPED)
+        + _paired_logs(base - timedelta(hours=4), "buy", DecisionOutcome.PENDING)
+    )
+    await db_session.commit()
+
+    comparison = await executor.compare_shadow_vs_active(
+        shadow_version="v2.0.0", strategy_name="fib_rsi", symbol="GOLD", days=1
+    )
+
+    # PENDING active decisions have no action and are not paired
+    assert comparison["paired_decisions"] == 3
+    assert comparison["agreement_count"] == 2
+    assert comparison["agreement_rate"] == pytest.approx(200 / 3)
+    assert comparison["side_mismatch_count"] == 1
+    assert sum(b["paired_decisions"] for b in comparison["buckets"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_compare_pairs_recorded_active_decision_with_candle(db_session):
+    """Test an active decision logged after the candle pairs with its shadow."""
+    executor = ShadowExecutor(db_session)
+    now = datetime.utcnow()
+    candle = now.replace(minute=now.minute - now.minute % 15, second=0, microsecond=0)
+
+    for ts in (candle - timedelta(minutes=15), candle):
+        await executor.execute_shadow(
+            version="v2.0.0",
+            strategy_name="fib_rsi",
+            strategy_engine=MockStrategyEngine(
+                generate_signal_result=[MockSignalCandidate(side=1)]
+            ),
+            df=pd.DataFrame(),
+            symbol="GOLD",
+            timestamp=ts,
+        )
+    # Stamped with the wall clock, not the candle time
+    await record_decision(
+        db=db_session,
+        strategy="fib_rsi",
+        symbol="GOLD",
+        features={"side": "sell"},
+        outcome=DecisionOutcome.ENTERED,
+    )
+
+    comparison = await executor.compare_shadow_vs_active(
+        shadow_version="v2.0.0", strategy_name="fib_rsi", symbol="GOLD", days=1
+    )
+
+    # Only the current candle has an active decision within one bar
+    assert comparison["total_shadow_decisions"] == 2
+    assert comparison["paired_decisions"] == 1
+    assert comparison["agreement_rate"] == pytest.approx(100.0)
+    assert comparison["side_mismatch_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_compare_refreshes_incrementally(db_session):
+    """Test cached buckets are reused and only recent buckets are re-read."""
+    executor = ShadowExecutor(db_session)
+    now = datetime.utcnow()
+    old = now - timedelta(days=3)
+
+    db_session.add_all(_paired_logs(old, "buy", DecisionOutcome.ENTERED, "buy"))
+    await db_session.commit()
+    first = await executor.compare_shadow_vs_active(
+        shadow_version="v2.0.0", strategy_name="fib_rsi", symbol="GOLD", days=7
+    )
+
+    # New candle lands in the current bucket; a back-dated row lands in a
+    # cached bucket and is only seen after a full rebuild
+    db_session.add_all(
+        _paired_logs(now, "sell", DecisionOutcome.ENTERED, "sell")
+        + _paired_logs(old + timedelta(minutes=15), "buy", DecisionOutcome.SKIPPED)
+    )
+    await db_session.commit()
+    second = await executor.compare_shadow_vs_active(
+        shadow_version="v2.0.0", strategy_name="fib_rsi", symbol="GOLD", days=7
+    )
+
+    executor.comparison_cache.invalidate("fib_rsi")
+    rebuilt = await executor.compare_shadow_vs_active(
+        shadow_version="v2.0.0", strategy_name="fib_rsi", symbol="GOLD", days=7
+    )
+
+    assert first["paired_decisions"] == 1
+    assert second["paired_decisions"] == 2
+    assert second["agreement_count"] == 2
+    assert rebuilt["paired_decisions"] == 3
+    assert rebuilt["agreement_count"] == 2
@@ -14,10 +14,12 @@ Tests cover:
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
+import fakeredis.aioredis
 import httpx
 import pytest
 from telegram.error import TelegramError
 
+from backend.app.strategy.cache import DedupeGuard
 from backend.app.strategy.candles import CandleDetector, get_candle_detector
 from backend.app.strategy.publisher import SignalPublisher, get_signal_publisher
 
@@ -643,3 +645,50 @@ class TestIntegration:
             # Second attempt (should be blocked by detector)
             should_process = detector.should_process_candle("GOLD", "15m", timestamp2)
             assert should_process is False  # Blocked by candle detector
+
+    @pytest.mark.asyncio
+    async def test_shared_guard_dedupes_across_workers(self):
+        """Test two workers sharing Redis process and publish each candle once."""
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        workers = [
+            (
+                CandleDetector(
+                    window_seconds=60, dedupe=DedupeGuard(redis_client=redis_client)
+                ),
+                SignalPublisher(
+                    signals_api_base="http://test.com",
+                    dedupe=DedupeGuard(redis_client=redis_client),
+                ),
+            )
+            for _ in range(2)
+        ]
+        timestamp = datetime(2025, 1, 1, 10, 15, 5)
+        candle_start = datetime(2025, 1, 1, 10, 15, 0)
+        signal_data = {
+            "instrument": "GOLD",
+            "side": "buy",
+            "entry_price": 1950.50,
+            "strategy": "ppo_gold",
+            "timestamp": timestamp,
+        }
+
+        processed = [
+            await detector.should_process_candle_async("GOLD", "15m", timestamp)
+            for detector, _ in workers
+        ]
+        assert processed == [True, False]
+
+        with patch("httpx.AsyncClient.post") as mock_post:
+            mock_response = AsyncMock()
+            mock_response.json = Mock(return_value={"id": "sig-1", "status": "new"})
+            mock_response.raise_for_status = Mock()
+            mock_post.return_value = mock_response
+
+            results = [
+                await publisher.publish(signal_data, candle_start=candle_start)
+                for _, publisher in workers
+            ]
+
+        assert [r["api_success"] for r in results] == [True, False]
+        assert results[1]["error"] == "Duplicate signal"
+        assert mock_post.call_count == 1
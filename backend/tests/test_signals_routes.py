@@ -407,6 +407,56 @@ class TestSignalCreationEndpoint:
         assert data["payload"]["confidence"] == 0.85
 
 
+class TestSignalBatchEndpoint:
+    """Test POST /api/v1/signals/batch endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_create_signals_batch_200(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test batch ingest returns per-item results in order."""
+        response = await client.post(
+            "/api/v1/signals/batch",
+            json={
+                "signals": [
+                    {
+                        "instrument": "XAUUSD",
+                        "side": "buy",
+                        "price": 1950.50,
+                        "external_id": "batch-route-1",
+                    },
+                    {
+                        "instrument": "EURUSD",
+                        "side": "sell",
+                        "price": 1.085,
+                        "external_id": "batch-route-1",
+                    },
+                ]
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert data["duplicates"] == 1
+        assert [r["status"] for r in data["results"]] == ["created", "duplicate"]
+        assert data["results"][0]["signal"]["instrument"] == "XAUUSD"
+
+    @pytest.mark.asyncio
+    async def test_create_signals_batch_empty_422(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test empty batch is rejected."""
+        response = await client.post(
+            "/api/v1/signals/batch",
+            json={"signals": []},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
+
 class TestSignalRetrievalEndpoint:
     """Test GET /api/v1/signals/{signal_id} endpoint."""
 
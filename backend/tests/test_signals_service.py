@@ -18,7 +18,7 @@ import pytest
 from sqlalchemy import select
 
 from backend.app.signals.models import Signal, SignalStatus
-from backend.app.signals.schema import SignalCreate
+from backend.app.signals.schema import SignalBatchItem, SignalCreate
 from backend.app.signals.service import (
     DuplicateSignalError,
     SignalNotFoundError,
@@ -339,6 +339,108 @@ class TestSignalDeduplication:
         assert signal1.id != signal2.id
 
 
+class TestSignalBatchCreation:
+    """Test set-based batch ingest."""
+
+    @pytest.mark.asyncio
+    async def test_batch_creates_all_new_signals(self, signal_service, db_session):
+        """Test a clean batch is inserted in request order."""
+        items = [
+            SignalBatchItem(
+                instrument="XAUUSD", side="buy", price=1950.5, external_id="b-1"
+            ),
+            SignalBatchItem(
+                instrument="EURUSD", side="sell", price=1.085, external_id="b-2"
+            ),
+        ]
+
+        out = await signal_service.create_signals_batch("user_batch", items)
+
+        assert out.created == 2
+        assert out.duplicates == 0
+        assert [r.status for r in out.results] == ["created", "created"]
+        assert out.results[0].signal.instrument == "XAUUSD"
+        assert out.results[1].signal.external_id == "b-2"
+
+        rows = await db_session.execute(
+            select(Signal).where(Signal.user_id == "user_batch")
+        )
+        assert len(rows.scalars().all()) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_existing_external_id(
+        self, signal_service, valid_signal_create
+    ):
+        """Test external_id already stored is reported as duplicate."""
+        await signal_service.create_signal(
+            user_id="user_batch_ext",
+            signal_create=valid_signal_create,
+            external_id="ext-seen",
+        )
+
+        out = await signal_service.create_signals_batch(
+            "user_batch_ext",
+            [
+                SignalBatchItem(
+                    instrument="EURUSD",
+                    side="buy",
+                    price=1.085,
+                    external_id="ext-seen",
+                ),
+                SignalBatchItem(instrument="GBPUSD", side="buy", price=1.27),
+            ],
+        )
+
+        assert [r.status for r in out.results] == ["duplicate", "created"]
+        assert out.results[0].error
+        assert out.created == 1
+        assert out.duplicates == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_window_duplicate(
+        self, signal_service, valid_signal_create
+    ):
+        """Test (instrument, version) within the window is a duplicate."""
+        await signal_service.create_signal(
+            user_id="user_batch_window", signal_create=valid_signal_create
+        )
+
+        out = await signal_service.create_signals_batch(
+            "user_batch_window",
+            [
+                SignalBatchItem(instrument="XAUUSD", side="sell", price=1951.0),
+                SignalBatchItem(
+                    instrument="XAUUSD", side="buy", price=1951.0, version="2.0"
+                ),
+            ],
+        )
+
+        assert [r.status for r in out.results] == ["duplicate", "created"]
+
+    @pytest.mark.asyncio
+    async def test_batch_first_item_wins_in_batch(self, signal_service):
+        """Test later duplicates inside the same batch are dropped."""
+        out = await signal_service.create_signals_batch(
+            "user_batch_inner",
+            [
+                SignalBatchItem(
+                    instrument="USDJPY", side="buy", price=150.1, external_id="x"
+                ),
+                SignalBatchItem(
+                    instrument="AUDUSD", side="buy", price=0.66, external_id="x"
+                ),
+                SignalBatchItem(instrument="USDJPY", side="sell", price=150.2),
+            ],
+        )
+
+        assert [r.status for r in out.results] == [
+            "created",
+            "duplicate",
+            "duplicate",
+        ]
+        assert out.created == 1
+
+
 class TestHMACSignatureVerification:
     """Test HMAC signature verification."""
 
@@ -11,9 +11,12 @@ Tests cover:
 Coverage: 100% of business logic with real implementations and fake backends.
 """
 
+import asyncio
 import os
 import pickle
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -24,6 +27,16 @@ import pytest
 from httpx import AsyncClient, Response
 
 from backend.app.observability.metrics import get_metrics
+from backend.app.strategy.features import (
+    OFFLOAD_MIN_BARS,
+    FeatureContext,
+    atr_sma_last,
+    bb_position_last,
+    macd_last,
+    rsi_sma_last,
+    true_range,
+)
+from backend.app.strategy.fib_rsi.indicators import RSICalculator
 from backend.app.strategy.fib_rsi.schema import SignalCandidate
 from backend.app.strategy.ppo.loader import PPOModelLoader
 from backend.app.strategy.ppo.runner import PPOStrategy
@@ -431,6 +444,224 @@ class TestStrategyScheduler:
         assert results is None  # Should skip execution
 
 
+class TestConcurrentStrategies:
+    """Tests for concurrent strategy execution and shared features."""
+
+    @staticmethod
+    def _signal() -> SignalCandidate:
+        return SignalCandidate(
+            instrument="GOLD",
+            side="buy",
+            entry_price=1950.0,
+            stop_loss=1935.0,
+            take_profit=1980.0,
+            confidence=0.85,
+            timestamp=datetime.utcnow(),
+            reason="test_signal",
+        )
+
+    @pytest.mark.asyncio
+    async def test_strategies_run_concurrently(self, sample_ohlc_df, monkeypatch):
+        """Test strategies overlap instead of running back to back."""
+        monkeypatch.setenv("STRATEGIES_ENABLED", "a,b,c")
+        registry = StrategyRegistry()
+
+        async def slow_generate(df, instrument, timestamp):
+            await asyncio.sleep(0.2)
+            return self._signal()
+
+        for name in ("a", "b", "c"):
+            strategy = MagicMock()
+            strategy.generate_signal = slow_generate
+            registry.register_strategy(name, lambda s=strategy: s)
+        registry.initialize_enabled_strategies("STRATEGIES_ENABLED")
+
+        scheduler = StrategyScheduler(registry=registry, feature_executor=None)
+
+        start = time.perf_counter()
+        results = await scheduler.run_strategies(
+            sample_ohlc_df, "GOLD", datetime.utcnow(), post_to_api=False
+        )
+        elapsed = time.perf_counter() - start
+
+        assert sorted(results) == ["a", "b", "c"]
+        assert all(len(v) == 1 for v in results.values())
+        assert elapsed < 0.5  # Sequential would take >= 0.6s
+
+    @pytest.mark.asyncio
+    async def test_small_frame_does_not_create_pool(self, sample_ohlc_df, monkeypatch):
+        """Test the shared process pool is only created for offloadable frames."""
+        monkeypatch.setenv("STRATEGIES_ENABLED", "a")
+        registry = StrategyRegistry()
+
+        async def generate(df, instrument, timestamp):
+            return self._signal()
+
+        strategy = MagicMock()
+        strategy.generate_signal = generate
+        registry.register_strategy("a", lambda: strategy)
+        registry.initialize_enabled_strategies("STRATEGIES_ENABLED")
+
+        created = []
+        monkeypatch.setattr(
+            "backend.app.strategy.scheduler.get_feature_executor",
+            lambda: created.append(True),
+        )
+        scheduler = StrategyScheduler(registry=registry)
+
+        await scheduler.run_strategies(
+            sample_ohlc_df, "GOLD", datetime.utcnow(), post_to_api=False
+        )
+
+        assert len(sample_ohlc_df) < OFFLOAD_MIN_BARS
+        assert created == []
+
+    @pytest.mark.asyncio
+    async def test_slow_strategy_times_out_without_blocking_others(
+        self, sample_ohlc_df, monkeypatch
+    ):
+        """Test a strategy past its timeout yields nothing; others publish."""
+        monkeypatch.setenv("STRATEGIES_ENABLED", "slow,fast")
+        registry = StrategyRegistry()
+
+        async def hang(df, instrument, timestamp):
+            await asyncio.sleep(5)
+
+        slow = MagicMock()
+        slow.generate_signal = hang
+        fast = MagicMock()
+        fast.generate_signal = AsyncMock(return_value=self._signal())
+        registry.register_strategy("slow", lambda: slow)
+        registry.register_strategy("fast", lambda: fast)
+        registry.initialize_enabled_strategies("STRATEGIES_ENABLED")
+
+        publisher = MagicMock()
+        publisher.publish = AsyncMock(return_value={"api_success": True})
+        scheduler = StrategyScheduler(
+            registry=registry,
+            signal_publisher=publisher,
+            strategy_timeout_seconds=0.05,
+        )
+
+        start = time.perf_counter()
+        results = await scheduler.run_strategies(
+            sample_ohlc_df, "GOLD", datetime(2025, 1, 1, 10, 15)
+        )
+
+        assert time.perf_counter() - start < 1.0
+        assert results["slow"] == []
+        assert len(results["fast"]) == 1
+        publisher.publish.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_feature_context_shared_between_strategies(
+        self, sample_ohlc_df, monkeypatch
+    ):
+        """Test strategies declaring `features` receive one shared context."""
+        monkeypatch.setenv("STRATEGIES_ENABLED", "x,y")
+        registry = StrategyRegistry()
+        seen = []
+
+        class FeatureAwareStrategy:
+            async def generate_signal(self, df, instrument, timestamp, features=None):
+                seen.append(features)
+                await features.rsi(14)
+                return None
+
+        registry.register_strategy("x", FeatureAwareStrategy)
+        registry.register_strategy("y", FeatureAwareStrategy)
+        registry.initialize_enabled_strategies("STRATEGIES_ENABLED")
+
+        scheduler = StrategyScheduler(registry=registry)
+        await scheduler.run_strategies(
+            sample_ohlc_df, "GOLD", datetime.utcnow(), post_to_api=False
+        )
+
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
+        assert seen[0].misses == 1
+        assert seen[0].hits == 1
+
+
+class TestFeatureContext:
+    """Tests for per-candle feature memoization."""
+
+    @pytest.mark.asyncio
+    async def test_rsi_matches_calculator_and_is_memoized(self, sample_ohlc_df):
+        """Test memoized RSI equals a direct RSICalculator run."""
+        features = FeatureContext(sample_ohlc_df)
+
+        first = await features.rsi(14)
+        second = await features.rsi(14)
+
+        assert first is second
+        assert first == RSICalculator.calculate(sample_ohlc_df["close"].tolist(), 14)
+        assert (features.misses, features.hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_distinct_parameters_are_distinct_features(self, sample_ohlc_df):
+        """Test different periods are computed separately."""
+        features = FeatureContext(sample_ohlc_df)
+
+        await features.rsi(14)
+        await features.rsi(7)
+
+        assert features.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_compute_once(self, sample_ohlc_df):
+        """Test concurrent awaiters of one feature share a computation."""
+        features = FeatureContext(sample_ohlc_df)
+
+        values = await asyncio.gather(*(features.macd() for _ in range(5)))
+
+        assert len(set(values)) == 1
+        assert features.misses == 1
+        assert features.hits == 4
+
+    @pytest.mark.asyncio
+    async def test_rolling_mean_features_match_direct(self, sample_ohlc_df):
+        """Test PPO-style features equal the pure functions on the frame."""
+        features = FeatureContext(sample_ohlc_df)
+        close = sample_ohlc_df["close"]
+        tr = true_range(sample_ohlc_df["high"], sample_ohlc_df["low"], close)
+
+        assert await features.rsi_sma(14) == rsi_sma_last(close, 14)
+        assert await features.atr_sma(14) == atr_sma_last(tr, 14)
+        assert await features.macd() == macd_last(close)
+        assert await features.bb_position(20) == bb_position_last(close, 20)
+
+    @pytest.mark.asyncio
+    async def test_steady_state_frame_offloaded(self):
+        """Test a pipeline-sized frame is computed in the executor."""
+        n = OFFLOAD_MIN_BARS
+        df = pd.DataFrame(
+            {
+                "open": np.random.uniform(1950, 1960, n),
+                "high": np.random.uniform(1960, 1970, n),
+                "low": np.random.uniform(1940, 1950, n),
+                "close": np.random.uniform(1950, 1960, n),
+                "volume": np.random.randint(1000, 2000, n),
+            }
+        )
+        executor = ThreadPoolExecutor(max_workers=1)
+        submitted = []
+        original_submit = executor.submit
+
+        def spy_submit(fn, *args, **kwargs):
+            submitted.append(fn)
+            return original_submit(fn, *args, **kwargs)
+
+        executor.submit = spy_submit
+        try:
+            features = FeatureContext(df, executor=executor)
+            assert await features.macd() == macd_last(df["close"])
+        finally:
+            executor.shutdown(wait=True)
+
+        assert submitted == [macd_last]
+
+
 # ==================== PPOLoader Tests ====================
 
 
@@ -0,0 +1,268 @@
+"""Tests for incremental trust scoring (TrustScoreIndex).
+
+Validates:
+- Incremental scores and percentiles match a full recalculation
+- Changes only rescore the nodes they touch
+- Scores are persisted incrementally and survive a restart
+- TrustScoringService goes through the index
+"""
+
+import random
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.auth.models import User
+from backend.app.trust.graph import (
+    TrustScoreIndex,
+    _build_graph_from_endorsements,
+    _calculate_percentiles,
+    calculate_trust_scores,
+)
+from backend.app.trust.models import Endorsement, TrustCalculationLog, UserTrustScore
+from backend.app.trust.service import TrustScoringService
+
+
+def _full(created, perf, edges):
+    """Reference scores from the NetworkX path."""
+    endorsements = [
+        Endorsement(endorser_id=s, endorsee_id=d, weight=w)
+        for (s, d), w in edges.items()
+    ]
+    scores = calculate_trust_scores(
+        _build_graph_from_endorsements(endorsements), perf, created
+    )
+    return scores, _calculate_percentiles(scores)
+
+
+def _assert_matches(index: TrustScoreIndex, created, perf, edges):
+    expected, percentiles = _full(created, perf, edges)
+    assert index.scores() == expected
+    assert {u: index.percentile(u) for u in expected} == percentiles
+
+
+def test_incremental_matches_full_recalculation():
+    """Every change yields exactly the full-recalculation scores."""
+    rng = random.Random(49)
+    now = datetime.utcnow()
+    users = [f"u{i:02d}" for i in range(40)]
+    created = {
+        u: now - timedelta(days=rng.randint(0, 500), hours=rng.randint(1, 12))
+        for u in users
+    }
+    perf = {
+        u: {
+            "win_rate": rng.uniform(0.4, 0.8),
+            "sharpe_ratio": rng.uniform(0, 2.5),
+            "profit_factor": rng.uniform(0.8, 3.5),
+        }
+        for u in users
+    }
+    edges = {}
+    while len(edges) < 120:
+        s, d = rng.sample(users, 2)
+        edges[(s, d)] = rng.choice([0.1, 0.25, 0.4, 0.8])
+
+    index = TrustScoreIndex()
+    index.load(created, perf, [(s, d, w) for (s, d), w in edges.items()])
+    assert set(index.recompute()) == set(users)
+    _assert_matches(index, created, perf, edges)
+    assert index.recompute() == []
+
+    # One endorsement: only its endpoints can change
+    s, d = next((a, b) for a in users for b in users if a != b and (a, b) not in edges)
+    edges[(s, d)] = 0.3
+    index.set_endorsement(s, d, 0.3)
+    assert set(index.recompute()) <= {s, d}
+    _assert_matches(index, created, perf, edges)
+
+    # Revocation and re-weighting
+    revoked = next(iter(edges))
+    del edges[revoked]
+    index.revoke_endorsement(*revoked)
+    reweighted = list(edges)[5]
+    edges[reweighted] = 0.15
+    index.set_endorsement(*reweighted, 0.15)
+    assert set(index.recompute()) <= {*revoked, *reweighted}
+    _assert_matches(index, created, perf, edges)
+
+    # Performance change rescores only that user
+    perf[users[7]] = {"win_rate": 0.75, "sharpe_ratio": 2.0, "profit_factor": 3.0}
+    index.set_performance(users[7], perf[users[7]])
+    assert index.recompute() == [users[7]]
+    _assert_matches(index, created, perf, edges)
+
+    # A new user renormalizes only endorsed users
+    created["newcomer"] = now - timedelta(days=3, hours=2)
+    index.add_user("newcomer", created["newcomer"])
+    changed = set(index.recompute())
+    assert "newcomer" in changed
+    assert changed <= {d for _, d in edges} | {"newcomer"}
+    _assert_matches(index, created, perf, edges)
+
+    # Many edits fold the overlay into the CSR arrays
+    for _ in range(1500):
+        s, d = rng.sample(users, 2)
+        weight = rng.choice([0.0, 0.2, 0.5])
+        if weight:
+            edges[(s, d)] = weight
+        else:
+            edges.pop((s, d), None)
+        index.set_endorsement(s, d, weight)
+    index.recompute()
+    assert index.graph._overlay_size < 1500
+    _assert_matches(index, created, perf, edges)
+
+
+async def _user(db_session: AsyncSession, days: int) -> str:
+    user = User(
+        id=str(uuid4()),
+        email=f"{uuid4().hex[:12]}@test.com",
+        password_hash="hashed_password",
+        created_at=datetime.utcnow() - timedelta(days=days, hours=1),
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user.id
+
+
+async def _stored(db_session: AsyncSession, user_id: str) -> UserTrustScore:
+    result = await db_session.execute(
+        select(UserTrustScore)
+        .where(UserTrustScore.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_refresh_and_persist_only_changes(db_session: AsyncSession):
+    """Only changed scores are written, and a restarted index writes none."""
+    a, b, c = [await _user(db_session, days) for days in (30, 180, 400)]
+    db_session.add(Endorsement(endorser_id=a, endorsee_id=b, weight=0.4))
+    await db_session.commit()
+
+    index = TrustScoreIndex()
+    assert set(await index.refresh(db_session)) == {a, b, c}
+    assert await index.persist(db_session) == 3
+    assert (await _stored(db_session, b)).endorsement_component == round(
+        0.4 / (3 * 0.5) * 100, 2
+    )
+
+    assert await index.refresh(db_session) == []
+    assert await index.persist(db_session) == 0
+
+    # New endorsement of c: the endorser's own score does not move
+    endorsement = Endorsement(endorser_id=a, endorsee_id=c, weight=0.9)
+    db_session.add(endorsement)
+    await db_session.commit()
+    assert await index.refresh(db_session) == [c]
+    assert await index.persist(db_session) == 1
+    stored = await _stored(db_session, c)
+    assert stored.endorsement_component == round(0.5 / 1.5 * 100, 2)
+    assert stored.percentile == 66
+
+    logs = (
+        (
+            await db_session.execute(
+                select(TrustCalculationLog).where(TrustCalculationLog.user_id == c)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert len(logs) == 2
+    assert {log.input_graph_edges for log in logs} == {1, 2}
+
+    # Revocation takes the edge away again
+    endorsement.revoked_at = datetime.utcnow()
+    await db_session.commit()
+    assert await index.refresh(db_session) == [c]
+    assert await index.persist(db_session) == 1
+    assert (await _stored(db_session, c)).endorsement_component == 0.0
+
+    # A restarted process rebuilds from the database and rewrites nothing
+    restarted = TrustScoreIndex()
+    await restarted.refresh(db_session)
+    assert restarted.scores() == index.scores()
+    assert await restarted.persist(db_session) == 0
+    count = await db_session.execute(select(func.count(UserTrustScore.id)))
+    assert count.scalar_one() == 3
+
+
+@pytest.mark.asyncio
+async def test_persist_refreshes_moved_percentiles(db_session: AsyncSession):
+    """Unchanged scores get a fresh percentile when other users overtake them."""
+    a, b, c = [await _user(db_session, days) for days in (30, 180, 400)]
+    index = TrustScoreIndex()
+    await index.refresh(db_session)
+    assert await index.persist(db_session) == 3
+    before = await _stored(db_session, b)
+    assert before.percentile == 33
+    calculated_at, valid_until = before.calculated_at, before.valid_until
+
+    # b endorses a: a overtakes b, whose own score does not change
+    db_session.add(Endorsement(endorser_id=b, endorsee_id=a, weight=0.5))
+    await db_session.commit()
+    assert await index.refresh(db_session) == [a]
+    assert await index.persist(db_session) == 1
+    after = await _stored(db_session, b)
+    assert after.percentile == 0
+    assert after.calculated_at == calculated_at
+    assert after.valid_until > valid_until
+    assert (await _stored(db_session, a)).percentile == 33
+    assert (await _stored(db_session, c)).percentile == 66
+    logs = await db_session.execute(
+        select(func.count(TrustCalculationLog.id)).where(
+            TrustCalculationLog.user_id == b
+        )
+    )
+    assert logs.scalar_one() == 1
+
+    # Expired rows get a new valid_until even when nothing moved
+    after.valid_until = datetime.utcnow() - timedelta(minutes=1)
+    await db_session.commit()
+    restarted = TrustScoreIndex()
+    await restarted.refresh(db_session)
+    assert await restarted.persist(db_session) == 0
+    assert (await _stored(db_session, b)).valid_until > datetime.utcnow()
+    assert await restarted.persist(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_service_scores_through_index(db_session: AsyncSession, monkeypatch):
+    """The service writes only changed scores and reads them from the index."""
+    index = TrustScoreIndex()
+    monkeypatch.setattr(
+        "backend.app.trust.service.get_trust_score_index", lambda: index
+    )
+    a, b = [await _user(db_session, days) for days in (30, 180)]
+    db_session.add(Endorsement(endorser_id=a, endorsee_id=b, weight=0.4))
+    await db_session.commit()
+
+    result = await TrustScoringService.calculate_all_trust_scores(db_session)
+    assert result["users_scored"] == 2
+    assert sum(result["scores_by_tier"].values()) == 2
+    assert (await _stored(db_session, a)).performance_component > 0
+
+    again = await TrustScoringService.calculate_all_trust_scores(db_session)
+    assert again["users_scored"] == 0
+
+    # A user who joins later gets performance data too
+    c = str(uuid4())
+    db_session.add(User(id=c, email=f"{c[:12]}@test.com", password_hash="hashed"))
+    await db_session.commit()
+    score = await TrustScoringService.calculate_single_user_score(c, db_session)
+    assert score is not None
+    assert (
+        score["components"]["performance"]
+        == (await _stored(db_session, a)).performance_component
+    )
+    assert score["percentile"] == index.percentile(c)
+    assert (
+        await TrustScoringService.calculate_single_user_score("nobody", db_session)
+        is None
+    )
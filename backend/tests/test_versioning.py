@@ -10,11 +10,19 @@ Validates:
 Tests use REAL database (PostgreSQL) and REAL implementations (NO MOCKS).
 """
 
+import asyncio
+
+import fakeredis.aioredis
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, update
 
-from backend.app.strategy.models import StrategyVersion, VersionStatus
-from backend.app.strategy.versioning import VersionRegistry
+from backend.app.strategy.models import CanaryConfig, StrategyVersion, VersionStatus
+from backend.app.strategy.versioning import (
+    ROUTING_CHANNEL,
+    VersionRegistry,
+    VersionRoutingTable,
+    user_bucket,
+)
 
 
 @pytest.mark.asyncio
@@ -512,3 +520,85 @@ async def test_multiple_shadows_allowed(db_session):
 
     shadows = await registry.get_shadow_versions("fib_rsi")
     assert len(shadows) == 3
+
+
+@pytest.mark.asyncio
+async def test_routing_served_from_table_until_invalidated(db_session):
+    """Routing is cached per strategy and refreshed by lifecycle changes."""
+    registry = VersionRegistry(db_session, routing=VersionRoutingTable())
+
+    await registry.register_version(
+        strategy_name="fib_rsi",
+        version="v1.0.0",
+        config={},
+        status=VersionStatus.ACTIVE,
+    )
+    await registry.register_version(
+        strategy_name="fib_rsi", version="v2.0.0", config={}
+    )
+    await registry.activate_canary("fib_rsi", "v2.0.0", 0.0)
+
+    users = [f"user_{i:03d}" for i in range(200)]
+    for user_id in users:
+        version = await registry.route_user_to_version(user_id, "fib_rsi")
+        assert version.version == "v1.0.0"
+
+    # Changed behind the registry's back: the cached route still applies
+    await db_session.execute(
+        update(CanaryConfig)
+        .where(CanaryConfig.strategy_name == "fib_rsi")
+        .values(rollout_percent=100.0)
+    )
+    await db_session.commit()
+    version = await registry.route_user_to_version(users[0], "fib_rsi")
+    assert version.version == "v1.0.0"
+
+    # A registry update invalidates; routing matches the hash buckets again
+    await registry.update_canary_percent("fib_rsi", 30.0)
+    for user_id in users:
+        version = await registry.route_user_to_version(user_id, "fib_rsi")
+        expected = "v2.0.0" if user_bucket(user_id) < 30.0 else "v1.0.0"
+        assert version.version == expected
+
+
+@pytest.mark.asyncio
+async def test_routing_invalidation_published_to_other_processes(db_session):
+    """Invalidations reach other routing tables over Redis pub/sub."""
+    server = fakeredis.FakeServer()
+    redis_client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    local = VersionRoutingTable(
+        fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    )
+    remote = VersionRoutingTable(redis_client)
+    remote.start()
+    for _ in range(100):
+        if (await redis_client.pubsub_numsub(ROUTING_CHANNEL))[0][1]:
+            break
+        await asyncio.sleep(0.01)
+
+    registry = VersionRegistry(db_session, routing=local)
+    await registry.register_version(
+        strategy_name="ppo_gold",
+        version="v1.0.0",
+        config={},
+        status=VersionStatus.ACTIVE,
+    )
+    await registry.register_version(
+        strategy_name="ppo_gold", version="v2.0.0", config={}
+    )
+    await asyncio.sleep(0.05)
+    route = await remote.get(db_session, "ppo_gold")
+    assert route.canary is None
+    assert "ppo_gold" in remote._routes
+
+    await registry.activate_canary("ppo_gold", "v2.0.0", 100.0)
+    for _ in range(100):
+        if "ppo_gold" not in remote._routes:
+            break
+        await asyncio.sleep(0.01)
+    assert "ppo_gold" not in remote._routes
+
+    route = await remote.get(db_session, "ppo_gold")
+    assert route.canary is not None and route.canary.version == "v2.0.0"
+    assert route.route("user_123").version == "v2.0.0"
+    await remote.stop()